@@ -58,7 +58,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.AssociationRules.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 
@@ -411,7 +411,6 @@ if __name__ == "__main__":
             _ap = ARWithConfidence(_ab._sys.argv[1], float(_ab._sys.argv[3]), _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = ARWithConfidence(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Association Rules:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
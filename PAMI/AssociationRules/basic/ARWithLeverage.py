@@ -55,7 +55,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.AssociationRules.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _Leverage:
@@ -351,7 +351,7 @@ class ARWithLeverage:
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -407,7 +407,6 @@ if __name__ == "__main__":
             _ap = ARWithLeverage(_ab._sys.argv[1], float(_ab._sys.argv[3]), _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = ARWithLeverage(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Association Rules:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -33,15 +33,16 @@ __copyright__ = """
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import csv as _csv
-import pandas as _pd
+from PAMI import lazyImport as _lazyImport
+_pd = _lazyImport.lazyModule('pandas')
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
+_psutil = _lazyImport.lazyModule('psutil')
 import sys as _sys
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import functools as _functools
 
 
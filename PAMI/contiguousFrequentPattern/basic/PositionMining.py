@@ -31,11 +31,12 @@
 
 
 
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import numpy as np
 import math
 from PAMI.contigousFrequentPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 __copyright__ = """
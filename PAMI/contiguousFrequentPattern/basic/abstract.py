@@ -16,15 +16,16 @@
 
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+from PAMI import lazyImport as _lazyImport
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import csv as _csv
-import pandas as _pd
+_pd = _lazyImport.lazyModule('pandas')
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
+_psutil = _lazyImport.lazyModule('psutil')
 from array import *
 import functools as _functools
 import sys as _sys
@@ -54,9 +54,10 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.correlatedPattern.basic import abstract as _ab
-import pandas as _pd
+from PAMI import lazyImport as _lazyImport
+_pd = _lazyImport.lazyModule('pandas')
 from typing import List, Dict, Tuple, Union
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 class _Node:
     """
@@ -368,7 +369,7 @@ class CoMine(_ab._correlatedPatterns):
     _maxPatternLength = 1000
     _sep = "\t"
 
-    def __init__(self, iFile: Union[str, _pd.DataFrame], minSup: Union[int, float, str], minAllConf: float, sep: str="\t") ->None:
+    def __init__(self, iFile: 'Union[str, _pd.DataFrame]', minSup: Union[int, float, str], minAllConf: float, sep: str="\t") ->None:
         """
         param iFile: give the input file
         type iFile: str or DataFrame or url
@@ -648,7 +649,7 @@ class CoMine(_ab._correlatedPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_pd.DataFrame':
         """
         Storing final correlated patterns in a dataframe
 
@@ -710,7 +711,6 @@ if __name__ == "__main__":
             _ap = CoMine(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]), _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = CoMine(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of Correlated-Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
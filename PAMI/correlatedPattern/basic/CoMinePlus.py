@@ -53,9 +53,10 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.correlatedPattern.basic import abstract as _ab
-import pandas as _pd
+from PAMI import lazyImport as _lazyImport
+_pd = _lazyImport.lazyModule('pandas')
 from typing import List, Dict, Tuple, Set, Union, Any, Optional, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _Node:
@@ -377,7 +378,7 @@ class CoMinePlus(_ab._correlatedPatterns):
     _maxPatternLength = 1000
     _sep = "\t"
 
-    def __init__(self, iFile: Union[str, _pd.DataFrame], minSup: Union[int, float, str], minAllConf: str, sep: str="\t") -> None:
+    def __init__(self, iFile: 'Union[str, _pd.DataFrame]', minSup: Union[int, float, str], minAllConf: str, sep: str="\t") -> None:
         """
         param iFile: input file name
 
@@ -659,7 +660,7 @@ class CoMinePlus(_ab._correlatedPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_pd.DataFrame':
         """
         Storing final correlated patterns in a dataframe
 
@@ -720,7 +721,6 @@ if __name__ == "__main__":
             _ap = CoMinePlus(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]), _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = CoMinePlus(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]))
-        _ap.startMine()
         _ap.mine()
         _correlatedPatterns = _ap.getPatterns()
         print("Total number of Correlated-Frequent Patterns:", len(_ap.getPatterns()))
@@ -57,8 +57,10 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.coveragePattern.basic import abstract as _ab
+from PAMI.coveragePattern.basic import coverageEngine as _engine
+import numpy as _np
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 class CMine(_ab._coveragePatterns):
     """
@@ -249,61 +251,29 @@ class CMine(_ab._coveragePatterns):
         coverageTidData = dict(sorted(coverageTidData.items(), reverse=True, key=lambda x: len(x[1])))
         return coverageTidData
 
-    def tidToBitset(self,item_set: Dict[str, int]) -> Dict[str, int]:
+    def tidToBitset(self, item_set: Dict[str, List[int]]) -> _np.ndarray:
         """
-        This function converts tid list to bitset.
+        This function converts the tid lists of the coverage items to a packed bitmap.
 
-        :param item_set:
-        :return: Dictionary
-        :rtype: dict
-        """
-        bitset = {}
-
-        for k,v in item_set.items():
-            bitset[k] = 0b1
-            bitset[k] = (bitset[k] << int(v[0])) | 0b1
-            for i in range(1,len(v)):
-                diff = int(v[i]) - int(v[i-1])
-                bitset[k] = (bitset[k] << diff) | 0b1
-            bitset[k] = (bitset[k] << (self._lno - int(v[i])))
-        return bitset
-
-    def genPatterns(self,prefix: Tuple[str, int],tidData: List[Tuple[str, int]]) -> None:
+        :param item_set: coverage items and their tid lists
+        :type item_set: dict
+        :return: one row of uint64 words per item, in the order of item_set
+        :rtype: numpy.ndarray
         """
-        This function generate coverage pattern about prefix.
+        return _engine.bitmapFromTids([[tid - 1 for tid in tids] for tids in item_set.values()], self._lno)
 
-        :param prefix: String
-        :param tidData: list
-        :return: None
-        """
-        # variables to store coverage item set and
-        item_set = prefix[0]
-
-        # Get the length of tidData
-        length = len(tidData)
-        for i in range(length):
-            tid = prefix[1] & tidData[i][1]
-            tid1 = prefix[1] | tidData[i][1]
-            andCount = bin(tid).count("1") - 1
-            orCount = bin(tid1).count("1") - 1
-            if orCount/len(self._Database) >= self._minCS and andCount / len(str(prefix[1])) <= self._maxOR:
-                coverageItem_set = item_set + '\t' + tidData[i][0]
-                if orCount / len(self._Database) >= self._minRF:
-                    self._finalPatterns[coverageItem_set] = andCount
-                self.genPatterns((coverageItem_set,tid),tidData[i+1:length])
-
-    def generateAllPatterns(self,coverageItems: Dict[str, int]) -> None:
+    def generateAllPatterns(self, coverageItems: Dict[str, List[int]]) -> None:
         """
         This function generates all coverage patterns.
 
-        :param coverageItems: coverage items
+        :param coverageItems: coverage items and their tid lists, in decreasing order of support
+        :type coverageItems: dict
         :return: None
         """
-        tidData = list(coverageItems.items())
-        length = len(tidData)
-        for i in range(length):
-            #print(i,tidData[i][0])
-            self.genPatterns(tidData[i],tidData[i+1:length])
+        items = list(coverageItems)
+        bitmap = self.tidToBitset(coverageItems)
+        for pattern, support, coverage in _engine.coveragePatterns(bitmap, self._lno, self._minCS, self._maxOR):
+            self._finalPatterns['\t'.join(items[i] for i in pattern)] = support
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self) -> None:
@@ -322,9 +292,8 @@ class CMine(_ab._coveragePatterns):
         self._minRF =  self._convert(self._minRF)
         self._maxOR = self._convert(self._maxOR)
         coverageItems = self.creatingCoverageItems()
-        self._finalPatterns = {k: len(v) for k, v in coverageItems.items()}
-        coverageItemsBitset = self.tidToBitset(coverageItems)
-        self.generateAllPatterns(coverageItemsBitset)
+        self._finalPatterns = {}
+        self.generateAllPatterns(coverageItems)
         self.save('output.txt')
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -364,7 +333,7 @@ class CMine(_ab._coveragePatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final coverage patterns in a dataframe
 
@@ -419,7 +388,6 @@ if __name__=="__main__":
             _ap = CMine(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5], _ab._sys.argv[6])
         if len(_ab._sys.argv) == 6:
             _ap = CMine(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of coverage Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
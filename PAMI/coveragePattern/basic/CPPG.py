@@ -54,9 +54,10 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.coveragePattern.basic import abstract as _ab
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 _maxPer = float()
@@ -424,7 +425,7 @@ class CPPG(_ab._coveragePatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """Storing final periodic-frequent patterns in a dataframe
 
         :return: returning periodic-frequent patterns in a dataframe
@@ -475,7 +476,6 @@ if __name__ == "__main__":
             _ap = CPPG(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5], _ab._sys.argv[6])
         if len(_ab._sys.argv) == 6:
             _ap = CPPG(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Coverage Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -0,0 +1,133 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Coverage pattern search over packed transaction bitmaps.
+
+The items of a pattern are kept in decreasing order of support. The coverage set of a pattern is the union of the
+transactions of its items, and the overlap ratio of a pattern is the fraction of the transactions of its last item
+already covered by the rest of the pattern:
+
+    overlapRatio(P + (b,)) = |coverage(P) & transactions(b)| / |transactions(b)|
+
+Extending a pattern only grows its coverage set, so an extension that breaks maxOR under a prefix breaks it under every
+longer prefix as well. The search is depth first, every prefix passes its coverage mask and the mask of the
+transactions holding all its items down the recursion, and all the extensions of a prefix are checked at once with a
+vectorized popcount of the bitmap rows masked by the coverage of the prefix. The coverage of an extension follows as
+|coverage(P)| + |transactions(b)| - overlap.
+
+.. code-block:: python
+
+        from PAMI.coveragePattern.basic import coverageEngine as engine
+
+        bitmap = engine.bitmapFromTids(tidLists, numTransactions)
+
+        for pattern, support, coverage in engine.coveragePatterns(bitmap, numTransactions, minCS, maxOR):
+            print([items[item] for item in pattern], support, coverage)
+"""
+
+import numpy as _np
+from typing import Iterator, List, Tuple
+from PAMI.extras.packedBitsets import popcount as _popcount
+
+
+def bitmapFromTids(tidLists: List[List[int]], numTransactions: int) -> _np.ndarray:
+    """
+    Packed item x transaction bitmap
+
+    :param tidLists: the transaction indexes, counted from 0, of every item
+    :type tidLists: list
+    :param numTransactions: number of transactions of the database
+    :type numTransactions: int
+    :return: bit t of row i is set when transaction t holds item i
+    :rtype: numpy.ndarray
+    """
+    words = max(1, (numTransactions + 63) // 64)
+    bitmap = _np.zeros((len(tidLists), words), dtype=_np.uint64)
+    lengths = [len(tids) for tids in tidLists]
+    if sum(lengths) == 0:
+        return bitmap
+    rows = _np.repeat(_np.arange(len(tidLists)), lengths)
+    tids = _np.concatenate([_np.asarray(tids, dtype=_np.int64) for tids in tidLists])
+    _np.bitwise_or.at(bitmap, (rows, tids >> 6), _np.left_shift(_np.uint64(1), (tids & 63).astype(_np.uint64)))
+    return bitmap
+
+
+def _overlaps(bitmap: _np.ndarray, extensions: _np.ndarray, mask: _np.ndarray, batchRows: int) -> _np.ndarray:
+    """
+    popcount(bitmap[b] & mask) for every b in extensions, a batch of rows at a time
+    """
+    counts = _np.empty(len(extensions), dtype=_np.int64)
+    for start in range(0, len(extensions), batchRows):
+        batch = extensions[start:start + batchRows]
+        counts[start:start + len(batch)] = _popcount(bitmap[batch] & mask)
+    return counts
+
+
+def _search(bitmap: _np.ndarray, supports: _np.ndarray, prefix: tuple, coverMask: _np.ndarray, coverage: int,
+            allMask: _np.ndarray, extensions: _np.ndarray, numTransactions: int, minCS: float, maxOR: float,
+            batchRows: int) -> Iterator[Tuple[tuple, int, int]]:
+    """
+    Depth-first search of the extensions of a prefix
+
+    :param coverMask: transactions holding at least one item of the prefix
+    :param allMask: transactions holding every item of the prefix
+    :param extensions: candidate items, all after the last item of the prefix
+    """
+    overlaps = _overlaps(bitmap, extensions, coverMask, batchRows)
+    keep = overlaps / supports[extensions] <= maxOR
+    extensions, overlaps = extensions[keep], overlaps[keep]
+    if len(extensions) == 0:
+        return
+    patternSupports = _overlaps(bitmap, extensions, allMask, batchRows)
+    for i, item in enumerate(extensions.tolist()):
+        pattern = prefix + (item,)
+        patternCoverage = coverage + int(supports[item]) - int(overlaps[i])
+        if patternCoverage / numTransactions >= minCS:
+            yield pattern, int(patternSupports[i]), patternCoverage
+        if i + 1 < len(extensions):
+            yield from _search(bitmap, supports, pattern, coverMask | bitmap[item], patternCoverage,
+                               allMask & bitmap[item], extensions[i + 1:], numTransactions, minCS, maxOR, batchRows)
+
+
+def coveragePatterns(bitmap: _np.ndarray, numTransactions: int, minCS: float, maxOR: float,
+                     batchBytes: int = 64 * 1024 * 1024) -> Iterator[Tuple[tuple, int, int]]:
+    """
+    Coverage patterns of a database
+
+    :param bitmap: packed item x transaction bitmap, rows in decreasing order of support
+    :type bitmap: numpy.ndarray
+    :param numTransactions: number of transactions of the database
+    :type numTransactions: int
+    :param minCS: minimum coverage support, as a fraction of the database
+    :type minCS: float
+    :param maxOR: maximum overlap ratio
+    :type maxOR: float
+    :param batchBytes: upper bound on the size of the temporary rows masked at once
+    :type batchBytes: int
+    :return: (item indexes, number of transactions holding every item, number of transactions holding any item)
+             of every coverage pattern, in depth-first order
+    :rtype: generator
+    """
+    if len(bitmap) == 0 or numTransactions == 0:
+        return
+    supports = _popcount(bitmap)
+    batchRows = max(1, batchBytes // max(1, bitmap.shape[1] * 8))
+    for item in range(len(bitmap)):
+        if supports[item] / numTransactions >= minCS:
+            yield (item,), int(supports[item]), int(supports[item])
+        if item + 1 < len(bitmap):
+            yield from _search(bitmap, supports, (item,), bitmap[item], int(supports[item]), bitmap[item],
+                               _np.arange(item + 1, len(bitmap)), numTransactions, minCS, maxOR, batchRows)
@@ -0,0 +1,515 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Input sources of the miners.
+
+A miner accepts a file name, a URL, a DataFrame, a Parquet file or any iterable of transactions as its input. openSource
+wraps the input into a DataSource, which streams the records of the database as blocks of text lines read with large
+buffered reads, or as transactions split on the separator of the miner. Files and HTTP bodies compressed with gzip,
+bzip2, xz or zstd are recognised from their first bytes and decompressed on the fly; zstd needs the zstandard package.
+HTTP inputs are read through a pool of keep-alive connections shared by all the sources, redirects are followed, and a
+request failing before its body is read is retried with exponential backoff. When http_proxy or https_proxy applies to
+a URL, it is read through urllib.request instead, which goes through the proxy.
+
+.. code-block:: python
+
+        from PAMI import dataSources
+
+        for transaction in dataSources.transactions("https://host/transactional.txt.gz", "\\t"):
+            print(transaction)
+
+        with dataSources.openSource("temporal.txt.zst") as source:
+            for lines in source.lineBlocks():
+                print(len(lines))
+"""
+
+import bz2 as _bz2
+import gzip as _gzip
+import io as _io
+import itertools as _itertools
+import lzma as _lzma
+import threading as _threading
+import time as _time
+import urllib.parse as _parse
+from abc import ABC as _ABC, abstractmethod as _abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from PAMI import lazyImport as _lazyImport
+
+_http = _lazyImport.lazyModule('http.client')
+_request = _lazyImport.lazyModule('urllib.request')
+
+_bufferSize = 1 << 20
+
+_redirects = (301, 302, 303, 307, 308)
+
+_magic = ((b'\x1f\x8b', 'gzip'), (b'BZh', 'bz2'), (b'\xfd7zXZ\x00', 'xz'), (b'\x28\xb5\x2f\xfd', 'zstd'))
+
+
+def _decompressed(stream: _io.BufferedReader) -> Any:
+    """
+    The stream, decompressed when its first bytes are those of gzip, bzip2, xz or zstd data
+    """
+    head = stream.peek(6)[:6]
+    for magic, name in _magic:
+        if head.startswith(magic):
+            if name == 'gzip':
+                return _gzip.GzipFile(fileobj=stream, mode='rb')
+            if name == 'bz2':
+                return _bz2.BZ2File(stream, mode='rb')
+            if name == 'xz':
+                return _lzma.LZMAFile(stream, mode='rb')
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("Reading zstd compressed inputs needs the zstandard package") from None
+            return zstandard.ZstdDecompressor().stream_reader(stream)
+    return stream
+
+
+def compression(path: str) -> Optional[str]:
+    """
+    :param path: name of a local file
+    :type path: str
+    :return: gzip, bz2, xz or zstd when the first bytes of the file are those of compressed data, None otherwise
+    :rtype: str
+    """
+    with open(path, 'rb') as f:
+        head = f.read(6)
+    for magic, name in _magic:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _textOf(raw: Any, bufferSize: int, encoding: str) -> _io.TextIOWrapper:
+    """
+    Decoded text of a binary stream, read bufferSize bytes at a time and decompressed when needed
+    """
+    buffered = _io.BufferedReader(raw, bufferSize)
+    stream = _decompressed(buffered)
+    if stream is not buffered:
+        stream = _io.BufferedReader(stream, bufferSize)
+    return _io.TextIOWrapper(stream, encoding=encoding)
+
+
+def _isFrame(data: Any) -> bool:
+    """
+    True for a pandas DataFrame, without importing pandas
+    """
+    return type(data).__module__.startswith('pandas') and hasattr(data, 'columns')
+
+
+def _split(line: str, sep: str) -> List[str]:
+    """
+    The items of a line, as the miners have always split them
+    """
+    return [item for item in (i.rstrip() for i in line.split(sep)) if item]
+
+
+class DataSource(_ABC):
+    """
+    :Description:  The records of an input database. Subclasses produce blocks of text lines; the transactions are the
+                   lines split on the separator, the items being right-stripped and the empty items dropped, so that
+                   a blank line is an empty transaction.
+
+    :Attributes:
+
+        :param sep: str :
+            separator of the items of a line
+        :param bufferSize: int :
+            number of bytes read at a time
+    """
+
+    def __init__(self, sep: str = '\t', bufferSize: int = _bufferSize) -> None:
+        self.sep = sep
+        self.bufferSize = bufferSize
+
+    @_abstractmethod
+    def lineBlocks(self) -> Iterator[List[str]]:
+        """
+        :return: the lines of the database, a block of about bufferSize bytes at a time
+        :rtype: generator
+        """
+        pass
+
+    def lines(self) -> Iterator[str]:
+        """
+        :return: the lines of the database
+        :rtype: generator
+        """
+        for block in self.lineBlocks():
+            yield from block
+
+    def transactions(self) -> Iterator[List[str]]:
+        """
+        :return: the items of every line of the database
+        :rtype: generator
+        """
+        sep = self.sep
+        for block in self.lineBlocks():
+            for line in block:
+                yield _split(line, sep)
+
+    def close(self) -> None:
+        """
+        Releases the resources held by the source
+        """
+        pass
+
+    def __enter__(self) -> 'DataSource':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class FileSource(DataSource):
+    """
+    :Description:  A local file, plain or compressed with gzip, bzip2, xz or zstd
+
+    :Attributes:
+
+        :param path: str :
+            name of the file
+        :param encoding: str :
+            encoding of the text
+    """
+
+    def __init__(self, path: str, sep: str = '\t', bufferSize: int = _bufferSize, encoding: str = 'utf-8') -> None:
+        super().__init__(sep, bufferSize)
+        self.path = path
+        self.encoding = encoding
+
+    def lineBlocks(self) -> Iterator[List[str]]:
+        with _textOf(open(self.path, 'rb', buffering=0), self.bufferSize, self.encoding) as text:
+            while True:
+                block = text.readlines(self.bufferSize)
+                if not block:
+                    return
+                yield block
+
+
+class HTTPPool:
+    """
+    :Description:  Keep-alive HTTP connections, kept idle per (scheme, host, port) and reused by the next request to
+                   the same server
+
+    :Attributes:
+
+        :param maxIdle: int :
+            number of idle connections kept per server
+        :param timeout: float :
+            timeout of the socket operations, in seconds
+    """
+
+    def __init__(self, maxIdle: int = 8, timeout: float = 60) -> None:
+        self.maxIdle = maxIdle
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = _threading.Lock()
+
+    def acquire(self, scheme: str, host: str, port: Optional[int]) -> 'Tuple[_http.HTTPConnection, bool]':
+        """
+        :return: (an idle connection to the server or a new one, True when the connection is an idle one)
+        :rtype: tuple
+        """
+        with self._lock:
+            idle = self._idle.get((scheme, host, port))
+            if idle:
+                return idle.pop(), True
+        if scheme == 'https':
+            return _http.HTTPSConnection(host, port, timeout=self.timeout), False
+        return _http.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def release(self, scheme: str, connection: '_http.HTTPConnection') -> None:
+        """
+        Keeps a connection whose last response was read completely for the next request to its server
+        """
+        key = (scheme, connection.host, connection.port)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxIdle:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def request(self, url: str, headers: Optional[Dict[str, str]] = None, retries: int = 3, backoff: float = 0.5,
+                maxRedirects: int = 5) -> 'Tuple[_http.HTTPResponse, _http.HTTPConnection]':
+        """
+        Sends a GET request, following redirects and retrying connection failures and server errors
+
+        :param url: the URL
+        :type url: str
+        :param headers: headers of the request
+        :type headers: dict
+        :param retries: number of retries
+        :type retries: int
+        :param backoff: delay before the first retry, in seconds, doubled after every retry
+        :type backoff: float
+        :param maxRedirects: number of redirects followed
+        :type maxRedirects: int
+        :return: (response, connection)
+        :rtype: tuple
+        """
+        attempt = 0
+        redirects = 0
+        while True:
+            parts = _parse.urlsplit(url)
+            if parts.scheme not in ('http', 'https'):
+                raise IOError('Unsupported URL: ' + url)
+            target = parts.path or '/'
+            if parts.query:
+                target += '?' + parts.query
+            port = parts.port or (443 if parts.scheme == 'https' else 80)
+            connection, reused = self.acquire(parts.scheme, parts.hostname, port)
+            try:
+                connection.request('GET', target, headers=headers or {})
+                response = connection.getresponse()
+            except (OSError, _http.HTTPException):
+                connection.close()
+                if reused:
+                    continue
+                if attempt == retries:
+                    raise
+            else:
+                if 300 <= response.status < 400:
+                    location = response.getheader('Location')
+                    response.read()
+                    self.release(parts.scheme, connection)
+                    if response.status not in _redirects or not location:
+                        raise IOError('HTTP ' + str(response.status) + ' ' + str(response.reason) + ': ' + url)
+                    if redirects == maxRedirects:
+                        raise IOError('Too many redirects: ' + url)
+                    redirects += 1
+                    url = _parse.urljoin(url, location)
+                    continue
+                if response.status < 500 or attempt == retries:
+                    if response.status >= 400:
+                        response.read()
+                        self.release(parts.scheme, connection)
+                        raise IOError('HTTP ' + str(response.status) + ' ' + str(response.reason) + ': ' + url)
+                    return response, connection
+                response.read()
+                self.release(parts.scheme, connection)
+            _time.sleep(backoff * 2 ** attempt)
+            attempt += 1
+
+    def close(self) -> None:
+        """
+        Closes the idle connections
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+defaultPool = HTTPPool()
+
+
+class HTTPSource(DataSource):
+    """
+    :Description:  A file served over HTTP or HTTPS, read through a pool of keep-alive connections. Redirects are
+                   followed, and the file is read with urllib.request when the environment sets a proxy for it.
+
+    :Attributes:
+
+        :param url: str :
+            the URL
+        :param pool: HTTPPool :
+            pool of the connections, the pool shared by all the sources when None
+        :param retries: int :
+            number of retries of a failing request
+        :param backoff: float :
+            delay before the first retry, in seconds
+    """
+
+    def __init__(self, url: str, sep: str = '\t', bufferSize: int = _bufferSize, encoding: str = 'utf-8',
+                 pool: Optional[HTTPPool] = None, retries: int = 3, backoff: float = 0.5) -> None:
+        super().__init__(sep, bufferSize)
+        self.url = url
+        self.encoding = encoding
+        self.pool = pool or defaultPool
+        self.retries = retries
+        self.backoff = backoff
+
+    def _proxied(self) -> bool:
+        """
+        True when the environment sets a proxy for the URL, such as http_proxy or https_proxy
+        """
+        parts = _parse.urlsplit(self.url)
+        return parts.scheme in _request.getproxies() and not _request.proxy_bypass(parts.hostname or '')
+
+    def _proxiedBlocks(self) -> Iterator[List[str]]:
+        """
+        The lines read through urllib.request, which sends the request to the proxy and follows the redirects
+        """
+        request = _request.Request(self.url, headers={'Accept-Encoding': 'gzip'})
+        with _textOf(_request.urlopen(request, timeout=self.pool.timeout), self.bufferSize, self.encoding) as text:
+            while True:
+                block = text.readlines(self.bufferSize)
+                if not block:
+                    return
+                yield block
+
+    def lineBlocks(self) -> Iterator[List[str]]:
+        if self._proxied():
+            yield from self._proxiedBlocks()
+            return
+        response, connection = self.pool.request(self.url, {'Accept-Encoding': 'gzip'}, self.retries, self.backoff)
+        complete = False
+        try:
+            text = _textOf(response, self.bufferSize, self.encoding)
+            while True:
+                block = text.readlines(self.bufferSize)
+                if not block:
+                    break
+                yield block
+            complete = True
+        finally:
+            if complete and response.isclosed() and not response.will_close:
+                self.pool.release('https' if isinstance(connection, _http.HTTPSConnection) else 'http', connection)
+            else:
+                connection.close()
+
+
+class RecordSource(DataSource):
+    """
+    :Description:  An iterable of records, every record being a line or a transaction. A transaction is kept as it
+                   is, and written as its items joined by sep when lines are asked for.
+
+    :Attributes:
+
+        :param records: iterable :
+            the records
+        :param blockSize: int :
+            number of records of a block
+    """
+
+    def __init__(self, records: Iterable[Any], sep: str = '\t', blockSize: int = 10000) -> None:
+        super().__init__(sep)
+        self.records = records
+        self.blockSize = blockSize
+
+    def _blocks(self) -> Iterator[List[Any]]:
+        records = iter(self.records)
+        while True:
+            block = list(_itertools.islice(records, self.blockSize))
+            if not block:
+                return
+            yield block
+
+    def lineBlocks(self) -> Iterator[List[str]]:
+        sep = self.sep
+        for block in self._blocks():
+            yield [record if isinstance(record, str) else sep.join(map(str, record)) for record in block]
+
+    def transactions(self) -> Iterator[List[Any]]:
+        sep = self.sep
+        for block in self._blocks():
+            for record in block:
+                yield _split(record, sep) if isinstance(record, str) else list(record)
+
+
+class FrameSource(RecordSource):
+    """
+    :Description:  A DataFrame whose column holds the transactions as lists of items
+
+    :Attributes:
+
+        :param frame: DataFrame :
+            the DataFrame
+        :param column: str :
+            column of the transactions
+    """
+
+    def __init__(self, frame: Any, sep: str = '\t', column: str = 'Transactions', blockSize: int = 10000) -> None:
+        super().__init__(frame[column].tolist() if column in frame.columns else [], sep, blockSize)
+        self.frame = frame
+        self.column = column
+
+
+class ParquetSource(RecordSource):
+    """
+    :Description:  A Parquet file whose column holds the transactions as lists of items, read a row group batch at a
+                   time
+
+    :Attributes:
+
+        :param path: str :
+            name of the file
+        :param column: str :
+            column of the transactions
+    """
+
+    def __init__(self, path: str, sep: str = '\t', column: str = 'Transactions', blockSize: int = 100000) -> None:
+        super().__init__((), sep, blockSize)
+        self.path = path
+        self.column = column
+
+    def _blocks(self) -> Iterator[List[Any]]:
+        from PAMI.extras.csvParquet.csvParquet import readChunks
+        for frame in readChunks(self.path, self.blockSize, columns=[self.column]):
+            yield frame[self.column].tolist()
+
+
+def openSource(iFile: Any, sep: str = '\t', **options) -> DataSource:
+    """
+    The DataSource of an input
+
+    :param iFile: a DataSource, a URL, the name of a file or of a Parquet file, a DataFrame, or an iterable of lines
+                  or of transactions
+    :type iFile: str or DataSource or DataFrame or iterable
+    :param sep: separator of the items of a line
+    :type sep: str
+    :param options: keyword arguments of the source class, such as bufferSize, column, pool or retries
+    :return: the source
+    :rtype: DataSource
+    """
+    if isinstance(iFile, DataSource):
+        return iFile
+    if isinstance(iFile, str):
+        if _parse.urlsplit(iFile).scheme in ('http', 'https'):
+            return HTTPSource(iFile, sep, **options)
+        if iFile.lower().endswith(('.parquet', '.pq')):
+            return ParquetSource(iFile, sep, **options)
+        return FileSource(iFile, sep, **options)
+    if _isFrame(iFile):
+        return FrameSource(iFile, sep, **options)
+    return RecordSource(iFile, sep, **options)
+
+
+def transactions(iFile: Any, sep: str = '\t', **options) -> Iterator[List[str]]:
+    """
+    The transactions of an input, see openSource
+
+    :return: the items of every record
+    :rtype: generator
+    """
+    with openSource(iFile, sep, **options) as source:
+        yield from source.transactions()
+
+
+def lines(iFile: Any, sep: str = '\t', **options) -> Iterator[str]:
+    """
+    The lines of an input, see openSource
+
+    :return: every record as a line
+    :rtype: generator
+    """
+    with openSource(iFile, sep, **options) as source:
+        yield from source.lines()
@@ -6,13 +6,13 @@
 #
 #             from PAMI.extras.DF2DB import DF2DB as db
 #
-#             obj = db.DF2DB(idf, ">=", 16, "sparse/dense")
+#             obj = db.DF2DB(idf, 16, ">=", "sparse/dense")
 #
-#             obj.getTransactional("outputFileName") # To create transactional database
+#             obj.getTransactionalDatabase("outputFileName") # To create transactional database
 #
-#             obj.getTemporal("outputFileName") # To create temporal database
+#             obj.getTemporalDatabase("outputFileName") # To create temporal database
 #
-#             obj.getUtility("outputFileName") # To create utility database
+#             obj.getUtilityDatabase("outputFileName") # To create utility database
 #
 
 
@@ -34,8 +34,7 @@ Copyright (C)  2021 Rage Uday Kiran
      You should have received a copy of the GNU General Public License
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from PAMI.extras.DF2DB.DenseFormatDF import *
-from PAMI.extras.DF2DB.SparseFormatDF import *
+from PAMI.extras.DF2DB.StreamingDF2DB import StreamingDF2DB
 import sys
 
 class DF2DB:
@@ -45,14 +44,18 @@ class DF2DB:
 
     :Attributes:
 
-        :param inputDF: DataFrame :
-             It is sparse or dense DataFrame
+        :param inputDF: DataFrame or str :
+             It is sparse or dense DataFrame, or the name of a CSV or Parquet file holding one
         :param thresholdValue: int or float :
              It is threshold value of all item
         :param condition: str :
              It is condition of all item
         :param DFtype: str :
              It is DataFrame type. It should be sparse or dense. Default DF is sparse.
+        :param chunkSize: int :
+             It is the number of rows converted at a time
+        :param numWorkers: int :
+             It is the number of processes converting chunks
 
 
     **Importing this algorithm into a python program**
@@ -61,27 +64,23 @@ class DF2DB:
 
             from PAMI.extras.DF2DB import DF2DB as db
 
-            obj = db.DF2DB(idf, ">=", 16, "sparse/dense")
+            obj = db.DF2DB(idf, 16, ">=", "sparse/dense")
 
-            obj.getTransactional("outputFileName") # To create transactional database
+            obj.getTransactionalDatabase("outputFileName") # To create transactional database
 
-            obj.getTemporal("outputFileName") # To create temporal database
+            obj.getTemporalDatabase("outputFileName") # To create temporal database
 
-            obj.getUtility("outputFileName") # To create utility database
+            obj.getUtilityDatabase("outputFileName") # To create utility database
     """
 
 
-    def __init__(self, inputDF, thresholdValue, condition, DFtype='sparse') -> None:
+    def __init__(self, inputDF, thresholdValue, condition, DFtype='sparse', chunkSize=100000, numWorkers=1) -> None:
         self.inputDF = inputDF
         self.thresholdValue = thresholdValue
         self.condition = condition
         self.DFtype = DFtype.lower()
-        if DFtype == 'sparse':
-            self.DF2DB = DenseFormatDF(self.inputDF, self.condition, self.thresholdValue)
-        elif DFtype == 'dense':
-            self.DF2DB = SparseFormatDF(self.inputDF, self.condition, self.thresholdValue)
-        else:
-            raise Exception('DF type should be sparse or dense')
+        self.DF2DB = StreamingDF2DB(self.inputDF, self.condition, self.thresholdValue, self.DFtype, chunkSize=chunkSize,
+                                    numWorkers=numWorkers)
 
     def getTransactionalDatabase(self, outputFile) -> str:
         """
@@ -118,5 +117,5 @@ class DF2DB:
 
 
 if __name__ == '__main__':
-    obj = DF2DB(sys.argv[1], sys.argv[2], sys.argv[3], sys.argv[4])
+    obj = DF2DB(sys.argv[1], float(sys.argv[2]), sys.argv[3], sys.argv[4])
     obj.getTransactionalDatabase(sys.argv[5])
\ No newline at end of file
@@ -42,7 +42,10 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import operator
+import numpy as np
 from typing import Union
+from PAMI.extras.DF2DB import conversionEngine as engine
+from PAMI.extras.raggedRows import formatLines, rowSums
 
 condition_operator = {
     '<': operator.lt,
@@ -87,15 +90,20 @@ class DenseFormatDF:
             obj.getFileName("outputFileName") # To get file name of the database
     """
 
-    def __init__(self, inputDF) -> None:
+    def __init__(self, inputDF, blockCells: int = 1 << 24) -> None:
         self.inputDF = inputDF
         self.tids = []
         self.items = []
         self.outputFile = ' '
         self.items = list(self.inputDF.columns.values)
         self.tids = list(self.inputDF.index)
+        self.blockCells = blockCells
 
-    def convert2TransactionalDatabase(self, outputFile: str, condition: str, thresholdValue: Union[int, float]) -> None:
+    def _blocks(self, condition, thresholdValue, rowMultiple: int = 1):
+        return engine.cellBlocks(self.inputDF, condition, thresholdValue, self.blockCells, rowMultiple)
+
+    def convert2TransactionalDatabase(self, outputFile: str, condition: str, thresholdValue: Union[int, float],
+                                      binary: bool = False) -> None:
         """
         :Description: Create transactional data base
 
@@ -112,28 +120,28 @@ class DenseFormatDF:
              :param thresholdValue: User defined value.
 
              :type thresholdValue: Union[int, float]
+
+             :param binary: store the database as a NumPy .npz file, see conversionEngine.saveBinary
+
+             :type binary: bool
         """
 
 
         self.outputFile = outputFile
+        if condition not in condition_operator:
+            print('Condition error')
+            return
+        if binary:
+            rows, offsets, columns, values = engine.collect(self._blocks(condition, thresholdValue))
+            engine.saveBinary(outputFile, self.items, None, offsets, columns)
+            return
+        names = engine.labels(self.items)
         with open(outputFile, 'w') as f:
-            if condition not in condition_operator:
-                print('Condition error')
-            else:
-                for tid in self.tids:
-                    transaction = [item for item in self.items if
-                                   condition_operator[condition](self.inputDF.at[tid, item], thresholdValue)]
-                    if len(transaction) > 1:
-                        f.write(f'{transaction[0]}')
-                        for item in transaction[1:]:
-                            f.write(f'\t{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{transaction[0]}')
-                    else:
-                        continue
-                    f.write('\n')
-
-    def convert2TemporalDatabase(self, outputFile: str, condition: str, thresholdValue: Union[int, float]) -> None:
+            for start, stop, rows, offsets, columns, values in self._blocks(condition, thresholdValue):
+                f.write(formatLines([(names[columns], offsets)], len(rows)))
+
+    def convert2TemporalDatabase(self, outputFile: str, condition: str, thresholdValue: Union[int, float],
+                                 binary: bool = False) -> None:
         """
         :Description: Create temporal database
 
@@ -148,26 +156,25 @@ class DenseFormatDF:
         :param thresholdValue: User defined value.
 
         :type thresholdValue: Union
+
+        :param binary: store the database as a NumPy .npz file, see conversionEngine.saveBinary
+
+        :type binary: bool
         """
 
         self.outputFile = outputFile
+        if condition not in condition_operator:
+            print('Condition error')
+            return
+        tids = np.asarray(self.tids)
+        if binary:
+            rows, offsets, columns, values = engine.collect(self._blocks(condition, thresholdValue))
+            engine.saveBinary(outputFile, self.items, tids[rows] + 1, offsets, columns)
+            return
+        names = engine.labels(self.items)
         with open(outputFile, 'w') as f:
-            if condition not in condition_operator:
-                print('Condition error')
-            else:
-                for tid in self.tids:
-                    transaction = [item for item in self.items if
-                                   condition_operator[condition](self.inputDF.at[tid, item], thresholdValue)]
-                    if len(transaction) > 1:
-                        f.write(f'{tid + 1}')
-                        for item in transaction:
-                            f.write(f'\t{item}')
-                    elif len(transaction) == 1:
-                        f.write(f'{tid + 1}')
-                        f.write(f'\t{transaction[0]}')
-                    else:
-                        continue
-                    f.write('\n')
+            for start, stop, rows, offsets, columns, values in self._blocks(condition, thresholdValue):
+                f.write(formatLines([tids[rows] + 1, '\t', (names[columns], offsets)], len(rows)))
 
     def convert2MultipleTimeSeries(self, interval: int, outputFile: str, condition: str,
                                    thresholdValue: Union[int, float]) -> None:
@@ -189,65 +196,31 @@ class DenseFormatDF:
         :type thresholdValue: int or float
         """
         self.outputFile = outputFile
-        writer = open(self.outputFile, 'w+')
-        # with open(self.outputFile, 'w+') as f:
-        count = 0
-        tids = []
-        items = []
-        values = []
-        for tid in self.tids:
-            count += 1
-            transaction = [item for item in self.items if
-                           condition_operator[condition](self.inputDF.at[tid, item], thresholdValue)]
-            for i in transaction:
-                tids.append(count)
-                items.append(i)
-                values.append(self.inputDF.at[tid, i])
-            if count == interval:
-                s1, s, ss = str(), str(), str()
-                if len(values) > 0:
-
-                    for j in range(len(tids)):
-                        s1 = s1 + str(tids[j]) + '\t'
-                    for j in range(len(items)):
-                        s = s + items[j] + '\t'
-                    for j in range(len(values)):
-                        ss = ss + str(values[j]) + '\t'
-
-                s2 = s1 + ':' + s + ':' + ss
-                writer.write("%s\n" % s2)
-                tids, items, values = [], [], []
-                count = 0
+        names = engine.labels(self.items)
+        with open(self.outputFile, 'w') as writer:
+            for start, stop, rows, offsets, columns, values in self._blocks(condition, thresholdValue, interval):
+                # one line per complete interval, the entries of a line are numbered by their row in the interval
+                groups = (stop - start) // interval
+                cellRows = np.repeat(rows, np.diff(offsets)) - start
+                keep = cellRows < groups * interval
+                cellRows, columns, values = cellRows[keep], columns[keep], values[keep]
+                bounds = np.searchsorted(cellRows // interval, np.arange(groups + 1))
+                tab = np.where(np.diff(bounds) > 0, '\t', '').astype(object)
+                writer.write(formatLines([(cellRows % interval + 1, bounds), tab, ':', (names[columns], bounds), tab,
+                                         ':', (values, bounds), tab], groups))
 
     def convert2UncertainTransactional(self, outputFile: str, condition: str,
                                        thresholdValue: Union[int, float]) -> None:
         self.outputFile = outputFile
+        if condition not in condition_operator:
+            print('Condition error')
+            return
+        names = engine.labels(self.items)
         with open(outputFile, 'w') as f:
-            if condition not in condition_operator:
-                print('Condition error')
-            else:
-                for tid in self.tids:
-                    transaction = [item for item in self.items if
-                                   condition_operator[condition](self.inputDF.at[tid, item], thresholdValue)]
-                    uncertain = [self.inputDF.at[tid, item] for item in self.items if
-                                 condition_operator[condition](self.inputDF.at[tid, item], thresholdValue)]
-                    if len(transaction) > 1:
-                        f.write(f'{transaction[0]}')
-                        for item in transaction[1:]:
-                            f.write(f'\t{item}')
-                        f.write(f':')
-                        for value in uncertain:
-                            tt = 0.1 + 0.036 * abs(25 - value)
-                            tt = round(tt, 2)
-                            f.write(f'\t{tt}')
-                    elif len(transaction) == 1:
-                        f.write(f'{transaction[0]}')
-                        tt = 0.1 + 0.036 * abs(25 - uncertain[0])
-                        tt = round(tt, 2)
-                        f.write(f':{tt}')
-                    else:
-                        continue
-                    f.write('\n')
+            for start, stop, rows, offsets, columns, values in self._blocks(condition, thresholdValue):
+                probabilities = np.round(0.1 + 0.036 * np.abs(25 - values.astype(float)), 2)
+                tab = np.where(np.diff(offsets) > 1, '\t', '').astype(object)
+                f.write(formatLines([(names[columns], offsets), ':', tab, (probabilities, offsets)], len(rows)))
 
     def convert2UtilityDatabase(self, outputFile: str) -> None:
         """
@@ -261,18 +234,11 @@ class DenseFormatDF:
         """
 
         self.outputFile = outputFile
+        names = engine.labels(self.items)
         with open(self.outputFile, 'w') as f:
-            for tid in self.tids:
-                df = self.inputDF.loc[tid].dropna()
-                f.write(f'{df.index[0]}')
-                for item in df.index[1:]:
-                    f.write(f'\t{item}')
-                f.write(f':{df.sum()}:')
-                f.write(f'{df.at[df.index[0]]}')
-
-                for item in df.index[1:]:
-                    f.write(f'\t{df.at[item]}')
-                f.write('\n')
+            for start, stop, rows, offsets, columns, values in self._blocks(None, None):
+                sums = rowSums(values, offsets)
+                f.write(formatLines([(names[columns], offsets), ':', sums, ':', (values, offsets)], len(rows)))
 
     def getFileName(self) -> str:
         """
@@ -37,7 +37,8 @@ Copyright (C)  2021 Rage Uday Kiran
      You should have received a copy of the GNU General Public License
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import sys
 
 class SparseFormatDF:
@@ -0,0 +1,309 @@
+# StreamingDF2DB converts a dense or sparse CSV/Parquet file, or a DataFrame, into a database a chunk of rows at a time.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.extras.DF2DB import StreamingDF2DB as db
+#
+#             obj = db.StreamingDF2DB("sensors.csv", ">=", 16, "dense", chunkSize=100000, numWorkers=4)
+#
+#             obj.createTransactional("outputFileName") # To create transactional database
+#
+#             obj.createTemporal("outputFileName") # To create temporal database
+#
+#             obj.createUtility("outputFileName") # To create utility database
+#
+#             obj.getFileName() # To get file name of the database
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import sys
+import collections
+import multiprocessing
+import numpy as np
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from typing import Iterator, Optional, Tuple, Union
+from PAMI.extras.DF2DB import conversionEngine as engine
+from PAMI.extras.csvParquet import csvParquet as _csvParquet
+from PAMI.extras.raggedRows import formatLines, rowSums
+
+databaseTypes = ('transactional', 'temporal', 'utility')
+
+
+def _lines(kind: str, tids: np.ndarray, names: np.ndarray, offsets: np.ndarray, values: np.ndarray, sep: str) -> str:
+    """
+    Formats the transactions of a chunk
+
+    :param tids: timestamp of every transaction
+    :param names: item of every entry
+    :param offsets: the entries of transaction t are names[offsets[t]:offsets[t + 1]]
+    :param values: value of every entry
+    """
+    if kind == 'transactional':
+        fields = [(names, offsets)]
+    elif kind == 'temporal':
+        fields = [tids, sep, (names, offsets)]
+    else:
+        fields = [(names, offsets), ':', rowSums(values, offsets), ':', (values, offsets)]
+    return formatLines(fields, len(offsets) - 1, sep)
+
+
+def _convertDense(frame: 'pd.DataFrame', kind: str, condition: str, thresholdValue: Union[int, float], sep: str,
+                  indexColumn: Optional[str]) -> str:
+    """
+    Converts a chunk of a dense frame, whose rows are transactions and columns are items. Without indexColumn the
+    timestamp of a row is its index plus one, as in DenseFormatDF.
+    """
+    if indexColumn is None:
+        tids = frame.index.to_numpy() + 1
+    else:
+        tids = frame[indexColumn].to_numpy()
+        frame = frame.drop(columns=indexColumn)
+    if kind == 'utility':
+        condition, thresholdValue = None, None
+    rows, offsets, columns, values = engine.collect(engine.cellBlocks(frame, condition, thresholdValue))
+    return _lines(kind, tids[rows], engine.labels(frame.columns)[columns], offsets, values, sep)
+
+
+def _convertSparse(frame: 'pd.DataFrame', kind: str, condition: str, thresholdValue: Union[int, float],
+                   sep: str) -> str:
+    """
+    Converts a chunk of a sparse frame with columns tid, item and value, the rows of a transaction being consecutive
+    """
+    tids = frame['tid'].to_numpy()
+    items = frame['item'].to_numpy()
+    values = frame['value'].to_numpy()
+    if kind != 'utility':
+        keep = engine.conditionMask(values, condition, thresholdValue)
+        tids, items, values = tids[keep], items[keep], values[keep]
+    starts = np.flatnonzero(np.concatenate(([len(tids) > 0], tids[1:] != tids[:-1])))
+    offsets = np.append(starts, len(tids)).astype(np.int64)
+    return _lines(kind, tids[starts], engine.labels(items), offsets, values, sep)
+
+
+def _convertChunk(frame: 'pd.DataFrame', kind: str, DFtype: str, condition: str, thresholdValue: Union[int, float],
+                  sep: str, indexColumn: Optional[str]) -> str:
+    if DFtype == 'dense':
+        return _convertDense(frame, kind, condition, thresholdValue, sep, indexColumn)
+    return _convertSparse(frame, kind, condition, thresholdValue, sep)
+
+
+def numberRows(chunks: 'Iterator[pd.DataFrame]') -> 'Iterator[pd.DataFrame]':
+    """
+    Indexes the rows of the chunks of a file by their position in the file, counted from 0
+
+    :param chunks: chunks of a file, in order
+    :type chunks: iterator
+    :return: the chunks
+    :rtype: generator
+    """
+    start = 0
+    for frame in chunks:
+        frame.index = pd.RangeIndex(start, start + len(frame))
+        start += len(frame)
+        yield frame
+
+
+def completeTransactions(chunks: 'Iterator[pd.DataFrame]', column: str = 'tid') -> 'Iterator[pd.DataFrame]':
+    """
+    Moves the rows of the last transaction of every chunk to the next chunk, so that no transaction of a sparse file
+    is split over two chunks
+
+    :param chunks: chunks of a frame whose rows of a transaction are consecutive
+    :type chunks: iterator
+    :param column: column holding the transaction of every row
+    :type column: str
+    :return: the chunks, every one made of whole transactions
+    :rtype: generator
+    """
+    carry = None
+    for frame in chunks:
+        if carry is not None and len(carry):
+            frame = pd.concat([carry, frame], ignore_index=True)
+        if len(frame) == 0:
+            continue
+        tids = frame[column].to_numpy()
+        changes = np.flatnonzero(tids[1:] != tids[:-1])
+        cut = int(changes[-1]) + 1 if len(changes) else 0
+        carry = frame.iloc[cut:]
+        if cut:
+            yield frame.iloc[:cut]
+    if carry is not None and len(carry):
+        yield carry
+
+
+class StreamingDF2DB:
+    """
+    :Description:  Converts a DataFrame, or a CSV or Parquet file holding one, into a transactional, temporal or utility
+                   database without loading it whole. The input is read chunkSize rows at a time, the threshold
+                   condition is applied to every chunk with one vectorized comparison, and every converted chunk is
+                   appended to the output file, so the memory in use is bounded by the size of a few chunks. With
+                   numWorkers > 1 the chunks are converted in a process pool, at most two chunks per process being
+                   in flight, and written in order.
+
+    :Attributes:
+
+        :param inputDF: str or DataFrame :
+            name of a CSV or Parquet file, or a DataFrame
+        :param condition: str :
+            condition of the values to keep, one of <, >, <=, >=, == and !=
+        :param thresholdValue: int or float :
+            value the cells are compared with
+        :param DFtype: str :
+            dense (rows are transactions and columns are items) or sparse (columns tid, item and value, the rows of
+            a transaction being consecutive)
+        :param chunkSize: int :
+            number of rows read at a time
+        :param sep: str :
+            separator of the columns of a CSV input file
+        :param outputSep: str :
+            separator of the items in the output database
+        :param indexColumn: str :
+            column of a dense input holding the timestamps. When it is None the timestamp of a row is its
+            DataFrame index plus one, as in DenseFormatDF, and the rows of a file are numbered from 1.
+        :param numWorkers: int :
+            number of processes converting chunks
+
+    **Importing this algorithm into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras.DF2DB import StreamingDF2DB as db
+
+            obj = db.StreamingDF2DB("sensors.csv", ">=", 16, "dense", chunkSize=100000, numWorkers=4)
+
+            obj.createTransactional("outputFileName") # To create transactional database
+
+            obj.createTemporal("outputFileName") # To create temporal database
+
+            obj.createUtility("outputFileName") # To create utility database
+
+            obj.getFileName() # To get file name of the database
+    """
+
+    def __init__(self, inputDF: 'Union[str, pd.DataFrame]', condition: str, thresholdValue: Union[int, float],
+                 DFtype: str = 'dense', chunkSize: int = 100000, sep: str = ',', outputSep: str = '\t',
+                 indexColumn: Optional[str] = None, numWorkers: int = 1) -> None:
+        self.inputDF = inputDF
+        self.condition = condition
+        self.thresholdValue = thresholdValue
+        self.DFtype = DFtype.lower()
+        self.chunkSize = int(chunkSize)
+        self.sep = sep
+        self.outputSep = outputSep
+        self.indexColumn = indexColumn
+        self.numWorkers = int(numWorkers)
+        self.outputFile = ''
+        if self.DFtype not in ('dense', 'sparse'):
+            raise Exception('DF type should be sparse or dense')
+        if self.condition not in engine.conditionOperators:
+            raise ValueError('Condition error: ' + str(self.condition))
+
+    def _chunks(self) -> 'Iterator[pd.DataFrame]':
+        if isinstance(self.inputDF, pd.DataFrame):
+            frame = self.inputDF
+            if self.DFtype == 'sparse' and 'tid' not in frame.columns:
+                frame = frame.rename_axis('tid').reset_index()
+            return (frame.iloc[start:start + self.chunkSize] for start in range(0, len(frame), self.chunkSize))
+        return numberRows(_csvParquet.readChunks(self.inputDF, self.chunkSize, self.sep))
+
+    def _tasks(self, kind: str) -> Iterator[Tuple]:
+        """
+        Arguments of _convertChunk for every chunk, in order
+        """
+        chunks = self._chunks()
+        if self.DFtype == 'sparse':
+            chunks = completeTransactions(chunks)
+        for frame in chunks:
+            yield frame, kind, self.DFtype, self.condition, self.thresholdValue, self.outputSep, self.indexColumn
+
+    def convert(self, outputFile: str, kind: str = 'transactional') -> None:
+        """
+        Converts the input chunk by chunk and appends every converted chunk to outputFile
+
+        :param outputFile: name of the output database
+        :type outputFile: str
+        :param kind: transactional, temporal or utility
+        :type kind: str
+        :return: None
+        """
+        if kind not in databaseTypes:
+            raise ValueError("kind must be one of " + ", ".join(databaseTypes))
+        self.outputFile = outputFile
+        with open(outputFile, 'w') as writer:
+            if self.numWorkers <= 1:
+                for task in self._tasks(kind):
+                    writer.write(_convertChunk(*task))
+                return
+            with multiprocessing.Pool(self.numWorkers) as pool:
+                pending = collections.deque()
+                for task in self._tasks(kind):
+                    pending.append(pool.apply_async(_convertChunk, task))
+                    if len(pending) >= 2 * self.numWorkers:
+                        writer.write(pending.popleft().get())
+                while pending:
+                    writer.write(pending.popleft().get())
+
+    def createTransactional(self, outputFile: str) -> None:
+        """
+        Create transactional data base
+
+        :param outputFile: Write transactional data base into outputFile
+        :type outputFile: str
+        :return: None
+        """
+        self.convert(outputFile, 'transactional')
+
+    def createTemporal(self, outputFile: str) -> None:
+        """
+        Create temporal data base
+
+        :param outputFile: Write temporal data base into outputFile
+        :type outputFile: str
+        :return: None
+        """
+        self.convert(outputFile, 'temporal')
+
+    def createUtility(self, outputFile: str) -> None:
+        """
+        Create the utility data base, made of all the non-missing values whatever the condition
+
+        :param outputFile: Write utility data base into outputFile
+        :type outputFile: str
+        :return: None
+        """
+        self.convert(outputFile, 'utility')
+
+    def getFileName(self) -> str:
+        """
+        :return: outputFile name
+        :rtype: str
+        """
+        return self.outputFile
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 7:
+        obj = StreamingDF2DB(sys.argv[1], sys.argv[2], float(sys.argv[3]), sys.argv[4])
+        obj.convert(sys.argv[5], sys.argv[6])
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
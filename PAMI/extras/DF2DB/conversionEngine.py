@@ -0,0 +1,216 @@
+# conversionEngine applies the threshold condition of a DataFrame to a whole block of rows at once and keeps the
+# selected cells of every row as a compressed sparse row (CSR) list.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.extras.DF2DB import conversionEngine as engine
+#
+#             for start, stop, rows, offsets, columns, values in engine.cellBlocks(df, ">=", 16):
+#
+#                 print(rows, offsets, columns)
+#
+#             rows, offsets, columns, values = engine.collect(engine.cellBlocks(df, ">=", 16))
+#
+#             engine.saveBinary("database.npz", df.columns, None, offsets, columns)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import operator
+import numpy as np
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+conditionOperators = {
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+
+Block = Tuple[int, int, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def conditionMask(values: np.ndarray, condition: Union[str, Sequence[str]],
+                  threshold: Union[int, float, Sequence]) -> np.ndarray:
+    """
+    Evaluates the condition on every cell of a 2-D array at once
+
+    :param values: rows x columns array
+    :type values: numpy.ndarray
+    :param condition: one of <, >, <=, >=, == and !=, or one condition per column
+    :type condition: str or list
+    :param threshold: the value to compare the cells with, or one value per column
+    :type threshold: int or float or list
+    :return: cell (r, c) is True when values[r, c] satisfies the condition of column c
+    :rtype: numpy.ndarray
+    """
+    if isinstance(condition, str):
+        if condition not in conditionOperators:
+            raise ValueError('Condition error: ' + condition)
+        return np.asarray(conditionOperators[condition](values, np.asarray(threshold)), dtype=bool)
+    conditions = np.asarray(condition, dtype=object)
+    thresholds = np.broadcast_to(np.asarray(threshold), conditions.shape)
+    mask = np.zeros(values.shape, dtype=bool)
+    for name in set(conditions.tolist()):
+        if name not in conditionOperators:
+            raise ValueError('Condition error: ' + str(name))
+        columns = np.flatnonzero(conditions == name)
+        mask[:, columns] = np.asarray(conditionOperators[name](values[:, columns], thresholds[columns]), dtype=bool)
+    return mask
+
+
+def blockRows(numColumns: int, blockCells: int = 1 << 24, rowMultiple: int = 1) -> int:
+    """
+    :return: number of rows of a block of about blockCells cells, a multiple of rowMultiple
+    :rtype: int
+    """
+    rows = max(1, blockCells // max(1, numColumns))
+    return max(rowMultiple, rows - rows % rowMultiple)
+
+
+def maskToRows(mask: np.ndarray, values: np.ndarray, start: int = 0) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
+                                                                               np.ndarray]:
+    """
+    Selected cells of a block of rows, row after row and in column order within a row
+
+    :param mask: rows x columns selection
+    :type mask: numpy.ndarray
+    :param values: rows x columns values
+    :type values: numpy.ndarray
+    :param start: position of the first row of the block
+    :type start: int
+    :return: (positions of the rows holding a selected cell, offsets, columns, values), the cells of the r-th of these
+             rows are columns[offsets[r]:offsets[r + 1]]
+    :rtype: tuple
+    """
+    cellRows, columns = np.nonzero(mask)
+    counts = np.bincount(cellRows, minlength=mask.shape[0])
+    rows = np.flatnonzero(counts)
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(counts[rows], out=offsets[1:])
+    return rows + start, offsets, columns, values[cellRows, columns]
+
+
+def cellBlocks(frame: 'pd.DataFrame', condition: Optional[Union[str, Sequence[str]]] = None,
+               threshold: Union[int, float, Sequence] = None, blockCells: int = 1 << 24,
+               rowMultiple: int = 1) -> Iterator[Block]:
+    """
+    Selected cells of a dense DataFrame, a block of rows at a time
+
+    :param frame: rows are transactions and columns are items
+    :type frame: pandas.DataFrame
+    :param condition: condition of the cells to keep, see conditionMask. The cells that are not NaN are kept when None.
+    :type condition: str or list
+    :param threshold: the value to compare the cells with, or one value per column
+    :type threshold: int or float or list
+    :param blockCells: about the number of cells compared at once
+    :type blockCells: int
+    :param rowMultiple: the number of rows of every block but the last is a multiple of rowMultiple
+    :type rowMultiple: int
+    :return: (first row, end row, rows, offsets, columns, values) of every block, as returned by maskToRows
+    :rtype: generator
+    """
+    step = blockRows(frame.shape[1], blockCells, rowMultiple)
+    for start in range(0, len(frame), step):
+        stop = min(start + step, len(frame))
+        values = frame.iloc[start:stop].to_numpy()
+        if condition is None:
+            mask = ~pd.isna(values)
+        else:
+            mask = conditionMask(values, condition, threshold)
+        yield (start, stop) + maskToRows(mask, values, start)
+
+
+def collect(blocks: Iterator[Block]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Concatenates the blocks of cellBlocks
+
+    :return: (rows, offsets, columns, values) of the whole frame
+    :rtype: tuple
+    """
+    rows, sizes, columns, values = [], [], [], []
+    for start, stop, positions, offsets, blockColumns, blockValues in blocks:
+        rows.append(positions)
+        sizes.append(np.diff(offsets))
+        columns.append(blockColumns)
+        values.append(blockValues)
+    if not rows:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, np.zeros(1, dtype=np.int64), empty, empty
+    sizes = np.concatenate(sizes)
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    return np.concatenate(rows), offsets, np.concatenate(columns), np.concatenate(values)
+
+
+def labels(names: Sequence) -> np.ndarray:
+    """
+    :return: str(name) of every name, as an object array to index with column positions
+    :rtype: numpy.ndarray
+    """
+    return np.array([str(name) for name in names], dtype=object)
+
+
+def saveBinary(outputFile: str, items: Sequence, timestamps: Optional[np.ndarray], offsets: np.ndarray,
+               columns: np.ndarray) -> None:
+    """
+    Stores a transactional or temporal database as a NumPy .npz file instead of text: the item names, the CSR offsets,
+    the item index of every entry and, for a temporal database, the timestamp of every transaction
+
+    :param outputFile: name of the file. NumPy appends .npz when the name has another extension.
+    :type outputFile: str
+    :param items: name of every item
+    :type items: list
+    :param timestamps: timestamp of every transaction, None for a transactional database
+    :type timestamps: numpy.ndarray
+    :param offsets: the items of transaction t are columns[offsets[t]:offsets[t + 1]]
+    :type offsets: numpy.ndarray
+    :param columns: item index of every entry
+    :type columns: numpy.ndarray
+    :return: None
+    """
+    arrays = {'items': np.asarray(labels(items), dtype=str), 'offsets': np.asarray(offsets, dtype=np.int64),
+              'columns': np.asarray(columns, dtype=np.int32 if len(items) < 2 ** 31 else np.int64)}
+    if timestamps is not None:
+        arrays['timestamps'] = np.asarray(timestamps)
+    np.savez(outputFile, **arrays)
+
+
+def loadBinary(inputFile: str) -> Tuple[List[List[str]], Optional[List]]:
+    """
+    Reads a database stored by saveBinary
+
+    :param inputFile: name of the .npz file
+    :type inputFile: str
+    :return: (items of every transaction, timestamps of the transactions or None)
+    :rtype: tuple
+    """
+    with np.load(inputFile) as data:
+        names = data['items'].tolist()
+        offsets = data['offsets'].tolist()
+        columns = data['columns'].tolist()
+        timestamps = data['timestamps'].tolist() if 'timestamps' in data.files else None
+    transactions = [[names[column] for column in columns[offsets[t]:offsets[t + 1]]] for t in range(len(offsets) - 1)]
+    return transactions, timestamps
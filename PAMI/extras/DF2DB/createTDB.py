@@ -32,7 +32,8 @@ __copyright__ = """
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 
 
 class createTDB:
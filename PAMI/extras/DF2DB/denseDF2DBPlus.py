@@ -38,8 +38,11 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import sys
+from PAMI.extras.DF2DB import conversionEngine as engine
+from PAMI.extras.raggedRows import formatLines
 
 class DenseFormatDFPlus:
     """
@@ -83,6 +86,14 @@ class DenseFormatDFPlus:
         self.tids = list(self.inputDF.columns)
         self.df = pd.merge(self.inputDF, self.thresholdConditionDF, left_index=True, right_index=True)
 
+    def _blocks(self):
+        """
+        Cells of every transaction satisfying the condition and threshold of their item, a block of rows at a time
+        """
+        conditions = self.df.loc[self.items, 'condition'].tolist()
+        thresholds = self.df.loc[self.items, 'threshold'].to_numpy()
+        return engine.cellBlocks(self.inputDF.T, conditions, thresholds)
+
 
     def createTransactional(self, outputFile: str) -> None:
         """
@@ -93,24 +104,10 @@ class DenseFormatDFPlus:
         """
 
         self.outputFile = outputFile
+        names = engine.labels(self.items)
         with open(outputFile, 'w') as f:
-            for tid in self.tids:
-                transaction = [item for item in self.items if
-                               (self.df.at[item, 'condition'] == '>' and self.df.at[item, tid] > self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '>=' and self.df.at[item, tid] >= self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '<=' and self.df.at[item, tid] <= self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '<' and self.df.at[item, tid] < self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '==' and self.df.at[item, tid] == self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '!=' and self.df.at[item, tid] != self.df.at[item, 'threshold'])]
-                if len(transaction) > 1:
-                    f.write(f'{transaction[0]}')
-                    for item in transaction[1:]:
-                        f.write(f',{item}')
-                elif len(transaction) == 1:
-                    f.write(f'{transaction[0]}')
-                else:
-                    continue
-                f.write('\n')
+            for start, stop, rows, offsets, columns, values in self._blocks():
+                f.write(formatLines([(names[columns], offsets)], len(rows), ','))
 
 
 
@@ -123,25 +120,11 @@ class DenseFormatDFPlus:
         """
 
         self.outputFile = outputFile
+        names = engine.labels(self.items)
+        tids = engine.labels(self.tids)
         with open(outputFile, 'w') as f:
-            for tid in self.tids:
-                transaction = [item for item in self.items if
-                               (self.df.at[item, 'condition'] == '>' and self.df.at[item, tid] > self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '>=' and self.df.at[item, tid] >= self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '<=' and self.df.at[item, tid] <= self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '<' and self.df.at[item, tid] < self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '==' and self.df.at[item, tid] == self.df.at[item, 'threshold']) or
-                               (self.df.at[item, 'condition'] == '!=' and self.df.at[item, tid] != self.df.at[item, 'threshold'])]
-                if len(transaction) > 1:
-                    f.write(f'{tid}')
-                    for item in transaction:
-                        f.write(f',{item}')
-                elif len(transaction) == 1:
-                    f.write(f'{tid}')
-                    f.write(f',{transaction[0]}')
-                else:
-                    continue
-                f.write('\n')
+            for start, stop, rows, offsets, columns, values in self._blocks():
+                f.write(formatLines([tids[rows], ',', (names[columns], offsets)], len(rows), ','))
 
     def createUtility(self, outputFile: str) -> None:
         """
@@ -33,9 +33,10 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import sys as _sys
-import pandas as _pd
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+from PAMI import lazyImport as _lazyImport
+_pd = _lazyImport.lazyModule('pandas')
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 
 class usingBeta():
     """
@@ -137,7 +138,7 @@ class usingBeta():
                 else:
                     self._finalPatterns[x] = y
 
-    def getMISDataFrame(self) -> _pd.DataFrame:
+    def getMISDataFrame(self) -> '_pd.DataFrame':
         """
         Storing items and its respective minimum support in a dataframe
         :return: returning items and its respective minimum support in a dataframe
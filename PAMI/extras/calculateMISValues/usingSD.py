@@ -32,10 +32,11 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import sys as _sys
-import pandas as _pd
-import validators as _validators
+from PAMI import lazyImport as _lazyImport
+_pd = _lazyImport.lazyModule('pandas')
+_validators = _lazyImport.lazyModule('validators')
 import statistics as _statistics
-from urllib.request import urlopen as _urlopen
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 
 class usingSD():
     """
@@ -138,7 +139,7 @@ class usingSD():
             else:
                 self._finalPatterns[x] = y
 
-    def getDataFrame(self) -> _pd.DataFrame:
+    def getDataFrame(self) -> '_pd.DataFrame':
         """
         Storing Items and its respective calculated minimum support values in a dataframe
         :return: returning Items and its respective calculated minimum support values in a dataframe
@@ -34,9 +34,10 @@ Copyright (C)  2021 Rage Uday Kiran
 import time
 from statistics import stdev
 import sys
-import pandas as pd
-import plotly.express as px
-import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+px = _lazyImport.lazyModule('plotly.express')
+from PAMI.lazyImport import deprecated
 
 class convertMultipleTSIntoFuzzy():
     """
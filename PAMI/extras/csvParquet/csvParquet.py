@@ -13,6 +13,8 @@
 #
 #             obj.parquetFormat("FileName") # To generate file in form of sparse or dense
 #
+#             for chunk in cp.readChunks("FileName", 100000): # To read a CSV or Parquet file a chunk of rows at a time
+#
 
 
 
@@ -35,8 +37,10 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import numpy as np
+from typing import Iterator, List, Optional
 
 class csvParquet():
     """
@@ -345,3 +349,30 @@ def parquetFormat(file: str, sep: str, inputType: str, outputType: str) -> None:
             # df = pd.DataFrame([nums, vals], index=iindexes)
             # print(df)
             df.to_parquet(file, engine='pyarrow')
+
+
+def readChunks(file: str, chunkSize: int = 100000, sep: str = ',',
+               columns: Optional[List[str]] = None) -> 'Iterator[pd.DataFrame]':
+    """
+    Reads a CSV or Parquet file chunkSize rows at a time, so that only one chunk is in memory
+
+    :param file: name of the file. Files ending with .parquet or .pq are read as Parquet with pyarrow, the others as CSV.
+    :type file: str
+    :param chunkSize: number of rows of a chunk
+    :type chunkSize: int
+    :param sep: separator of the columns of a CSV file
+    :type sep: str
+    :param columns: the columns to read, all of them when None
+    :type columns: list
+    :return: the chunks, in order
+    :rtype: generator
+    """
+    if file.lower().endswith(('.parquet', '.pq')):
+        import pyarrow.parquet as pq
+        parquet = pq.ParquetFile(file)
+        for batch in parquet.iter_batches(batch_size=chunkSize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        with pd.read_csv(file, sep=sep, chunksize=chunkSize, usecols=columns) as reader:
+            for chunk in reader:
+                yield chunk
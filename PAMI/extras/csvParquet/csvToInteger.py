@@ -33,7 +33,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import numpy as np
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 
 class csvToInteger():
     """
@@ -34,11 +34,12 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import sys
-import statistics
-import validators
-from urllib.request import urlopen
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+validators = _lazyImport.lazyModule('validators')
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
+pd = _lazyImport.lazyModule('pandas')
 import PAMI.extras.graph.plotLineGraphFromDictionary as plt
+from PAMI.extras.dbStats import statsEngine
 
 class FuzzyDatabase:
     """
@@ -111,6 +112,7 @@ class FuzzyDatabase:
         self.lengthList = []
         self.utility = {}
         self.sep = sep
+        self.summary = None
 
     def run(self) -> None:
         self.readDatabase()
@@ -173,6 +175,33 @@ class FuzzyDatabase:
                 self.utility[transaction[i]] += utilities[i]
         self.lengthList = [len(s) for s in self.database.values()]
         self.utility = {k: v for k, v in sorted(self.utility.items(), key=lambda x:x[1], reverse=True)}
+        self.summary = None
+
+    def summarize(self, numWorkers: int = 1) -> None:
+        """
+        Collects the statistics in one pass over the input file without keeping its transactions, optionally
+        reading chunks of the file in numWorkers processes. The getters then answer from the collected counters.
+        Inputs that are not local files are read with readDatabase.
+
+        :param numWorkers: number of processes reading the file
+        :type numWorkers: int
+        :return: None
+        """
+        if isinstance(self.inputFile, str) and not validators.url(self.inputFile):
+            parser = statsEngine.fuzzyLine
+            self.summary = statsEngine.summarizeFile(self.inputFile, parser, self.sep, numWorkers)
+        else:
+            self.readDatabase()
+
+    def _getSummary(self) -> statsEngine.DatabaseSummary:
+        """
+        Counters of the database, collected in one pass over the transactions the first time they are needed
+        """
+        if self.summary is None:
+            self.summary = statsEngine.DatabaseSummary()
+            for transaction, utilities in zip(self.database.values(), self.utilityValues):
+                self.summary.add(transaction, values=utilities)
+        return self.summary
 
     def getDatabaseSize(self) -> int:
         """
@@ -180,7 +209,7 @@ class FuzzyDatabase:
         :return: dataset size
         :rtype: int
         """
-        return len(self.database)
+        return self._getSummary().size
 
     def getTotalNumberOfItems(self) -> int:
         """
@@ -188,7 +217,7 @@ class FuzzyDatabase:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def getMinimumTransactionLength(self) -> int:
         """
@@ -196,7 +225,7 @@ class FuzzyDatabase:
         :return: minimum transaction length
         :rtype: int
         """
-        return min(self.lengthList)
+        return min(self._getSummary().lengths)
 
     def getAverageTransactionLength(self) -> float:
         """
@@ -204,8 +233,7 @@ class FuzzyDatabase:
         :return: average transaction length
         :rtype: float
         """
-        totalLength = sum(self.lengthList)
-        return totalLength / len(self.database)
+        return statsEngine.mean(self._getSummary().lengths)
 
     def getMaximumTransactionLength(self) -> int:
         """
@@ -213,7 +241,7 @@ class FuzzyDatabase:
         :return: maximum transaction length
         :rtype: int
         """
-        return max(self.lengthList)
+        return max(self._getSummary().lengths)
 
     def getStandardDeviationTransactionLength(self) -> float:
         """
@@ -221,7 +249,7 @@ class FuzzyDatabase:
         :return: standard deviation transaction length
         :rtype: float
         """
-        return statistics.pstdev(self.lengthList)
+        return statsEngine.pstdev(self._getSummary().lengths)
 
     def getVarianceTransactionLength(self) -> float:
         """
@@ -229,7 +257,7 @@ class FuzzyDatabase:
         :return: variance transaction length
         :rtype: float
         """
-        return statistics.variance(self.lengthList)
+        return statsEngine.variance(self._getSummary().lengths)
 
     def getNumberOfItems(self) -> int:
         """
@@ -237,7 +265,7 @@ class FuzzyDatabase:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def getSparsity(self) -> float:
         # percentage of 0 dense dataframe
@@ -246,8 +274,7 @@ class FuzzyDatabase:
         :return: dataset sparsity
         :rtype: float
         """
-        matrixSize = self.getDatabaseSize()*len(self.getSortedListOfItemFrequencies())
-        return (matrixSize - sum(self.getSortedListOfItemFrequencies().values())) / matrixSize
+        return self._getSummary().sparsity()
 
     def getSortedListOfItemFrequencies(self) -> dict:
         """
@@ -255,14 +282,8 @@ class FuzzyDatabase:
         :return: item frequencies
         :rtype: dict
         """
-        itemFrequencies = {}
-        rangeFrequencies = {}
-        for tid in self.database:
-            for item in self.database[tid]:
-                itemFrequencies[item] = itemFrequencies.get(item, 0)
-                itemFrequencies[item] += 1
-        return {k: v for k, v in sorted(itemFrequencies.items(), key=lambda x:x[1], reverse=True)}
-    
+        return self._getSummary().sortedItemFrequencies()
+
     def getFrequenciesInRange(self) -> dict:
         fre = self.getSortedListOfItemFrequencies()
         rangeFrequencies = {}
@@ -283,11 +304,7 @@ class FuzzyDatabase:
         :return: transactional length
         :rtype: dict
         """
-        transactionLength = {}
-        for length in self.lengthList:
-            transactionLength[length] = transactionLength.get(length, 0)
-            transactionLength[length] += 1
-        return {k: v for k, v in sorted(transactionLength.items(), key=lambda x:x[0])}
+        return statsEngine.distribution(self._getSummary().lengths)
 
     def save(self, data: dict, outputFile: str) -> None:
         """
@@ -308,7 +325,7 @@ class FuzzyDatabase:
         :return: total utility
         :rtype: int
         """
-        return sum(list(self.utility.values()))
+        return sum(self._getSummary().itemValues.values())
 
     def getMinimumUtility(self) -> int:
         """
@@ -316,7 +333,7 @@ class FuzzyDatabase:
         :return: min utility
         :rtype: int
         """
-        return min(list(self.utility.values()))
+        return min(self._getSummary().itemValues.values())
 
     def getAverageUtility(self) -> float:
         """
@@ -324,7 +341,8 @@ class FuzzyDatabase:
         :return: average utility
         :rtype: float
         """
-        return sum(list(self.utility.values())) / len(self.utility)
+        itemValues = self._getSummary().itemValues
+        return sum(itemValues.values()) / len(itemValues)
 
     def getMaximumUtility(self) -> int:
         """
@@ -332,7 +350,7 @@ class FuzzyDatabase:
         :return: max utility
         :rtype: int
         """
-        return max(list(self.utility.values()))
+        return max(self._getSummary().itemValues.values())
 
     def getSortedUtilityValuesOfItem(self) -> dict:
         """
@@ -340,8 +358,8 @@ class FuzzyDatabase:
         :return: sorted dictionary utility value of item
         :rtype: dict
         """
-        return self.utility
-    
+        return self._getSummary().sortedItemValues()
+
     def printStats(self) -> None:
         print(f'Database size : {self.getDatabaseSize()}')
         print(f'Number of items : {self.getTotalNumberOfItems()}')
@@ -34,13 +34,14 @@ Copyright (C)  2021 Rage Uday Kiran
      You should have received a copy of the GNU General Public License
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-import statistics
-import pandas as pd
-import validators
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+validators = _lazyImport.lazyModule('validators')
 import numpy as np
-from urllib.request import urlopen
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import sys
 import PAMI.extras.graph.plotLineGraphFromDictionary as plt
+from PAMI.extras.dbStats import statsEngine
 
 
 class MultipleTimeSeriesFuzzyDatabaseStats:
@@ -118,6 +119,7 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         self.sep = sep
         self.database = {}
         self.itemFrequencies = {}
+        self.summary = None
 
     def run(self) -> None:
         self.readDatabase()
@@ -175,6 +177,33 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
                     print("File Not Found")
                     quit()
         self.lengthList = [len(s) for s in self._transactions]
+        self.summary = None
+
+    def summarize(self, numWorkers: int = 1) -> None:
+        """
+        Collects the statistics in one pass over the input file without keeping its transactions, optionally
+        reading chunks of the file in numWorkers processes. The getters then answer from the collected counters.
+        Inputs that are not local files are read with readDatabase.
+
+        :param numWorkers: number of processes reading the file
+        :type numWorkers: int
+        :return: None
+        """
+        if isinstance(self.inputFile, str) and not validators.url(self.inputFile):
+            parser = statsEngine.multipleTimeSeriesFuzzyLine
+            self.summary = statsEngine.summarizeFile(self.inputFile, parser, self.sep, numWorkers)
+        else:
+            self.readDatabase()
+
+    def _getSummary(self) -> statsEngine.DatabaseSummary:
+        """
+        Counters of the database, collected in one pass over the transactions the first time they are needed
+        """
+        if self.summary is None:
+            self.summary = statsEngine.DatabaseSummary()
+            for transaction, values in zip(self._transactions, self._fuzzyValues):
+                self.summary.add(transaction, values=values)
+        return self.summary
 
     def getDatabaseSize(self) -> int:
         """
@@ -182,7 +211,7 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: dataset size
         :rtype: int
         """
-        return len(self.database)
+        return self._getSummary().size
 
     def getTotalNumberOfItems(self) -> int:
         """
@@ -190,7 +219,7 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def getMinimumTransactionLength(self) -> int:
         """
@@ -198,7 +227,7 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: minimum transaction length
         :rtype: int
         """
-        return min(self.lengthList)
+        return min(self._getSummary().lengths)
 
     def getAverageTransactionLength(self) -> float:
         """
@@ -206,8 +235,7 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: average transaction length
         :rtype: float
         """
-        totalLength = sum(self.lengthList)
-        return totalLength / len(self.database)
+        return statsEngine.mean(self._getSummary().lengths)
 
     def getMaximumTransactionLength(self) -> int:
         """
@@ -215,7 +243,7 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: maximum transaction length
         :rtype: int
         """
-        return max(self.lengthList)
+        return max(self._getSummary().lengths)
 
     def getStandardDeviationTransactionLength(self) -> float:
         """
@@ -223,7 +251,7 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: standard deviation transaction length
         :rtype: float
         """
-        return statistics.pstdev(self.lengthList)
+        return statsEngine.pstdev(self._getSummary().lengths)
 
     def getVarianceTransactionLength(self) -> float:
         """
@@ -231,7 +259,7 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: variance transaction length
         :rtype: float
         """
-        return statistics.variance(self.lengthList)
+        return statsEngine.variance(self._getSummary().lengths)
 
     def getNumberOfItems(self) -> int:
         """
@@ -239,28 +267,16 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def convertDataIntoMatrix(self) -> np.ndarray:
-        singleItems = self.getSortedListOfItemFrequencies()
-        # big_array = np.zeros((self.getDatabaseSize(), len(self.getSortedListOfItemFrequencies())))
-        itemsets = {}
-        for i in self.database:
-            for item in singleItems:
-                if item in itemsets:
-                    if item in self.database[i]:
-                        itemsets[item].append(1)
-                    else:
-                        itemsets[item].append(0)
-                else:
-                    if item in self.database[i]:
-                        itemsets[item] = [1]
-                    else:
-                        itemsets[item] = [0]
-        # new = pd.DataFrame.from_dict(itemsets)
-        data = list(itemsets.values())
-        an_array = np.array(data)
-        return an_array
+        """
+        Dense items x transactions 0/1 matrix of the database. The sparsity and the density no longer need it.
+
+        :return: one row per item, in decreasing order of frequency
+        :rtype: numpy.ndarray
+        """
+        return statsEngine.denseMatrix(self.database.values(), list(self.getSortedListOfItemFrequencies()))
 
     def getSparsity(self) -> float:
         """
@@ -268,19 +284,15 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: database sparsity
         :rtype: float
         """
-        big_array = self.convertDataIntoMatrix()
-        n_zeros = np.count_nonzero(big_array == 0)
-        return (n_zeros / big_array.size)
+        return self._getSummary().sparsity()
 
     def getDensity(self) -> float:
         """
-        get the sparsity of database. sparsity is percentage of 0 of database.
-        :return: database sparsity
+        get the density of database. density is percentage of non-zero cells of database.
+        :return: database density
         :rtype: float
         """
-        big_array = self.convertDataIntoMatrix()
-        n_zeros = np.count_nonzero(big_array != 0)
-        return (n_zeros / big_array.size)
+        return self._getSummary().density()
 
     def getSortedListOfItemFrequencies(self) -> dict:
         """
@@ -288,20 +300,9 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: item frequencies
         :rtype: dict
         """
-        itemFrequencies = {}
-        for line in range(len(self._transactions)):
-            times = self._ts[line]
-            items = self._transactions[line]
-            quantities = self._fuzzyValues[line]
-            for i in range(0, len(items)):
-                item = items[i]
-                if item in itemFrequencies:
-                    itemFrequencies[item] += quantities[i]
-                else:
-                    itemFrequencies[item] = quantities[i]
-        self.itemFrequencies = {k: v for k, v in sorted(itemFrequencies.items(), key=lambda x: x[1], reverse=True)}
+        self.itemFrequencies = self._getSummary().sortedItemValues()
         return self.itemFrequencies
-    
+
     def getFrequenciesInRange(self) -> dict:
         fre = self.getSortedListOfItemFrequencies()
         rangeFrequencies = {}
@@ -320,11 +321,7 @@ class MultipleTimeSeriesFuzzyDatabaseStats:
         :return: transactional length
         :rtype: dict
         """
-        transactionLength = {}
-        for length in self.lengthList:
-            transactionLength[length] = transactionLength.get(length, 0)
-            transactionLength[length] += 1
-        return {k: v for k, v in sorted(transactionLength.items(), key=lambda x: x[0])}
+        return statsEngine.distribution(self._getSummary().lengths)
 
     def save(self, data: dict, outputFile: str) -> None:
         """
@@ -35,12 +35,13 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import statistics
-import validators
-from urllib.request import urlopen
+from PAMI import lazyImport as _lazyImport
+validators = _lazyImport.lazyModule('validators')
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import PAMI.extras.graph.plotLineGraphFromDictionary as plt
 import sys
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
+from PAMI.extras.dbStats import statsEngine
 
 
 class SequentialDatabase():
@@ -155,11 +156,13 @@ class SequentialDatabase():
         self.subSeqLengthList = []
         self.sep = sep
         self.database = {}
+        self.summary = None
 
     def readDatabase(self) -> None:
         """
         read sequential database from input file and store into database and size of each sequence and subsequences.
         """
+        self.summary = None
         if isinstance(self.inputFile, str):
             if validators.url(self.inputFile):
                 data = urlopen(self.inputFile)
@@ -206,13 +209,41 @@ class SequentialDatabase():
                             self.database[rowNum] = seq
 
 
+    def summarize(self, numWorkers: int = 1) -> None:
+        """
+        Collects the statistics in one pass over the input file without keeping its transactions, optionally
+        reading chunks of the file in numWorkers processes. The getters then answer from the collected counters.
+        Inputs that are not local files are read with readDatabase.
+
+        :param numWorkers: number of processes reading the file
+        :type numWorkers: int
+        :return: None
+        """
+        if isinstance(self.inputFile, str) and not validators.url(self.inputFile):
+            parser = statsEngine.sequentialLine
+            self.summary = statsEngine.summarizeFile(self.inputFile, parser, self.sep, numWorkers)
+        else:
+            self.readDatabase()
+
+    def _getSummary(self) -> statsEngine.DatabaseSummary:
+        """
+        Counters of the database, collected in one pass over the transactions the first time they are needed
+        """
+        if self.summary is None:
+            self.summary = statsEngine.DatabaseSummary()
+            for sequence in self.database.values():
+                items = [item for element in sequence for item in element]
+                elementLengths = [len(element) for element in sequence]
+                self.summary.add(items, length=len(sequence), elementLengths=elementLengths)
+        return self.summary
+
     def getDatabaseSize(self) -> int:
         """
         get the size of database
         :return: dataset size
         :rtype: int
         """
-        return len(self.database)
+        return self._getSummary().size
 
     def getTotalNumberOfItems(self) -> int:
         """
@@ -220,7 +251,7 @@ class SequentialDatabase():
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def getMinimumSequenceLength(self) -> int:
         """
@@ -228,7 +259,7 @@ class SequentialDatabase():
         :return: minimum sequence length
         :rtype: int
         """
-        return min(self.seqLengthList)
+        return min(self._getSummary().lengths)
 
     def getAverageSubsequencePerSequenceLength(self) -> float:
         """
@@ -236,19 +267,17 @@ class SequentialDatabase():
         :return: average subsequence length per sequence length
         :rtype: float
         """
-        totalLength = sum(self.seqLengthList)
-        return totalLength / len(self.database)
+        summary = self._getSummary()
+        return statsEngine.total(summary.lengths) / summary.size
 
     def getAverageItemPerSubsequenceLength(self) -> float:
-
         """
         get the average Item length per subsequence. It is sum of all item length divided by subsequence length.
         :return: average Item length per subsequence
         :rtype: float
         """
-
-        totalLength = sum(list(map(sum,self.subSeqLengthList)))
-        return totalLength / sum(self.seqLengthList)
+        summary = self._getSummary()
+        return statsEngine.total(summary.elementLengths) / statsEngine.total(summary.lengths)
 
     def getMaximumSequenceLength(self) -> int:
         """
@@ -256,7 +285,7 @@ class SequentialDatabase():
         :return: maximum sequence length
         :rtype: int
         """
-        return max(self.seqLengthList)
+        return max(self._getSummary().lengths)
 
     def getStandardDeviationSequenceLength(self) -> float:
         """
@@ -264,7 +293,7 @@ class SequentialDatabase():
         :return: standard deviation sequence length
         :rtype: float
         """
-        return statistics.pstdev(self.seqLengthList)
+        return statsEngine.pstdev(self._getSummary().lengths)
 
     def getVarianceSequenceLength(self) -> float:
         """
@@ -272,7 +301,7 @@ class SequentialDatabase():
         :return: variance Sequence length
         :rtype: float
         """
-        return statistics.variance(self.seqLengthList)
+        return statsEngine.variance(self._getSummary().lengths)
 
     def getSequenceSize(self) -> int:
         """
@@ -280,7 +309,7 @@ class SequentialDatabase():
         :return: sequences size
         :rtype: int
         """
-        return sum(self.seqLengthList)
+        return statsEngine.total(self._getSummary().lengths)
 
     def getMinimumSubsequenceLength(self) -> int:
         """
@@ -288,7 +317,7 @@ class SequentialDatabase():
         :return: minimum subsequence length
         :rtype: int
         """
-        return min(list(map(min,self.subSeqLengthList)))
+        return min(self._getSummary().elementLengths)
 
     def getAverageItemPerSequenceLength(self) -> float:
         """
@@ -296,8 +325,8 @@ class SequentialDatabase():
         :return: average item length per sequence
         :rtype: float
         """
-        totalLength = sum(list(map(sum,self.subSeqLengthList)))
-        return totalLength / len(self.database)
+        summary = self._getSummary()
+        return statsEngine.total(summary.elementLengths) / summary.size
 
     def getMaximumSubsequenceLength(self) -> int:
         """
@@ -305,7 +334,7 @@ class SequentialDatabase():
         :return: maximum subsequence length
         :rtype: int
         """
-        return max(list(map(max,self.subSeqLengthList)))
+        return max(self._getSummary().elementLengths)
 
     def getStandardDeviationSubsequenceLength(self) -> float:
         """
@@ -313,10 +342,7 @@ class SequentialDatabase():
         :return: standard deviation subsequence length
         :rtype: float
         """
-        allList=[]
-        for i in self.subSeqLengthList:
-            allList=allList+i
-        return statistics.pstdev(allList)
+        return statsEngine.pstdev(self._getSummary().elementLengths)
 
     def getVarianceSubsequenceLength(self) -> float:
         """
@@ -324,10 +350,7 @@ class SequentialDatabase():
         :return: variance subSequence length
         :rtype: float
         """
-        allList = []
-        for i in self.subSeqLengthList:
-            allList = allList + i
-        return statistics.variance(allList)
+        return statsEngine.variance(self._getSummary().elementLengths)
 
     def getSortedListOfItemFrequencies(self) -> Dict[str, int]:
         """
@@ -335,13 +358,7 @@ class SequentialDatabase():
         :return: item frequencies
         :rtype: dict
         """
-        itemFrequencies = {}
-        for seq in self.database:
-            for sub in self.database[seq]:
-                for item in sub:
-                    itemFrequencies[item] = itemFrequencies.get(item, 0)
-                    itemFrequencies[item] += 1
-        return {k: v for k, v in sorted(itemFrequencies.items(), key=lambda x: x[1], reverse=True)}
+        return self._getSummary().sortedItemFrequencies()
 
     def getFrequenciesInRange(self) -> Dict[int, int]:
         """
@@ -366,11 +383,7 @@ class SequentialDatabase():
         :return: Sequence length
         :rtype: dict
         """
-        transactionLength = {}
-        for length in self.seqLengthList:
-            transactionLength[length] = transactionLength.get(length, 0)
-            transactionLength[length] += 1
-        return {k: v for k, v in sorted(transactionLength.items(), key=lambda x: x[0])}
+        return statsEngine.distribution(self._getSummary().lengths)
 
     def getSubsequencialLengthDistribution(self) -> Dict[int, int]:
         """
@@ -378,12 +391,7 @@ class SequentialDatabase():
         :return: subSequence length
         :rtype: dict
         """
-        transactionLength = {}
-        for sublen in self.subSeqLengthList:
-            for length in sublen:
-                transactionLength[length] = transactionLength.get(length, 0)
-                transactionLength[length] += 1
-        return {k: v for k, v in sorted(transactionLength.items(), key=lambda x: x[0])}
+        return statsEngine.distribution(self._getSummary().elementLengths)
 
     def run(self) -> None:
         self.readDatabase()
@@ -35,12 +35,13 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import sys
-import statistics
-import pandas as pd
-import validators
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+validators = _lazyImport.lazyModule('validators')
 import numpy as np
-from urllib.request import urlopen
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 from typing import Dict, Union
+from PAMI.extras.dbStats import statsEngine
 
 
 class TemporalDatabase:
@@ -103,7 +104,7 @@ class TemporalDatabase:
             obj.printStats()
     """
 
-    def __init__(self, inputFile: Union[str, pd.DataFrame], sep: str = '\t') -> None:
+    def __init__(self, inputFile: 'Union[str, pd.DataFrame]', sep: str = '\t') -> None:
         """
         :param inputFile: input file name or path
         :type inputFile: str
@@ -118,6 +119,7 @@ class TemporalDatabase:
         self.periodList = []
         self.sep = sep
         self.periods = {}
+        self.summary = None
 
     def run(self) -> None:
         self.readDatabase()
@@ -148,7 +150,7 @@ class TemporalDatabase:
                     temp = [i.rstrip() for i in line.split(self.sep)]
                     temp = [x for x in temp if x]
                     self.database[numberOfTransaction] = temp[1:]
-                    self.timeStampCount[int(temp[0])] = self.timeStampCount.get(int(line[0]), 0)
+                    self.timeStampCount[int(temp[0])] = self.timeStampCount.get(int(temp[0]), 0)
                     self.timeStampCount[int(temp[0])] += 1
             else:
                 try:
@@ -160,7 +162,7 @@ class TemporalDatabase:
                             temp = [x for x in temp if x]
                             if len(temp) > 0:
                                 self.database[numberOfTransaction] = temp[1:]
-                                self.timeStampCount[int(temp[0])] = self.timeStampCount.get(int(line[0]), 0)
+                                self.timeStampCount[int(temp[0])] = self.timeStampCount.get(int(temp[0]), 0)
                                 self.timeStampCount[int(temp[0])] += 1
                 except IOError:
                     print("File Not Found")
@@ -182,6 +184,34 @@ class TemporalDatabase:
         for key in self.periods:
             self.periods[key][0] = max(self.periods[key][0], abs(len(self.database) - self.periods[key][1]))
         self.periods = {k: v[0] for k, v in self.periods.items()}
+        self.summary = None
+
+    def summarize(self, numWorkers: int = 1) -> None:
+        """
+        Collects the statistics in one pass over the input file without keeping its transactions, optionally
+        reading chunks of the file in numWorkers processes. The getters then answer from the collected counters.
+        Inputs that are not local files are read with readDatabase.
+
+        :param numWorkers: number of processes reading the file
+        :type numWorkers: int
+        :return: None
+        """
+        if isinstance(self.inputFile, str) and not validators.url(self.inputFile):
+            parser = statsEngine.temporalLine
+            self.summary = statsEngine.summarizeFile(self.inputFile, parser, self.sep, numWorkers)
+        else:
+            self.readDatabase()
+
+    def _getSummary(self) -> statsEngine.DatabaseSummary:
+        """
+        Counters of the database, collected in one pass over the transactions the first time they are needed
+        """
+        if self.summary is None:
+            self.summary = statsEngine.DatabaseSummary()
+            for position in sorted(self.database):
+                self.summary.add(self.database[position], position=position)
+            self.summary.timestamps = dict(self.timeStampCount)
+        return self.summary
 
     def getDatabaseSize(self) -> int:
         """
@@ -189,7 +219,7 @@ class TemporalDatabase:
         :return: dataset size
         :rtype: int
         """
-        return len(self.database)
+        return self._getSummary().size
 
     def getMinimumTransactionLength(self) -> int:
         """
@@ -197,7 +227,7 @@ class TemporalDatabase:
         :return: minimum transaction length
         :rtype: int
         """
-        return min(self.lengthList)
+        return min(self._getSummary().lengths)
 
     def getAverageTransactionLength(self) -> float:
         """
@@ -205,8 +235,7 @@ class TemporalDatabase:
         :return: average transaction length
         :rtype: float
         """
-        totalLength = sum(self.lengthList)
-        return totalLength / len(self.database)
+        return statsEngine.mean(self._getSummary().lengths)
 
     def getMaximumTransactionLength(self) -> int:
         """
@@ -214,7 +243,7 @@ class TemporalDatabase:
         :return: maximum transaction length
         :rtype: int
         """
-        return max(self.lengthList)
+        return max(self._getSummary().lengths)
 
     def getStandardDeviationTransactionLength(self) -> float:
         """
@@ -222,7 +251,7 @@ class TemporalDatabase:
         :return: standard deviation transaction length
         :rtype: float
         """
-        return statistics.pstdev(self.lengthList)
+        return statsEngine.pstdev(self._getSummary().lengths)
 
     def getVarianceTransactionLength(self) -> float:
         """
@@ -230,26 +259,16 @@ class TemporalDatabase:
         :return: variance transaction length
         :rtype: float
         """
-        return statistics.variance(self.lengthList)
+        return statsEngine.variance(self._getSummary().lengths)
 
     def convertDataIntoMatrix(self) -> np.ndarray:
-        singleItems = self.getSortedListOfItemFrequencies()
-        itemsets = {}
-        for tid in self.database:
-            for item in singleItems:
-                if item in itemsets:
-                    if item in self.database[tid]:
-                        itemsets[item].append(1)
-                    else:
-                        itemsets[item].append(0)
-                else:
-                    if item in self.database[tid]:
-                        itemsets[item] = [1]
-                    else:
-                        itemsets[item] = [0]
-        data = list(itemsets.values())
-        an_array = np.array(data)
-        return an_array
+        """
+        Dense items x transactions 0/1 matrix of the database. The sparsity and the density no longer need it.
+
+        :return: one row per item, in decreasing order of frequency
+        :rtype: numpy.ndarray
+        """
+        return statsEngine.denseMatrix(self.database.values(), list(self.getSortedListOfItemFrequencies()))
 
     def getSparsity(self) -> float:
         """
@@ -257,19 +276,15 @@ class TemporalDatabase:
         :return: database sparsity
         :rtype: float
         """
-        big_array = self.convertDataIntoMatrix()
-        n_zeros = np.count_nonzero(big_array == 0)
-        return (n_zeros / big_array.size)
+        return self._getSummary().sparsity()
 
     def getDensity(self) -> float:
         """
-        get the sparsity of database. sparsity is percentage of 0 of database.
-        :return: database sparsity
+        get the density of database. density is percentage of non-zero cells of database.
+        :return: database density
         :rtype: float
         """
-        big_array = self.convertDataIntoMatrix()
-        n_zeros = np.count_nonzero(big_array == 1)
-        return (1.0 - n_zeros / big_array.size)
+        return self._getSummary().density()
 
     def getTotalNumberOfItems(self) -> int:
         """
@@ -277,7 +292,7 @@ class TemporalDatabase:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def getSortedListOfItemFrequencies(self) -> Dict[str, int]:
         """
@@ -285,12 +300,7 @@ class TemporalDatabase:
         :return: item frequencies
         :rtype: dict
         """
-        itemFrequencies = {}
-        for tid in self.database:
-            for item in self.database[tid]:
-                itemFrequencies[item] = itemFrequencies.get(item, 0)
-                itemFrequencies[item] += 1
-        return {k: v for k, v in sorted(itemFrequencies.items(), key=lambda x: x[1], reverse=True)}
+        return self._getSummary().sortedItemFrequencies()
 
     def getFrequenciesInRange(self) -> Dict[int, int]:
         fre = self.getSortedListOfItemFrequencies()
@@ -306,7 +316,7 @@ class TemporalDatabase:
         return rangeFrequencies
 
     def getPeriodsInRange(self) -> Dict[int, int]:
-        fre = {k: v for k, v in sorted(self.periods.items(), key=lambda x: x[1])}
+        fre = {k: v for k, v in sorted(self._getSummary().periodsOfItems().items(), key=lambda x: x[1])}
         rangePeriods = {}
         maximum = max([i for i in fre.values()])
         values = [int(i * maximum / 6) for i in range(1, 6)]
@@ -324,11 +334,7 @@ class TemporalDatabase:
         :return: transactional length
         :rtype: dict
         """
-        transactionLength = {}
-        for length in self.lengthList:
-            transactionLength[length] = transactionLength.get(length, 0)
-            transactionLength[length] += 1
-        return {k: v for k, v in sorted(transactionLength.items(), key=lambda x: x[0])}
+        return statsEngine.distribution(self._getSummary().lengths)
 
     def save(self, data: dict, outputFile: str) -> None:
         """
@@ -349,7 +355,7 @@ class TemporalDatabase:
         :return: minimum inter arrival period
         :rtype: int
         """
-        return min(self.periodList)
+        return min(self._getSummary().interArrivalPeriods())
 
     def getAverageInterArrivalPeriod(self) -> float:
         """
@@ -357,8 +363,7 @@ class TemporalDatabase:
         :return: average inter arrival period
         :rtype: float
         """
-        totalPeriod = sum(self.periodList)
-        return totalPeriod / len(self.periodList)
+        return statsEngine.mean(self._getSummary().interArrivalPeriods())
 
     def getMaximumInterArrivalPeriod(self) -> int:
         """
@@ -366,7 +371,7 @@ class TemporalDatabase:
         :return: maximum inter arrival period
         :rtype: int
         """
-        return max(self.periodList)
+        return max(self._getSummary().interArrivalPeriods())
 
     def getMinimumPeriodOfItem(self) -> int:
         """
@@ -374,7 +379,7 @@ class TemporalDatabase:
         :return: minimum period
         :rtype: int
         """
-        return min([i for i in self.periods.values()])
+        return min(self._getSummary().periodsOfItems().values())
 
     def getAveragePeriodOfItem(self) -> float:
         """
@@ -382,7 +387,8 @@ class TemporalDatabase:
         :return: average period
         :rtype: float
         """
-        return sum([i for i in self.periods.values()]) / len(self.periods)
+        periods = self._getSummary().periodsOfItems()
+        return sum(periods.values()) / len(periods)
 
     def getMaximumPeriodOfItem(self) -> int:
         """
@@ -390,7 +396,7 @@ class TemporalDatabase:
         :return: maximum period
         :rtype: int
         """
-        return max([i for i in self.periods.values()])
+        return max(self._getSummary().periodsOfItems().values())
 
     def getStandardDeviationPeriod(self) -> float:
         """
@@ -398,7 +404,7 @@ class TemporalDatabase:
         :return: standard deviation period
         :rtype: float
         """
-        return statistics.pstdev(self.periodList)
+        return statsEngine.pstdev(self._getSummary().interArrivalPeriods())
 
     def getNumberOfTransactionsPerTimestamp(self) -> Dict[int, int]:
         """
@@ -406,8 +412,9 @@ class TemporalDatabase:
         :return: number of transactions per time stamp as dict
         :rtype: dict
         """
-        maxTS = max(list(self.timeStampCount.keys()))
-        return {ts: self.timeStampCount.get(ts, 0) for ts in range(1, maxTS + 1)}
+        timeStampCount = self._getSummary().timestamps
+        maxTS = max(list(timeStampCount.keys()))
+        return {ts: timeStampCount.get(ts, 0) for ts in range(1, maxTS + 1)}
 
     def printStats(self) -> None:
         print(f'Database size : {self.getDatabaseSize()}')
@@ -34,13 +34,14 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import sys
-import statistics
-import pandas as pd
-import validators
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+validators = _lazyImport.lazyModule('validators')
 import numpy as np
-from urllib.request import urlopen
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import PAMI.extras.graph.plotLineGraphFromDictionary as plt
+from PAMI.extras.dbStats import statsEngine
 
 
 class UncertainTemporalDatabase:
@@ -118,6 +119,7 @@ class UncertainTemporalDatabase:
         self.timeStampCount = {}
         self.periodList = []
         self.sep = sep
+        self.summary = None
 
     def run(self) -> None:
         self.readDatabase()
@@ -148,7 +150,7 @@ class UncertainTemporalDatabase:
                     temp = line.split(':')
                     temp1 = [i.rstrip() for i in temp[0].split(self.sep)]
                     self.database[numberOfTransaction] = temp[1:]
-                    self.timeStampCount[int(temp[0])] = self.timeStampCount.get(int(line[0]), 0)
+                    self.timeStampCount[int(temp[0])] = self.timeStampCount.get(int(temp[0]), 0)
                     self.timeStampCount[int(temp[0])] += 1
             else:
                 try:
@@ -160,12 +162,13 @@ class UncertainTemporalDatabase:
                             temp = [i for i in temp1[0].split(self.sep)]
                             if len(temp) > 0:
                                 self.database[numberOfTransaction] = temp[1:]
-                                self.timeStampCount[int(temp[0])] = self.timeStampCount.get(int(line[0]), 0)
+                                self.timeStampCount[int(temp[0])] = self.timeStampCount.get(int(temp[0]), 0)
                                 self.timeStampCount[int(temp[0])] += 1
                 except IOError:
                     print("File Not Found")
                     quit()
         self.lengthList = [len(s) for s in self.database.values()]
+        self.summary = None
         timeStampList = sorted(list(self.database.keys()))
         preTimeStamp = 0
         for ts in timeStampList:
@@ -184,13 +187,40 @@ class UncertainTemporalDatabase:
         #     self.periodList.append(int(ts)-preTimeStamp)
         #     preTimeStamp = ts
 
+    def summarize(self, numWorkers: int = 1) -> None:
+        """
+        Collects the statistics in one pass over the input file without keeping its transactions, optionally
+        reading chunks of the file in numWorkers processes. The getters then answer from the collected counters.
+        Inputs that are not local files are read with readDatabase.
+
+        :param numWorkers: number of processes reading the file
+        :type numWorkers: int
+        :return: None
+        """
+        if isinstance(self.inputFile, str) and not validators.url(self.inputFile):
+            parser = statsEngine.uncertainTemporalLine
+            self.summary = statsEngine.summarizeFile(self.inputFile, parser, self.sep, numWorkers)
+        else:
+            self.readDatabase()
+
+    def _getSummary(self) -> statsEngine.DatabaseSummary:
+        """
+        Counters of the database, collected in one pass over the transactions the first time they are needed
+        """
+        if self.summary is None:
+            self.summary = statsEngine.DatabaseSummary()
+            for position in sorted(self.database):
+                self.summary.add(self.database[position], position=position)
+            self.summary.timestamps = dict(self.timeStampCount)
+        return self.summary
+
     def getDatabaseSize(self) -> int:
         """
         get the size of database
         :return: dataset size
         :rtype: int
         """
-        return len(self.database)
+        return self._getSummary().size
 
     def getMinimumTransactionLength(self) -> int:
         """
@@ -198,7 +228,7 @@ class UncertainTemporalDatabase:
         :return: minimum transaction length
         :rtype: int
         """
-        return min(self.lengthList)
+        return min(self._getSummary().lengths)
 
     def getAverageTransactionLength(self) -> float:
         """
@@ -206,8 +236,7 @@ class UncertainTemporalDatabase:
         :return: average transaction length
         :rtype: float
         """
-        totalLength = sum(self.lengthList)
-        return totalLength / len(self.database)
+        return statsEngine.mean(self._getSummary().lengths)
 
     def getMaximumTransactionLength(self) -> int:
         """
@@ -215,7 +244,7 @@ class UncertainTemporalDatabase:
         :return: maximum transaction length
         :rtype: int
         """
-        return max(self.lengthList)
+        return max(self._getSummary().lengths)
 
     def getStandardDeviationTransactionLength(self) -> float:
         """
@@ -223,7 +252,7 @@ class UncertainTemporalDatabase:
         :return: standard deviation transaction length
         :rtype: float
         """
-        return statistics.pstdev(self.lengthList)
+        return statsEngine.pstdev(self._getSummary().lengths)
 
     def getVarianceTransactionLength(self) -> float:
         """
@@ -231,26 +260,16 @@ class UncertainTemporalDatabase:
         :return: variance transaction length
         :rtype: float
         """
-        return statistics.variance(self.lengthList)
+        return statsEngine.variance(self._getSummary().lengths)
 
     def convertDataIntoMatrix(self) -> np.ndarray:
-        singleItems = self.getSortedListOfItemFrequencies()
-        itemsets = {}
-        for tid in self.database:
-            for item in singleItems:
-                if item in itemsets:
-                    if item in self.database[tid]:
-                        itemsets[item].append(1)
-                    else:
-                        itemsets[item].append(0)
-                else:
-                    if item in self.database[tid]:
-                        itemsets[item] = [1]
-                    else:
-                        itemsets[item] = [0]
-        data = list(itemsets.values())
-        an_array = np.array(data)
-        return an_array
+        """
+        Dense items x transactions 0/1 matrix of the database. The sparsity and the density no longer need it.
+
+        :return: one row per item, in decreasing order of frequency
+        :rtype: numpy.ndarray
+        """
+        return statsEngine.denseMatrix(self.database.values(), list(self.getSortedListOfItemFrequencies()))
 
     def getSparsity(self) -> float:
         """
@@ -258,19 +277,15 @@ class UncertainTemporalDatabase:
         :return: database sparsity
         :rtype: float
         """
-        big_array = self.convertDataIntoMatrix()
-        n_zeros = np.count_nonzero(big_array == 0)
-        return (n_zeros / big_array.size)
+        return self._getSummary().sparsity()
 
     def getDensity(self) -> float:
         """
-        get the sparsity of database. sparsity is percentage of 0 of database.
-        :return: database sparsity
+        get the density of database. density is percentage of non-zero cells of database.
+        :return: database density
         :rtype: float
         """
-        big_array = self.convertDataIntoMatrix()
-        n_zeros = np.count_nonzero(big_array == 1)
-        return (1.0 - n_zeros / big_array.size)
+        return self._getSummary().density()
 
     def getTotalNumberOfItems(self) -> int:
         """
@@ -278,7 +293,7 @@ class UncertainTemporalDatabase:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def getSortedListOfItemFrequencies(self) -> dict:
         """
@@ -286,13 +301,8 @@ class UncertainTemporalDatabase:
         :return: item frequencies
         :rtype: dict
         """
-        itemFrequencies = {}
-        for tid in self.database:
-            for item in self.database[tid]:
-                itemFrequencies[item] = itemFrequencies.get(item, 0)
-                itemFrequencies[item] += 1
-        return {k: v for k, v in sorted(itemFrequencies.items(), key=lambda x: x[1], reverse=True)}
-    
+        return self._getSummary().sortedItemFrequencies()
+
     def getFrequenciesInRange(self) -> dict:
         fre = self.getSortedListOfItemFrequencies()
         rangeFrequencies = {}
@@ -313,11 +323,7 @@ class UncertainTemporalDatabase:
         :return: transactional length
         :rtype: dict
         """
-        transactionLength = {}
-        for length in self.lengthList:
-            transactionLength[length] = transactionLength.get(length, 0)
-            transactionLength[length] += 1
-        return {k: v for k, v in sorted(transactionLength.items(), key=lambda x: x[0])}
+        return statsEngine.distribution(self._getSummary().lengths)
 
     def save(self, data: dict, outputFile: str) -> None:
         """
@@ -338,7 +344,7 @@ class UncertainTemporalDatabase:
         :return: minimum period
         :rtype: int
         """
-        return min(self.periodList)
+        return min(self._getSummary().interArrivalPeriods())
 
     def getAveragePeriod(self) -> float:
         """
@@ -346,8 +352,7 @@ class UncertainTemporalDatabase:
         :return: average period
         :rtype: float
         """
-        totalPeriod = sum(self.periodList)
-        return totalPeriod / len(self.periodList)
+        return statsEngine.mean(self._getSummary().interArrivalPeriods())
 
     def getMaximumPeriod(self) -> int:
         """
@@ -355,7 +360,7 @@ class UncertainTemporalDatabase:
         :return: maximum period
         :rtype: int
         """
-        return max(self.periodList)
+        return max(self._getSummary().interArrivalPeriods())
 
     def getStandardDeviationPeriod(self) -> float:
         """
@@ -363,7 +368,7 @@ class UncertainTemporalDatabase:
         :return: standard deviation period
         :rtype: float
         """
-        return statistics.pstdev(self.periodList)
+        return statsEngine.pstdev(self._getSummary().interArrivalPeriods())
 
     def getNumberOfTransactionsPerTimestamp(self) -> dict:
         """
@@ -371,9 +376,10 @@ class UncertainTemporalDatabase:
         :return: number of transactions per time stamp as dict
         :rtype: float
         """
-        maxTS = max(list(self.timeStampCount.keys()))
-        return {ts: self.timeStampCount.get(ts, 0) for ts in range(1, maxTS + 1)}
-   
+        timeStampCount = self._getSummary().timestamps
+        maxTS = max(list(timeStampCount.keys()))
+        return {ts: timeStampCount.get(ts, 0) for ts in range(1, maxTS + 1)}
+
     def printStats(self) -> None:
         print(f'Database size : {self.getDatabaseSize()}')
         print(f'Number of items : {self.getTotalNumberOfItems()}')
@@ -34,13 +34,14 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import sys
-import statistics
-import pandas as pd
-import validators
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+validators = _lazyImport.lazyModule('validators')
 import numpy as np
-from urllib.request import urlopen
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import PAMI.extras.graph.plotLineGraphFromDictionary as plt
+from PAMI.extras.dbStats import statsEngine
 
 class UncertainTransactionalDatabase:
     """
@@ -108,6 +109,7 @@ class UncertainTransactionalDatabase:
         self.lengthList = []
         self.sep = sep
         self.database = {}
+        self.summary = None
 
     def run(self) -> None:
         self.readDatabase()
@@ -150,6 +152,33 @@ class UncertainTransactionalDatabase:
                     print("File Not Found")
                     quit()
         self.lengthList = [len(s) for s in self.database.values()]
+        self.summary = None
+
+    def summarize(self, numWorkers: int = 1) -> None:
+        """
+        Collects the statistics in one pass over the input file without keeping its transactions, optionally
+        reading chunks of the file in numWorkers processes. The getters then answer from the collected counters.
+        Inputs that are not local files are read with readDatabase.
+
+        :param numWorkers: number of processes reading the file
+        :type numWorkers: int
+        :return: None
+        """
+        if isinstance(self.inputFile, str) and not validators.url(self.inputFile):
+            parser = statsEngine.uncertainTransactionalLine
+            self.summary = statsEngine.summarizeFile(self.inputFile, parser, self.sep, numWorkers)
+        else:
+            self.readDatabase()
+
+    def _getSummary(self) -> statsEngine.DatabaseSummary:
+        """
+        Counters of the database, collected in one pass over the transactions the first time they are needed
+        """
+        if self.summary is None:
+            self.summary = statsEngine.DatabaseSummary()
+            for transaction in self.database.values():
+                self.summary.add(transaction)
+        return self.summary
 
     def getDatabaseSize(self) -> int:
         """
@@ -157,7 +186,7 @@ class UncertainTransactionalDatabase:
         :return: dataset size
         :rtype: int
         """
-        return len(self.database)
+        return self._getSummary().size
 
     def getTotalNumberOfItems(self) -> int:
         """
@@ -165,7 +194,7 @@ class UncertainTransactionalDatabase:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def getMinimumTransactionLength(self) -> int:
         """
@@ -173,7 +202,7 @@ class UncertainTransactionalDatabase:
         :return: minimum transaction length
         :rtype: int
         """
-        return min(self.lengthList)
+        return min(self._getSummary().lengths)
 
     def getAverageTransactionLength(self) -> float:
         """
@@ -181,8 +210,7 @@ class UncertainTransactionalDatabase:
         :return: average transaction length
         :rtype: float
         """
-        totalLength = sum(self.lengthList)
-        return totalLength / len(self.database)
+        return statsEngine.mean(self._getSummary().lengths)
 
     def getMaximumTransactionLength(self) -> int:
         """
@@ -190,7 +218,7 @@ class UncertainTransactionalDatabase:
         :return: maximum transaction length
         :rtype: int
         """
-        return max(self.lengthList)
+        return max(self._getSummary().lengths)
 
     def getStandardDeviationTransactionLength(self) -> float:
         """
@@ -198,7 +226,7 @@ class UncertainTransactionalDatabase:
         :return: standard deviation transaction length
         :rtype: float
         """
-        return statistics.pstdev(self.lengthList)
+        return statsEngine.pstdev(self._getSummary().lengths)
 
     def getVarianceTransactionLength(self) -> float:
         """
@@ -206,7 +234,7 @@ class UncertainTransactionalDatabase:
         :return: variance transaction length
         :rtype: float
         """
-        return statistics.variance(self.lengthList)
+        return statsEngine.variance(self._getSummary().lengths)
 
     def getNumberOfItems(self) -> int:
         """
@@ -214,28 +242,16 @@ class UncertainTransactionalDatabase:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def convertDataIntoMatrix(self) -> np.ndarray:
-        singleItems = self.getSortedListOfItemFrequencies()
-        # big_array = np.zeros((self.getDatabaseSize(), len(self.getSortedListOfItemFrequencies())))
-        itemsets = {}
-        for i in self.database:
-            for item in singleItems:
-                if item in itemsets:
-                    if item in self.database[i]:
-                        itemsets[item].append(1)
-                    else:
-                        itemsets[item].append(0)
-                else:
-                    if item in self.database[i]:
-                        itemsets[item] = [1]
-                    else:
-                        itemsets[item] = [0]
-        # new = pd.DataFrame.from_dict(itemsets)
-        data = list(itemsets.values())
-        an_array = np.array(data)
-        return an_array
+        """
+        Dense items x transactions 0/1 matrix of the database. The sparsity and the density no longer need it.
+
+        :return: one row per item, in decreasing order of frequency
+        :rtype: numpy.ndarray
+        """
+        return statsEngine.denseMatrix(self.database.values(), list(self.getSortedListOfItemFrequencies()))
 
     def getSparsity(self) -> float:
         """
@@ -243,19 +259,15 @@ class UncertainTransactionalDatabase:
         :return: database sparsity
         :rtype: float
         """
-        big_array = self.convertDataIntoMatrix()
-        n_zeros = np.count_nonzero(big_array == 0)
-        return (n_zeros / big_array.size)
+        return self._getSummary().sparsity()
 
     def getDensity(self) -> float:
         """
-        get the sparsity of database. sparsity is percentage of 0 of database.
-        :return: database sparsity
+        get the density of database. density is percentage of non-zero cells of database.
+        :return: database density
         :rtype: float
         """
-        big_array = self.convertDataIntoMatrix()
-        n_zeros = np.count_nonzero(big_array != 0)
-        return (n_zeros / big_array.size)
+        return self._getSummary().density()
 
     def getSortedListOfItemFrequencies(self) -> dict:
         """
@@ -263,12 +275,7 @@ class UncertainTransactionalDatabase:
         :return: item frequencies
         :rtype: dict
         """
-        itemFrequencies = {}
-        for tid in self.database:
-            for item in self.database[tid]:
-                itemFrequencies[item] = itemFrequencies.get(item, 0)
-                itemFrequencies[item] += 1
-        return {k: v for k, v in sorted(itemFrequencies.items(), key=lambda x: x[1], reverse=True)}
+        return self._getSummary().sortedItemFrequencies()
 
     def getFrequenciesInRange(self) -> dict:
         fre = self.getSortedListOfItemFrequencies()
@@ -288,11 +295,7 @@ class UncertainTransactionalDatabase:
         :return: transactional length
         :rtype: dict
         """
-        transactionLength = {}
-        for length in self.lengthList:
-            transactionLength[length] = transactionLength.get(length, 0)
-            transactionLength[length] += 1
-        return {k: v for k, v in sorted(transactionLength.items(), key=lambda x: x[0])}
+        return statsEngine.distribution(self._getSummary().lengths)
 
     def save(self, data: dict, outputFile: str) -> None:
         """
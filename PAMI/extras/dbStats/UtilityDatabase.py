@@ -35,10 +35,11 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import sys
-import statistics
-from urllib.request import urlopen
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
+pd = _lazyImport.lazyModule('pandas')
 from typing import Union
+from PAMI.extras.dbStats import statsEngine
 
 class UtilityDatabase:
     """
@@ -67,7 +68,7 @@ class UtilityDatabase:
 
     """
 
-    def __init__(self, inputFile: Union[str, pd.DataFrame], sep: str='\t') -> None:
+    def __init__(self, inputFile: 'Union[str, pd.DataFrame]', sep: str='\t') -> None:
         """
         :param inputFile: input file name or path
         :type inputFile: str
@@ -80,6 +81,7 @@ class UtilityDatabase:
         self.lengthList = []
         self.utility = {}
         self.sep = sep
+        self.summary = None
 
     def run(self) -> None:
         self.readDatabase()
@@ -142,6 +144,33 @@ class UtilityDatabase:
                 self.utility[transaction[i]] += utilities[i]
         self.lengthList = [len(s) for s in self.database.values()]
         self.utility = {k: v for k, v in sorted(self.utility.items(), key=lambda x:x[1], reverse=True)}
+        self.summary = None
+
+    def summarize(self, numWorkers: int = 1) -> None:
+        """
+        Collects the statistics in one pass over the input file without keeping its transactions, optionally
+        reading chunks of the file in numWorkers processes. The getters then answer from the collected counters.
+        Inputs that are not local files are read with readDatabase.
+
+        :param numWorkers: number of processes reading the file
+        :type numWorkers: int
+        :return: None
+        """
+        if isinstance(self.inputFile, str) and not self.inputFile.startswith(("http://", "https://")):
+            parser = statsEngine.utilityLine
+            self.summary = statsEngine.summarizeFile(self.inputFile, parser, self.sep, numWorkers)
+        else:
+            self.readDatabase()
+
+    def _getSummary(self) -> statsEngine.DatabaseSummary:
+        """
+        Counters of the database, collected in one pass over the transactions the first time they are needed
+        """
+        if self.summary is None:
+            self.summary = statsEngine.DatabaseSummary()
+            for transaction, utilities in zip(self.database.values(), self.utilityValues):
+                self.summary.add(transaction, values=utilities)
+        return self.summary
 
     def getDatabaseSize(self) -> int:
         """
@@ -149,7 +178,7 @@ class UtilityDatabase:
         :return: size of database
         :rtype: int
         """
-        return len(self.database)
+        return self._getSummary().size
 
     def getTotalNumberOfItems(self) -> int:
         """
@@ -157,7 +186,7 @@ class UtilityDatabase:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def getMinimumTransactionLength(self) -> int:
         """
@@ -165,7 +194,7 @@ class UtilityDatabase:
         :return: minimum transaction length
         :rtype: int
         """
-        return min(self.lengthList)
+        return min(self._getSummary().lengths)
 
     def getAverageTransactionLength(self) -> float:
         """
@@ -173,8 +202,7 @@ class UtilityDatabase:
         :return: average transaction length
         :rtype: float
         """
-        totalLength = sum(self.lengthList)
-        return totalLength / len(self.database)
+        return statsEngine.mean(self._getSummary().lengths)
 
     def getMaximumTransactionLength(self) -> int:
         """
@@ -182,7 +210,7 @@ class UtilityDatabase:
         :return: maximum transaction length
         :rtype: int
         """
-        return max(self.lengthList)
+        return max(self._getSummary().lengths)
 
     def getStandardDeviationTransactionLength(self) -> float:
         """
@@ -190,7 +218,7 @@ class UtilityDatabase:
         :return: standard deviation transaction length
         :rtype: float
         """
-        return statistics.pstdev(self.lengthList)
+        return statsEngine.pstdev(self._getSummary().lengths)
 
     def getVarianceTransactionLength(self) -> float:
         """
@@ -198,7 +226,7 @@ class UtilityDatabase:
         :return: variance transaction length
         :rtype: float
         """
-        return statistics.variance(self.lengthList)
+        return statsEngine.variance(self._getSummary().lengths)
 
     def getNumberOfItems(self) -> int:
         """
@@ -206,7 +234,7 @@ class UtilityDatabase:
         :return: number of items
         :rtype: int
         """
-        return len(self.getSortedListOfItemFrequencies())
+        return self._getSummary().numberOfItems()
 
     def getSparsity(self) -> float:
         # percentage of 0 dense dataframe
@@ -215,8 +243,7 @@ class UtilityDatabase:
         :return: sparsity of database in floating values
         :rtype: float
         """
-        matrixSize = self.getDatabaseSize()*len(self.getSortedListOfItemFrequencies())
-        return (matrixSize - sum(self.getSortedListOfItemFrequencies().values())) / matrixSize
+        return self._getSummary().sparsity()
 
     def getSortedListOfItemFrequencies(self) -> dict:
         """
@@ -224,13 +251,8 @@ class UtilityDatabase:
         :return: item frequencies
         :rtype: dict
         """
-        itemFrequencies = {}
-        for tid in self.database:
-            for item in self.database[tid]:
-                itemFrequencies[item] = itemFrequencies.get(item, 0)
-                itemFrequencies[item] += 1
-        return {k: v for k, v in sorted(itemFrequencies.items(), key=lambda x:x[1], reverse=True)}
-    
+        return self._getSummary().sortedItemFrequencies()
+
     def getFrequenciesInRange(self) -> dict:
         """
         This function is used to get the Frequencies in range
@@ -256,11 +278,7 @@ class UtilityDatabase:
         :return: a dictionary of Transaction Length Distribution
         :rtype: dict
         """
-        transactionLength = {}
-        for length in self.lengthList:
-            transactionLength[length] = transactionLength.get(length, 0)
-            transactionLength[length] += 1
-        return {k: v for k, v in sorted(transactionLength.items(), key=lambda x:x[0])}
+        return statsEngine.distribution(self._getSummary().lengths)
 
     def save(self, data, outputFile) -> None:
         """
@@ -281,7 +299,7 @@ class UtilityDatabase:
         :return: total utility
         :rtype: int
         """
-        return sum(list(self.utility.values()))
+        return sum(self._getSummary().itemValues.values())
 
     def getMinimumUtility(self) -> int:
         """
@@ -289,7 +307,7 @@ class UtilityDatabase:
         :return: integer value of minimum utility
         :rtype: int
         """
-        return min(list(self.utility.values()))
+        return min(self._getSummary().itemValues.values())
 
     def getAverageUtility(self) -> float:
         """
@@ -297,7 +315,8 @@ class UtilityDatabase:
         :return: average utility
         :rtype: float
         """
-        return sum(list(self.utility.values())) / len(self.utility)
+        itemValues = self._getSummary().itemValues
+        return sum(itemValues.values()) / len(itemValues)
 
     def getMaximumUtility(self) -> int:
         """
@@ -305,7 +324,7 @@ class UtilityDatabase:
         :return: integer value of maximum utility
         :rtype: int
         """
-        return max(list(self.utility.values()))
+        return max(self._getSummary().itemValues.values())
 
     def getSortedUtilityValuesOfItem(self) -> dict:
         """
@@ -313,8 +332,8 @@ class UtilityDatabase:
         :return: sorted dictionary utility value of item
         :rtype: dict
         """
-        return self.utility
-    
+        return self._getSummary().sortedItemValues()
+
     def printStats(self) -> None:
 
         """
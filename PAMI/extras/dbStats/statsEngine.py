@@ -0,0 +1,465 @@
+# statsEngine collects the statistics of a database in a single pass, without building an items x transactions matrix.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.extras.dbStats import statsEngine
+#
+#             summary = statsEngine.summarizeFile(iFile, statsEngine.transactionalLine, "\t", numWorkers=4)
+#
+#             print(summary.size, summary.sparsity(), statsEngine.mean(summary.lengths))
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import math
+import statistics
+import multiprocessing
+import numpy as np
+from fractions import Fraction
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class DatabaseSummary:
+    """
+    :Description:  Counters describing a database, filled one transaction at a time. Two summaries of consecutive
+                   parts of a file can be merged, so a file can be summarized in chunks by several processes.
+
+    :Attributes:
+
+        size : int
+            number of transactions
+        lengths : dict
+            number of transactions of every length
+        itemCounts : dict
+            number of occurrences of every item, in order of first appearance
+        cells : int
+            number of distinct (transaction, item) pairs, i.e. the non-zero cells of the items x transactions matrix
+        itemValues : dict
+            sum of the values (utility, fuzzy value, ...) of every item
+        timestamps : dict
+            number of transactions of every timestamp
+        gaps : dict
+            number of times every gap between the positions of consecutive transactions occurs
+        itemPeriods : dict
+            first position, last position and largest gap between consecutive positions of every item
+        elementLengths : dict
+            number of elements of every length, for sequences
+    """
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.lengths = {}
+        self.itemCounts = {}
+        self.cells = 0
+        self.itemValues = {}
+        self.timestamps = {}
+        self.gaps = {}
+        self.itemPeriods = {}
+        self.elementLengths = {}
+        self.firstPosition = None
+        self.lastPosition = None
+
+    def add(self, items: list, position: Optional[int] = None, timestamp: Optional[int] = None,
+            values: Optional[list] = None, length: Optional[int] = None,
+            elementLengths: Optional[List[int]] = None) -> None:
+        """
+        Adds one transaction
+
+        :param items: items of the transaction
+        :type items: list
+        :param position: position of the transaction, used for the gaps and the item periods
+        :type position: int
+        :param timestamp: timestamp of the transaction
+        :type timestamp: int
+        :param values: value of every item of the transaction
+        :type values: list
+        :param length: length of the transaction when it is not the number of items
+        :type length: int
+        :param elementLengths: lengths of the elements of a sequence
+        :type elementLengths: list
+        """
+        self.size += 1
+        length = len(items) if length is None else length
+        self.lengths[length] = self.lengths.get(length, 0) + 1
+        for item in items:
+            self.itemCounts[item] = self.itemCounts.get(item, 0) + 1
+        distinct = set(items)
+        self.cells += len(distinct)
+        if values is not None:
+            for item, value in zip(items, values):
+                self.itemValues[item] = self.itemValues.get(item, 0) + value
+        if timestamp is not None:
+            self.timestamps[timestamp] = self.timestamps.get(timestamp, 0) + 1
+        if elementLengths is not None:
+            for elementLength in elementLengths:
+                self.elementLengths[elementLength] = self.elementLengths.get(elementLength, 0) + 1
+        if position is not None:
+            if self.lastPosition is None:
+                self.firstPosition = position
+            else:
+                gap = position - self.lastPosition
+                self.gaps[gap] = self.gaps.get(gap, 0) + 1
+            self.lastPosition = position
+            for item in distinct:
+                period = self.itemPeriods.get(item)
+                if period is None:
+                    self.itemPeriods[item] = [position, position, 0]
+                else:
+                    period[2] = max(period[2], position - period[1])
+                    period[1] = position
+
+    def merge(self, other: 'DatabaseSummary', offset: int = 0) -> None:
+        """
+        Adds the transactions of a summary of the part of the database that follows this one
+
+        :param other: summary of the next part
+        :type other: DatabaseSummary
+        :param offset: amount added to the positions of other
+        :type offset: int
+        """
+        self.size += other.size
+        self.cells += other.cells
+        for mine, theirs in ((self.lengths, other.lengths), (self.itemCounts, other.itemCounts),
+                             (self.itemValues, other.itemValues), (self.timestamps, other.timestamps),
+                             (self.gaps, other.gaps), (self.elementLengths, other.elementLengths)):
+            for key, value in theirs.items():
+                mine[key] = mine.get(key, 0) + value
+        if other.firstPosition is None:
+            return
+        if self.lastPosition is None:
+            self.firstPosition = other.firstPosition + offset
+        else:
+            gap = other.firstPosition + offset - self.lastPosition
+            self.gaps[gap] = self.gaps.get(gap, 0) + 1
+        self.lastPosition = other.lastPosition + offset
+        for item, (first, last, gap) in other.itemPeriods.items():
+            period = self.itemPeriods.get(item)
+            if period is None:
+                self.itemPeriods[item] = [first + offset, last + offset, gap]
+            else:
+                period[2] = max(period[2], gap, first + offset - period[1])
+                period[1] = last + offset
+
+    def numberOfItems(self) -> int:
+        return len(self.itemCounts)
+
+    def sortedItemFrequencies(self) -> Dict[str, int]:
+        """
+        :return: number of occurrences of every item, most frequent first
+        :rtype: dict
+        """
+        return dict(sorted(self.itemCounts.items(), key=lambda x: x[1], reverse=True))
+
+    def sortedItemValues(self) -> Dict[str, float]:
+        """
+        :return: sum of the values of every item, largest first
+        :rtype: dict
+        """
+        return dict(sorted(self.itemValues.items(), key=lambda x: x[1], reverse=True))
+
+    def sparsity(self) -> float:
+        """
+        :return: fraction of zero cells of the items x transactions matrix
+        :rtype: float
+        """
+        matrixSize = self.size * self.numberOfItems()
+        return (matrixSize - self.cells) / matrixSize
+
+    def density(self) -> float:
+        """
+        :return: fraction of non-zero cells of the items x transactions matrix
+        :rtype: float
+        """
+        return self.cells / (self.size * self.numberOfItems())
+
+    def interArrivalPeriods(self) -> Dict[int, int]:
+        """
+        :return: number of times every gap occurs between consecutive positions, the first gap counted from 0
+        :rtype: dict
+        """
+        gaps = dict(self.gaps)
+        if self.firstPosition is not None:
+            gaps[self.firstPosition] = gaps.get(self.firstPosition, 0) + 1
+        return gaps
+
+    def periodsOfItems(self, last: Optional[int] = None) -> Dict[str, int]:
+        """
+        :param last: end of the database, the number of transactions by default
+        :type last: int
+        :return: largest gap of every item, counting the gaps from 0 to its first position and from its last position
+                 to the end of the database
+        :rtype: dict
+        """
+        last = self.size if last is None else last
+        return {item: max(first, gap, abs(last - final)) for item, (first, final, gap) in self.itemPeriods.items()}
+
+
+def total(histogram: Dict[int, int]) -> int:
+    """
+    :param histogram: number of occurrences of every value
+    :type histogram: dict
+    :return: sum of the values
+    :rtype: int
+    """
+    return sum(value * count for value, count in histogram.items())
+
+
+def mean(histogram: Dict[int, int]) -> float:
+    return total(histogram) / sum(histogram.values())
+
+
+def _sumOfSquares(histogram: Dict[int, int]) -> Tuple[int, Fraction]:
+    count = sum(histogram.values())
+    average = Fraction(total(histogram), count)
+    return count, sum(count * (value - average) ** 2 for value, count in histogram.items())
+
+
+def pstdev(histogram: Dict[int, int]) -> float:
+    """
+    :return: population standard deviation of the values, as statistics.pstdev of the expanded list
+    :rtype: float
+    """
+    count, squares = _sumOfSquares(histogram)
+    if count < 1:
+        raise statistics.StatisticsError('pstdev requires at least one data point')
+    return math.sqrt(squares / count)
+
+
+def variance(histogram: Dict[int, int]) -> float:
+    """
+    :return: sample variance of the values, as statistics.variance of the expanded list
+    :rtype: float
+    """
+    count, squares = _sumOfSquares(histogram)
+    if count < 2:
+        raise statistics.StatisticsError('variance requires at least two data points')
+    return float(squares / (count - 1))
+
+
+def distribution(histogram: Dict[int, int]) -> Dict[int, int]:
+    """
+    :return: the histogram in increasing order of value
+    :rtype: dict
+    """
+    return dict(sorted(histogram.items(), key=lambda x: x[0]))
+
+
+def denseMatrix(transactions, items: list) -> np.ndarray:
+    """
+    Dense items x transactions 0/1 matrix. Its size is the number of items times the number of transactions, so the
+    statistics themselves are computed from a DatabaseSummary instead.
+
+    :param transactions: items of every transaction
+    :type transactions: iterable
+    :param items: the items, one row each
+    :type items: list
+    :return: cell (i, t) is 1 when transaction t holds items[i]
+    :rtype: numpy.ndarray
+    """
+    transactions = list(transactions)
+    index = {item: i for i, item in enumerate(items)}
+    rows, columns = [], []
+    for column, transaction in enumerate(transactions):
+        for item in transaction:
+            if item in index:
+                rows.append(index[item])
+                columns.append(column)
+    matrix = np.zeros((len(items), len(transactions)), dtype=int)
+    matrix[rows, columns] = 1
+    return matrix
+
+
+Record = Optional[dict]
+
+
+def transactionalLine(line: str, sep: str) -> Record:
+    """
+    Parses one line of a transactional database
+    """
+    items = [x for x in (i.rstrip() for i in line.split(sep)) if x]
+    return {'items': items}
+
+
+def temporalLine(line: str, sep: str) -> Record:
+    """
+    Parses one line of a temporal database, whose first field is the timestamp
+    """
+    temp = [x for x in (i.rstrip() for i in line.split(sep)) if x]
+    if not temp:
+        return None
+    return {'items': temp[1:], 'timestamp': int(temp[0])}
+
+
+def uncertainTransactionalLine(line: str, sep: str) -> Record:
+    """
+    Parses one line of an uncertain transactional database, items:probabilities
+    """
+    return {'items': line.strip().split(':')[0].split(sep)}
+
+
+def uncertainTemporalLine(line: str, sep: str) -> Record:
+    """
+    Parses one line of an uncertain temporal database, timestamp and items:probabilities
+    """
+    temp = line.strip().split(':')[0].split(sep)
+    return {'items': temp[1:], 'timestamp': int(temp[0])}
+
+
+def utilityLine(line: str, sep: str) -> Record:
+    """
+    Parses one line of a utility database, items:transaction utility:item utilities
+    """
+    temp = [i.rstrip() for i in line.split(':')]
+    items = [x for x in temp[0].split(sep) if x]
+    values = [x for x in (int(s) for s in temp[2].split(sep)) if x]
+    return {'items': items, 'values': values}
+
+
+def fuzzyLine(line: str, sep: str) -> Record:
+    """
+    Parses one line of a fuzzy database, items:fuzzy values
+    """
+    temp = [i.rstrip() for i in line.split(':')]
+    items = [x for x in temp[0].split(sep) if x]
+    values = [x for x in (int(s) for s in temp[1].split(sep)) if x]
+    return {'items': items, 'values': values}
+
+
+def multipleTimeSeriesFuzzyLine(line: str, sep: str) -> Record:
+    """
+    Parses one line of a multiple time series fuzzy database, timestamps:items:fuzzy values. Every item becomes
+    (timestamp,item).
+    """
+    parts = line.strip().split(':')
+    times = [x for x in parts[0].strip().split(sep) if x]
+    items = [x for x in parts[1].strip().split(sep) if x]
+    values = [float(x) for x in parts[2].strip().split(sep) if x]
+    return {'items': ['(' + times[k] + ',' + items[k] + ')' for k in range(len(times))], 'values': values}
+
+
+def sequentialLine(line: str, sep: str) -> Record:
+    """
+    Parses one line of a sequential database, whose elements end with -1 and whose sequence ends with -2
+    """
+    temp = [x for x in (i.rstrip(sep) for i in line.split('-1')) if x]
+    temp.pop()
+    items, elementLengths = [], []
+    for element in temp:
+        if len(element) > 1:
+            element = sorted(set(element.split()))
+        items.extend(element)
+        elementLengths.append(len(element))
+    if not temp:
+        return None
+    return {'items': items, 'length': len(temp), 'elementLengths': elementLengths}
+
+
+def summarizeLines(lines, parser: Callable[[str, str], Record], sep: str) -> Tuple[DatabaseSummary, int]:
+    """
+    Summarizes lines of a database
+
+    :param lines: the lines to read
+    :type lines: iterable
+    :param parser: function turning a line into the keyword arguments of DatabaseSummary.add, or None to skip it
+    :type parser: function
+    :param sep: separator of the items
+    :type sep: str
+    :return: the summary, whose positions are the line numbers counted from 1, and the number of lines read
+    :rtype: tuple
+    """
+    summary = DatabaseSummary()
+    lineNumber = 0
+    for line in lines:
+        lineNumber += 1
+        record = parser(line, sep)
+        if record is not None:
+            summary.add(position=lineNumber, **record)
+    return summary, lineNumber
+
+
+def _summarizeRange(path: str, parser: Callable[[str, str], Record], sep: str, start: int,
+                    end: int) -> Tuple[DatabaseSummary, int]:
+    """
+    Summarizes the lines of a file that start in [start, end)
+    """
+    def lines():
+        with open(path, 'rb') as f:
+            f.seek(start)
+            while f.tell() < end:
+                line = f.readline()
+                if not line:
+                    break
+                yield line.decode('utf-8').replace('\r\n', '\n')
+
+    return summarizeLines(lines(), parser, sep)
+
+
+def _chunkStarts(path: str, chunks: int) -> List[int]:
+    """
+    Offsets splitting a file into about the given number of chunks, every offset at the start of a line
+    """
+    size = os.path.getsize(path)
+    starts = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, chunks):
+            f.seek(max(size * i // chunks, starts[-1]))
+            if f.tell() > 0:
+                f.seek(f.tell() - 1)
+                f.readline()
+            if f.tell() >= size:
+                break
+            if f.tell() > starts[-1]:
+                starts.append(f.tell())
+    return starts + [size]
+
+
+def summarizeFile(path: str, parser: Callable[[str, str], Record], sep: str = '\t', numWorkers: int = 1,
+                  chunkBytes: int = 64 * 1024 * 1024) -> DatabaseSummary:
+    """
+    Summarizes a database file in one pass
+
+    :param path: path of the file
+    :type path: str
+    :param parser: function turning a line into the keyword arguments of DatabaseSummary.add, or None to skip it
+    :type parser: function
+    :param sep: separator of the items
+    :type sep: str
+    :param numWorkers: number of processes reading chunks of the file in parallel
+    :type numWorkers: int
+    :param chunkBytes: approximate size of a chunk when numWorkers is more than 1
+    :type chunkBytes: int
+    :return: summary of the file, whose positions are the line numbers counted from 1
+    :rtype: DatabaseSummary
+    """
+    if numWorkers <= 1:
+        with open(path, 'r', encoding='utf-8') as f:
+            return summarizeLines(f, parser, sep)[0]
+    chunks = max(numWorkers, -(-os.path.getsize(path) // chunkBytes))
+    starts = _chunkStarts(path, chunks)
+    ranges = [(path, parser, sep, starts[i], starts[i + 1]) for i in range(len(starts) - 1)]
+    with multiprocessing.Pool(numWorkers) as pool:
+        parts = pool.starmap(_summarizeRange, ranges)
+    summary, offset = DatabaseSummary(), 0
+    for part, lines in parts:
+        summary.merge(part, offset)
+        offset += lines
+    return summary
@@ -0,0 +1,302 @@
+# fuzzyEngine evaluates the membership functions of a fuzzy file over a whole column of quantities at once and writes
+# the fuzzy database a chunk of transactions at a time.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.extras.fuzzyTransformation import fuzzyEngine as engine
+#
+#             regions = engine.FuzzyRegions.fromFile(fuzFile, "\t")
+#
+#             memberships, whole = regions.memberships([3, 7, 12])
+#
+#             engine.convert(iFile, regions, oFile, "\t", "temporal")
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import itertools
+import numpy as np
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+validators = _lazyImport.lazyModule('validators')
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from PAMI.extras.raggedRows import formatLines
+
+databaseTypes = ('transactional', 'temporal', 'utility')
+
+Chunk = Tuple[Optional[np.ndarray], np.ndarray, np.ndarray, np.ndarray]
+
+
+class FuzzyRegions:
+    """
+    :Description:  The regions of a fuzzy file. Every line of the file holds the lower and the upper bound of a region
+                   and the labels of its lower and upper bound. A quantity of the first region belongs to the first
+                   label, a quantity of at least the lower bound of the last region to the last label, and a quantity
+                   of any other region to the two labels of the region, with degrees falling linearly from 1 at the
+                   bound of the label to 0 at the other bound. The labels are numbered in the order they first appear
+                   as upper labels.
+
+    :Attributes:
+
+        :param bounds: list :
+            (lower bound, upper bound) of every region
+        :param regionLabels: list :
+            (lower label, upper label) of every region
+    """
+
+    def __init__(self, bounds: Sequence[Sequence[float]], regionLabels: Sequence[Sequence[str]]) -> None:
+        self.bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 2)
+        self.regionLabels = [tuple(pair) for pair in regionLabels]
+        self.labelKey = {}
+        for lowerLabel, upperLabel in self.regionLabels:
+            self.labelKey.setdefault(upperLabel, len(self.labelKey))
+        self.labels = np.array(list(self.labelKey), dtype=object)
+
+    @classmethod
+    def fromFile(cls, fuzFile: str, sep: str = '\t') -> 'FuzzyRegions':
+        """
+        Reads the regions of a fuzzy file
+
+        :param fuzFile: name of the fuzzy file, one region per line
+        :type fuzFile: str
+        :param sep: separator of the fields of a line
+        :type sep: str
+        :return: the regions
+        :rtype: FuzzyRegions
+        """
+        bounds, regionLabels = [], []
+        with open(fuzFile, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.split('\n')[0].split(sep)
+                if len(parts) < 4:
+                    continue
+                bounds.append([int(parts[0].strip()), int(parts[1].strip())])
+                regionLabels.append((parts[2].strip(), parts[3].strip()))
+        return cls(bounds, regionLabels)
+
+    def memberships(self, quantities: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Degrees of every quantity in every label
+
+        :param quantities: the quantities
+        :type quantities: list or numpy.ndarray
+        :return: (quantities x labels degrees, True for the quantities of the first or the last region)
+        :rtype: tuple
+        """
+        quantities = np.asarray(quantities, dtype=np.float64)
+        degrees = np.zeros((len(quantities), len(self.labels)))
+        if len(self.bounds) == 0:
+            return degrees, np.zeros(len(quantities), dtype=bool)
+        first = (self.bounds[0, 0] < quantities) & (quantities <= self.bounds[0, 1])
+        last = ~first & (quantities >= self.bounds[-1, 0])
+        rest = ~(first | last)
+        for (low, high), (lowerLabel, upperLabel) in zip(self.bounds[1:-1], self.regionLabels[1:-1]):
+            inside = np.flatnonzero(rest & (low <= quantities) & (quantities <= high))
+            base = high - low
+            degrees[inside, self.labelKey[lowerLabel]] = (high - quantities[inside]) / base
+            degrees[inside, self.labelKey[upperLabel]] = (quantities[inside] - low) / base
+        degrees[first, 0] = 1
+        degrees[last, -1] = 1
+        return degrees, first | last
+
+
+def _split(fields: List[str], sep: str) -> Tuple[List[str], np.ndarray]:
+    """
+    All the values of the fields, and the number of values of every field
+    """
+    counts = np.fromiter((field.count(sep) + 1 for field in fields), dtype=np.int64, count=len(fields))
+    return sep.join(fields).split(sep), counts
+
+
+def parseLines(lines: Iterable[str], sep: str = '\t', kind: str = 'transactional') -> Chunk:
+    """
+    Parses lines of a database with quantities
+
+    :param lines: lines "items:quantities" of a transactional database, "timestamp items:quantities" of a temporal
+                  database or "timestamp items:total:quantities" of a utility database
+    :type lines: list
+    :param sep: separator of the items and of the quantities
+    :type sep: str
+    :param kind: transactional, temporal or utility
+    :type kind: str
+    :return: (timestamps or None, items, quantities, offsets), the items of transaction t being
+             items[offsets[t]:offsets[t + 1]]
+    :rtype: tuple
+    """
+    itemFields, quantityFields = [], []
+    position = 2 if kind == 'utility' else 1
+    for line in lines:
+        parts = line.strip().split(':')
+        if len(parts) <= position:
+            continue
+        itemFields.append(parts[0].strip())
+        quantityFields.append(parts[position].strip())
+    items, counts = _split(itemFields, sep)
+    quantities, quantityCounts = _split(quantityFields, sep)
+    items = np.array(items, dtype=object)
+    timestamps = None
+    if kind != 'transactional':
+        starts = np.cumsum(counts) - counts
+        if kind == 'temporal':
+            timestamps = np.array(items[starts].tolist(), dtype=np.int64)
+        keep = np.ones(len(items), dtype=bool)
+        keep[starts] = False
+        items = items[keep]
+        counts = counts - 1
+    if np.any(quantityCounts < counts):
+        line = int(np.flatnonzero(quantityCounts < counts)[0]) + 1
+        raise ValueError('Transaction ' + str(line) + ' of the chunk has fewer quantities than items')
+    quantityStarts = np.cumsum(quantityCounts) - quantityCounts
+    quantities = np.array(quantities, dtype=object)[np.repeat(quantityStarts, counts) + _within(counts)]
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return timestamps, items, quantities.astype(np.float64), offsets
+
+
+def _within(counts: np.ndarray) -> np.ndarray:
+    """
+    Position of every entry within its transaction
+    """
+    starts = np.cumsum(counts) - counts
+    return np.arange(int(counts.sum())) - np.repeat(starts, counts)
+
+
+def fromLists(transactions: Sequence[Sequence], quantities: Sequence[Sequence],
+              timestamps: Optional[Sequence[int]] = None) -> Chunk:
+    """
+    The chunk of transactions given as lists of items and lists of quantities
+
+    :return: (timestamps or None, items, quantities, offsets) as returned by parseLines
+    :rtype: tuple
+    """
+    counts = np.array([len(items) for items in transactions], dtype=np.int64)
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    items = np.array([str(item) for row in transactions for item in row], dtype=object)
+    values = np.array([value for row, items in zip(quantities, transactions) for value in list(row)[:len(items)]],
+                      dtype=np.float64)
+    if timestamps is not None:
+        timestamps = np.asarray(timestamps)
+    return timestamps, items, values, offsets
+
+
+def formatChunk(regions: FuzzyRegions, timestamps: Optional[np.ndarray], items: np.ndarray, quantities: np.ndarray,
+                offsets: np.ndarray) -> str:
+    """
+    Lines of the fuzzy database of a chunk of transactions. Every line holds the item.label entries whose degree is
+    not zero, a colon and the degrees rounded to two decimals, preceded by the timestamp when timestamps is not None.
+
+    :param regions: the fuzzy regions
+    :type regions: FuzzyRegions
+    :param timestamps: timestamp of every transaction, or None
+    :type timestamps: numpy.ndarray
+    :param items: item of every entry
+    :type items: numpy.ndarray
+    :param quantities: quantity of every entry
+    :type quantities: numpy.ndarray
+    :param offsets: the entries of transaction t are items[offsets[t]:offsets[t + 1]]
+    :type offsets: numpy.ndarray
+    :return: the lines
+    :rtype: str
+    """
+    degrees, whole = regions.memberships(quantities)
+    entries, keys = np.nonzero(degrees)
+    values, inverse = np.unique(degrees[entries, keys], return_inverse=True)
+    tokens = np.array([str(round(value, 2)) for value in values.tolist()], dtype=object)[inverse.reshape(-1)]
+    tokens[whole[entries]] = '1'
+    names = items[entries] + '.' + regions.labels[keys]
+    before = np.zeros(len(quantities) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(entries, minlength=len(quantities)), out=before[1:])
+    fuzzyOffsets = before[offsets]
+    separators = np.where(np.diff(fuzzyOffsets) > 0, '\t', '').astype(object)
+    fields = [(names, fuzzyOffsets), ':', (tokens, fuzzyOffsets), separators]
+    if timestamps is not None:
+        fields = [timestamps, separators] + fields
+    return formatLines(fields, len(offsets) - 1, '\t', ' \n')
+
+
+def lineChunks(iFile: str, chunkLines: int = 100000) -> Iterator[List[str]]:
+    """
+    Lines of a file or a URL, chunkLines at a time
+
+    :param iFile: name or URL of the file
+    :type iFile: str
+    :param chunkLines: number of lines of a chunk
+    :type chunkLines: int
+    :return: the chunks of lines
+    :rtype: generator
+    """
+    if validators.url(iFile):
+        yield from _chunksOf((line.decode('utf-8') for line in urlopen(iFile)), chunkLines)
+        return
+    with open(iFile, 'r', encoding='utf-8') as f:
+        yield from _chunksOf(f, chunkLines)
+
+
+def _chunksOf(lines: Iterable[str], chunkLines: int) -> Iterator[List[str]]:
+    while True:
+        chunk = list(itertools.islice(lines, chunkLines))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert(iFile: 'Union[str, pd.DataFrame]', regions: FuzzyRegions, oFile: str, sep: str = '\t',
+            kind: str = 'transactional', chunkLines: int = 100000) -> int:
+    """
+    Converts a database with quantities into a fuzzy database, a chunk of transactions at a time
+
+    :param iFile: name or URL of the input file, or a DataFrame with columns Transactions and fuzzyValues, and TS for
+                  a temporal database
+    :type iFile: str or pandas.DataFrame
+    :param regions: the fuzzy regions
+    :type regions: FuzzyRegions
+    :param oFile: name of the fuzzy database
+    :type oFile: str
+    :param sep: separator of the items and of the quantities of the input
+    :type sep: str
+    :param kind: transactional, temporal or utility
+    :type kind: str
+    :param chunkLines: number of transactions converted at a time
+    :type chunkLines: int
+    :return: number of transactions
+    :rtype: int
+    """
+    if kind not in databaseTypes:
+        raise ValueError("kind must be one of " + ", ".join(databaseTypes))
+    if isinstance(iFile, pd.DataFrame):
+        def chunks():
+            for start in range(0, len(iFile), chunkLines):
+                frame = iFile.iloc[start:start + chunkLines]
+                timestamps = None
+                if kind == 'temporal':
+                    timestamps = frame['TS'].tolist() if 'TS' in frame.columns else range(start + 1, start + len(frame) + 1)
+                yield fromLists(frame['Transactions'].tolist(), frame['fuzzyValues'].tolist(), timestamps)
+        chunks = chunks()
+    else:
+        chunks = (parseLines(lines, sep, kind) for lines in lineChunks(iFile, chunkLines))
+    numTransactions = 0
+    with open(oFile, 'w') as writer:
+        for timestamps, items, quantities, offsets in chunks:
+            writer.write(formatChunk(regions, timestamps, items, quantities, offsets))
+            numTransactions += len(offsets) - 1
+    return numTransactions
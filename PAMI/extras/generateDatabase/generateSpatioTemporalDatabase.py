@@ -35,7 +35,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 import random as rand
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-import pandas
+from PAMI import lazyImport as _lazyImport
+pandas = _lazyImport.lazyModule('pandas')
 import sys
 
 class spatioTemporalDatabaseGenerator():
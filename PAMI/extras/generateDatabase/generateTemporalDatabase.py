@@ -37,7 +37,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from typing import Tuple, List, Union
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import numpy as np
 import random
 import sys
@@ -155,7 +156,7 @@ class generateTemporalDatabase:
         """
         return self.outputFile
 
-    def getDatabaseAsDataFrame(self) -> pd.DataFrame:
+    def getDatabaseAsDataFrame(self) -> 'pd.DataFrame':
         """
         return dataframe
         :return: dataframe
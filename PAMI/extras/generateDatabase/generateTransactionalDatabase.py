@@ -36,7 +36,8 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 import numpy as np
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import sys
 
 
@@ -187,7 +188,7 @@ class generateTransactionalDatabase:
             for line in self.db:
                 f.write(','.join(map(str, line)) + '\n')
 
-    def getTransactions(self) -> pd.DataFrame:
+    def getTransactions(self) -> 'pd.DataFrame':
         """
         Get the transactional database
 
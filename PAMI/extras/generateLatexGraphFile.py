@@ -29,7 +29,8 @@ Copyright (C)  2021 Rage Uday Kiran
      You should have received a copy of the GNU General Public License
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 
 class generateLatexGraphFile():
     """
@@ -49,7 +50,7 @@ class generateLatexGraphFile():
 
 
 
-def generateLatexCode(result: pd.DataFrame) -> None:
+def generateLatexCode(result: 'pd.DataFrame') -> None:
 
     titles = result.columns.tolist()
     titles.remove("minsup")
@@ -36,8 +36,9 @@ Copyright (C)  2021 Rage Uday Kiran
 
 import sys
 
-import plotly.express as _px
-import pandas as _pd
+from PAMI import lazyImport as _lazyImport
+_px = _lazyImport.lazyModule('plotly.express')
+_pd = _lazyImport.lazyModule('pandas')
 
 class DF2Fig():
     """
@@ -72,7 +73,7 @@ class DF2Fig():
 
     """
 
-    def __init__(self, dataFrame: _pd.DataFrame) -> None:
+    def __init__(self, dataFrame: '_pd.DataFrame') -> None:
         self._dataFrame = dataFrame
 
     def plot(self, xColumn, yColumn, algorithm=None) -> None:
@@ -35,7 +35,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 
 
 class DF2Tex:
@@ -58,7 +59,7 @@ class DF2Tex:
 
     """
 
-    def generateLatexCode(self, result: pd.DataFrame, xColumn, yColumn, algorithmColumn=None) -> None:
+    def generateLatexCode(self, result: 'pd.DataFrame', xColumn, yColumn, algorithmColumn=None) -> None:
         titles = [xColumn, yColumn]
         legendary = pd.unique(result.iloc[:, 0].values.ravel())
         xaxisValues = result[xColumn].values
@@ -31,7 +31,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import sys
-import matplotlib.pyplot as plt
+from PAMI import lazyImport as _lazyImport
+plt = _lazyImport.lazyModule('matplotlib.pyplot')
 
 class plotLineGraphFromDictionary:
     """
@@ -31,8 +31,9 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import matplotlib.pyplot as plt
-import pandas as _pd
+from PAMI import lazyImport as _lazyImport
+plt = _lazyImport.lazyModule('matplotlib.pyplot')
+_pd = _lazyImport.lazyModule('pandas')
 import sys
 
 class plotGraphsFromDataFrame():
@@ -60,7 +61,7 @@ class plotGraphsFromDataFrame():
             obj.save()
     """
 
-    def __init__(self, dataFrame: _pd.DataFrame) -> None:
+    def __init__(self, dataFrame: '_pd.DataFrame') -> None:
 
         self._dataFrame = dataFrame
 
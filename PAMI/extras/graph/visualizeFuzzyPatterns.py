@@ -35,8 +35,9 @@ Copyright (C)  2021 Rage Uday Kiran
 # obj = fig.visualizePatterns('soramame_frequentPatterns.txt',50)
 # obj.visualize(width=1000,height=900)
 
-import plotly.express as px
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+px = _lazyImport.lazyModule('plotly.express')
+pd = _lazyImport.lazyModule('pandas')
 import sys
 
 
@@ -31,8 +31,9 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import plotly.express as px
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+px = _lazyImport.lazyModule('plotly.express')
+pd = _lazyImport.lazyModule('pandas')
 import sys
 
 
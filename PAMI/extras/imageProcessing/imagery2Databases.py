@@ -31,7 +31,8 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import sys
 
 
@@ -93,7 +94,7 @@ class createDatabase:
             self.itemSupport.append(self.supports)
             self.dataframe.loc[self.dataframe.shape[0], 'objects'] = dataDic.keys()
 
-    def getDataFrame(self) -> pd.DataFrame:
+    def getDataFrame(self) -> 'pd.DataFrame':
         return self.dataframe
 
     # This function will save the list of objects found in each image as a transactional database.
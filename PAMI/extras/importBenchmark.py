@@ -0,0 +1,181 @@
+# importBenchmark measures the time to import PAMI modules, every import in a fresh interpreter, and lists the heavy
+# dependencies every import loads, to catch regressions of the start-up time of mining jobs.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.extras import importBenchmark as ib
+#
+#             results = ib.measure(["PAMI.frequentPattern.basic.FPGrowth"], repeat=5)
+#
+#             ib.printResults(results)
+#
+#             problems = ib.check(results, budget=0.2, baseline=ib.load("importTimes.json"))
+#
+#             ib.save(results, "importTimes.json")
+#
+# **Running the benchmark from the command line**
+# --------------------------------------------------------
+#
+#             python -m PAMI.extras.importBenchmark --budget 0.2 --baseline importTimes.json
+#
+#             python -m PAMI.extras.importBenchmark --save importTimes.json PAMI.frequentPattern.basic.FPGrowth
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence
+
+defaultModules = [
+    'PAMI.frequentPattern.basic.FPGrowth',
+    'PAMI.frequentPattern.basic.Apriori',
+    'PAMI.frequentPattern.basic.ECLAT',
+    'PAMI.periodicFrequentPattern.basic.PFPGrowth',
+    'PAMI.highUtilityPattern.basic.EFIM',
+    'PAMI.uncertainFrequentPattern.basic.PUFGrowth',
+    'PAMI.extras.DF2DB.DF2DB',
+    'PAMI.extras.graph.visualizePatterns',
+]
+
+heavyModules = ('pandas', 'numpy', 'psutil', 'validators', 'urllib.request', 'http.client', 'matplotlib', 'plotly',
+                'networkx', 'pyspark', 'cupy', 'deprecated', 'wrapt')
+
+forbiddenModules = ('pandas', 'psutil', 'validators', 'urllib.request', 'matplotlib', 'plotly', 'networkx', 'pyspark',
+                    'cupy', 'deprecated')
+
+_probe = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+seconds = time.perf_counter() - start
+print(json.dumps([seconds, [name for name in sys.argv[2:] if name in sys.modules]]))
+"""
+
+
+def measure(modules: Sequence[str] = defaultModules, repeat: int = 5) -> Dict[str, dict]:
+    """
+    Imports every module repeat times, every time in a new interpreter
+
+    :param modules: full names of the modules
+    :type modules: list
+    :param repeat: number of imports of every module
+    :type repeat: int
+    :return: for every module, the median import time in seconds, the fastest one and the heavy modules it loads
+    :rtype: dict
+    """
+    results = {}
+    for module in modules:
+        times, loaded = [], []
+        for _ in range(repeat):
+            run = subprocess.run([sys.executable, '-c', _probe, module] + list(heavyModules), capture_output=True,
+                                 text=True)
+            if run.returncode != 0:
+                raise ImportError('Importing ' + module + ' failed:\n' + run.stderr.strip())
+            seconds, loaded = json.loads(run.stdout.strip().splitlines()[-1])
+            times.append(seconds)
+        results[module] = {'seconds': statistics.median(times), 'fastest': min(times), 'loaded': loaded}
+    return results
+
+
+def check(results: Dict[str, dict], budget: Optional[float] = None, forbidden: Sequence[str] = forbiddenModules,
+          baseline: Optional[Dict[str, dict]] = None, tolerance: float = 1.5) -> List[str]:
+    """
+    Regressions of a benchmark
+
+    :param results: results of measure
+    :type results: dict
+    :param budget: largest median import time allowed, in seconds
+    :type budget: float
+    :param forbidden: modules that must not be loaded by the imports
+    :type forbidden: list
+    :param baseline: results of an earlier benchmark
+    :type baseline: dict
+    :param tolerance: largest ratio allowed between the median time of a module and its median time in the baseline
+    :type tolerance: float
+    :return: one message per regression
+    :rtype: list
+    """
+    problems = []
+    for module, result in results.items():
+        heavy = [name for name in result['loaded'] if name in forbidden]
+        if heavy:
+            problems.append(module + ' loads ' + ', '.join(heavy))
+        if budget is not None and result['seconds'] > budget:
+            problems.append(module + ' takes %.3f s, more than the budget of %.3f s' % (result['seconds'], budget))
+        if baseline and module in baseline and result['seconds'] > tolerance * baseline[module]['seconds']:
+            problems.append(module + ' takes %.3f s, against %.3f s in the baseline'
+                            % (result['seconds'], baseline[module]['seconds']))
+    return problems
+
+
+def printResults(results: Dict[str, dict]) -> None:
+    """
+    Prints one line per module: the median and the fastest import time in milliseconds and the heavy modules loaded
+    """
+    width = max([len(module) for module in results] + [6])
+    print('%-*s %10s %10s  %s' % (width, 'module', 'median ms', 'min ms', 'loads'))
+    for module, result in results.items():
+        print('%-*s %10.1f %10.1f  %s' % (width, module, 1000 * result['seconds'], 1000 * result['fastest'],
+                                          ', '.join(result['loaded'])))
+
+
+def save(results: Dict[str, dict], oFile: str) -> None:
+    """
+    Stores the results as JSON, to be used as the baseline of a later benchmark
+    """
+    with open(oFile, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load(iFile: str) -> Dict[str, dict]:
+    """
+    Reads results stored by save
+    """
+    with open(iFile) as f:
+        return json.load(f)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Import time of PAMI modules, every import in a fresh interpreter')
+    parser.add_argument('modules', nargs='*', default=defaultModules, help='full names of the modules')
+    parser.add_argument('--repeat', type=int, default=5, help='number of imports of every module')
+    parser.add_argument('--budget', type=float, default=None, help='largest median import time allowed, in seconds')
+    parser.add_argument('--baseline', default=None, help='JSON results of an earlier run to compare with')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='largest slowdown allowed against the baseline')
+    parser.add_argument('--save', default=None, help='stores the results as JSON')
+    args = parser.parse_args(argv)
+    results = measure(args.modules, args.repeat)
+    printResults(results)
+    if args.save:
+        save(results, args.save)
+    problems = check(results, args.budget, forbiddenModules, load(args.baseline) if args.baseline else None,
+                     args.tolerance)
+    for problem in problems:
+        print('Regression: ' + problem)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
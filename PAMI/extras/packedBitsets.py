@@ -0,0 +1,47 @@
+# packedBitsets holds the helpers shared by the miners that keep an item x transaction bitmap packed in uint64 words,
+# one row of words per item or candidate.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.extras.packedBitsets import popcount
+#
+#             supports = popcount(bitmap[candidates] & mask)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import numpy as np
+
+_popcountTable = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Counts the set bits of every row of a 2-D uint64 array
+
+    :param words: packed bitsets, one row per candidate
+    :type words: numpy.ndarray
+    :return: number of set bits of every row
+    :rtype: numpy.ndarray
+    """
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return _popcountTable[words.view(np.uint8)].sum(axis=1, dtype=np.int64)
@@ -31,7 +31,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import folium
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 from typing import Dict, List
 import re
 
@@ -87,7 +88,7 @@ class plotPointOnMap:
         # return {patternId: patterns[patternId - 1] for patternId in range(1, int(self.k) + 1)}
         return patterns[:self.k]
 
-    def convertPOINT(self, patterns: List[List[str]]) -> pd.DataFrame:
+    def convertPOINT(self, patterns: List[List[str]]) -> 'pd.DataFrame':
         locations = pd.DataFrame(columns=['patternId', 'latitude', 'longitude'])
         patternId = 1
         for pattern in patterns:
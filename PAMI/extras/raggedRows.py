@@ -0,0 +1,131 @@
+# raggedRows holds the helpers shared by the database converters and generators, which keep a chunk of rows as a flat
+# array of values with the offsets of every row, and write the chunk as text in one go.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.extras.raggedRows import formatLines, rowSums
+#
+#             sums = rowSums(values, offsets)
+#
+#             with open(outputFile, 'w') as writer:
+#
+#                 writer.write(formatLines([(items, offsets), ':', sums, ':', (values, offsets)], len(offsets) - 1))
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from typing import List
+
+
+def ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Concatenation of range(start, start + length) for every pair
+
+    :param starts: first value of every range
+    :type starts: numpy.ndarray
+    :param lengths: length of every range
+    :type lengths: numpy.ndarray
+    :return: the values of all the ranges
+    :rtype: numpy.ndarray
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    shift = np.repeat(np.asarray(starts, dtype=np.int64) - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(total, dtype=np.int64) + shift
+
+
+def rowSums(values: np.ndarray, offsets: np.ndarray, exact: bool = True) -> np.ndarray:
+    """
+    Sums of the values of every row, the values of row r being values[offsets[r]:offsets[r + 1]]
+
+    :param values: values of all the rows
+    :type values: numpy.ndarray
+    :param offsets: offsets of the rows
+    :type offsets: numpy.ndarray
+    :param exact: sum floats row by row, in the order numpy sums a row, so that the sums are those of pandas on the
+                  same rows. Otherwise floats are summed at once, which is faster but may differ in the last digits.
+    :type exact: bool
+    :return: the sum of every row, 0 for an empty row
+    :rtype: numpy.ndarray
+    """
+    values = np.asarray(values)
+    if len(offsets) < 2:
+        return values[:0]
+    if values.dtype.kind in 'iub' or not exact:
+        sums = np.concatenate(([0], np.cumsum(values)))
+        return sums[offsets[1:]] - sums[offsets[:-1]]
+    bounds = offsets.tolist()
+    return np.array([values[bounds[r]:bounds[r + 1]].sum() for r in range(len(bounds) - 1)], dtype=values.dtype)
+
+
+def _tokens(values) -> list:
+    values = np.asarray(values)
+    if values.dtype == object:
+        return [str(value) for value in values.tolist()]
+    return list(map(str, values.tolist()))
+
+
+def formatLines(fields: List, numRows: int, sep: str = '\t', end: str = '\n') -> str:
+    """
+    Formats a chunk of rows field after field
+
+    :param fields: every field is either a str written on every row, an array holding one value per row, or a tuple
+                   (values, offsets) of the values of every row, joined by sep
+    :type fields: list
+    :param numRows: number of rows
+    :type numRows: int
+    :param sep: separator of the values of a row
+    :type sep: str
+    :param end: written at the end of every row
+    :type end: str
+    :return: the formatted rows
+    :rtype: str
+    """
+    counts, pieces = [], []
+    for field in fields:
+        if isinstance(field, str):
+            counts.append(np.ones(numRows, dtype=np.int64))
+            pieces.append([field] * numRows)
+        elif isinstance(field, tuple):
+            values, offsets = field
+            sizes = np.diff(offsets)
+            separators = np.full(len(values), sep, dtype=object)
+            separators[offsets[1:][sizes > 0] - 1] = ''
+            both = np.empty(2 * len(values), dtype=object)
+            both[0::2] = _tokens(values)
+            both[1::2] = separators
+            counts.append(2 * sizes)
+            pieces.append(both)
+        else:
+            counts.append(np.ones(numRows, dtype=np.int64))
+            pieces.append(_tokens(field))
+    perRow = np.sum(counts, axis=0, dtype=np.int64) + 1 if counts else np.ones(numRows, dtype=np.int64)
+    rowStart = np.cumsum(perRow) - perRow
+    lines = np.empty(int(perRow.sum()), dtype=object)
+    before = rowStart.copy()
+    for count, piece in zip(counts, pieces):
+        lines[ranges(before, count)] = piece
+        before += count
+    lines[before] = end
+    return ''.join(lines.tolist())
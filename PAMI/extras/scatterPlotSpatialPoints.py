@@ -30,9 +30,10 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import matplotlib.pyplot as _plt
-import pandas as _pd
-from urllib.request import urlopen as _urlopen
+from PAMI import lazyImport as _lazyImport
+_plt = _lazyImport.lazyModule('matplotlib.pyplot')
+_pd = _lazyImport.lazyModule('pandas')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 from typing import Dict, List
 
 
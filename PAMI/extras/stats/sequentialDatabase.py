@@ -36,8 +36,9 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import statistics
-import validators
-from urllib.request import urlopen
+from PAMI import lazyImport as _lazyImport
+validators = _lazyImport.lazyModule('validators')
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import PAMI.extras.graph.plotLineGraphFromDictionary as plt
 import sys
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
@@ -36,10 +36,11 @@ Copyright (C)  2021 Rage Uday Kiran
 
 import sys
 import statistics
-import pandas as pd
-import validators
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+validators = _lazyImport.lazyModule('validators')
 import numpy as np
-from urllib.request import urlopen
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 from typing import Dict, Union
 
 
@@ -103,7 +104,7 @@ class temporalDatabase:
             obj.printStats()
     """
 
-    def __init__(self, inputFile: Union[str, pd.DataFrame], sep: str = '\t') -> None:
+    def __init__(self, inputFile: 'Union[str, pd.DataFrame]', sep: str = '\t') -> None:
         """
         :param inputFile: input file name or path
         :type inputFile: str
@@ -36,8 +36,9 @@ Copyright (C)  2021 Rage Uday Kiran
 
 import sys
 import statistics
-from urllib.request import urlopen
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
+pd = _lazyImport.lazyModule('pandas')
 from typing import Union
 
 class utilityDatabase:
@@ -67,7 +68,7 @@ class utilityDatabase:
 
     """
 
-    def __init__(self, inputFile: Union[str, pd.DataFrame], sep: str='\t') -> None:
+    def __init__(self, inputFile: 'Union[str, pd.DataFrame]', sep: str='\t') -> None:
         """
         :param inputFile: input file name or path
         :type inputFile: str
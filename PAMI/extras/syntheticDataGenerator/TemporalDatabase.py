@@ -30,9 +30,12 @@ __copyright__ = """
 """
 
 
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import numpy as np
 import sys
+from PAMI.extras.syntheticDataGenerator import generatorEngine as engine
+from PAMI.extras.raggedRows import formatLines
 
 
 class TemporalDatabase:
@@ -63,6 +66,18 @@ class TemporalDatabase:
         :param typeOfFile: str
             specify database or dataframe to get corresponding output
 
+        :param zipfExponent: float
+            items are Zipf distributed with this exponent when it is positive, uniform otherwise
+
+        :param numPatterns: int
+            number of correlated itemsets seeded into the transactions, in the style of the IBM Quest generator
+
+        :param avgPatternLength: int
+            average length of a seeded itemset
+
+        :param seed: int
+            seed of the random generator
+
     :Methods:
         getFileName():
             returns filename
@@ -109,7 +124,8 @@ class TemporalDatabase:
     """
     def __init__(self, numOfTransactions: int, avgLenOfTransactions: int, 
                  numItems: int, outputFile: str, percentage: int=50,
-                 sep: str='\t', typeOfFile: str="Database") -> None:
+                 sep: str='\t', typeOfFile: str="Database", zipfExponent: float=0.0,
+                 numPatterns: int=0, avgPatternLength: int=4, seed: int=None) -> None:
         
         """
         Initialize the generateTemporalDatabase class with required parameters.
@@ -125,6 +141,7 @@ class TemporalDatabase:
             self.percentage = percentage
         self.sep = sep
         self.typeOfFile = typeOfFile.lower()
+        self.sampler = engine.ItemSampler(numItems, zipfExponent, numPatterns, avgPatternLength, seed=seed)
 
     def getFileName(self) -> str:
         """
@@ -133,7 +150,7 @@ class TemporalDatabase:
         """
         return self.outputFile
 
-    def getDatabaseAsDataFrame(self) -> pd.DataFrame:
+    def getDatabaseAsDataFrame(self) -> 'pd.DataFrame':
         """
         This function return the database in dataframe format.
 
@@ -160,24 +177,12 @@ class TemporalDatabase:
         Returns:
         array: list - tuned array
         """
-        # first generate a random array of length n whose values average to m
-        values = np.random.randint(1, self.numItems, len(array))
-
-        while np.sum(values) != sumRes:
-            # get index of largest value
-            # if sum is too large, decrease the largest value
-            if np.sum(values) > sumRes:
-                maxIndex = np.argmax(values)
-                values[maxIndex] -= 1
-            # if sum is too small, increase the smallest value
-            else:
-                minIndex = np.argmin(values)
-                values[minIndex] += 1
-
-        # get location of all values greater than numItems
-        
+        if len(array) == 0:
+            return array
+        values = engine.transactionLengths(len(array), sumRes / len(array), rng=self.sampler.rng)
+
         for i in range(len(array)):
-            array[i][1] = values[i]
+            array[i][1] = int(values[i])
 
         return array
 
@@ -187,33 +192,33 @@ class TemporalDatabase:
         :return: None
         """
 
-        db = []
-        lineSize = []
-        for i in range(self.numOfTransactions):
-            db.append([i])
-            if self.performCoinFlip(self.percentage):
-                lineSize.append([i,0])
-        
-        # make it so that sum of lineSize[1] equal to numTransactions * avgLenOfTransactions
-        sumRes = self.numOfTransactions * self.avgLenOfTransactions
-        self.tuning(lineSize, sumRes)
+        # timestamps holding a transaction, flipped all at once
+        timestamps = np.flatnonzero(self.sampler.rng.random(self.numOfTransactions) < self.percentage)
 
-        for i in range(len(lineSize)):
-            if lineSize[i][1] > self.numItems:
-                raise ValueError("Error: Either increase numItems or decrease avgLenOfTransactions or modify percentage")
-            line = np.random.choice(range(1, self.numItems + 1), lineSize[i][1], replace=False)
-            db[lineSize[i][0]].extend(line)
+        # make it so that sum of lineSize equal to numTransactions * avgLenOfTransactions
+        sumRes = self.numOfTransactions * self.avgLenOfTransactions
+        if sumRes > len(timestamps) * self.numItems:
+            raise ValueError("Error: Either increase numItems or decrease avgLenOfTransactions or modify percentage")
+        lengths = np.zeros(self.numOfTransactions, dtype=np.int64)
+        if len(timestamps):
+            lengths[timestamps] = engine.transactionLengths(len(timestamps), sumRes / len(timestamps), self.numItems,
+                                                            rng=self.sampler.rng)
 
         if self.typeOfFile == "database":
             with open(self.outputFile, "w") as outFile:
-                for line in db:
-                    outFile.write(self.sep.join(map(str, line)) + '\n')
-            outFile.close()
+                for start, items, offsets in self.sampler.chunks(lengths):
+                    rows = len(offsets) - 1
+                    separators = np.where(np.diff(offsets) > 0, self.sep, '').astype(object)
+                    outFile.write(formatLines([np.arange(start, start + rows), separators, (items, offsets)],
+                                              rows, self.sep))
 
         if self.typeOfFile == "dataframe":
+            transactions = []
+            for start, items, offsets in self.sampler.chunks(lengths):
+                transactions.extend(items.tolist()[a:b] for a, b in zip(offsets[:-1].tolist(), offsets[1:].tolist()))
             data = {
-                'timestamp': [line[0] for line in db],
-                'transactions': pd.Series([line[1:] for line in db])
+                'timestamp': np.arange(self.numOfTransactions),
+                'transactions': pd.Series(transactions)
             }
             self.df = pd.DataFrame(data)
 
@@ -221,5 +226,5 @@ class TemporalDatabase:
 
 if __name__ == '__main__':
 
-    obj = TemporalDatabase(sys.argv[1], sys.argv[2], sys.argv[3], sys.argv[4])
-    obj.create(sys.argv[5])
+    obj = TemporalDatabase(int(sys.argv[1]), float(sys.argv[2]), int(sys.argv[3]), sys.argv[4])
+    obj.create()
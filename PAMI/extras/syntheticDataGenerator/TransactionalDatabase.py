@@ -14,8 +14,11 @@
 #
 
 import numpy as np
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import sys
+from PAMI.extras.syntheticDataGenerator import generatorEngine as engine
+from PAMI.extras.raggedRows import formatLines
 
 
 __copyright__ = """
@@ -46,6 +49,14 @@ class TransactionalDatabase:
             Average number of items per line
         numItems: int
             Total number of items
+        zipfExponent: float
+            Items are Zipf distributed with this exponent when it is positive, uniform otherwise
+        numPatterns: int
+            Number of correlated itemsets seeded into the transactions, in the style of the IBM Quest generator
+        avgPatternLength: int
+            Average length of a seeded itemset
+        seed: int
+            Seed of the random generator
 
     :Methods:
 
@@ -87,7 +98,8 @@ class TransactionalDatabase:
     
     """
 
-    def __init__(self, numLines, avgItemsPerLine, numItems) -> None:
+    def __init__(self, numLines, avgItemsPerLine, numItems, zipfExponent=0.0, numPatterns=0, avgPatternLength=4,
+                 seed=None) -> None:
         """
         Initialize the transactional database with the given parameters
 
@@ -97,12 +109,22 @@ class TransactionalDatabase:
         :type avgItemsPerLine: int
         :param numItems: total number of items
         :type numItems: int
+        :param zipfExponent: exponent of the Zipf distribution of the items, 0 for uniform items
+        :type zipfExponent: float
+        :param numPatterns: number of correlated itemsets seeded into the lines
+        :type numPatterns: int
+        :param avgPatternLength: average length of a seeded itemset
+        :type avgPatternLength: int
+        :param seed: seed of the random generator
+        :type seed: int
         """
 
         self.numLines = numLines
         self.avgItemsPerLine = avgItemsPerLine
         self.numItems = numItems
-        self.db = []
+        self.sampler = engine.ItemSampler(numItems, zipfExponent, numPatterns, avgPatternLength, seed=seed)
+        self.items = np.zeros(0, dtype=np.int64)
+        self.offsets = np.zeros(1, dtype=np.int64)
     
     def tuning(self, array, sumRes) -> list:
         """
@@ -117,17 +139,7 @@ class TransactionalDatabase:
         array: list - tuned array
         """
 
-        while np.sum(array) != sumRes:
-            # get index of largest value
-            randIndex = np.random.randint(0, len(array))
-            # if sum is too large, decrease the largest value
-            if np.sum(array) > sumRes:
-                array[randIndex] -= 1
-            # if sum is too small, increase the smallest value
-            else:
-                minIndex = np.argmin(array)
-                array[randIndex] += 1
-        return array
+        return engine.tuneLengths(np.asarray(array, dtype=np.int64), sumRes, 1, self.numItems, self.sampler.rng)
         
 
     def generateArray(self, nums, avg, maxItems) -> list:
@@ -145,46 +157,20 @@ class TransactionalDatabase:
         values: list - random array
         """
 
-        # generate n random values
-        values = np.random.randint(1, maxItems, nums)
-
-        sumRes = nums * avg
-
-        self.tuning(values, sumRes)
-
-        # if any value is less than 1, increase it and tune the array again
-        while np.any(values < 1):
-            for i in range(nums):
-                if values[i] < 1:
-                    values[i] += 1
-            self.tuning(values, sumRes)
-
-        while np.any(values > maxItems):
-            for i in range(nums):
-                if values[i] > maxItems:
-                    values[i] -= 1
-            self.tuning(values, sumRes)
-
-
-        # if all values are same then randomly increase one value and decrease another
-        while np.all(values == values[0]):
-            values[np.random.randint(0, nums)] += 1
-            self.tuning(values, sumRes)
-
-        return values
+        return engine.transactionLengths(nums, avg, maxItems, rng=self.sampler.rng)
 
     def create(self) -> None:
         """
         Generate the transactional database with the given input parameters.
+        The items of line r are kept in items[offsets[r]:offsets[r + 1]].
         Returns: None
         """
-        db = set()
-
-        values = self.generate_array(self.numLines, self.avgItemsPerLine, self.numItems)
+        values = self.generateArray(self.numLines, self.avgItemsPerLine, self.numItems)
 
-        for value in values:
-            line = np.random.choice(range(1, self.numItems + 1), value, replace=False)
-            self.db.append(line)
+        self.offsets = engine.offsetsOf(values)
+        self.items = np.empty(int(self.offsets[-1]), dtype=np.int32 if self.numItems < 2 ** 31 else np.int64)
+        for start, items, offsets in self.sampler.chunks(values):
+            self.items[self.offsets[start]:self.offsets[start] + len(items)] = items
 
     def save(self, filename) -> None:
         """
@@ -195,23 +181,25 @@ class TransactionalDatabase:
         """
 
         with open(filename, 'w') as f:
-            for line in self.db:
-                f.write(','.join(map(str, line)) + '\n')
+            for start, offsets, (items,) in engine.chunksOf(self.offsets, self.items):
+                f.write(formatLines([(items, offsets)], len(offsets) - 1, sep=','))
 
-    def getTransactions(self) -> pd.DataFrame:
+    def getTransactions(self) -> 'pd.DataFrame':
         """
         Get the transactional database in dataFrame format
 
         Returns:
         db: pd.dataFrame - transactional database
         """
-        df = pd.DataFrame(self.db)
+        items = self.items.tolist()
+        offsets = self.offsets.tolist()
+        df = pd.DataFrame([items[a:b] for a, b in zip(offsets[:-1], offsets[1:])])
         return df
         
 
 if __name__ == "__main__":
     # test the class
-    obj = TransactionalDatabase(sys.argv[1], sys.argv[2], sys.argv[3])
+    obj = TransactionalDatabase(int(sys.argv[1]), float(sys.argv[2]), int(sys.argv[3]))
     obj.create()
     obj.save(sys.argv[4])
     # print(obj.getTransactions())
@@ -1,5 +1,7 @@
-import random as _rd
+import numpy as _np
 import sys as _sys
+from PAMI.extras.syntheticDataGenerator import generatorEngine as _engine
+from PAMI.extras.raggedRows import formatLines
 
 
 class createGeoreferentialTemporalDatabase:
@@ -41,26 +43,16 @@ class createGeoreferentialTemporalDatabase:
         :type outputFile: str
         :return: outputFile name
         """
-        writer = open(outputFile, 'w+')
-        items = []
-        count = 1
-        for i in range(self._noOfItems):
-            lat = _rd.randint(1, self._noOfItems)
-            lon = _rd.randint(1, self._noOfItems)
-            if lat == lon:
-                lon = _rd.randint(1, self._noOfItems)
-            stt = '(' + str(lat) + ' ' + str(lon) + ')'
-            items.append(stt)
-        for i in range(self._totalTransactions):
-            length = _rd.randint(1, self._avgTransactionLength + 20)
-            st = str(count)
-            for i in range(length):
-                rd = _rd.randint(0, len(items) - 1)
-                item = items[rd]
-                st = st + str(item) + '\t'
-            writer.write("%s \n" % st)
-            count += 1
-            
+        sampler = _engine.ItemSampler(self._noOfItems)
+        lengths = _engine.uniformLengths(self._totalTransactions, self._avgTransactionLength + 20, self._noOfItems,
+                                         sampler.rng)
+        labels = _engine.coordinates(self._noOfItems, sampler.rng)
+        with open(outputFile, 'w') as writer:
+            for start, items, offsets in sampler.chunks(lengths):
+                rows = len(offsets) - 1
+                writer.write(formatLines([_np.arange(start + 1, start + rows + 1), '\t',
+                                         (labels[items - 1], offsets), '\t \n'], rows, end=''))
+
 if __name__ == "__main__":
     _ap = str()
     _ap = createSyntheticGeoreferentialTemporal(100000, 870, 10)
@@ -1,5 +1,7 @@
-import random as _rd
+import numpy as _np
 import sys as _sys
+from PAMI.extras.syntheticDataGenerator import generatorEngine as _engine
+from PAMI.extras.raggedRows import formatLines
 class createSyntheticTemporal:
     """
     This class create synthetic temporal database.
@@ -39,17 +41,15 @@ class createSyntheticTemporal:
         :type outputFile: str
         :return: outputFile name
         """
-        count = 1
-        writer = open(outputFile, 'w+')
-        for i in range(self._totalTransactions):
-            length = _rd.randint(1, self._avgTransactionLength + 20)
-            st = str(count) + '\t'
-            for i in range(length):
-                item = _rd.randint(1, self._noOfItems)
-                st = st + str(item) + '\t'
-            writer.write("%s \n" % st)
-            count += 1
-            
+        sampler = _engine.ItemSampler(self._noOfItems)
+        lengths = _engine.uniformLengths(self._totalTransactions, self._avgTransactionLength + 20, self._noOfItems,
+                                         sampler.rng)
+        with open(outputFile, 'w') as writer:
+            for start, items, offsets in sampler.chunks(lengths):
+                rows = len(offsets) - 1
+                writer.write(formatLines([_np.arange(start + 1, start + rows + 1), '\t', (items, offsets),
+                                         '\t \n'], rows, end=''))
+
 if __name__ == "__main__":
     _ap = str()
     _ap = createSyntheticTemporal(100000, 870, 10)
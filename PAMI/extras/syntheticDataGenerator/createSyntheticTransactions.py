@@ -1,5 +1,6 @@
-import random as _rd
 import sys as _sys
+from PAMI.extras.syntheticDataGenerator import generatorEngine as _engine
+from PAMI.extras.raggedRows import formatLines
 class createSyntheticTransaction:
     """
     This class create synthetic transaction database.
@@ -39,15 +40,14 @@ class createSyntheticTransaction:
         :type outputFile: str
         :return: outputFile name
         """
-        writer = open(outputFile, 'w+')
-        for i in range(self._totalTransactions):
-            length = _rd.randint(1, self._avgTransactionLength + 20)
-            st = str()
-            for i in range(length):
-                item = _rd.randint(1, self._noOfItems)
-                st = st + str(item) + '\t'
-            writer.write("%s \n" % st)
-            
+        sampler = _engine.ItemSampler(self._noOfItems)
+        lengths = _engine.uniformLengths(self._totalTransactions, self._avgTransactionLength + 20, self._noOfItems,
+                                         sampler.rng)
+        with open(outputFile, 'w') as writer:
+            for start, items, offsets in sampler.chunks(lengths):
+                rows = len(offsets) - 1
+                writer.write(formatLines([(items, offsets), '\t \n'], rows, end=''))
+
 if __name__ == "__main__":
     _ap = str()
     _ap = createSyntheticTransaction(100000, 870, 10)
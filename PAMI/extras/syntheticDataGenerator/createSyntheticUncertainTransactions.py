@@ -1,5 +1,6 @@
-import random as _rd
 import sys as _sys
+from PAMI.extras.syntheticDataGenerator import generatorEngine as _engine
+from PAMI.extras.raggedRows import formatLines
 
 
 class createSyntheticUncertainTransaction:
@@ -41,20 +42,16 @@ class createSyntheticUncertainTransaction:
         :type outputFile: str
         :return: outputFile name
         """
-        writer = open(outputFile, 'w+')
-        for i in range(self._totalTransactions):
-            length = _rd.randint(1, self._avgTransactionLength + 20)
-            st = str()
-            st1 = str()
-            for i in range(length):
-                item = _rd.randint(1, self._noOfItems)
-                probability = _rd.uniform(0, 1)
-                st = st + str(item) + '\t'
-                st1 = st1 + str(probability) + '\t'
-            writer.write("%s:" % st)
-            writer.write("%s \n" % st1)
-            
-            
+        sampler = _engine.ItemSampler(self._noOfItems)
+        lengths = _engine.uniformLengths(self._totalTransactions, self._avgTransactionLength + 20, self._noOfItems,
+                                         sampler.rng)
+        with open(outputFile, 'w') as writer:
+            for start, items, offsets in sampler.chunks(lengths):
+                rows = len(offsets) - 1
+                probabilities = sampler.rng.random(len(items))
+                writer.write(formatLines([(items, offsets), '\t:', (probabilities, offsets), '\t \n'],
+                                         rows, end=''))
+
 if __name__ == "__main__":
     _ap = str()
     _ap = createSyntheticUncertainTransaction(100000, 870, 10)
@@ -1,5 +1,6 @@
-import random as _rd
 import sys as _sys
+from PAMI.extras.syntheticDataGenerator import generatorEngine as _engine
+from PAMI.extras.raggedRows import formatLines, rowSums
 
 
 class createSyntheticUtility:
@@ -45,23 +46,16 @@ class createSyntheticUtility:
         :type outputFile: str
         :return: outputFile name
         """
-        writer = open(outputFile, 'w+')
-        for i in range(self._totalTransactions):
-            length = _rd.randint(1, self._avgTransactionLength + 20)
-            st = str()
-            st1 = str()
-            su = []
-            for i in range(length):
-                item = _rd.randint(1, self._noOfItems)
-                utility = _rd.randint(1, self._maxUtilRange) 
-                st = st + str(item) + '\t'
-                su.append(utility)
-                st1 = st1 + str(utility) + '\t'
-            summation = sum([i for i in su])
-            st = st + ":" + str(summation) + ":"
-            writer.write("%s" % st)
-            writer.write("%s \n" % st1)
-            
+        sampler = _engine.ItemSampler(self._noOfItems)
+        lengths = _engine.uniformLengths(self._totalTransactions, self._avgTransactionLength + 20, self._noOfItems,
+                                         sampler.rng)
+        with open(outputFile, 'w') as writer:
+            for start, items, offsets in sampler.chunks(lengths):
+                rows = len(offsets) - 1
+                utilities = sampler.rng.integers(1, self._maxUtilRange + 1, len(items))
+                writer.write(formatLines([(items, offsets), '\t:', rowSums(utilities, offsets), ':',
+                                         (utilities, offsets), '\t \n'], rows, end=''))
+
 if __name__ == "__main__":
     _ap = str()
     _ap = createSyntheticUtility(100000, 870, 100, 10)
@@ -1,30 +1,34 @@
-import random
+import numpy as np
+from PAMI.extras.syntheticDataGenerator import generatorEngine as engine
+from PAMI.extras.raggedRows import formatLines
 
 
 class generateTransactional:
     __transactionSize: int
     __numOfItems: int
     __avgTransactionLength: int
-    __transactions: list[list[int]]
+    __items: np.ndarray
+    __offsets: np.ndarray
 
     def __init__(self, transactionSize: int, numOfItems: int, avgTransactionLength: int) -> None:
         self.__transactionSize = transactionSize
         self.__numOfItems = numOfItems
         self.__avgTransactionLength = avgTransactionLength
 
-        self.__transactions = list()
+        self.__items = np.zeros(0, dtype=np.int64)
+        self.__offsets = np.zeros(1, dtype=np.int64)
 
     def generate(self) -> None:
-        for tid in range(self.__transactionSize):
-            length = random.randint(1, self.__avgTransactionLength * 2)
-            transaction = [random.randint(1, self.__numOfItems)
-                           for _ in range(length)]
-            self.__transactions.append(transaction)
+        sampler = engine.ItemSampler(self.__numOfItems)
+        lengths = engine.uniformLengths(self.__transactionSize, self.__avgTransactionLength * 2, self.__numOfItems,
+                                        sampler.rng)
+        self.__items, self.__offsets = sampler.sample(lengths)
 
     def save(self, outputFile: str, sep="\t") -> None:
         with open(outputFile, 'w') as f:
-            for transaction in self.__transactions:
-                f.write(f"{sep.join(map(str, transaction))}\n")
+            for start, offsets, (items,) in engine.chunksOf(self.__offsets, self.__items):
+                rows = len(offsets) - 1
+                f.write(formatLines([(items, offsets)], rows, sep))
 
 
 if __name__ == "__main__":
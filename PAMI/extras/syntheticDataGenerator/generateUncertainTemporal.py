@@ -1,4 +1,6 @@
-import random
+import numpy as np
+from PAMI.extras.syntheticDataGenerator import generatorEngine as engine
+from PAMI.extras.raggedRows import formatLines, rowSums
 
 
 class generateUncertainTemporal:
@@ -6,8 +8,9 @@ class generateUncertainTemporal:
     __numOfItems: int
     __avgTransactionLength: int
     __significant: int
-    __transactions: list[list[int]]
-    __probabilitis: list[list[float]]
+    __items: np.ndarray
+    __offsets: np.ndarray
+    __probabilities: np.ndarray
 
     def __init__(self, transactionSize: int, numOfItems: int, avgTransactionLength: int, significant=2) -> None:
         self.__transactionSize = transactionSize
@@ -15,24 +18,25 @@ class generateUncertainTemporal:
         self.__avgTransactionLength = avgTransactionLength
         self.__significant = significant
 
-        self.__transactions = list()
-        self.__probabilitis = list()
+        self.__items = np.zeros(0, dtype=np.int64)
+        self.__offsets = np.zeros(1, dtype=np.int64)
+        self.__probabilities = np.zeros(0)
 
     def generate(self) -> None:
-        for tid in range(self.__transactionSize):
-            length = random.randint(1, self.__avgTransactionLength * 2)
-            transaction = [random.randint(1, self.__numOfItems)
-                           for _ in range(length)]
-            self.__transactions.append(transaction)
-            probability = [round(random.uniform(0, 1), self.__significant)
-                           for _ in range(length)]
-            self.__probabilitis.append(probability)
+        sampler = engine.ItemSampler(self.__numOfItems)
+        lengths = engine.uniformLengths(self.__transactionSize, self.__avgTransactionLength * 2, self.__numOfItems,
+                                        sampler.rng)
+        self.__items, self.__offsets = sampler.sample(lengths)
+        self.__probabilities = np.round(sampler.rng.random(len(self.__items)), self.__significant)
 
     def save(self, outputFile: str, sep="\t") -> None:
         with open(outputFile, 'w') as f:
-            for tid, (transaction, probability) in enumerate(zip(self.__transactions, self.__probabilitis)):
-                f.write(
-                    f"{tid+1}{sep}{sep.join(map(str, transaction))}:{round(sum(probability), self.__significant)}:{sep.join(map(str, probability))}\n")
+            for start, offsets, (items, probabilities) in engine.chunksOf(self.__offsets, self.__items,
+                                                                           self.__probabilities):
+                rows = len(offsets) - 1
+                sums = np.round(rowSums(probabilities, offsets, exact=False), self.__significant)
+                f.write(formatLines([np.arange(start + 1, start + rows + 1), sep, (items, offsets), ':', sums,
+                                    ':', (probabilities, offsets)], rows, sep))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
-import random
-import pandas as pd
+import numpy as np
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.extras.syntheticDataGenerator import generatorEngine as engine
+from PAMI.extras.raggedRows import formatLines, rowSums
 
 
 class generateUtilityTransactional:
@@ -10,9 +13,10 @@ class generateUtilityTransactional:
     __maxUtilityValue: int
     __minNumOfTimesAnItem: int
     __maxNumOfTimesAnItem: int
-    __transactions: list[list[int]]
-    __internalUtility: dict[str, list[int]]
-    __externalUtility: list[list[int]]
+    __items: np.ndarray
+    __offsets: np.ndarray
+    __internalUtility: dict[str, np.ndarray]
+    __externalUtility: np.ndarray
 
     def __init__(self, transactionSize: int, numOfItems: int, avgTransactionLength: int,
                  minUtilityValue: int, maxUtilityValue: int,
@@ -25,55 +29,53 @@ class generateUtilityTransactional:
         self.__minNumOfTimesAnItem = minNumOfTimesAnItem
         self.__maxNumOfTimesAnItem = maxNumOfTimesAnItem
 
-        self.__transactions = list()
+        self.__items = np.zeros(0, dtype=np.int64)
+        self.__offsets = np.zeros(1, dtype=np.int64)
         self.__internalUtility = dict()
-        self.__externalUtility = list()
+        self.__externalUtility = np.zeros(0, dtype=np.int64)
 
     def generate(self) -> None:
-        items = [i+1 for i in range(self.__numOfItems)]
-        self.__transactions = [random.sample(items, random.randint(
-            1, self.__avgTransactionLength*2)) for _ in range(self.__transactionSize)]
-        self.__generateInternalUtility()
-        self.__generateExternalUtility()
+        sampler = engine.ItemSampler(self.__numOfItems)
+        lengths = engine.uniformLengths(self.__transactionSize, self.__avgTransactionLength * 2, self.__numOfItems,
+                                        sampler.rng)
+        self.__items, self.__offsets = sampler.sample(lengths)
+        self.__generateInternalUtility(sampler.rng)
+        self.__generateExternalUtility(sampler.rng)
 
-    def __generateInternalUtility(self) -> None:
-        items = [i+1 for i in range(self.__numOfItems)]
-        utilityValues = [random.randint(
-            self.__minUtilityValue, self.__maxUtilityValue) for i in range(self.__numOfItems)]
+    def __generateInternalUtility(self, rng: np.random.Generator) -> None:
+        items = np.arange(1, self.__numOfItems + 1)
+        utilityValues = rng.integers(self.__minUtilityValue, self.__maxUtilityValue + 1, self.__numOfItems)
         self.__internalUtility = {
             "items": items, "utilityValues": utilityValues}
 
-    def __generateExternalUtility(self) -> None:
-        self.__externalUtility = [[random.randint(self.__minNumOfTimesAnItem, self.__maxNumOfTimesAnItem) for _ in range(
-            len(transaction))] for transaction in self.__transactions]
+    def __generateExternalUtility(self, rng: np.random.Generator) -> None:
+        self.__externalUtility = rng.integers(self.__minNumOfTimesAnItem, self.__maxNumOfTimesAnItem + 1,
+                                              len(self.__items))
 
     def save(self, outputFile: str, sep="\t", type="utility") -> None:
         if (type == "utility"):
             with open(outputFile, 'w') as f:
-                for transaction, exUtils in zip(self.__transactions, self.__externalUtility):
-                    f.write(f"{sep.join(map(str, transaction))}:")
-                    utilityValues = [
-                        eu*self.__internalUtility["utilityValues"][item-1] for item, eu in zip(transaction, exUtils)]
-                    f.write(
-                        f"{sum(utilityValues)}:{sep.join(map(str, utilityValues))}\n")
+                for start, offsets, (items, exUtils) in engine.chunksOf(self.__offsets, self.__items,
+                                                                        self.__externalUtility):
+                    rows = len(offsets) - 1
+                    utilityValues = exUtils * self.__internalUtility["utilityValues"][items - 1]
+                    sums = rowSums(utilityValues, offsets)
+                    f.write(formatLines([(items, offsets), ':', sums, ':', (utilityValues, offsets)], rows, sep))
 
         elif (type == "internal"):
             with open(outputFile, "w") as f:
-                for item, utility in zip(self.__internalUtility["items"], self.__internalUtility["utilityValues"]):
-                    f.write(f"{item}{sep}{utility}\n")
+                f.write(formatLines([self.__internalUtility["items"], sep,
+                                    self.__internalUtility["utilityValues"]], self.__numOfItems))
 
         elif (type == "external"):
+            chunkSize = max(1, 1000000 // max(1, self.__numOfItems))
             with open(outputFile, "w") as f:
-                for transaction, exUtils in zip(self.__transactions, self.__externalUtility):
-                    utils = list()
-                    count = 0
-                    for item in [i+1 for i in range(self.__numOfItems)]:
-                        if item in transaction:
-                            utils.append(exUtils[count])
-                            count += 1
-                        else:
-                            utils.append(0)
-                    f.write(f"{sep.join(map(str,utils))}\n")
+                for start, offsets, (items, exUtils) in engine.chunksOf(self.__offsets, self.__items,
+                                                                        self.__externalUtility, chunkSize=chunkSize):
+                    rows = len(offsets) - 1
+                    utils = np.zeros((rows, self.__numOfItems), dtype=np.int64)
+                    utils[np.repeat(np.arange(rows), np.diff(offsets)), items - 1] = exUtils
+                    f.write(formatLines([(utils.ravel(), np.arange(rows + 1) * self.__numOfItems)], rows, sep))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,318 @@
+# generatorEngine draws synthetic databases in bulk with numpy, a chunk of transactions at a time.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.extras.syntheticDataGenerator import generatorEngine as engine
+#
+#             from PAMI.extras.raggedRows import formatLines
+#
+#             sampler = engine.ItemSampler(numItems, zipfExponent=1.0, numPatterns=100, seed=1)
+#
+#             lengths = engine.transactionLengths(numTransactions, avgLength, numItems, rng=sampler.rng)
+#
+#             with open(outputFile, 'w') as writer:
+#
+#                 for start, items, offsets in sampler.chunks(lengths):
+#
+#                     writer.write(formatLines([(items, offsets)], len(offsets) - 1))
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import numpy as np
+from typing import Iterator, Optional, Tuple
+from PAMI.extras.raggedRows import ranges
+
+
+def _rng(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    return np.random.default_rng() if rng is None else rng
+
+
+def offsetsOf(lengths: np.ndarray) -> np.ndarray:
+    """
+    :param lengths: number of values of every row
+    :type lengths: numpy.ndarray
+    :return: the values of row r are values[offsets[r]:offsets[r + 1]]
+    :rtype: numpy.ndarray
+    """
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def tuneLengths(lengths: np.ndarray, total: int, minLength: int = 1, maxLength: Optional[int] = None,
+                rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Moves the lengths, in place, until they sum to total. The missing (or extra) units are spread over the rows in
+    one multinomial draw, weighted by how far every row is from its bound, and the few units lost to the bounds are
+    spread again.
+
+    :param lengths: length of every transaction
+    :type lengths: numpy.ndarray
+    :param total: the sum to reach
+    :type total: int
+    :param minLength: smallest length of a transaction
+    :type minLength: int
+    :param maxLength: largest length of a transaction, unbounded when None
+    :type maxLength: int
+    :return: lengths
+    :rtype: numpy.ndarray
+    """
+    rng = _rng(rng)
+    upper = np.iinfo(np.int64).max // max(1, len(lengths)) if maxLength is None else maxLength
+    if len(lengths) * minLength > total or len(lengths) * upper < total:
+        raise ValueError("Error: the lengths cannot sum to %d within [%d, %d]" % (total, minLength, upper))
+    np.clip(lengths, minLength, upper, out=lengths)
+    while True:
+        difference = int(total - lengths.sum())
+        if difference == 0:
+            return lengths
+        room = (upper - lengths) if difference > 0 else (lengths - minLength)
+        room = room.astype(np.float64)
+        moves = rng.multinomial(abs(difference), room / room.sum())
+        moves = np.minimum(moves, room.astype(np.int64))
+        lengths += moves if difference > 0 else -moves
+
+
+def transactionLengths(numTransactions: int, avgLength: float, maxLength: Optional[int] = None, minLength: int = 1,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Poisson distributed transaction lengths, as in the IBM Quest generator, tuned so that their average is exactly
+    avgLength (up to rounding of the total)
+
+    :param numTransactions: number of transactions
+    :type numTransactions: int
+    :param avgLength: average length of a transaction
+    :type avgLength: float
+    :param maxLength: largest length of a transaction, usually the number of items
+    :type maxLength: int
+    :param minLength: smallest length of a transaction
+    :type minLength: int
+    :return: length of every transaction
+    :rtype: numpy.ndarray
+    """
+    rng = _rng(rng)
+    lengths = rng.poisson(avgLength, int(numTransactions)).astype(np.int64)
+    return tuneLengths(lengths, int(round(numTransactions * avgLength)), minLength, maxLength, rng)
+
+
+def uniformLengths(numTransactions: int, maxLength: int, numItems: int,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Transaction lengths drawn uniformly between 1 and maxLength, and at most numItems
+
+    :return: length of every transaction
+    :rtype: numpy.ndarray
+    """
+    rng = _rng(rng)
+    return np.minimum(rng.integers(1, maxLength + 1, int(numTransactions)), numItems).astype(np.int64)
+
+
+def zipfWeights(numItems: int, exponent: float) -> np.ndarray:
+    """
+    :return: the probability of item i (counted from 0) proportional to 1 / (i + 1) ** exponent
+    :rtype: numpy.ndarray
+    """
+    weights = 1.0 / np.arange(1, numItems + 1, dtype=np.float64) ** exponent
+    return weights / weights.sum()
+
+
+class ItemSampler:
+    """
+    :Description:  Draws the items of many transactions at once. Items are numbered from 1 to numItems and the items
+                   of a transaction are distinct and sorted.
+
+                   Items are uniform, or Zipf distributed when zipfExponent > 0. With numPatterns > 0 the transactions
+                   are seeded with correlated itemsets in the style of the IBM Quest generator: every pattern has a
+                   Poisson length around avgPatternLength, shares an exponentially distributed fraction (mean
+                   correlation) of its items with the previous pattern, has an exponentially distributed weight and
+                   a corruption level around 0.5. A transaction takes patterns by weight, drops every item of a
+                   pattern with the corruption level of the pattern, keeps what fits in its length and is filled up
+                   with single items.
+
+    :Attributes:
+
+        numItems : int
+            number of items
+        weights : numpy.ndarray
+            probability of every item, None when uniform
+        patterns : tuple
+            (items, offsets, weights, corruption) of the seeded patterns, None without patterns
+        rng : numpy.random.Generator
+            the random generator
+    """
+
+    def __init__(self, numItems: int, zipfExponent: float = 0.0, numPatterns: int = 0, avgPatternLength: float = 4,
+                 correlation: float = 0.5, seed: Optional[int] = None) -> None:
+        self.numItems = int(numItems)
+        self.rng = np.random.default_rng(seed)
+        self.weights = zipfWeights(self.numItems, zipfExponent) if zipfExponent > 0 else None
+        self.patterns = None
+        if numPatterns > 0:
+            self.patterns = self._questPatterns(int(numPatterns), avgPatternLength, correlation)
+
+    def _draw(self, size: int) -> np.ndarray:
+        """
+        Independent items, counted from 0
+        """
+        if self.weights is None:
+            return self.rng.integers(0, self.numItems, size)
+        return self.rng.choice(self.numItems, size, p=self.weights)
+
+    def _questPatterns(self, numPatterns: int, avgLength: float, correlation: float) -> tuple:
+        lengths = np.clip(self.rng.poisson(avgLength, numPatterns), 1, self.numItems)
+        shared = np.minimum(self.rng.exponential(correlation, numPatterns), 1.0)
+        rows = []
+        previous = np.zeros(0, dtype=np.int64)
+        for length, fraction in zip(lengths.tolist(), shared.tolist()):
+            keep = min(len(previous), int(fraction * length))
+            row = self.rng.choice(previous, keep, replace=False) if keep else np.zeros(0, dtype=np.int64)
+            candidates = self._draw(4 * length)
+            candidates = candidates[np.sort(np.unique(candidates, return_index=True)[1])]
+            fresh = candidates[~np.isin(candidates, row)]
+            row = np.sort(np.concatenate((row, fresh[:length - keep]))).astype(np.int64)
+            rows.append(row)
+            previous = row
+        weights = self.rng.exponential(1.0, numPatterns)
+        corruption = np.clip(self.rng.normal(0.5, 0.1, numPatterns), 0.0, 1.0)
+        return (np.concatenate(rows).astype(np.int64), offsetsOf([len(row) for row in rows]),
+                weights / weights.sum(), corruption)
+
+    def _seed(self, lengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Items taken from the patterns, as (row, item) pairs with at most lengths[row] pairs per row
+        """
+        patternItems, patternOffsets, patternWeights, corruption = self.patterns
+        rounds = max(1, int(np.ceil(lengths.mean() / max(1.0, np.diff(patternOffsets).mean()))))
+        room = lengths.copy()
+        seededRows, seededItems = [], []
+        for _ in range(rounds):
+            active = np.flatnonzero(room > 0)
+            if len(active) == 0:
+                break
+            chosen = self.rng.choice(len(patternWeights), len(active), p=patternWeights)
+            sizes = np.diff(patternOffsets)[chosen]
+            positions = ranges(patternOffsets[chosen], sizes)
+            rows = np.repeat(active, sizes)
+            kept = self.rng.random(len(positions)) >= np.repeat(corruption[chosen], sizes)
+            positions, rows = positions[kept], rows[kept]
+            rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+            fits = rank < room[rows]
+            rows, positions = rows[fits], positions[fits]
+            room -= np.bincount(rows, minlength=len(room))
+            seededRows.append(rows)
+            seededItems.append(patternItems[positions])
+        return np.concatenate(seededRows), np.concatenate(seededItems)
+
+    def _distinct(self, items: np.ndarray, offsets: np.ndarray) -> None:
+        """
+        Redraws, in place, the repeated items of every row until the items of every row are distinct, and sorts them
+        """
+        active = np.arange(len(offsets) - 1)
+        while len(active):
+            sizes = offsets[active + 1] - offsets[active]
+            positions = ranges(offsets[active], sizes)
+            rows = np.repeat(np.arange(len(active)), sizes)
+            keys = rows * self.numItems + items[positions]
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+            items[positions] = items[positions][order]
+            repeated = np.zeros(len(keys), dtype=bool)
+            repeated[1:] = keys[1:] == keys[:-1]
+            if not repeated.any():
+                return
+            items[positions[repeated]] = self._draw(int(repeated.sum()))
+            active = active[np.unique(rows[repeated])]
+
+    def sample(self, lengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Items of a batch of transactions
+
+        :param lengths: length of every transaction, at most numItems
+        :type lengths: numpy.ndarray
+        :return: (items, offsets), the items of transaction r are items[offsets[r]:offsets[r + 1]]
+        :rtype: tuple
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if len(lengths) and lengths.max() > self.numItems:
+            raise ValueError("Error: a transaction cannot hold more than %d distinct items" % self.numItems)
+        offsets = offsetsOf(lengths)
+        items = self._draw(int(offsets[-1])).astype(np.int64)
+        if self.patterns is not None and len(lengths):
+            rows, seeded = self._seed(lengths)
+            order = np.argsort(rows, kind='stable')
+            rows, seeded = rows[order], seeded[order]
+            rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+            items[offsets[rows] + rank] = seeded
+        dense = np.flatnonzero(2 * lengths > self.numItems)
+        for row in dense.tolist():
+            items[offsets[row]:offsets[row + 1]] = self.rng.choice(self.numItems, lengths[row], replace=False,
+                                                                   p=self.weights)
+        self._distinct(items, offsets)
+        return items + 1, offsets
+
+    def chunks(self, lengths: np.ndarray, chunkSize: int = 100000) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Items of the transactions, chunkSize transactions at a time
+
+        :param lengths: length of every transaction
+        :type lengths: numpy.ndarray
+        :param chunkSize: number of transactions of a chunk
+        :type chunkSize: int
+        :return: (index of the first transaction, items, offsets) of every chunk
+        :rtype: generator
+        """
+        for start in range(0, len(lengths), chunkSize):
+            items, offsets = self.sample(lengths[start:start + chunkSize])
+            yield start, items, offsets
+
+
+def chunksOf(offsets: np.ndarray, *values: np.ndarray,
+             chunkSize: int = 100000) -> Iterator[Tuple[int, np.ndarray, Tuple[np.ndarray, ...]]]:
+    """
+    Splits rows stored as (values, offsets) into chunks of chunkSize rows
+
+    :param offsets: the values of row r are values[offsets[r]:offsets[r + 1]]
+    :type offsets: numpy.ndarray
+    :param values: one or more arrays of values sharing the offsets
+    :type values: numpy.ndarray
+    :return: (index of the first row, offsets of the chunk counted from 0, values of the chunk) of every chunk
+    :rtype: generator
+    """
+    for start in range(0, len(offsets) - 1, chunkSize):
+        stop = min(start + chunkSize, len(offsets) - 1)
+        first, last = offsets[start], offsets[stop]
+        yield start, offsets[start:stop + 1] - first, tuple(array[first:last] for array in values)
+
+
+def coordinates(numItems: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Random '(lat lon)' labels of the items of a georeferenced database, with lat and lon between 1 and numItems
+
+    :return: the label of every item, counted from 0
+    :rtype: numpy.ndarray
+    """
+    rng = _rng(rng)
+    lat = rng.integers(1, numItems + 1, numItems)
+    lon = rng.integers(1, numItems + 1, numItems)
+    same = lat == lon
+    lon[same] = rng.integers(1, numItems + 1, int(same.sum()))
+    return np.array(['(' + str(a) + ' ' + str(b) + ')' for a, b in zip(lat.tolist(), lon.tolist())], dtype=object)
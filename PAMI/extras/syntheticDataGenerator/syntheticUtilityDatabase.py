@@ -1,4 +1,6 @@
 import random as _rd
+from PAMI.extras.syntheticDataGenerator import generatorEngine as _engine
+from PAMI.extras.raggedRows import formatLines, rowSums
 
 
 class syntheticUtilityDatabase:
@@ -52,24 +54,14 @@ class syntheticUtilityDatabase:
             print("Error: avgTransactionLength cannot exceed numOfItems.")
             return
 
+        sampler = _engine.ItemSampler(self.numOfItems)
+        lengths = _engine.uniformLengths(self.totalTransactions, self.avgTransactionLength + 20, self.numOfItems,
+                                         sampler.rng)
         with open(outputFile, 'w') as writer:
-            for _ in range(self.totalTransactions):
-                length = _rd.randint(1, self.avgTransactionLength + 20)
-                items = [_rd.randint(1, self.numOfItems) for _ in range(length)]
-                utilities = [_rd.randint(1, self.maxUtilRange) for _ in range(length)]
-
-                # Generating 13 random numbers with a target sum of 2000
-                randomNumbers = self.createRandomNumbers(13, 2000)
-
-                # Checking if avgTransactionLength exceeds numOfItems
-                if self.avgTransactionLength > self.numOfItems:
-                    print("Error: avgTransactionLength cannot exceed numOfItems.")
-                    return
-
-                st = '\t'.join(map(str, items)) + '\t:' + str(sum(utilities)) + ':'
-                st1 = '\t'.join(map(str, randomNumbers)) + '\t'
-
-                writer.write(f"{st}{st1}\n")
+            for start, items, offsets in sampler.chunks(lengths):
+                utilities = sampler.rng.integers(1, self.maxUtilRange + 1, len(items))
+                writer.write(formatLines([(items, offsets), '\t:', rowSums(utilities, offsets), ':',
+                                         (utilities, offsets), '\t\n'], len(offsets) - 1, end=''))
 
     def createRandomNumbers(self, n: int, targetSum: int) -> list[float]:
         """
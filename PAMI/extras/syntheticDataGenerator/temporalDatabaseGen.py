@@ -1,4 +1,7 @@
 import random as _rd
+import numpy as _np
+from PAMI.extras.syntheticDataGenerator import generatorEngine as _engine
+from PAMI.extras.raggedRows import formatLines
 
 
 class CreateSyntheticTemporal:
@@ -42,23 +45,14 @@ class CreateSyntheticTemporal:
             print("Error: avg_transaction_length cannot exceed num_of_items.")
             return
 
-        count = 1
+        sampler = _engine.ItemSampler(self.num_of_items)
+        lengths = _engine.uniformLengths(self.total_transactions, self.avg_transaction_length + 20, self.num_of_items,
+                                         sampler.rng)
         with open(output_file, 'w') as writer:
-            for _ in range(self.total_transactions):
-                length = _rd.randint(1, self.avg_transaction_length + 20)
-                st = str(count) + '\t'
-                random_numbers = self.generate_random_numbers(13, 2000)
-
-                # Checking if avgTransactionLength exceeds numOfItems
-                if self.avg_transaction_length > self.num_of_items:
-                    print("Error: avg_transaction_length cannot exceed num_of_items.")
-                    return
-
-                for _ in range(length):
-                    item = _rd.randint(1, self.num_of_items)
-                    st = st + str(item) + '\t'
-                writer.write("%s \n" % st)
-                count += 1
+            for start, items, offsets in sampler.chunks(lengths):
+                rows = len(offsets) - 1
+                writer.write(formatLines([_np.arange(start + 1, start + rows + 1), '\t', (items, offsets),
+                                         '\t \n'], rows, end=''))
 
     def generate_random_numbers(self, n: int, target_sum: int) -> list[float]:
         """
@@ -1,6 +1,8 @@
 import numpy as np
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 import random
+from PAMI.extras.raggedRows import formatLines
 
 
 class UtilityDataGenerator:
@@ -14,7 +16,8 @@ class UtilityDataGenerator:
         self.maxInternalUtilityValue = maximumInternalUtilityValue
         self.minExternalUtilityValue = minimumExternalUtilityValue
         self.maxExternalUtilityValue = maximumExternalUtilityValue
-        self.entries = []
+        self.entries = np.zeros((0, numberOfItems), dtype=np.int64)
+        self.sums = np.zeros(0, dtype=np.int64)
         self.ExternalUtilityData = self.GenerateExternalUtilityData()
 
     def GenerateExternalUtilityData(self):
@@ -22,19 +25,26 @@ class UtilityDataGenerator:
         ExternalUtilityData = {f'item{item}': random.randint(100, 900) for item in items}
         return ExternalUtilityData
 
-    def Generate(self):
-        for entry_id in range(1, self.databaseSize + 1):
-            entry_length = np.random.randint(1, self.averageLengthOfTransaction * 2)
-            entry = np.random.randint(self.minInternalUtilityValue, self.maxInternalUtilityValue + 1,
-                                      size=self.numberOfItems)
-            entry_sum = entry.sum()
-            self.entries.append((entry, entry_sum))
-
-    def Save(self, fileName):
+    def Generate(self, chunkSize=10000):
+        # drawn chunkSize entries at a time into one matrix of the smallest integer type that holds the utilities
+        dtype = np.result_type(np.min_scalar_type(self.minInternalUtilityValue),
+                               np.min_scalar_type(self.maxInternalUtilityValue))
+        self.entries = np.empty((self.databaseSize, self.numberOfItems), dtype=dtype)
+        for start in range(0, self.databaseSize, chunkSize):
+            rows = min(chunkSize, self.databaseSize - start)
+            self.entries[start:start + rows] = np.random.randint(self.minInternalUtilityValue,
+                                                                 self.maxInternalUtilityValue + 1,
+                                                                 size=(rows, self.numberOfItems))
+        self.sums = self.entries.sum(axis=1, dtype=np.int64)
+
+    def Save(self, fileName, chunkSize=10000):
         with open(fileName, 'w') as file:
-            for idx, (entry, entry_sum) in enumerate(self.entries, start=1):
-                entry_str = '\t'.join(map(str, entry))
-                file.write(f'{idx}\t{entry_str}\t{entry_sum}\n')
+            for start in range(0, len(self.entries), chunkSize):
+                entries = self.entries[start:start + chunkSize]
+                rows = len(entries)
+                offsets = np.arange(rows + 1, dtype=np.int64) * self.numberOfItems
+                file.write(formatLines([np.arange(start + 1, start + rows + 1), '\t', (entries.ravel(), offsets), '\t',
+                                        self.sums[start:start + rows]], rows))
 
     def SaveItemsInternalUtilityValues(self, fileName):
         items = random.sample(range(1, self.numberOfItems + 1), self.numberOfItems)
@@ -53,8 +63,8 @@ class UtilityDataGenerator:
 
     def GetUtilityData(self):
         data = {'Entry ID': range(1, len(self.entries) + 1),
-                'Entries': [entry for entry, _ in self.entries],
-                'Sum': [entry_sum for _, entry_sum in self.entries]}
+                'Entries': list(self.entries),
+                'Sum': self.sums}
         df = pd.DataFrame(data)
         return df
 
@@ -1,6 +1,7 @@
 
-import networkx as nx
-import matplotlib.pyplot as plt
+from PAMI import lazyImport as _lazyImport
+nx = _lazyImport.lazyModule('networkx')
+plt = _lazyImport.lazyModule('matplotlib.pyplot')
 
 class graphDatabase:
 
@@ -52,9 +52,11 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.faultTolerantFrequentPattern.basic import abstract as _ab
-import pandas as pd
+from PAMI.faultTolerantFrequentPattern.basic import faultTolerantEngine as _engine
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class FTApriori(_ab._faultTolerantFrequentPatterns):
@@ -230,32 +232,6 @@ class FTApriori(_ab._faultTolerantFrequentPatterns):
                 value = int(value)
         return value
 
-    def _Count(self, k) -> Tuple[int, List[List[str]]]:
-        """
-        :param k: list of items
-
-        :type k: list
-
-        :return: count of items in k and list
-
-        :rtype: tuple
-
-        """
-        count = 0
-        items = []
-        k = list(k)
-        n = len(k) - self._faultTolerance
-        c = _ab._itertools.combinations(k, n)
-        count = 0
-        for j in c:
-            j = list(j)
-            for i in self._Database:
-                if set(j).issubset(i):
-                    count += 1
-                    items.append(i)
-        items = list(set(map(tuple, items)))
-        return len(items), items
-
     def _oneLengthFrequentItems(self) -> None:
         self._mapSupport = {}
         for li in self._Database:
@@ -266,36 +242,6 @@ class FTApriori(_ab._faultTolerantFrequentPatterns):
                     self._mapSupport[i] += 1
         self._mapSupport = {k: v for k, v in self._mapSupport.items() if v >= self._itemSup}
 
-    def _countItemSupport(self, itemset) -> int:
-        """
-        This function is used to count the  itemSupport
-
-        :param itemSet: frequent itemSet that generated
-
-        :type itemset: list
-
-        :return: count of items
-
-        :rtype: int
-
-        """
-        tids = {}
-        res = True
-        count = 0
-        for x in self._Database:
-            if abs(len(itemset) - len(set(x) & set(itemset))) <= self._faultTolerance:
-                count += 1
-        return count
-
-    def _getFaultPatterns(self) -> None:
-        l = [k for k, v in self._mapSupport.items()]
-        for i in range(0, len(l) + 1):
-            c = _ab._itertools.combinations(l, i)
-            for j in c:
-                res = self._countItemSupport(j)
-                if len(j) >= self._minLength and res >= self._minSup:
-                    self._finalPatterns[tuple(j)] = res
-
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self) -> None:
         """
@@ -316,8 +262,12 @@ class FTApriori(_ab._faultTolerantFrequentPatterns):
         self._minLength = int(self._minLength)
         self._faultTolerance = int(self._faultTolerance)
         self._oneLengthFrequentItems()
-
-        self._getFaultPatterns()
+        self._finalPatterns = {}
+        items = list(self._mapSupport)
+        bitmap = _engine.itemBitmap(self._Database, items)
+        for pattern, support in _engine.mine(bitmap, len(self._Database), self._minSup, self._faultTolerance,
+                                             self._minLength):
+            self._finalPatterns[tuple(items[i] for i in pattern)] = support
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -365,7 +315,7 @@ class FTApriori(_ab._faultTolerantFrequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -437,7 +387,6 @@ if __name__ == "__main__":
                             _ab._sys.argv[5], _ab._sys.argv[6], _ab._sys.argv[7], )
         if len(_ab._sys.argv) == 7:
             _ap = FTApriori(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5], _ab._sys.argv[6])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -57,8 +57,9 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.faultTolerantFrequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 _minSup = str()
 _fp._sys.setrecursionlimit(20000)
@@ -396,7 +397,7 @@ class FTFPGrowth(_fp._faultTolerantFrequentPatterns):
     __rank = {}
     __rankDup = {}
 
-    def __init__(self, iFile: Union[str, pd.DataFrame], minSup: Union[int, float, str], itemSup: float, minLength: int, faultTolerance: int, sep: str='\t') -> None:
+    def __init__(self, iFile: 'Union[str, pd.DataFrame]', minSup: Union[int, float, str], itemSup: float, minLength: int, faultTolerance: int, sep: str='\t') -> None:
         super().__init__(iFile, minSup, itemSup, minLength, faultTolerance, sep)
 
     def __creatingItemSets(self) -> None:
@@ -625,7 +626,7 @@ class FTFPGrowth(_fp._faultTolerantFrequentPatterns):
 
         return self.__endTime - self.__startTime
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -688,7 +689,6 @@ if __name__ == "__main__":
                              _fp._sys.argv[5], _fp._sys.argv[6], _fp._sys.argv[7])
         if len(_fp._sys.argv) == 7:
             _ap = FTFPGrowth(_fp._sys.argv[1], _fp._sys.argv[3], _fp._sys.argv[4], _fp._sys.argv[5], _fp._sys.argv[6])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_fp._sys.argv[2])
@@ -0,0 +1,153 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Level-wise search shared by the fault-tolerant frequent pattern miners.
+
+The fault-tolerant support of a pattern X is the number of transactions that miss at most f items of X. A transaction
+missing at most f items of X misses at most f items of every subset of X, so the support is anti-monotone and the
+patterns are mined level by level: the candidates of length k are joined from frequent patterns of length k - 1 that
+share a prefix, and a candidate is dropped as soon as one of its subsets of length k - 1 is not frequent.
+
+Every item is a row of a packed uint64 transaction bitmap. Instead of the number of items of a pattern P present in
+every transaction, the count is kept bit-sliced: exact[d] marks the transactions that miss exactly d items of P, for d
+from 0 to f. A transaction missing fewer than f items of P supports every extension P + (b,), and one missing exactly f
+items supports it only when it contains b, so all the extensions of P are counted at once as
+
+    support(P + (b,)) = popcount(exact[0] | ... | exact[f - 1]) + popcount(exact[f] & row[b])
+
+.. code-block:: python
+
+        from PAMI.faultTolerantFrequentPattern.basic import faultTolerantEngine as engine
+
+        bitmap = engine.itemBitmap(transactions, items)
+
+        for pattern, support in engine.mine(bitmap, len(transactions), minSup, faultTolerance):
+            print([items[item] for item in pattern], support)
+"""
+
+import numpy as _np
+from typing import Iterable, Iterator, List, Tuple
+from PAMI.extras.packedBitsets import popcount as _popcount
+
+
+def itemBitmap(transactions: List[Iterable], items: List) -> _np.ndarray:
+    """
+    Packed item x transaction bitmap
+
+    :param transactions: the items of every transaction
+    :type transactions: list
+    :param items: the items to keep, one row each
+    :type items: list
+    :return: bit t of row i is set when transaction t contains items[i]
+    :rtype: numpy.ndarray
+    """
+    index = {item: i for i, item in enumerate(items)}
+    rows, tids = [], []
+    for tid, transaction in enumerate(transactions):
+        for item in set(transaction):
+            position = index.get(item)
+            if position is not None:
+                rows.append(position)
+                tids.append(tid)
+    words = max(1, (len(transactions) + 63) // 64)
+    bitmap = _np.zeros((len(items), words), dtype=_np.uint64)
+    rows = _np.asarray(rows, dtype=_np.int64)
+    tids = _np.asarray(tids, dtype=_np.int64)
+    _np.bitwise_or.at(bitmap, (rows, tids >> 6), _np.left_shift(_np.uint64(1), (tids & 63).astype(_np.uint64)))
+    return bitmap
+
+
+def _validMask(numTransactions: int, words: int) -> _np.ndarray:
+    """
+    :return: the bits of the transactions of the database
+    """
+    mask = _np.zeros(words, dtype=_np.uint64)
+    full, rest = divmod(numTransactions, 64)
+    mask[:full] = _np.uint64(0xFFFFFFFFFFFFFFFF)
+    if rest:
+        mask[full] = _np.uint64((1 << rest) - 1)
+    return mask
+
+
+def _extensionSupports(bitmap: _np.ndarray, valid: _np.ndarray, prefix: tuple, extensions: List[int],
+                       faultTolerance: int) -> _np.ndarray:
+    """
+    Fault-tolerant supports of prefix + (b,) for every b in extensions
+    """
+    exact = [valid.copy()] + [_np.zeros_like(valid) for _ in range(faultTolerance)]
+    for item in prefix:
+        row = bitmap[item]
+        for d in range(faultTolerance, 0, -1):
+            exact[d] = (exact[d] & row) | (exact[d - 1] & ~row)
+        exact[0] &= row
+    fewer = _np.zeros_like(valid)
+    for d in range(faultTolerance):
+        fewer |= exact[d]
+    base = int(_popcount(fewer[None, :])[0])
+    return base + _popcount(bitmap[extensions] & exact[faultTolerance])
+
+
+def mine(bitmap: _np.ndarray, numTransactions: int, minSup: float, faultTolerance: int,
+         minLength: int = 0) -> Iterator[Tuple[tuple, int]]:
+    """
+    Fault-tolerant frequent patterns, shortest first and in lexicographic order of the item indexes within a length
+
+    :param bitmap: packed item x transaction bitmap, as returned by itemBitmap
+    :type bitmap: numpy.ndarray
+    :param numTransactions: number of transactions of the database
+    :type numTransactions: int
+    :param minSup: minimum fault-tolerant support
+    :type minSup: int or float
+    :param faultTolerance: number of items of a pattern a transaction may miss
+    :type faultTolerance: int
+    :param minLength: length of the shortest pattern to report. The empty pattern is reported when it is 0.
+    :type minLength: int
+    :return: (item indexes, fault-tolerant support) of every pattern
+    :rtype: generator
+    """
+    if numTransactions < minSup:
+        return
+    faultTolerance = max(0, int(faultTolerance))
+    valid = _validMask(numTransactions, bitmap.shape[1])
+    if minLength <= 0:
+        yield (), numTransactions
+    items = list(range(len(bitmap)))
+    supports = _extensionSupports(bitmap, valid, (), items, faultTolerance) if items else []
+    frequent = [(item,) for item, support in zip(items, supports) if support >= minSup]
+    if minLength <= 1:
+        for pattern, support in zip(items, supports):
+            if support >= minSup:
+                yield (pattern,), int(support)
+    while frequent:
+        known = set(frequent)
+        groups = {}
+        for pattern in frequent:
+            groups.setdefault(pattern[:-1], []).append(pattern[-1])
+        nextLevel = []
+        for prefix, lasts in groups.items():
+            for i in range(len(lasts) - 1):
+                pattern = prefix + (lasts[i],)
+                extensions = [b for b in lasts[i + 1:]
+                              if all(pattern[:k] + pattern[k + 1:] + (b,) in known for k in range(len(prefix)))]
+                if not extensions:
+                    continue
+                supports = _extensionSupports(bitmap, valid, pattern, extensions, faultTolerance)
+                for b, support in zip(extensions, supports.tolist()):
+                    if support >= minSup:
+                        nextLevel.append(pattern + (b,))
+                        if len(pattern) + 1 >= minLength:
+                            yield pattern + (b,), support
+        frequent = nextLevel
@@ -50,7 +50,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.frequentPattern.basic import abstract as _ab
 from typing import Dict, Union
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class Apriori(_ab._frequentPatterns):
@@ -163,37 +163,7 @@ class Apriori(_ab._frequentPatterns):
         """
         Storing the complete transactions of the database/input file in a database variable
         """
-        self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            temp = []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                temp = self._iFile['Transactions'].tolist()
-
-            for k in temp:
-                self._Database.append(set(k))
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(set(temp))
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self._Database.append(set(temp))
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        self._Database = [set(transaction) for transaction in self._readTransactions()]
 
     def _convert(self, value: Union[int, float, str]) -> Union[int, float]:
         """
@@ -326,7 +296,7 @@ class Apriori(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -392,7 +362,6 @@ if __name__ == "__main__":
             _ap = Apriori(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = Apriori(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ap._sys.argv[2])
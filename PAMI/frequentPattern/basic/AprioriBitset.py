@@ -0,0 +1,414 @@
+# AprioriBitset is the CPU counterpart of the cuda Apriori miners. It keeps an item x transaction packed bitmap in NumPy
+# and counts every candidate of a level in batches of gather-AND-popcount operations.
+#
+# **Importing this algorithm into a python program**
+# ---------------------------------------------------------
+#
+#             import PAMI.frequentPattern.basic.AprioriBitset as alg
+#
+#             obj = alg.AprioriBitset(iFile, minSup, numWorkers=4)
+#
+#             obj.mine()
+#
+#             frequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Frequent Patterns:", len(frequentPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as _np
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from PAMI.frequentPattern.basic import abstract as _ab
+from PAMI.lazyImport import deprecated
+from PAMI.extras.packedBitsets import popcount as _popcount
+
+
+class AprioriBitset(_ab._frequentPatterns):
+    """
+    :Description: AprioriBitset is the CPU counterpart of the cuda Apriori miners (cuApriori, cuAprioriBit, cudaAprioriGCT).
+                  The database is stored as an item x transaction bitmap packed in uint64 words. Candidates are generated
+                  level by level with the apriori property, and all candidates of a level are counted in batches of
+                  gather-AND-popcount operations. Batches are spread over a pool of worker threads, since NumPy releases
+                  the GIL inside these operations and the bitmap is shared without copying.
+
+    :Reference:  Agrawal, R., Imieli ́nski, T., Swami, A.: Mining association rules between sets of items in large databases.
+            In: SIGMOD. pp. 207–216 (1993), https://doi.org/10.1145/170035.170072
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of frequent patterns
+    :param  oFile: str :
+                   Name of the output file to store complete set of frequent patterns
+    :param  minSup: int or float or str :
+                   The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  numWorkers: int :
+                   Number of threads used to count the candidate batches. The default is 1.
+    :param  batchBytes: int :
+                   Upper bound on the memory used by one batch of gathered bitsets. The default is 64 MB.
+
+    :Attributes:
+
+        startTime : float
+          To record the start time of the mining process
+
+        endTime : float
+          To record the completion time of the mining process
+
+        finalPatterns : dict
+          Storing the complete set of patterns in a dictionary variable
+
+        memoryUSS : float
+          To store the total amount of USS memory consumed by the program
+
+        memoryRSS : float
+          To store the total amount of RSS memory consumed by the program
+
+        Database : list
+          To store the transactions of a database in list
+
+    **Methods to execute code on terminal**
+    ------------------------------------------
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 AprioriBitset.py <inputFile> <outputFile> <minSup>
+
+      Example Usage:
+
+      (.venv) $ python3 AprioriBitset.py sampleDB.txt patterns.txt 10.0
+
+    .. note:: minSup will be considered in percentage of database transactions
+
+
+    **Importing this algorithm into a python program**
+    ---------------------------------------------------------
+    .. code-block:: python
+
+            import PAMI.frequentPattern.basic.AprioriBitset as alg
+
+            obj = alg.AprioriBitset(iFile, minSup, numWorkers=4)
+
+            obj.mine()
+
+            frequentPatterns = obj.getPatterns()
+
+            print("Total number of Frequent Patterns:", len(frequentPatterns))
+
+            obj.save(oFile)
+
+            Df = obj.getPatternsAsDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+    **Credits:**
+    -------------------
+
+               The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _minSup = str()
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _Database = []
+
+    def __init__(self, iFile, minSup, sep="\t", numWorkers=1, batchBytes=64 * 1024 * 1024):
+        super().__init__(iFile, minSup, sep)
+        self._numWorkers = max(1, int(numWorkers))
+        self._batchBytes = batchBytes
+
+    def _convert(self, value):
+        """
+        To convert the user specified minSup value
+
+        :param value: user specified minSup value
+        :type value: int or float or str
+        :return: converted type
+        :rtype: int or float
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (len(self._Database) * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (len(self._Database) * value)
+            else:
+                value = int(value)
+        return value
+
+    def _creatingItemSets(self):
+        """
+        Storing the complete transactions of the database/input file in a database variable
+        """
+        self._Database = self._readTransactions()
+
+    def _createBitmap(self):
+        """
+        Builds the packed item x transaction bitmap of the frequent items
+
+        :return: the frequent items ordered by decreasing support, their supports and the bitmap
+        :rtype: tuple
+        """
+        support = {}
+        for transaction in self._Database:
+            for item in set(transaction):
+                support[item] = support.get(item, 0) + 1
+        items = [k for k, v in sorted(support.items(), key=lambda x: x[1], reverse=True) if v >= self._minSup]
+        index = {item: i for i, item in enumerate(items)}
+        rows, tids = [], []
+        for tid, transaction in enumerate(self._Database):
+            for item in set(transaction):
+                position = index.get(item)
+                if position is not None:
+                    rows.append(position)
+                    tids.append(tid)
+        words = max(1, (len(self._Database) + 63) // 64)
+        bitmap = _np.zeros((len(items), words), dtype=_np.uint64)
+        rows = _np.asarray(rows, dtype=_np.int64)
+        tids = _np.asarray(tids, dtype=_np.int64)
+        _np.bitwise_or.at(bitmap, (rows, tids >> 6), _np.left_shift(_np.uint64(1), (tids & 63).astype(_np.uint64)))
+        return items, [support[item] for item in items], bitmap
+
+    @staticmethod
+    def _generateCandidates(frequent):
+        """
+        Joins the frequent itemsets of one level that share a prefix and keeps the candidates whose subsets are all
+        frequent
+
+        :param frequent: sorted tuples of item indices that were frequent at the previous level
+        :type frequent: list
+        :return: candidates of the next level, one row per candidate
+        :rtype: numpy.ndarray
+        """
+        known = set(frequent)
+        groups = {}
+        for itemset in frequent:
+            groups.setdefault(itemset[:-1], []).append(itemset[-1])
+        candidates = []
+        for prefix, lasts in groups.items():
+            lasts.sort()
+            for i in range(len(lasts)):
+                for j in range(i + 1, len(lasts)):
+                    candidate = prefix + (lasts[i], lasts[j])
+                    if all(candidate[:k] + candidate[k + 1:] in known for k in range(len(candidate) - 2)):
+                        candidates.append(candidate)
+        if not candidates:
+            return _np.zeros((0, len(frequent[0]) + 1 if frequent else 0), dtype=_np.int64)
+        return _np.asarray(candidates, dtype=_np.int64)
+
+    @staticmethod
+    def _countBatch(bitmap, candidates):
+        """
+        Counts the support of a batch of candidates with one gather-AND-popcount pass
+
+        :param bitmap: packed item x transaction bitmap
+        :type bitmap: numpy.ndarray
+        :param candidates: candidate itemsets, one row of item indices per candidate
+        :type candidates: numpy.ndarray
+        :return: support of every candidate
+        :rtype: numpy.ndarray
+        """
+        acc = bitmap[candidates[:, 0]]
+        for column in range(1, candidates.shape[1]):
+            _np.bitwise_and(acc, bitmap[candidates[:, column]], out=acc)
+        return _popcount(acc)
+
+    def _countCandidates(self, bitmap, candidates, executor):
+        """
+        Counts all candidates of a level, splitting them into batches bounded by batchBytes
+
+        :param bitmap: packed item x transaction bitmap
+        :type bitmap: numpy.ndarray
+        :param candidates: candidate itemsets of the level
+        :type candidates: numpy.ndarray
+        :param executor: thread pool used to count the batches, or None
+        :return: support of every candidate
+        :rtype: numpy.ndarray
+        """
+        rows = max(1, self._batchBytes // max(1, bitmap.shape[1] * 8))
+        batches = [candidates[i:i + rows] for i in range(0, len(candidates), rows)]
+        if executor is None or len(batches) == 1:
+            counts = [self._countBatch(bitmap, batch) for batch in batches]
+        else:
+            counts = list(executor.map(lambda batch: self._countBatch(bitmap, batch), batches))
+        return _np.concatenate(counts) if counts else _np.zeros(0, dtype=_np.int64)
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self._startTime = _ab._time.time()
+        self._finalPatterns = {}
+        self._creatingItemSets()
+        self._minSup = self._convert(self._minSup)
+        items, supports, bitmap = self._createBitmap()
+        for item, support in zip(items, supports):
+            self._finalPatterns[item] = support
+        executor = _ThreadPoolExecutor(max_workers=self._numWorkers) if self._numWorkers > 1 else None
+        try:
+            frequent = [(i,) for i in range(len(items))]
+            while frequent:
+                candidates = self._generateCandidates(frequent)
+                if len(candidates) == 0:
+                    break
+                counts = self._countCandidates(bitmap, candidates, executor)
+                keep = counts >= self._minSup
+                frequent = [tuple(row) for row in candidates[keep].tolist()]
+                for row, count in zip(frequent, counts[keep].tolist()):
+                    self._finalPatterns["\t".join(items[i] for i in row)] = count
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using AprioriBitset algorithm ")
+
+    def getMemoryUSS(self):
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """
+        Calculating the total amount of runtime taken by the mining process
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self):
+        """
+        Storing final frequent patterns in a dataframe
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+
+        data = [[a.replace('\t', ' '), b] for a, b in self._finalPatterns.items()]
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
+
+    def save(self, outFile):
+        """
+        Complete set of frequent patterns will be loaded in to an output file
+        :param outFile: name of the outputfile
+        :type outFile: file
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                patternsAndSupport = x.strip() + ":" + str(y)
+                writer.write("%s \n" % patternsAndSupport)
+
+    def getPatterns(self):
+        """
+        Function to send the set of frequent patterns after completion of the mining process
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self):
+        """
+        This function is used to print the result
+        """
+        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:
+            _ap = AprioriBitset(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:
+            _ap = AprioriBitset(_ab._sys.argv[1], _ab._sys.argv[3])
+        _ap.mine()
+        print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
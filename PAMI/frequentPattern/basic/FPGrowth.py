@@ -52,7 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.frequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 from itertools import combinations
 from collections import Counter
 
@@ -249,35 +249,7 @@ class FPGrowth(_fp._frequentPatterns):
         """
         Storing the complete transactions of the database/input file in a database variable
         """
-        self.__Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self.__Database = self._iFile['Transactions'].tolist()
-
-            #print(self.Database)
-        if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
-                data = _fp._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self.__Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self.__Database.append(temp)
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        self.__Database = self._readTransactions()
 
     def __convert(self, value) -> float:
         """
@@ -449,6 +421,7 @@ class FPGrowth(_fp._frequentPatterns):
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
         self.__creatingItemSets()
+        self.__finalPatterns = {}
         self._minSup = self.__convert(self._minSup)
         _minSup = self._minSup
 
@@ -505,7 +478,7 @@ class FPGrowth(_fp._frequentPatterns):
 
         return self.__endTime - self.__startTime
 
-    def getPatternsAsDataFrame(self) -> _fp._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_fp._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -562,7 +535,6 @@ if __name__ == "__main__":
             _ap = FPGrowth(_fp._sys.argv[1], _fp._sys.argv[3], _fp._sys.argv[4])
         if len(_fp._sys.argv) == 4:
             _ap = FPGrowth(_fp._sys.argv[1], _fp._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Frequent Patterns:", len( _ap.getPatterns()))
         _ap.save(_fp._sys.argv[2])
@@ -30,15 +30,17 @@
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import csv as _csv
-import pandas as _pd
+from PAMI import lazyImport as _lazyImport
+_pd = _lazyImport.lazyModule('pandas')
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
+_psutil = _lazyImport.lazyModule('psutil')
 import sys as _sys
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
+from PAMI import dataSources as _dataSources
 import functools as _functools
 
 
@@ -168,6 +170,21 @@ class _frequentPatterns(_ABC):
 
         pass'''
 
+    def _readTransactions(self) -> list:
+        """
+        Reads the transactions of the input through PAMI.dataSources. The input may be a file, plain or compressed
+        with gzip, bzip2, xz or zstd, a URL, a Parquet file, a DataFrame with a Transactions column, or an iterable of
+        transactions.
+
+        :return: the items of every transaction
+        :rtype: list
+        """
+        try:
+            return list(_dataSources.transactions(self._iFile, self._sep))
+        except FileNotFoundError:
+            print("File Not Found")
+            quit()
+
     @_abstractmethod
     def startMine(self):
         """
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.frequentPattern.closed import abstract as _ab
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class CHARM(_ab._frequentPatterns):
@@ -215,53 +215,15 @@ class CHARM(_ab._frequentPatterns):
         self._mapSupport = {}
         self._tidList = {}
         self._lno = 0
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self._Database = self._iFile['Transactions'].tolist()
-            for i in self._Database:
-                self._lno += 1
-                for j in i:
-                    if j not in self._mapSupport:
-                        self._mapSupport[j] = 1
-                        self._tidList[j] = [self._lno]
-                    else:
-                        self._mapSupport[j] += 1
-                        self._tidList[j].append(self._lno)
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    self._lno += 1
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    for j in temp:
-                        if j not in self._mapSupport:
-                            self._mapSupport[j] = 1
-                            self._tidList[j] = [self._lno]
-                        else:
-                            self._mapSupport[j] += 1
-                            self._tidList[j].append(self._lno)
-            else:
-                try:
-                    with open(self._iFile, 'r') as f:
-                        for line in f:
-                            i = [i.rstrip() for i in line.split(self._sep)]
-                            i = [x for x in i if x]
-                            self._lno += 1
-                            for j in i:
-                                if j not in self._mapSupport:
-                                    self._mapSupport[j] = 1
-                                    self._tidList[j] = [self._lno]
-                                else:
-                                    self._mapSupport[j] += 1
-                                    self._tidList[j].append(self._lno)
-                except IOError:
-                    print("File Not Found")
+        for transaction in self._readTransactions():
+            self._lno += 1
+            for j in transaction:
+                if j not in self._mapSupport:
+                    self._mapSupport[j] = 1
+                    self._tidList[j] = [self._lno]
+                else:
+                    self._mapSupport[j] += 1
+                    self._tidList[j].append(self._lno)
         self._minSup = self._convert(self._minSup)
         self._mapSupport = {k: v for k, v in self._mapSupport.items() if v >= self._minSup}
         _flist = {}
@@ -549,7 +511,6 @@ if __name__ == "__main__":
             _ap = CHARM(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = CHARM(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Closed Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
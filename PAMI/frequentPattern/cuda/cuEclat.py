@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 # from PAMI.frequentPattern.cuda import abstract as _ab
 import abstract as _ab
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 class cuEclat(_ab._frequentPatterns):
     """
@@ -380,7 +380,6 @@ if __name__ == "__main__":
             _ap = cuEclat(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = cuEclat(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 # from PAMI.frequentPattern.cuda import abstract as _ab
 import abstract as _ab
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 class cuEclatBit(_ab._frequentPatterns):
     """
@@ -412,7 +412,6 @@ if __name__ == "__main__":
             _ap = cuEclatBit(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = cuEclatBit(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -424,7 +423,6 @@ if __name__ == "__main__":
 
 """_ap = cuEclat("/home/tarun/PAMI/PAMI/frequentPattern/cuda/test.txt", 2, " ")
     _ap = cuEclat("/home/tarun/Transactional_T10I4D100K.csv", 450, "\t")
-    _ap.startMine()
     _ap.mine()
     print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
     print("Total Memory in USS:", _ap.getMemoryUSS())
@@ -51,7 +51,7 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 from PAMI.frequentPattern.basic import abstract as _ab
 # import abstract as _ab
 
@@ -59,7 +59,8 @@ import os
 import time
 import numpy as np
 import pycuda.gpuarray as gpuarray
-import psutil
+from PAMI import lazyImport as _lazyImport
+psutil = _lazyImport.lazyModule('psutil')
 
 
 class cudaAprioriGCT(_ab._frequentPatterns):
@@ -401,7 +402,6 @@ if __name__ == "__main__":
             _ap = cudaAprioriGCT(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = cudaAprioriGCT(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 import abstract as _ab
 
 import os
@@ -62,7 +62,8 @@ import time
 import numpy as np
 import pycuda.gpuarray as _gpuarray
 import pycuda.autoinit
-import psutil
+from PAMI import lazyImport as _lazyImport
+psutil = _lazyImport.lazyModule('psutil')
 import pycuda.driver as cuda
 from pycuda.compiler import SourceModule
 import pycuda
@@ -477,7 +478,6 @@ if __name__ == "__main__":
             _ap = cudaAprioriTID(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = cudaAprioriTID(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -0,0 +1,184 @@
+from abc import ABC as _ABC, abstractmethod as _abstractmethod
+import time as _time
+import csv as _csv
+from PAMI import lazyImport as _lazyImport
+_pd = _lazyImport.lazyModule('pandas')
+from collections import defaultdict as _defaultdict
+from itertools import combinations as _c
+import os as _os
+import os.path as _ospath
+_psutil = _lazyImport.lazyModule('psutil')
+import sys as _sys
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
+from PAMI import dataSources as _dataSources
+import functools as _functools
+import numpy as _np
+from PAMI.frequentPattern.parallel import backends as _backends
+
+class _frequentPatterns(_ABC):
+    """
+    :Description:   This abstract base class defines the variables and methods that every frequent pattern mining algorithm must
+                    employ in PAMI
+
+    :Attributes:
+
+        iFile : str
+            Input file name or path of the input file
+        minSup: integer or float or str
+            The user can specify minSup either in count or proportion of database size.
+            If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
+            Otherwise, it will be treated as float.
+            Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
+        numWorkers: integer
+            The user can specify numWorkers as the number of cores which are used
+        backend: str
+            Execution backend of the mining tasks: 'process' (default), 'spark' or 'inline'
+        sep : str
+            This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
+            However, the users can override their default separator
+        startTime:float
+            To record the start time of the algorithm
+        endTime:float
+            To record the completion time of the algorithm
+        finalPatterns: dict
+            Storing the complete set of patterns in a dictionary variable
+        oFile : str
+            Name of the output file to store complete set of frequent patterns
+        memoryUSS : float
+            To store the total amount of USS memory consumed by the program
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+
+    :Methods:
+
+        startMine()
+            Calling this function will start the actual mining process
+        getPatterns()
+            This function will output all interesting patterns discovered by an algorithm
+        save(oFile)
+            This function will store the discovered patterns in an output file specified by the user
+        getPatternsAsDataFrame()
+            The function outputs the patterns generated by an algorithm as a data frame
+        getMemoryUSS()
+            This function outputs the total amount of USS memory consumed by a mining algorithm
+        getMemoryRSS()
+            This function outputs the total amount of RSS memory consumed by a mining algorithm
+        getRuntime()
+            This function outputs the total runtime of a mining algorithm
+    """
+
+
+
+    def __init__(self, iFile, minSup, numWorkers=1, sep="\t", backend="process"):
+        """
+        :param iFile: Input file name or path of the input file
+        :type iFile: str or DataFrame
+        :param minSup: The user can specify minSup either in count or proportion of database size.
+            If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
+            Otherwise, it will be treated as float.
+            Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
+        :type minSup: int or float or str
+        :param numWorkers: The user can specify numWorkers as the number of cores which are used.
+        :type numWorkers: int
+        :param sep: separator used to distinguish items from each other. The default separator is tab space. However, users can override the default separator
+        :type sep: str
+        :param backend: execution backend of the mining tasks: 'process' (default), 'spark' or 'inline'
+        :type backend: str
+        """
+
+        self._iFile = iFile
+        self._sep = sep
+        self._minSup = minSup
+        self._numWorkers = int(numWorkers)
+        if backend not in _backends.backendNames:
+            raise ValueError("backend must be one of " + ", ".join(_backends.backendNames))
+        self._backend = backend
+        self._finalPatterns = {}
+        self._oFile = str()
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._startTime = float()
+        self._endTime = float()
+
+    def _readTransactions(self) -> list:
+        """
+        Reads the transactions of the input through PAMI.dataSources. The input may be a file, plain or compressed
+        with gzip, bzip2, xz or zstd, a URL, a Parquet file, a DataFrame with a Transactions column, or an iterable of
+        transactions.
+
+        :return: the items of every transaction
+        :rtype: list
+        """
+        try:
+            return list(_dataSources.transactions(self._iFile, self._sep))
+        except FileNotFoundError:
+            print("File Not Found")
+            quit()
+
+    @_abstractmethod
+    def startMine(self):
+        """
+        Code for the mining process will start from this function
+        """
+
+        pass
+
+    @_abstractmethod
+    def getPatterns(self):
+        """
+        Complete set of frequent patterns generated will be retrieved from this function
+        """
+
+        pass
+
+    @_abstractmethod
+    def save(self, oFile):
+        """
+        Complete set of frequent patterns will be saved in to an output file from this function
+        :param oFile: Name of the output file
+        :type oFile: csvfile
+        """
+
+        pass
+
+    @_abstractmethod
+    def getPatternsAsDataFrame(self):
+        """
+        Complete set of frequent patterns will be loaded in to data frame from this function
+        """
+
+        pass
+
+    @_abstractmethod
+    def getMemoryUSS(self):
+        """
+        Total amount of USS memory consumed by the program will be retrieved from this function
+        """
+
+        pass
+
+    @_abstractmethod
+    def getMemoryRSS(self):
+        """
+        Total amount of RSS memory consumed by the program will be retrieved from this function
+        """
+
+        pass
+
+    @_abstractmethod
+    def getRuntime(self):
+        """
+        Total amount of runtime taken by the program will be retrieved from this function
+        """
+
+        pass
+
+    @_abstractmethod
+    def printResults(self):
+        """
+        To print the results of execution.
+        """
+
+        pass
+
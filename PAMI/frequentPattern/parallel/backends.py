@@ -0,0 +1,212 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Execution backends of the parallel miners.
+
+A miner hands a backend a dictionary of NumPy arrays describing the database (the CSR encoding produced by
+:func:`encodeTransactions`) and a list of picklable tasks. Every task is run as ``function(arrays, task)`` and the
+results are returned in task order. Three backends are available:
+
+    inline
+        runs the tasks one after another in the calling process
+    process
+        publishes the arrays once through ``multiprocessing.shared_memory`` and runs the tasks on a
+        ``concurrent.futures.ProcessPoolExecutor`` whose workers map the arrays without copying them
+    spark
+        broadcasts the arrays and runs the tasks as a Spark job. pyspark is only imported when this backend is chosen.
+
+.. code-block:: python
+
+        from PAMI.frequentPattern.parallel import backends
+
+        with backends.openSession('process', arrays, numWorkers=4) as session:
+            results = session.map(function, tasks)
+"""
+
+import numpy as _np
+from collections import Counter as _Counter
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from itertools import repeat as _repeat
+from multiprocessing.shared_memory import SharedMemory as _SharedMemory
+from typing import Callable, Dict, List, Tuple
+
+backendNames = ('process', 'spark', 'inline')
+
+_workerBlocks = []
+_workerArrays = {}
+
+
+def encodeTransactions(database: List[List[str]], minSup: float) -> Tuple[List[str], List[int], Dict[str, _np.ndarray]]:
+    """
+    Ranks the frequent items by decreasing support and encodes every transaction as the sorted ranks of its frequent
+    items. Transactions without frequent items are dropped.
+
+    :param database: transactions given as lists of items
+    :type database: list
+    :param minSup: minimum support expressed in count
+    :type minSup: int or float
+    :return: the items in rank order, their supports and the arrays ``items`` (int32 ranks), ``indptr`` (int64 offsets)
+             and ``rows`` (int64 position of every kept transaction in the database)
+    :rtype: tuple
+    """
+    support = _Counter()
+    for transaction in database:
+        support.update(set(transaction))
+    items = [item for item, count in support.most_common() if count >= minSup]
+    rank = {item: index for index, item in enumerate(items)}
+    encoded, lengths, rows = [], [], []
+    for row, transaction in enumerate(database):
+        ranks = sorted({rank[item] for item in transaction if item in rank})
+        if ranks:
+            encoded.extend(ranks)
+            lengths.append(len(ranks))
+            rows.append(row)
+    indptr = _np.zeros(len(lengths) + 1, dtype=_np.int64)
+    _np.cumsum(lengths, out=indptr[1:])
+    arrays = {'items': _np.asarray(encoded, dtype=_np.int32), 'indptr': indptr,
+              'rows': _np.asarray(rows, dtype=_np.int64)}
+    return items, [support[item] for item in items], arrays
+
+
+def _attach(descriptor: Dict[str, Tuple[str, tuple, str]]) -> None:
+    """
+    Maps the shared arrays into a worker process
+
+    :param descriptor: shared memory name, shape and dtype of every array
+    :type descriptor: dict
+    """
+    global _workerBlocks, _workerArrays
+    _workerBlocks, _workerArrays = [], {}
+    for key, (name, shape, dtype) in descriptor.items():
+        block = _SharedMemory(name=name)
+        _workerBlocks.append(block)
+        _workerArrays[key] = _np.ndarray(shape, dtype=_np.dtype(dtype), buffer=block.buf)
+
+
+def _runTask(function: Callable, task):
+    """
+    Runs one task against the arrays mapped by :func:`_attach`
+    """
+    return function(_workerArrays, task)
+
+
+class _InlineSession:
+    """
+    Runs the tasks sequentially in the calling process
+    """
+
+    def __init__(self, arrays: Dict[str, _np.ndarray], numWorkers: int) -> None:
+        self._arrays = arrays
+
+    def map(self, function: Callable, tasks: List) -> List:
+        """
+        :param function: module level function called as function(arrays, task)
+        :param tasks: picklable task descriptions
+        :return: the result of every task, in task order
+        :rtype: list
+        """
+        return [function(self._arrays, task) for task in tasks]
+
+    def close(self) -> None:
+        self._arrays = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _ProcessSession(_InlineSession):
+    """
+    Publishes the arrays in shared memory and runs the tasks on a process pool
+    """
+
+    def __init__(self, arrays: Dict[str, _np.ndarray], numWorkers: int) -> None:
+        super().__init__(arrays, numWorkers)
+        self._blocks = []
+        descriptor = {}
+        try:
+            for key, array in arrays.items():
+                array = _np.ascontiguousarray(array)
+                block = _SharedMemory(create=True, size=max(1, array.nbytes))
+                self._blocks.append(block)
+                _np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                descriptor[key] = (block.name, array.shape, array.dtype.str)
+            self._pool = _ProcessPoolExecutor(max_workers=numWorkers, initializer=_attach, initargs=(descriptor,))
+        except BaseException:
+            self._release()
+            raise
+
+    def map(self, function: Callable, tasks: List) -> List:
+        return list(self._pool.map(_runTask, _repeat(function), tasks))
+
+    def _release(self) -> None:
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def close(self) -> None:
+        self._pool.shutdown()
+        self._release()
+        super().close()
+
+
+class _SparkSession(_InlineSession):
+    """
+    Broadcasts the arrays and runs every task as one Spark partition
+    """
+
+    def __init__(self, arrays: Dict[str, _np.ndarray], numWorkers: int) -> None:
+        super().__init__(arrays, numWorkers)
+        from pyspark import SparkConf, SparkContext
+        self._owner = SparkContext._active_spark_context is None
+        self._context = SparkContext.getOrCreate(SparkConf().setAppName("PAMI"))
+        self._broadcast = self._context.broadcast(arrays)
+
+    def map(self, function: Callable, tasks: List) -> List:
+        broadcast = self._broadcast
+        return self._context.parallelize(tasks, max(1, len(tasks))).map(
+            lambda task: function(broadcast.value, task)).collect()
+
+    def close(self) -> None:
+        self._broadcast.unpersist()
+        if self._owner:
+            self._context.stop()
+        super().close()
+
+
+def openSession(backend: str, arrays: Dict[str, _np.ndarray], numWorkers: int = 1) -> _InlineSession:
+    """
+    Opens an execution session over the given arrays. The session should be used as a context manager so that the
+    worker processes and the shared memory are released.
+
+    :param backend: one of 'process', 'spark' or 'inline'. The process backend runs inline when numWorkers is 1.
+    :type backend: str
+    :param arrays: the arrays made available to every task
+    :type arrays: dict
+    :param numWorkers: number of worker processes
+    :type numWorkers: int
+    :return: a session exposing map(function, tasks) and close()
+    """
+    if backend not in backendNames:
+        raise ValueError("backend must be one of " + ", ".join(backendNames))
+    if backend == 'spark':
+        return _SparkSession(arrays, numWorkers)
+    if backend == 'inline' or numWorkers <= 1:
+        return _InlineSession(arrays, numWorkers)
+    return _ProcessSession(arrays, numWorkers)
@@ -0,0 +1,350 @@
+# Parallel Apriori discovers frequent patterns level by level. Every level splits the database into row chunks whose candidate supports are counted in parallel on a local process pool over a shared-memory copy of the database, or on Spark when requested.
+#
+# **Importing this algorithm into a python program**
+# ----------------------------------------------------
+#
+#             from PAMI.frequentPattern.parallel import parallelApriori as alg
+#
+#             obj = alg.parallelApriori(iFile, minSup, numWorkers)
+#
+#             obj.mine()
+#
+#             frequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Frequent Patterns:", len(frequentPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.frequentPattern.parallel import abstract as _ab
+from PAMI.frequentPattern.basic.AprioriBitset import AprioriBitset as _AprioriBitset
+from PAMI.lazyImport import deprecated
+
+_chunkRows = 1 << 16
+_batchBytes = 64 * 1024 * 1024
+
+
+def _countChunk(arrays, task):
+    """
+    Counts the candidates of a level in a chunk of transactions. The chunk is turned into a packed item x transaction
+    bitmap and every candidate is counted with a gather-AND-popcount pass.
+
+    :param arrays: CSR encoding of the database
+    :type arrays: dict
+    :param task: (start, stop, numItems, candidates) where start and stop delimit the rows of the chunk
+    :type task: tuple
+    :return: the support of every candidate in the chunk
+    :rtype: numpy.ndarray
+    """
+    start, stop, numItems, candidates = task
+    items, indptr = arrays['items'], arrays['indptr']
+    rows = _ab._np.repeat(_ab._np.arange(stop - start, dtype=_ab._np.int64), _ab._np.diff(indptr[start:stop + 1]))
+    bitmap = _ab._np.zeros((numItems, max(1, (stop - start + 63) // 64)), dtype=_ab._np.uint64)
+    _ab._np.bitwise_or.at(bitmap, (items[indptr[start]:indptr[stop]], rows >> 6),
+                          _ab._np.left_shift(_ab._np.uint64(1), (rows & 63).astype(_ab._np.uint64)))
+    step = max(1, _batchBytes // (bitmap.shape[1] * 8))
+    counts = _ab._np.zeros(len(candidates), dtype=_ab._np.int64)
+    for i in range(0, len(candidates), step):
+        counts[i:i + step] = _AprioriBitset._countBatch(bitmap, candidates[i:i + step])
+    return counts
+
+
+class parallelApriori(_ab._frequentPatterns):
+    """
+    :Description: Parallel Apriori is an algorithm to discover frequent patterns in a transactional database. This program employs parallel apriori property (or downward closure property) to  reduce the search space effectively.
+                  Candidates of every level are generated once by a prefix join and counted over row chunks of the database.
+                  Each chunk is a task that builds a packed bitmap of its transactions and counts all candidates with
+                  gather-AND-popcount. The tasks run on a process pool that maps the database from shared memory, or on Spark
+                  with backend='spark'.
+
+    :Reference: N. Li, L. Zeng, Q. He and Z. Shi, "Parallel Implementation of Apriori Algorithm Based on MapReduce,"
+                2012 13th ACIS International Conference on Software Engineering, Artificial Intelligence,
+                Networking and Parallel/Distributed Computing, Kyoto, Japan, 2012, pp. 236-241, doi: 10.1109/SNPD.2012.31.
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of frequent patterns
+    :param  oFile: str :
+                   Name of the output file to store complete set of frequent patterns
+    :param  minSup: int :
+                   The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
+    :param  numWorkers: int :
+                   The number of worker processes
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   Execution backend of the counting tasks: 'process' (default), 'spark' or 'inline'
+
+
+    :Attributes:
+
+        startTime : float
+          To record the start time of the mining process
+
+        endTime : float
+          To record the completion time of the mining process
+
+        finalPatterns : dict
+          Storing the complete set of patterns in a dictionary variable
+
+        memoryUSS : float
+          To store the total amount of USS memory consumed by the program
+
+        memoryRSS : float
+          To store the total amount of RSS memory consumed by the program
+
+        lno : int
+                the number of transactions
+
+    **Methods to execute code on terminal**
+    ----------------------------------------------------
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 parallelApriori.py <inputFile> <outputFile> <minSup> <numWorkers>
+
+      Example Usage:
+
+      (.venv) $ python3 parallelApriori.py sampleDB.txt patterns.txt 10.0 3
+
+    .. note:: minSup will be considered in percentage of database transactions
+
+
+    **Importing this algorithm into a python program**
+    ----------------------------------------------------
+    .. code-block:: python
+
+                    from PAMI.frequentPattern.parallel import parallelApriori as alg
+
+                    obj = alg.parallelApriori(iFile, minSup, numWorkers)
+
+                    obj.mine()
+
+                    frequentPatterns = obj.getPatterns()
+
+                    print("Total number of Frequent Patterns:", len(frequentPatterns))
+
+                    obj.save(oFile)
+
+                    Df = obj.getPatternsAsDataFrame()
+
+                    memUSS = obj.getMemoryUSS()
+
+                    print("Total Memory in USS:", memUSS)
+
+                    memRSS = obj.getMemoryRSS()
+
+                    print("Total Memory in RSS", memRSS)
+
+                    run = obj.getRuntime()
+
+                    print("Total ExecutionTime in seconds:", run)
+
+
+    **Credits:**
+    ----------------------------------------------------
+
+             The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    _minSup = float()
+    _numWorkers = int()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _lno = int()
+    _Database = []
+
+    def __init__(self, iFile, minSup, numWorkers=1, sep='\t', backend='process'):
+        super().__init__(iFile, minSup, numWorkers, sep, backend)
+
+    def _creatingItemSets(self):
+        """
+        Storing the complete transactions of the database/input file in a database variable
+        """
+        self._Database = self._readTransactions()
+        self._lno = len(self._Database)
+
+    def _convert(self, value):
+        """
+        To convert the type of user specified minSup value
+
+        :param value: user specified minSup value
+        :return: converted type
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._lno * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._lno * value)
+            else:
+                value = int(value)
+        return value
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self._startTime = _ab._time.time()
+        self._finalPatterns = {}
+        self._creatingItemSets()
+        self._minSup = self._convert(self._minSup)
+        items, supports, arrays = _ab._backends.encodeTransactions(self._Database, self._minSup)
+        for item, support in zip(items, supports):
+            self._finalPatterns[item] = support
+        numRows = len(arrays['indptr']) - 1
+        chunk = max(1, min(_chunkRows, -(-numRows // max(1, self._numWorkers))))
+        bounds = [(start, min(numRows, start + chunk)) for start in range(0, numRows, chunk)]
+        with _ab._backends.openSession(self._backend, arrays, self._numWorkers) as session:
+            frequent = [(i,) for i in range(len(items))]
+            while frequent:
+                candidates = _AprioriBitset._generateCandidates(frequent)
+                if len(candidates) == 0:
+                    break
+                counts = sum(session.map(_countChunk, [(start, stop, len(items), candidates) for start, stop in bounds]))
+                keep = counts >= self._minSup
+                frequent = [tuple(row) for row in candidates[keep].tolist()]
+                for row, count in zip(frequent, counts[keep].tolist()):
+                    self._finalPatterns["\t".join(items[i] for i in row)] = count
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using Parallel Apriori algorithm")
+
+    def getMemoryUSS(self):
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self):
+        """
+        Storing final frequent patterns in a dataframe
+
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+        data = [[a.replace('\t', ' '), b] for a, b in self._finalPatterns.items()]
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
+
+    def save(self, outFile):
+        """
+        Complete set of frequent patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csv file
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                writer.write("%s:%s\n" % (x, y))
+
+    def getPatterns(self):
+        """
+        Function to send the set of frequent patterns after completion of the mining process
+
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self):
+        """
+        This function is used to print the results
+        """
+        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 5 or len(_ab._sys.argv) == 6:
+        if len(_ab._sys.argv) == 6:
+            _ap = parallelApriori(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
+        if len(_ab._sys.argv) == 5:
+            _ap = parallelApriori(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        _ap.mine()
+        print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
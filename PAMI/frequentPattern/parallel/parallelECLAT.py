@@ -0,0 +1,382 @@
+# Parallel ECLAT discovers frequent patterns by intersecting tid lists depth first. The equivalence classes of the frequent items are mined in parallel on a local process pool over a shared-memory copy of the database, or on Spark when requested.
+#
+# **Importing this algorithm into a python program**
+# ----------------------------------------------------
+#
+#             from PAMI.frequentPattern.parallel import parallelECLAT as alg
+#
+#             obj = alg.parallelECLAT(iFile, minSup, numWorkers)
+#
+#             obj.mine()
+#
+#             frequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Frequent Patterns:", len(frequentPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.frequentPattern.parallel import abstract as _ab
+from PAMI.lazyImport import deprecated
+
+
+def _tidLists(arrays, numItems):
+    """
+    Builds the sorted tid list of every item from the CSR encoding of the database
+
+    :param arrays: CSR encoding of the database
+    :type arrays: dict
+    :param numItems: number of frequent items
+    :type numItems: int
+    :return: the tid list of every item rank
+    :rtype: list
+    """
+    items, indptr = arrays['items'], arrays['indptr']
+    rows = _ab._np.repeat(_ab._np.arange(len(indptr) - 1, dtype=_ab._np.int32), _ab._np.diff(indptr))
+    order = _ab._np.argsort(items, kind='stable')
+    bounds = _ab._np.searchsorted(items[order], _ab._np.arange(numItems + 1))
+    tids = rows[order]
+    return [tids[bounds[i]:bounds[i + 1]] for i in range(numItems)]
+
+
+def _mineClass(prefix, members, minSup, patterns):
+    """
+    Depth-first search of an equivalence class
+
+    :param prefix: ranks of the common prefix of the class
+    :type prefix: tuple
+    :param members: (item, tid list) of the frequent extensions of the prefix
+    :type members: list
+    :param minSup: minimum support in count
+    :type minSup: int or float
+    :param patterns: receives every frequent pattern and its support
+    :type patterns: dict
+    """
+    for k, (item, tids) in enumerate(members):
+        pattern = prefix + (item,)
+        extensions = []
+        for other, otherTids in members[k + 1:]:
+            common = _ab._np.intersect1d(tids, otherTids, assume_unique=True)
+            if len(common) >= minSup:
+                patterns[pattern + (other,)] = len(common)
+                extensions.append((other, common))
+        if extensions:
+            _mineClass(pattern, extensions, minSup, patterns)
+
+
+def _mineClasses(arrays, task):
+    """
+    Mines the equivalence classes of the items assigned to a task
+
+    :param arrays: CSR encoding of the database
+    :type arrays: dict
+    :param task: (partition, numPartitions, numItems, minSup)
+    :type task: tuple
+    :return: patterns given as rank tuples and their support
+    :rtype: dict
+    """
+    partition, numPartitions, numItems, minSup = task
+    tidLists = _tidLists(arrays, numItems)
+    patterns = {}
+    for item in range(partition, numItems, numPartitions):
+        members = []
+        for other in range(item + 1, numItems):
+            common = _ab._np.intersect1d(tidLists[item], tidLists[other], assume_unique=True)
+            if len(common) >= minSup:
+                patterns[(item, other)] = len(common)
+                members.append((other, common))
+        if members:
+            _mineClass((item,), members, minSup, patterns)
+    return patterns
+
+
+class parallelECLAT(_ab._frequentPatterns):
+    """
+    :Description: ParallelEclat is an algorithm to discover frequent patterns in a transactional database.
+                  The frequent items are ranked by support and their equivalence classes are split into numWorkers groups.
+                  Every group becomes a task that builds the tid lists of the shared database and mines its classes depth first
+                  by intersecting sorted tid arrays. The tasks run on a process pool that maps the database from shared memory,
+                  or on Spark with backend='spark'.
+
+    :Reference: Zaki, M. J. "Scalable algorithms for association mining." IEEE Transactions on Knowledge and Data Engineering 12.3 (2000): 372-390.
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of frequent patterns
+    :param  oFile: str :
+                   Name of the output file to store complete set of frequent patterns
+    :param  minSup: int :
+                   The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
+    :param  numWorkers: int :
+                   The number of worker processes and of class partitions
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   Execution backend of the partition tasks: 'process' (default), 'spark' or 'inline'
+
+
+    :Attributes:
+
+        startTime : float
+          To record the start time of the mining process
+
+        endTime : float
+          To record the completion time of the mining process
+
+        finalPatterns : dict
+          Storing the complete set of patterns in a dictionary variable
+
+        memoryUSS : float
+          To store the total amount of USS memory consumed by the program
+
+        memoryRSS : float
+          To store the total amount of RSS memory consumed by the program
+
+        lno : int
+                the number of transactions
+
+    **Methods to execute code on terminal**
+    ----------------------------------------------------
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 parallelECLAT.py <inputFile> <outputFile> <minSup> <numWorkers>
+
+      Example Usage:
+
+      (.venv) $ python3 parallelECLAT.py sampleDB.txt patterns.txt 10.0 3
+
+    .. note:: minSup will be considered in percentage of database transactions
+
+
+    **Importing this algorithm into a python program**
+    ----------------------------------------------------
+    .. code-block:: python
+
+                    from PAMI.frequentPattern.parallel import parallelECLAT as alg
+
+                    obj = alg.parallelECLAT(iFile, minSup, numWorkers)
+
+                    obj.mine()
+
+                    frequentPatterns = obj.getPatterns()
+
+                    print("Total number of Frequent Patterns:", len(frequentPatterns))
+
+                    obj.save(oFile)
+
+                    Df = obj.getPatternsAsDataFrame()
+
+                    memUSS = obj.getMemoryUSS()
+
+                    print("Total Memory in USS:", memUSS)
+
+                    memRSS = obj.getMemoryRSS()
+
+                    print("Total Memory in RSS", memRSS)
+
+                    run = obj.getRuntime()
+
+                    print("Total ExecutionTime in seconds:", run)
+
+
+    **Credits:**
+    ----------------------------------------------------
+
+             The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    _minSup = float()
+    _numWorkers = int()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _lno = int()
+    _Database = []
+
+    def __init__(self, iFile, minSup, numWorkers=1, sep='\t', backend='process'):
+        super().__init__(iFile, minSup, numWorkers, sep, backend)
+
+    def _creatingItemSets(self):
+        """
+        Storing the complete transactions of the database/input file in a database variable
+        """
+        self._Database = self._readTransactions()
+        self._lno = len(self._Database)
+
+    def _convert(self, value):
+        """
+        To convert the type of user specified minSup value
+
+        :param value: user specified minSup value
+        :return: converted type
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._lno * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._lno * value)
+            else:
+                value = int(value)
+        return value
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self._startTime = _ab._time.time()
+        self._finalPatterns = {}
+        self._creatingItemSets()
+        self._minSup = self._convert(self._minSup)
+        items, supports, arrays = _ab._backends.encodeTransactions(self._Database, self._minSup)
+        for item, support in zip(items, supports):
+            self._finalPatterns[item] = support
+        numPartitions = max(1, min(self._numWorkers, len(items)))
+        tasks = [(partition, numPartitions, len(items), self._minSup) for partition in range(numPartitions)]
+        with _ab._backends.openSession(self._backend, arrays, self._numWorkers) as session:
+            results = session.map(_mineClasses, tasks)
+        for patterns in results:
+            for pattern, support in patterns.items():
+                self._finalPatterns["\t".join(items[i] for i in pattern)] = support
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using Parallel ECLAT algorithm")
+
+    def getMemoryUSS(self):
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self):
+        """
+        Storing final frequent patterns in a dataframe
+
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+        data = [[a.replace('\t', ' '), b] for a, b in self._finalPatterns.items()]
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
+
+    def save(self, outFile):
+        """
+        Complete set of frequent patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csv file
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                writer.write("%s:%s\n" % (x, y))
+
+    def getPatterns(self):
+        """
+        Function to send the set of frequent patterns after completion of the mining process
+
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self):
+        """
+        This function is used to print the results
+        """
+        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 5 or len(_ab._sys.argv) == 6:
+        if len(_ab._sys.argv) == 6:
+            _ap = parallelECLAT(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
+        if len(_ab._sys.argv) == 5:
+            _ap = parallelECLAT(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        _ap.mine()
+        print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
@@ -0,0 +1,471 @@
+# Parallel FPGrowth discovers frequent patterns in a transactional database with the partition → conditional-transaction → local-tree plan of PFP. The mining tasks run on a local process pool over a shared-memory copy of the database, or on Spark when requested.
+#
+# **Importing this algorithm into a python program**
+# ----------------------------------------------------
+#
+#             from PAMI.frequentPattern.parallel import parallelFPGrowth as alg
+#
+#             obj = alg.parallelFPGrowth(iFile, minSup, numWorkers)
+#
+#             obj.mine()
+#
+#             frequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Frequent Patterns:", len(frequentPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.frequentPattern.parallel import abstract as _ab
+from PAMI.lazyImport import deprecated
+
+_ab._sys.setrecursionlimit(20000)
+
+
+class _Node:
+    """
+    A node of the local FP-tree
+
+    :Attributes:
+
+        item : int
+            Rank of the item stored in the node
+        count : int
+            Support count of the path ending at the node
+        parent : _Node
+            Parent of the node
+        children : dict
+            Children of the node keyed by item
+    """
+    __slots__ = ('item', 'count', 'parent', 'children')
+
+    def __init__(self, item, parent):
+        self.item = item
+        self.count = 0
+        self.parent = parent
+        self.children = {}
+
+
+class _Tree:
+    """
+    Local FP-tree built from the conditional transactions of one partition
+
+    :Attributes:
+
+        root : _Node
+            Root of the tree
+        nodes : dict
+            Node links of every item
+    """
+
+    def __init__(self):
+        self.root = _Node(None, None)
+        self.nodes = {}
+
+    def add(self, transaction, count):
+        """
+        Inserts a transaction whose items are sorted by rank
+
+        :param transaction: ranks of the items
+        :type transaction: list
+        :param count: number of occurrences of the transaction
+        :type count: int
+        """
+        node = self.root
+        for item in transaction:
+            child = node.children.get(item)
+            if child is None:
+                child = _Node(item, node)
+                node.children[item] = child
+                self.nodes.setdefault(item, []).append(child)
+            child.count += count
+            node = child
+
+    def conditionalTree(self, item, minSup):
+        """
+        Builds the tree of the conditional pattern base of an item, keeping only the items that are frequent in it
+
+        :param item: rank of the item
+        :type item: int
+        :param minSup: minimum support in count
+        :type minSup: int or float
+        :return: the conditional tree
+        :rtype: _Tree
+        """
+        paths = []
+        support = {}
+        for node in self.nodes[item]:
+            path = []
+            parent = node.parent
+            while parent.item is not None:
+                path.append(parent.item)
+                support[parent.item] = support.get(parent.item, 0) + node.count
+                parent = parent.parent
+            if path:
+                path.reverse()
+                paths.append((path, node.count))
+        tree = _Tree()
+        for path, count in paths:
+            path = [x for x in path if support[x] >= minSup]
+            if path:
+                tree.add(path, count)
+        return tree
+
+    def mine(self, minSup, suffix, patterns, isResponsible=None):
+        """
+        FP-growth over the tree
+
+        :param minSup: minimum support in count
+        :type minSup: int or float
+        :param suffix: ranks of the pattern the tree is conditioned on
+        :type suffix: tuple
+        :param patterns: receives every frequent pattern and its support
+        :type patterns: dict
+        :param isResponsible: restricts the items of the first level, None for all items
+        :type isResponsible: callable
+        """
+        for item, nodes in self.nodes.items():
+            if isResponsible is not None and not isResponsible(item):
+                continue
+            support = sum(node.count for node in nodes)
+            if support < minSup:
+                continue
+            pattern = (item,) + suffix
+            patterns[pattern] = support
+            conditional = self.conditionalTree(item, minSup)
+            if conditional.nodes:
+                conditional.mine(minSup, pattern, patterns)
+
+
+def _conditionalTransactions(arrays, partition, numPartitions):
+    """
+    Generates the conditional transactions of a partition: for every transaction, the prefix ending at its last item
+    that belongs to the partition
+
+    :param arrays: CSR encoding of the database
+    :type arrays: dict
+    :param partition: index of the partition
+    :type partition: int
+    :param numPartitions: number of partitions
+    :type numPartitions: int
+    :return: the conditional transactions
+    :rtype: list
+    """
+    items, indptr = arrays['items'], arrays['indptr']
+    if len(indptr) < 2:
+        return []
+    positions = _ab._np.where(items % numPartitions == partition, _ab._np.arange(len(items)), -1)
+    last = _ab._np.maximum.reduceat(positions, indptr[:-1])
+    items = items.tolist()
+    starts = indptr[:-1]
+    return [items[starts[row]:last[row] + 1] for row in _ab._np.flatnonzero(last >= 0)]
+
+
+def _minePartition(arrays, task):
+    """
+    Builds the local FP-tree of a partition and mines the patterns whose last item belongs to it
+
+    :param arrays: CSR encoding of the database
+    :type arrays: dict
+    :param task: (partition, numPartitions, minSup)
+    :type task: tuple
+    :return: patterns given as rank tuples and their support
+    :rtype: dict
+    """
+    partition, numPartitions, minSup = task
+    tree = _Tree()
+    for transaction in _conditionalTransactions(arrays, partition, numPartitions):
+        tree.add(transaction, 1)
+    patterns = {}
+    tree.mine(minSup, (), patterns, lambda item: item % numPartitions == partition)
+    return patterns
+
+
+class parallelFPGrowth(_ab._frequentPatterns):
+    """
+    :Description: Parallel FPGrowth is one of the fundamental algorithm to discover frequent patterns in a transactional database.
+                  The frequent items are ranked by support and split into numWorkers groups. Every group becomes a task that
+                  scans the shared database, keeps the prefix of each transaction ending at its last item of the group, builds a
+                  local FP-tree from these conditional transactions and mines the patterns whose least frequent item is in the group.
+                  The tasks run on a process pool that maps the database from shared memory, or on Spark with backend='spark'.
+
+    :Reference: Li, Haoyuan et al. “Pfp: parallel fp-growth for query recommendation.” ACM Conference on Recommender Systems (2008).
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of frequent patterns
+    :param  oFile: str :
+                   Name of the output file to store complete set of frequent patterns
+    :param  minSup: int :
+                   The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
+    :param  numWorkers: int :
+                   The number of worker processes and of item partitions
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   Execution backend of the partition tasks: 'process' (default), 'spark' or 'inline'
+
+
+    :Attributes:
+
+        startTime : float
+          To record the start time of the mining process
+
+        endTime : float
+          To record the completion time of the mining process
+
+        finalPatterns : dict
+          Storing the complete set of patterns in a dictionary variable
+
+        memoryUSS : float
+          To store the total amount of USS memory consumed by the program
+
+        memoryRSS : float
+          To store the total amount of RSS memory consumed by the program
+
+        lno : int
+                the number of transactions
+
+    **Methods to execute code on terminal**
+    ----------------------------------------------------
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 parallelFPGrowth.py <inputFile> <outputFile> <minSup> <numWorkers>
+
+      Example Usage:
+
+      (.venv) $ python3 parallelFPGrowth.py sampleDB.txt patterns.txt 10.0 3
+
+    .. note:: minSup will be considered in percentage of database transactions
+
+
+    **Importing this algorithm into a python program**
+    ----------------------------------------------------
+    .. code-block:: python
+
+                    from PAMI.frequentPattern.parallel import parallelFPGrowth as alg
+
+                    obj = alg.parallelFPGrowth(iFile, minSup, numWorkers)
+
+                    obj.mine()
+
+                    frequentPatterns = obj.getPatterns()
+
+                    print("Total number of Frequent Patterns:", len(frequentPatterns))
+
+                    obj.save(oFile)
+
+                    Df = obj.getPatternsAsDataFrame()
+
+                    memUSS = obj.getMemoryUSS()
+
+                    print("Total Memory in USS:", memUSS)
+
+                    memRSS = obj.getMemoryRSS()
+
+                    print("Total Memory in RSS", memRSS)
+
+                    run = obj.getRuntime()
+
+                    print("Total ExecutionTime in seconds:", run)
+
+
+    **Credits:**
+    ----------------------------------------------------
+
+             The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    _minSup = float()
+    _numWorkers = int()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _lno = int()
+    _Database = []
+
+    def __init__(self, iFile, minSup, numWorkers=1, sep='\t', backend='process'):
+        super().__init__(iFile, minSup, numWorkers, sep, backend)
+
+    def _creatingItemSets(self):
+        """
+        Storing the complete transactions of the database/input file in a database variable
+        """
+        self._Database = self._readTransactions()
+        self._lno = len(self._Database)
+
+    def _convert(self, value):
+        """
+        To convert the type of user specified minSup value
+
+        :param value: user specified minSup value
+        :return: converted type
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._lno * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._lno * value)
+            else:
+                value = int(value)
+        return value
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Frequent pattern mining process will start from here
+        """
+        self._startTime = _ab._time.time()
+        self._finalPatterns = {}
+        self._creatingItemSets()
+        self._minSup = self._convert(self._minSup)
+        items, supports, arrays = _ab._backends.encodeTransactions(self._Database, self._minSup)
+        numPartitions = max(1, min(self._numWorkers, len(items)))
+        tasks = [(partition, numPartitions, self._minSup) for partition in range(numPartitions)]
+        with _ab._backends.openSession(self._backend, arrays, self._numWorkers) as session:
+            results = session.map(_minePartition, tasks)
+        for patterns in results:
+            for pattern, support in patterns.items():
+                self._finalPatterns["\t".join(items[i] for i in sorted(pattern))] = support
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using Parallel FPGrowth algorithm")
+
+    def getMemoryUSS(self):
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self):
+        """
+        Storing final frequent patterns in a dataframe
+
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+        data = [[a.replace('\t', ' '), b] for a, b in self._finalPatterns.items()]
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
+
+    def save(self, outFile):
+        """
+        Complete set of frequent patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csv file
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                writer.write("%s:%s\n" % (x, y))
+
+    def getPatterns(self):
+        """
+        Function to send the set of frequent patterns after completion of the mining process
+
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self):
+        """
+        This function is used to print the results
+        """
+        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 5 or len(_ab._sys.argv) == 6:
+        if len(_ab._sys.argv) == 6:
+            _ap = parallelFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
+        if len(_ab._sys.argv) == 5:
+            _ap = parallelFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        _ap.mine()
+        print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
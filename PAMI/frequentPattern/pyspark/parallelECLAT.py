@@ -52,11 +52,13 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pyspark import SparkConf, SparkContext
+from PAMI import lazyImport as _lazyImport
+SparkConf = _lazyImport.lazyAttribute('pyspark', 'SparkConf')
+SparkContext = _lazyImport.lazyAttribute('pyspark', 'SparkContext')
 # import abstract as _ab
 from PAMI.frequentPattern.pyspark import abstract as _ab
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class parallelECLAT(_ab._frequentPatterns):
@@ -360,7 +362,6 @@ if __name__ == "__main__":
             _ap = parallelECLAT(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = parallelECLAT(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
-        _ap.startMine()
         _ap.mine()
         _finalPatterns = _ap.getPatterns()
         print("Total number of Frequent Patterns:", len(_finalPatterns))
@@ -58,8 +58,10 @@ Copyright (C)  2021 Rage Uday Kiran
 from collections import defaultdict
 from PAMI.frequentPattern.pyspark import abstract as _ab
 from operator import add
-from pyspark import SparkConf as _SparkConf, SparkContext as _SparkContext
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+_SparkConf = _lazyImport.lazyAttribute('pyspark', 'SparkConf')
+_SparkContext = _lazyImport.lazyAttribute('pyspark', 'SparkContext')
+from PAMI.lazyImport import deprecated
 
 
 class Node:
@@ -499,7 +501,6 @@ if __name__ == "__main__":
             _ap = parallelFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = parallelFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
-        _ap.startMine()
         _ap.mine()
         _finalPatterns = _ap.getPatterns()
         print("Total number of Frequent Patterns:", len(_finalPatterns))
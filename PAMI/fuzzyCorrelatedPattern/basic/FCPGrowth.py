@@ -35,7 +35,7 @@
 
 from PAMI.fuzzyCorrelatedPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _FFList:
@@ -712,7 +712,7 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
         """
         return self._finalPatterns
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -767,7 +767,6 @@ if __name__ == "__main__":
             _ap = FCPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]), _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = FCPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of Fuzzy Correlated Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
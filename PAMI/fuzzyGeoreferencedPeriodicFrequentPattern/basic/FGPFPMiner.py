@@ -46,7 +46,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 import PAMI.fuzzyGeoreferencedPeriodicFrequentPattern.basic.abstract as _ab
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _FFList:
@@ -729,7 +729,6 @@ if __name__ == "__main__":
                              _ab._sys.argv[6])
         if len(_ab._sys.argv) == 5:
             _ap = FGPFPMiner(_ab._sys.argv[1], _ab._sys.argv[2], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Spatial Fuzzy Periodic Frequent  Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -739,7 +738,6 @@ if __name__ == "__main__":
         _ap.save("outputfile.txt")
     else:
         _ap = FGPFPMiner('sample.txt','nei.txt', 1, 10, ' ')
-        _ap.startMine()
         _ap.mine()
         print("Total number of Fuzzy Periodic-Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save('output.txt')
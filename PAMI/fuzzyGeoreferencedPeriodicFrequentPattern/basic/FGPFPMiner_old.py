@@ -40,10 +40,11 @@ Copyright (C)  2021 Rage Uday Kiran
      Copyright (C)  2021 Rage Uday Kiran
 
 """
-import pandas as pd
-import plotly.express as px
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+px = _lazyImport.lazyModule('plotly.express')
 import PAMI.fuzzyGeoreferencedPeriodicFrequentPattern.basic.abstract as _ab
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _FFList:
@@ -846,7 +847,6 @@ if __name__ == "__main__":
                              _ab._sys.argv[6])
         if len(_ab._sys.argv) == 5:
             _ap = FGPFPMiner(_ab._sys.argv[1], _ab._sys.argv[2], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Spatial Fuzzy Periodic Frequent  Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
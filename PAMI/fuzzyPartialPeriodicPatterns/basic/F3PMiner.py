@@ -64,7 +64,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.fuzzyPartialPeriodicPatterns.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _FFList:
@@ -636,7 +636,6 @@ if __name__ == "__main__":
             _ap = F3PMiner(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = F3PMiner(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         _ap.save(_ab._sys.argv[2])
         _ap.printResults()
@@ -66,7 +66,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.fuzzyPeriodicFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _FFList:
@@ -309,7 +309,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
     _fuzzyValues = []
     _ts = []
 
-    def __init__(self, iFile: Union[str, _ab._pd.DataFrame], minSup: Union[int, float], period: Union[int, float], sep: str="\t") -> None:
+    def __init__(self, iFile: 'Union[str, _ab._pd.DataFrame]', minSup: Union[int, float], period: Union[int, float], sep: str="\t") -> None:
         super().__init__(iFile, minSup, period, sep)
         self._oFile = ""
         self._BufferSize = 200
@@ -631,7 +631,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
         #res1 = str(sumLUtil) + " : " + str(period)
         self._finalPatterns[res] = [sumLUtil, period]
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -686,7 +686,6 @@ if __name__ == "__main__":
             _ap = FPFPMiner(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:  # to consider "\t" as a separator
             _ap = FPFPMiner(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Fuzzy Periodic-Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -695,7 +694,6 @@ if __name__ == "__main__":
         print("Total ExecutionTime in seconds:", _ap.getRuntime())
     else:
         _ap = FPFPMiner('sample.txt', 1, 10, ' ')
-        _ap.startMine()
         _ap.mine()
         print("Total number of Fuzzy Periodic-Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save('output.txt')
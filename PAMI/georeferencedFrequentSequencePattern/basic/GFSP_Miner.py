@@ -58,7 +58,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.georeferencedFrequentSequencePattern.basic import abstract as _ab
 import sys
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 sys.setrecursionlimit(10000)
 
@@ -1111,7 +1111,6 @@ if __name__ == "__main__":
             _ap = Spade(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = Spade(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
-        _ap.startMine()
         _ap.mine()
         _Patterns = _ap.getPatterns()
         print("Total number of Frequent Patterns:", len(_Patterns))
@@ -1124,7 +1123,6 @@ if __name__ == "__main__":
         print("Total ExecutionTime in ms:", _run)
     else:
         _ap = Spade('retail.txt', "file3.txt", 87, ' ')
-        _ap.startMine()
         _ap.mine()
         _Patterns = _ap.getPatterns()
         _memUSS = _ap.getMemoryUSS()
@@ -52,7 +52,9 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.georeferencedPartialPeriodicPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+import numpy as _np
+from PAMI.lazyImport import deprecated
 
 
 class STEclat(_ab._partialPeriodicSpatialPatterns):
@@ -268,6 +270,7 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
                     self._tidList[si].append(n)
         self._minPS = self._convert(self._minPS)
         self._mapSupport = {k: v[0] for k, v in self._mapSupport.items() if v[0] >= self._minPS}
+        self._tidList = {k: _pm.asTimestamps(self._tidList[k]) for k in self._mapSupport}
         plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x: x[1], reverse=True)]
         return plist
 
@@ -302,13 +305,7 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
         :param timeStamps: timestamps of a pattern
         :type timeStamps: list
         """
-        timeStamps.sort()
-        per = 0
-        for i in range(len(timeStamps) - 1):
-            j = i + 1
-            if abs(timeStamps[j] - timeStamps[i]) <= self._maxIAT:
-                per += 1
-        return per
+        return _pm.periodicSupport(_pm.asTimestamps(timeStamps, unique=False), self._maxIAT)
 
     def _save(self, prefix, suffix, tidSetX):
         """
@@ -354,11 +351,9 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
-            for j in range(i + 1, len(itemSets)):
-                itemJ = itemSets[j]
-                tidSetJ = tidSets[j]
-                y = list(set(tidSetX).intersection(tidSetJ))
-                val = self._getPeriodicSupport(y)
+            candidates = [_np.intersect1d(tidSetX, tidSets[j], assume_unique=True) for j in range(i + 1, len(itemSets))]
+            values = _pm.batchPeriodicSupport(candidates, self._maxIAT)
+            for itemJ, y, val in zip(itemSets[i + 1:], candidates, values):
                 if val >= self._minPS:
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
@@ -451,13 +446,11 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
             itemSets = []
             tidSets = []
             neighboursItems = self._getNeighbourItems(plist[i])
-            for j in range(i + 1, len(plist)):
-                if not plist[j] in neighboursItems:
-                    continue
-                itemJ = plist[j]
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetX).intersection(tidSetJ))
-                val = self._getPeriodicSupport(y1)
+            neighboursItems = set(neighboursItems)
+            neighbours = [itemJ for itemJ in plist[i + 1:] if itemJ in neighboursItems]
+            candidates = [_np.intersect1d(tidSetX, self._tidList[itemJ], assume_unique=True) for itemJ in neighbours]
+            values = _pm.batchPeriodicSupport(candidates, self._maxIAT)
+            for itemJ, y1, val in zip(neighbours, candidates, values):
                 if val >= self._minPS:
                     itemSets.append(itemJ)
                     tidSets.append(y1)
@@ -561,7 +554,6 @@ if __name__ == "__main__":
             _ap = STEclat(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5], _ab._sys.argv[6])
         if len(_ab._sys.argv) == 6:
             _ap = STEclat(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Spatial Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
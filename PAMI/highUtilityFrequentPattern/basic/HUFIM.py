@@ -56,7 +56,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.highUtilityFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Union
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _Transaction:
@@ -223,7 +223,7 @@ class _Dataset:
     transactions = []
     maxItem = 0
     
-    def __init__(self, datasetPath: Union[str, _ab._pd.DataFrame], sep: str) -> None:
+    def __init__(self, datasetPath: 'Union[str, _ab._pd.DataFrame]', sep: str) -> None:
         self.strToInt = {}
         self.intToStr = {}
         self.cnt = 1
@@ -863,7 +863,7 @@ class HUFIM(_ab._utilityPatterns):
                 else:
                     self._utilityBinArrayLU[item] = transaction.transactionUtility
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final patterns in a dataframe
 
@@ -945,7 +945,6 @@ if __name__ == '__main__':
             _ap = HUFIM(_ab._sys.argv[1], int(_ab._sys.argv[3]), float(_ab._sys.argv[4]), _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:    #takes "\t" as a separator
             _ap = HUFIM(_ab._sys.argv[1], int(_ab._sys.argv[3]), float(_ab._sys.argv[4]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of High Utility Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _Transaction:
@@ -198,7 +198,7 @@ class _Dataset:
     transactions = []
     maxItem = 0
     
-    def __init__(self,datasetPath: Union[str, _ab._pd.DataFrame], sep: str) -> None:
+    def __init__(self,datasetPath: 'Union[str, _ab._pd.DataFrame]', sep: str) -> None:
         self.strToInt = {}
         self.intToStr = {}
         self.transactions = []
@@ -207,7 +207,7 @@ class _Dataset:
         self.sep = sep
         self.createItemsets(datasetPath)
 
-    def createItemsets(self, datasetPath: Union[str, _ab._pd.DataFrame]) -> None:
+    def createItemsets(self, datasetPath: 'Union[str, _ab._pd.DataFrame]') -> None:
         """
         Storing the complete transactions of the database/input file in a database variable
         :param datasetPath: It represents the peth for the dataset
@@ -845,7 +845,6 @@ if __name__ == '__main__':
             _ap = EFIM(_ab._sys.argv[1], int(_ab._sys.argv[3]), _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:    #takes "\t" as a separator
             _ap = EFIM(_ab._sys.argv[1], int(_ab._sys.argv[3]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of High Utility Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -854,7 +853,6 @@ if __name__ == '__main__':
         print("Total ExecutionTime in seconds:", _ap.getRuntime())
     else:
         _ap = EFIM('/Users/likhitha/Downloads/Utility_T10I4D100K.csv', 50000, '\t')
-        _ap.startMine()
         _ap.mine()
         print("Total number of High Utility Patterns:", len(_ap.getPatterns()))
         _ap.save('/Users/likhitha/Downloads/UPGrowth_output.txt')
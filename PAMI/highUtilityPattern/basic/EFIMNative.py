@@ -0,0 +1,387 @@
+# EFIMNative runs the bundled C++ EFIM core (efim.cpp) on NumPy buffers and falls back to the Python EFIM when the
+# shared library has not been built.
+#
+# **Building the native library**
+# --------------------------------------------------------
+#
+#             g++ -O3 -std=c++17 -shared -fPIC -DEFIM_SHARED_LIBRARY efim.cpp -o libefim.so
+#
+# Place libefim.so next to this module or point the PAMI_EFIM_LIBRARY environment variable at it.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.highUtilityPattern.basic import EFIMNative as alg
+#
+#             obj=alg.EFIMNative("input.txt",35)
+#
+#             obj.mine()
+#
+#             Patterns = obj.getPatterns()
+#
+#             print("Total number of high utility Patterns:", len(Patterns))
+#
+#             obj.save("output")
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+import ctypes as _ctypes
+import tempfile as _tempfile
+import numpy as _np
+from PAMI.highUtilityPattern.basic import abstract as _ab
+from PAMI.highUtilityPattern.basic.EFIM import EFIM as _EFIM
+from typing import Tuple, Optional
+from PAMI.lazyImport import deprecated
+
+_libraryNames = ['libefim.so', 'libefim.dylib', 'efim.dll']
+_library = None
+
+
+def _loadLibrary() -> Optional[_ctypes.CDLL]:
+    """
+    Load the compiled efim.cpp library once per process.
+
+    :return: the loaded library, or None if it has not been built
+    :rtype: ctypes.CDLL
+    """
+    global _library
+    if _library is not None:
+        return _library or None
+    candidates = []
+    if _ab._os.environ.get('PAMI_EFIM_LIBRARY'):
+        candidates.append(_ab._os.environ['PAMI_EFIM_LIBRARY'])
+    here = _ab._ospath.dirname(_ab._ospath.abspath(__file__))
+    candidates.extend(_ab._ospath.join(here, name) for name in _libraryNames)
+    for path in candidates:
+        if not _ab._ospath.isfile(path):
+            continue
+        try:
+            lib = _ctypes.CDLL(path)
+        except OSError:
+            continue
+        u32 = _np.ctypeslib.ndpointer(dtype=_np.uint32, flags='C_CONTIGUOUS')
+        u64 = _np.ctypeslib.ndpointer(dtype=_np.uint64, flags='C_CONTIGUOUS')
+        lib.efimMine.argtypes = [u32, u32, u64, u32, _ctypes.c_uint64, _ctypes.c_uint32]
+        lib.efimMine.restype = _ctypes.c_void_p
+        lib.efimPatternCount.argtypes = [_ctypes.c_void_p]
+        lib.efimPatternCount.restype = _ctypes.c_uint64
+        lib.efimItemCount.argtypes = [_ctypes.c_void_p]
+        lib.efimItemCount.restype = _ctypes.c_uint64
+        lib.efimCopyPatterns.argtypes = [_ctypes.c_void_p, u32, u64, u64]
+        lib.efimCopyPatterns.restype = None
+        lib.efimFree.argtypes = [_ctypes.c_void_p]
+        lib.efimFree.restype = None
+        _library = lib
+        return lib
+    _library = False
+    return None
+
+
+def isAvailable() -> bool:
+    """
+    Check whether the native EFIM library can be loaded.
+
+    :return: True if the compiled library was found
+    :rtype: bool
+    """
+    return _loadLibrary() is not None
+
+
+class EFIMNative(_EFIM):
+    """
+    :Description:   EFIMNative mines High Utility ItemSets with the C++ EFIM core shipped in efim.cpp. The database is
+                    encoded once into flat NumPy buffers (items, utilities, indptr, transaction utilities) that are handed
+                    to the library without any text round-trip. When the library is not built, the pure Python EFIM is used.
+
+    :Reference:      Zida, S., Fournier-Viger, P., Lin, J.CW. et al. EFIM: a fast and memory efficient algorithm for
+                    high-utility itemset mining. Knowl Inf Syst 51, 595–625 (2017). https://doi.org/10.1007/s10115-016-0986-0
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of High Utility patterns. A DataFrame with 'Transactions',
+                   'Utilities' and 'UtilitySum' columns, or a tuple of NumPy arrays (items, utilities, indptr) in CSR
+                   layout, is also accepted.
+    :param minUtil: int :
+                   The user given minUtil value.
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+
+    :Attributes:
+
+        native : bool
+            True if the last mining run used the compiled library
+
+    :Methods :
+
+        mine()
+                Mining process will start from here
+        getPatterns()
+                Complete set of patterns will be retrieved with this function
+        save(oFile)
+                Complete set of patterns will be loaded in to a output file
+        getPatternsAsDataFrame()
+                Complete set of patterns will be loaded in to a dataframe
+        getMemoryUSS()
+                Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+                Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+               Total amount of runtime taken by the mining process will be retrieved from this function
+
+    **Executing the code on terminal:**
+    ------------------------------------------
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 EFIMNative.py <inputFile> <outputFile> <minUtil> <sep>
+
+      Example Usage:
+
+      (.venv) $ python3 EFIMNative.py sampleTDB.txt output.txt 35
+
+    Sample run of importing the code:
+    -------------------------------------
+    .. code-block:: python
+
+            from PAMI.highUtilityPattern.basic import EFIMNative as alg
+
+            obj=alg.EFIMNative("input.txt",35)
+
+            obj.mine()
+
+            Patterns = obj.getPatterns()
+
+            print("Total number of high utility Patterns:", len(Patterns))
+
+            obj.save("output")
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+    **Credits:**
+    -------------------
+        The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    def __init__(self, iFile, minUtil, sep="\t") -> None:
+        super().__init__(iFile, minUtil, sep)
+        self.native = False
+
+    def _appendTransaction(self, itemsString: list, utilityString: list, transactionUtility: int) -> None:
+        """
+        Encode one transaction into the flat buffers
+
+        :param itemsString: items of the transaction
+        :type itemsString: list
+        :param utilityString: utilities of the items
+        :type utilityString: list
+        :param transactionUtility: utility of the whole transaction
+        :type transactionUtility: int
+        :return: None
+        """
+        for item in itemsString:
+            code = self._strToInt.get(item)
+            if code is None:
+                code = len(self._strToInt) + 1
+                self._strToInt[item] = code
+                self._intToStr[code] = item
+            self._items.append(code)
+        self._utilities.extend(int(x) for x in utilityString)
+        self._indptr.append(len(self._items))
+        self._transactionUtility.append(int(transactionUtility))
+
+    def _readLines(self, lines) -> None:
+        """
+        Encode the lines of a utility database into the flat buffers
+
+        :param lines: iterable of lines in the 'items:transactionUtility:utilities' format
+        :return: None
+        """
+        for line in lines:
+            trans_list = line.strip().split(':')
+            if len(trans_list) < 3:
+                continue
+            itemsString = [x for x in trans_list[0].strip().split(self._sep) if x]
+            utilityString = [x for x in trans_list[2].strip().split(self._sep) if x]
+            self._appendTransaction(itemsString, utilityString, int(trans_list[1]))
+
+    def _readBuffers(self) -> Tuple[_np.ndarray, _np.ndarray, _np.ndarray, _np.ndarray]:
+        """
+        Convert the input into CSR buffers (items, utilities, indptr, transaction utilities)
+
+        :return: the four buffers handed to the native library
+        :rtype: tuple
+        """
+        self._strToInt, self._intToStr = {}, {}
+        if isinstance(self._iFile, tuple):
+            items, utilities, indptr = self._iFile
+            items = _np.ascontiguousarray(items)
+            uniques, codes = _np.unique(items, return_inverse=True)
+            self._intToStr = {i + 1: str(x) for i, x in enumerate(uniques.tolist())}
+            utilities = _np.ascontiguousarray(utilities, dtype=_np.uint32)
+            indptr = _np.ascontiguousarray(indptr, dtype=_np.uint64)
+            cumulative = _np.concatenate(([0], _np.cumsum(utilities, dtype=_np.uint64)))
+            sums = cumulative[indptr[1:]] - cumulative[indptr[:-1]]
+            return (codes.astype(_np.uint32) + 1, utilities, indptr, sums.astype(_np.uint32))
+        self._items, self._utilities, self._indptr, self._transactionUtility = [], [], [0], []
+        if isinstance(self._iFile, _ab._pd.DataFrame):
+            columns = self._iFile.columns.values.tolist()
+            if 'Transactions' in columns and 'Utilities' in columns and 'UtilitySum' in columns:
+                for items, utilities, total in zip(self._iFile['Transactions'], self._iFile['Utilities'],
+                                                   self._iFile['UtilitySum']):
+                    self._appendTransaction([str(x) for x in items], utilities, total)
+        if isinstance(self._iFile, str):
+            if _ab._validators.url(self._iFile):
+                self._readLines(line.decode("utf-8") for line in _ab._urlopen(self._iFile))
+            else:
+                try:
+                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                        self._readLines(f)
+                except IOError:
+                    print("File Not Found")
+                    quit()
+        buffers = (_np.asarray(self._items, dtype=_np.uint32), _np.asarray(self._utilities, dtype=_np.uint32),
+                   _np.asarray(self._indptr, dtype=_np.uint64),
+                   _np.asarray(self._transactionUtility, dtype=_np.uint32))
+        del self._items, self._utilities, self._indptr, self._transactionUtility
+        return buffers
+
+    def _mineNative(self, lib: _ctypes.CDLL) -> None:
+        """
+        Run the C++ EFIM core and decode its patterns
+
+        :param lib: the loaded native library
+        :type lib: ctypes.CDLL
+        :return: None
+        """
+        items, utilities, indptr, transactionUtility = self._readBuffers()
+        handle = lib.efimMine(items, utilities, indptr, transactionUtility, len(indptr) - 1, int(self._minUtil))
+        try:
+            count = lib.efimPatternCount(handle)
+            patternItems = _np.zeros(lib.efimItemCount(handle), dtype=_np.uint32)
+            patternIndptr = _np.zeros(count + 1, dtype=_np.uint64)
+            patternUtility = _np.zeros(count, dtype=_np.uint64)
+            lib.efimCopyPatterns(handle, patternItems, patternIndptr, patternUtility)
+        finally:
+            lib.efimFree(handle)
+        names = patternItems.tolist()
+        bounds = patternIndptr.tolist()
+        for i, utility in enumerate(patternUtility.tolist()):
+            pattern = "\t".join(self._intToStr[x] for x in names[bounds[i]:bounds[i + 1]])
+            self._finalPatterns[pattern] = str(utility)
+        self._patternCount = count
+
+    def _writeTemporaryFile(self) -> str:
+        """
+        Write a CSR input to a temporary utility database so that the Python EFIM can read it
+
+        :return: path of the temporary file
+        :rtype: str
+        """
+        items, utilities, indptr = self._iFile
+        bounds = [int(x) for x in indptr]
+        fd, path = _tempfile.mkstemp(suffix='.txt')
+        with _ab._os.fdopen(fd, 'w') as f:
+            for i in range(len(bounds) - 1):
+                transaction = [str(x) for x in items[bounds[i]:bounds[i + 1]]]
+                values = [int(x) for x in utilities[bounds[i]:bounds[i + 1]]]
+                f.write(self._sep.join(transaction) + ":" + str(sum(values)) + ":"
+                        + self._sep.join(str(x) for x in values) + "\n")
+        return path
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        """
+        Start the EFIM algorithm.
+        :return: None
+        """
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Start the EFIM algorithm, using the native library when it is available.
+        :return: None
+        """
+        lib = _loadLibrary()
+        self.native = lib is not None
+        if not self.native:
+            if not isinstance(self._iFile, tuple):
+                super().mine()
+                return
+            buffers, self._iFile = self._iFile, self._writeTemporaryFile()
+            try:
+                super().mine()
+            finally:
+                _ab._os.remove(self._iFile)
+                self._iFile = buffers
+            return
+        self._startTime = _ab._time.time()
+        self._finalPatterns = {}
+        self._minUtil = int(self._minUtil)
+        self._mineNative(lib)
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("High Utility patterns were generated successfully using EFIMNative algorithm")
+
+
+if __name__ == '__main__':
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:    #includes separator
+            _ap = EFIMNative(_ab._sys.argv[1], int(_ab._sys.argv[3]), _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:    #takes "\t" as a separator
+            _ap = EFIMNative(_ab._sys.argv[1], int(_ab._sys.argv[3]))
+        _ap.mine()
+        print("Total number of High Utility Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS",  _ap.getMemoryRSS())
+        print("Total ExecutionTime in seconds:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
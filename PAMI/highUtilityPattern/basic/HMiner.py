@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 class _Element:
@@ -726,7 +726,6 @@ if __name__ == "__main__":
             _ap = HMiner(_ab._sys.argv[1], int(_ab._sys.argv[3]), _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:  # to consider "\t" as a separator
             _ap = HMiner(_ab._sys.argv[1], int(_ab._sys.argv[3]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of huis:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
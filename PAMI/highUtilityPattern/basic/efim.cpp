@@ -54,74 +54,16 @@ struct vector_hash
     }
 };
 
-// return std::tuple(finalTransactions, primary, secondary, newintToString);
-
-std::tuple<std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash>,
-           std::vector<uint32_t>,
-           std::unordered_set<uint32_t>,
-           std::unordered_map<uint32_t, std::string>>
-readFile(std::string fileName, uint32_t minutil)
-{
-
-    std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash> transactions;
-    std::unordered_map<std::string, uint32_t> stringToInt;
-    std::unordered_map<uint32_t, std::string> intToString;
-    std::unordered_map<uint32_t, uint32_t> localutility;
-    std::ifstream inputFile(fileName);
-    std::string line;
-
-    uint32_t itemCounter = 1;
-
-    if (!inputFile.is_open())
-    {
-        std::cerr << "Error opening file: " << fileName << std::endl;
-        exit(EXIT_FAILURE);
-    }
-
-    while (std::getline(inputFile, line))
-    {
-        std::vector<std::string> lineSplit = charsplit(line, ':');
-        std::vector<std::string> items = charsplit(lineSplit[0], ' ');
-
-        std::vector<uint32_t> items2int;
-
-        uint32_t twu = std::stoi(lineSplit[1]);
-
-        for (std::string &item : items)
-        {
-            auto it = stringToInt.find(item);
-            if (it == stringToInt.end())
-            {
-                stringToInt[item] = itemCounter;
-                intToString[itemCounter] = item;
-                localutility[itemCounter] = twu;
-                itemCounter++;
-            }
-            else
-            {
-                localutility[it->second] += twu;
-            }
-            items2int.push_back(stringToInt[item]);
-        }
-
-        std::vector<uint32_t> utilities = intsplit(lineSplit[2], ' ');
+typedef std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash> Database;
+typedef std::vector<std::pair<std::vector<uint32_t>, uint32_t>> Patterns;
 
-        auto find = transactions.find(items2int);
-        if (find == transactions.end())
-        {
-            transactions.emplace(std::move(items2int), std::make_pair(std::move(utilities), 0));
-        }
-        else
-        {
-            for (uint32_t i = 0; i < find->second.first.size(); i++)
-            {
-                find->second.first[i] += utilities[i];
-            }
-        }
-    }
+// return std::tuple(finalTransactions, primary, secondary, finalintToint);
 
+std::tuple<Database, std::vector<uint32_t>, std::unordered_set<uint32_t>, std::vector<uint32_t>>
+buildDatabase(const Database &transactions, const std::unordered_map<uint32_t, uint32_t> &localutility, uint32_t minutil)
+{
     std::unordered_map<uint32_t, uint32_t> intTofinalint;
-    std::unordered_map<uint32_t, std::string> newintToString;
+    std::vector<uint32_t> finalintToint = {0};
     std::unordered_set<uint32_t> secondary;
 
     std::vector<std::pair<uint32_t, uint32_t>> sortedLocalutility(localutility.begin(), localutility.end());
@@ -135,14 +77,13 @@ readFile(std::string fileName, uint32_t minutil)
         {
             continue;
         }
-        // std::cout << intToString[item.first] << "->" << newitemCounter << ":" << item.second << std::endl;
         intTofinalint[item.first] = newitemCounter;
-        newintToString[newitemCounter] = intToString[item.first];
+        finalintToint.push_back(item.first);
         secondary.insert(newitemCounter);
         newitemCounter++;
     }
 
-    std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash> finalTransactions;
+    Database finalTransactions;
     std::unordered_map<uint32_t, uint32_t> subtreeUtility;
 
     for (auto &transaction : transactions)
@@ -151,9 +92,10 @@ readFile(std::string fileName, uint32_t minutil)
 
         for (uint32_t i = 0; i < transaction.second.first.size(); i++)
         {
-            if (intTofinalint.find(transaction.first[i]) != intTofinalint.end())
+            auto found = intTofinalint.find(transaction.first[i]);
+            if (found != intTofinalint.end())
             {
-                sortedTransaction.push_back(std::make_pair(intTofinalint[transaction.first[i]], transaction.second.first[i]));
+                sortedTransaction.push_back(std::make_pair(found->second, transaction.second.first[i]));
             }
         }
 
@@ -200,10 +142,120 @@ readFile(std::string fileName, uint32_t minutil)
         }
     }
 
+    return std::tuple(finalTransactions, primary, secondary, finalintToint);
+}
+
+// return std::tuple(finalTransactions, primary, secondary, newintToString);
+
+std::tuple<Database, std::vector<uint32_t>, std::unordered_set<uint32_t>, std::unordered_map<uint32_t, std::string>>
+readFile(std::string fileName, uint32_t minutil)
+{
+
+    Database transactions;
+    std::unordered_map<std::string, uint32_t> stringToInt;
+    std::unordered_map<uint32_t, std::string> intToString;
+    std::unordered_map<uint32_t, uint32_t> localutility;
+    std::ifstream inputFile(fileName);
+    std::string line;
+
+    uint32_t itemCounter = 1;
+
+    if (!inputFile.is_open())
+    {
+        std::cerr << "Error opening file: " << fileName << std::endl;
+        exit(EXIT_FAILURE);
+    }
+
+    while (std::getline(inputFile, line))
+    {
+        std::vector<std::string> lineSplit = charsplit(line, ':');
+        std::vector<std::string> items = charsplit(lineSplit[0], ' ');
+
+        std::vector<uint32_t> items2int;
+
+        uint32_t twu = std::stoi(lineSplit[1]);
+
+        for (std::string &item : items)
+        {
+            auto it = stringToInt.find(item);
+            if (it == stringToInt.end())
+            {
+                stringToInt[item] = itemCounter;
+                intToString[itemCounter] = item;
+                localutility[itemCounter] = twu;
+                itemCounter++;
+            }
+            else
+            {
+                localutility[it->second] += twu;
+            }
+            items2int.push_back(stringToInt[item]);
+        }
+
+        std::vector<uint32_t> utilities = intsplit(lineSplit[2], ' ');
+
+        auto find = transactions.find(items2int);
+        if (find == transactions.end())
+        {
+            transactions.emplace(std::move(items2int), std::make_pair(std::move(utilities), 0));
+        }
+        else
+        {
+            for (uint32_t i = 0; i < find->second.first.size(); i++)
+            {
+                find->second.first[i] += utilities[i];
+            }
+        }
+    }
+
+    auto [finalTransactions, primary, secondary, finalintToint] = buildDatabase(transactions, localutility, minutil);
+
+    std::unordered_map<uint32_t, std::string> newintToString;
+    for (uint32_t i = 1; i < finalintToint.size(); i++)
+    {
+        newintToString[i] = intToString[finalintToint[i]];
+    }
+
     return std::tuple(finalTransactions, primary, secondary, newintToString);
 }
 
-void outputToFile(std::string outputFileName, std::vector<std::pair<std::vector<std::string>, uint32_t>> patterns)
+// return std::tuple(finalTransactions, primary, secondary, finalintToint);
+
+std::tuple<Database, std::vector<uint32_t>, std::unordered_set<uint32_t>, std::vector<uint32_t>>
+readBuffers(const uint32_t *items, const uint32_t *utilities, const uint64_t *indptr,
+            const uint32_t *transactionUtility, uint64_t nTransactions, uint32_t minutil)
+{
+    Database transactions;
+    std::unordered_map<uint32_t, uint32_t> localutility;
+
+    for (uint64_t t = 0; t < nTransactions; t++)
+    {
+        std::vector<uint32_t> items2int(items + indptr[t], items + indptr[t + 1]);
+        std::vector<uint32_t> utilities2int(utilities + indptr[t], utilities + indptr[t + 1]);
+
+        for (const auto &item : items2int)
+        {
+            localutility[item] += transactionUtility[t];
+        }
+
+        auto find = transactions.find(items2int);
+        if (find == transactions.end())
+        {
+            transactions.emplace(std::move(items2int), std::make_pair(std::move(utilities2int), 0));
+        }
+        else
+        {
+            for (uint32_t i = 0; i < find->second.first.size(); i++)
+            {
+                find->second.first[i] += utilities2int[i];
+            }
+        }
+    }
+
+    return buildDatabase(transactions, localutility, minutil);
+}
+
+void outputToFile(std::string outputFileName, const Patterns &patterns, std::unordered_map<uint32_t, std::string> &intToString)
 {
     std::ofstream outputFile;
     outputFile.open(outputFileName);
@@ -211,18 +263,17 @@ void outputToFile(std::string outputFileName, std::vector<std::pair<std::vector<
     {
         for (const auto &item : pattern.first)
         {
-            outputFile << item << " ";
+            outputFile << intToString[item] << " ";
         }
         outputFile << "#UTIL: " << pattern.second << std::endl;
     }
     outputFile.close();
 }
 
-void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash> transactions,
-            std::vector<uint32_t> prefix,
-            std::vector<uint32_t> primary, std::unordered_set<uint32_t> secondary,
-            std::vector<std::pair<std::vector<std::string>, uint32_t>> &patterns, uint32_t minutil,
-            std::unordered_map<uint32_t, std::string> intToString)
+void search(const Database &transactions,
+            const std::vector<uint32_t> &prefix,
+            const std::vector<uint32_t> &primary, const std::unordered_set<uint32_t> &secondary,
+            Patterns &patterns, uint32_t minutil)
 {
 
     for (const auto &item : primary)
@@ -230,7 +281,7 @@ void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint
         std::vector<uint32_t> newprefix = prefix;
         newprefix.push_back(item);
 
-        std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash> projectedTransactions;
+        Database projectedTransactions;
         std::unordered_map<uint32_t, uint32_t> projectedSubtreeUtility;
         std::unordered_map<uint32_t, uint32_t> projectedLocalutility;
 
@@ -321,11 +372,7 @@ void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint
 
         if (utility >= minutil)
         {
-            patterns.push_back(std::make_pair(std::vector<std::string>(), utility));
-            for (const auto &item : newprefix)
-            {
-                patterns.back().first.push_back(intToString[item]);
-            }
+            patterns.push_back(std::make_pair(newprefix, utility));
         }
 
         std::vector<uint32_t> newprimary;
@@ -347,11 +394,75 @@ void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint
             }
         }
 
-        search(projectedTransactions, newprefix, newprimary, newsecondary, patterns, minutil, intToString);
+        search(projectedTransactions, newprefix, newprimary, newsecondary, patterns, minutil);
     }
 
 }
 
+// C entry points used by PAMI.highUtilityPattern.basic.EFIMNative through ctypes.
+// Build with: g++ -O3 -std=c++17 -shared -fPIC -DEFIM_SHARED_LIBRARY efim.cpp -o libefim.so
+
+struct EFIMResult
+{
+    Patterns patterns;
+    uint64_t itemCount = 0;
+};
+
+extern "C"
+{
+    // Mine the CSR database (items/utilities sliced by indptr) and return an opaque result handle.
+    void *efimMine(const uint32_t *items, const uint32_t *utilities, const uint64_t *indptr,
+                   const uint32_t *transactionUtility, uint64_t nTransactions, uint32_t minutil)
+    {
+        EFIMResult *result = new EFIMResult();
+        auto [transactions, primary, secondary, finalintToint] = readBuffers(items, utilities, indptr,
+                                                                            transactionUtility, nTransactions, minutil);
+        search(transactions, {}, primary, secondary, result->patterns, minutil);
+        for (auto &pattern : result->patterns)
+        {
+            for (auto &item : pattern.first)
+            {
+                item = finalintToint[item];
+            }
+            result->itemCount += pattern.first.size();
+        }
+        return result;
+    }
+
+    uint64_t efimPatternCount(void *handle)
+    {
+        return static_cast<EFIMResult *>(handle)->patterns.size();
+    }
+
+    uint64_t efimItemCount(void *handle)
+    {
+        return static_cast<EFIMResult *>(handle)->itemCount;
+    }
+
+    // Copy the patterns into caller-owned buffers: items[indptr[i]:indptr[i + 1]] is pattern i.
+    void efimCopyPatterns(void *handle, uint32_t *items, uint64_t *indptr, uint64_t *utility)
+    {
+        EFIMResult *result = static_cast<EFIMResult *>(handle);
+        uint64_t position = 0;
+        indptr[0] = 0;
+        for (uint64_t i = 0; i < result->patterns.size(); i++)
+        {
+            for (const auto &item : result->patterns[i].first)
+            {
+                items[position++] = item;
+            }
+            indptr[i + 1] = position;
+            utility[i] = result->patterns[i].second;
+        }
+    }
+
+    void efimFree(void *handle)
+    {
+        delete static_cast<EFIMResult *>(handle);
+    }
+}
+
+#ifndef EFIM_SHARED_LIBRARY
 int main(int argc, char *argv[])
 {
     if (argc != 4)
@@ -381,14 +492,14 @@ int main(int argc, char *argv[])
     clock_t start = clock();
 
     // return std::make_tuple(d_items, d_utilities, d_cost, d_indexesStart, d_indexesEnd, d_secondary, h_primary);
-    std::vector<std::pair<std::vector<std::string>, uint32_t>> patterns;
+    Patterns patterns;
     std::vector<uint32_t> prefix = {};
 
     auto [transactions, primary, secondary, intToString] = readFile(inputFileName, minutil);
 
     std::cout << "Finished reading file in " << double(clock() - start) / CLOCKS_PER_SEC << "s" << std::endl;
 
-    search(transactions, prefix, primary, secondary, patterns, minutil, intToString);
+    search(transactions, prefix, primary, secondary, patterns, minutil);
 
     clock_t end = clock();
     double elapsed_secs = double(end - start) / CLOCKS_PER_SEC;
@@ -396,7 +507,8 @@ int main(int argc, char *argv[])
     std::cout << "Time: " << elapsed_secs << "s\t"
               << "Patterns: " << patterns.size() << std::endl;
 
-    outputToFile(outputFileName, patterns);
+    outputToFile(outputFileName, patterns, intToString);
 
     return 0;
 }
+#endif
@@ -55,9 +55,10 @@ Copyright (C)  2021 Rage Uday Kiran
 import os
 import mmap
 import time
-import psutil
+from PAMI import lazyImport as _lazyImport
+psutil = _lazyImport.lazyModule('psutil')
 from joblib import Parallel, delayed
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 
 from PAMI.highUtilityPattern.parallel import abstract as _ab
@@ -522,7 +523,6 @@ if __name__ == "__main__":
             _ap = efimParallel(_ab._sys.argv[1], int(_ab._sys.argv[3]), _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:    #takes "\t" as a separator
             _ap = efimParallel(_ab._sys.argv[1], int(_ab._sys.argv[3]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of High Utility Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -531,7 +531,6 @@ if __name__ == "__main__":
         print("Total ExecutionTime in seconds:", _ap.getRuntime())
     else:
         _ap = efimParallel('/Users/likhitha/Downloads/Utility_T10I4D100K.csv', 50000, '\t')
-        _ap.startMine()
         _ap.mine()
         print("Total number of High Utility Patterns:", len(_ap.getPatterns()))
         _ap.save('/Users/likhitha/Downloads/UPGrowth_output.txt')
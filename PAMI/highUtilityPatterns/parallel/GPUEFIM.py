@@ -55,10 +55,11 @@ Copyright (C)  2021 Rage Uday Kiran
 import os
 import time
 import mmap
-import psutil
-import cupy as cp
+from PAMI import lazyImport as _lazyImport
+psutil = _lazyImport.lazyModule('psutil')
+cp = _lazyImport.lazyModule('cupy')
 import numpy as np
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 searchGPU = cp.RawKernel(r'''
 
@@ -515,7 +516,6 @@ if __name__ == "__main__":
 
     sep = " "
     f = GPUEFIM(inputFile, minUtil, sep)
-    f.startMine()
     f.mine()
     f.save("output.txt")
     print("# of patterns: " + str(len(f.getPatterns())))
@@ -23,10 +23,11 @@
 
 
 import abstract as _hus
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 from functools import reduce
 from operator import and_
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 _minSup = str()
 _hus._sys.setrecursionlimit(20000)
@@ -1019,7 +1020,6 @@ if __name__ == "__main__":
             _ap = SHUGrowth(_hus._sys.argv[1], _hus._sys.argv[2], _hus._sys.argv[3], _hus._sys.argv[4], _hus._sys.argv[5], _hus._sys.argv[6])
         if len(_hus._sys.argv) == 6:
             _ap = SHUGrowth(_hus._sys.argv[1], _hus._sys.argv[2], _hus._sys.argv[3], _hus._sys.argv[4], _hus._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Windows Processes:", len( _ap.getPatterns()))
         _ap.getPatternsAsDataFrame().to_csv("result.csv", index = False, sep='\t')
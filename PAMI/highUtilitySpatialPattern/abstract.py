@@ -28,18 +28,19 @@
 
 from abc import ABC, abstractmethod
 import time
-import validators
-from urllib.request import urlopen
+from PAMI import lazyImport as _lazyImport
+validators = _lazyImport.lazyModule('validators')
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import csv
-import pandas as pd
+pd = _lazyImport.lazyModule('pandas')
 from collections import defaultdict
 from itertools import combinations as c
 import os
 import os.path
-import psutil
+psutil = _lazyImport.lazyModule('psutil')
 import sys
-import validators
-from urllib.request import urlopen
+validators = _lazyImport.lazyModule('validators')
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 
 
 class utilityPatterns(ABC):
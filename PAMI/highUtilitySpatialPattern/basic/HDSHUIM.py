@@ -56,7 +56,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.highUtilitySpatialPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 class _Element:
     """
@@ -748,7 +748,6 @@ if __name__ == "__main__":
             _ap = HDSHUIM(_ab._sys.argv[1], _ab._sys.argv[3], int(_ab._sys.argv[4]), _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:  # to consider "\t" as a separator
             _ap = HDSHUIM(_ab._sys.argv[1], _ab._sys.argv[3], int(_ab._sys.argv[4]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of Spatial High-Utility Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -759,7 +758,6 @@ if __name__ == "__main__":
         for i in [100000, 500000]:
             _ap = HDSHUIM('/Users/Likhitha/Downloads/mushroom_main_2000.txt',
                     '/Users/Likhitha/Downloads/mushroom_neighbors_2000.txt', i, ' ')
-            _ap.startMine()
             _ap.mine()
             print("Total number of Spatial High Utility Patterns:", len(_ap.getPatterns()))
             print("Total Memory in USS:", _ap.getMemoryUSS())
@@ -55,8 +55,9 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.highUtilitySpatialPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator, Optional, TypeVar
 from functools import cmp_to_key as _cmpToKey
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 
 class _Transaction:
@@ -831,7 +832,7 @@ class SHUIM(_ab._utilityPatterns):
                 else:
                     self._utilityBinArrayLU[item] = transaction.getPmus()[idx]
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """
         Storing final patterns in a dataframe
 
@@ -916,7 +917,6 @@ if __name__ == '__main__':
             _ap = SHUIM(_ab._sys.argv[1], _ab._sys.argv[3], int(_ab._sys.argv[4]), _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = SHUIM(_ab._sys.argv[1], _ab._sys.argv[3], int(_ab._sys.argv[4]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of Spatial High Utility Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -926,7 +926,6 @@ if __name__ == '__main__':
     else:
         for i in [100000, 500000]:
             _ap = SHUIM('/Users/Likhitha/Downloads/mushroom_main_2000.txt', '/Users/Likhitha/Downloads/mushroom_neighbors_2000.txt', i, ' ')
-            _ap.startMine()
             _ap.mine()
             print("Total number of Spatial High Utility Patterns:", len(_ap.getPatterns()))
             #_ap.save(_ab._sys.argv[2])
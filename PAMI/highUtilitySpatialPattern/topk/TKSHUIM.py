@@ -58,7 +58,7 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.highUtilitySpatialPattern.topk.abstract import *
 from functools import cmp_to_key
 import heapq
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
 
 class Transaction:
     """
@@ -919,7 +919,6 @@ def main():
     k = 1000
     seperator = ' ' 
     obj = TKSHUIM(iFile=inputFile, nFile=neighborFile, k=k,  sep=seperator)    #initialize
-    obj.startMine()
     obj.mine()
     obj.printResults()
     print(obj.getPatterns())
@@ -0,0 +1,405 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Batch runs of the PAMI algorithms, the entry point of python -m PAMI.
+
+A job runs one algorithm over one database for a list of thresholds. The database is read once: the miners reading
+their input through PAMI.dataSources get the transactions already split, with every item interned so that all the runs
+share one string per item, and the other miners get a plain local copy of a URL or of a compressed file. Every run is
+made in a process of its own that inherits the loaded database, since many miners keep their results in class
+attributes that a second run in the same process would add to. The runs are made one after the other, or workers at a
+time, and every run reports its runtime, its memory and its number of patterns.
+
+.. code-block:: python
+
+        from PAMI import jobRunner
+
+        job = jobRunner.BatchJob("FPGrowth", "transactional.txt", [100, 200, 300], workers=3)
+
+        job.run()
+
+        job.printTable()
+
+        job.save("sweep.csv")
+
+From the command line, with the thresholds or with a JSON job spec, which may also be a list of jobs:
+
+.. code-block:: console
+
+        python -m PAMI FPGrowth transactional.txt 100 200 300 --workers 3
+
+        python -m PAMI PFPGrowth temporal.txt 100 200 --set maxPer=500 --patterns "patterns_{threshold}.txt"
+
+        python -m PAMI --job sweep.json
+
+        {"algorithm": "PFPGrowth", "input": "temporal.txt.gz", "sep": "\\t", "thresholds": [100, 200],
+         "parameters": {"maxPer": 500}, "workers": 2, "patterns": "patterns_{threshold}.txt", "table": "sweep.csv"}
+"""
+
+import argparse as _argparse
+import codecs as _codecs
+import csv as _csv
+import importlib as _importlib
+import inspect as _inspect
+import json as _json
+import multiprocessing as _multiprocessing
+import os as _os
+import sys as _sys
+import tempfile as _tempfile
+import time as _time
+import urllib.parse as _parse
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from PAMI import dataSources as _dataSources
+
+_root = _os.path.dirname(_os.path.abspath(__file__))
+
+_columns = (('threshold', 'threshold'), ('patterns', 'patterns'), ('runtime', 'runtime (s)'),
+            ('memoryRSS', 'memory RSS (MB)'), ('error', 'error'))
+
+_shared = None
+
+
+def algorithmModule(name: str) -> str:
+    """
+    :param name: name of an algorithm, such as FPGrowth, or its module, such as frequentPattern.basic.FPGrowth
+    :type name: str
+    :return: full name of the module of the algorithm
+    :rtype: str
+    """
+    if name.startswith('PAMI.'):
+        return name
+    if '.' in name:
+        return 'PAMI.' + name
+    matches = []
+    for directory, subdirectories, files in _os.walk(_root):
+        subdirectories[:] = sorted(d for d in subdirectories if d not in ('extras', '__pycache__'))
+        if name + '.py' in files:
+            path = _os.path.relpath(_os.path.join(directory, name), _os.path.dirname(_root))
+            matches.append(path.replace(_os.sep, '.'))
+    if not matches:
+        raise ValueError('Unknown algorithm: ' + name)
+    if len(matches) > 1:
+        raise ValueError(name + ' is ambiguous, give one of ' + ', '.join(matches))
+    return matches[0]
+
+
+def loadAlgorithm(module: str) -> type:
+    """
+    :param module: full name of the module of an algorithm
+    :type module: str
+    :return: the class of the algorithm, named as its module
+    :rtype: type
+    """
+    return getattr(_importlib.import_module(module), module.rsplit('.', 1)[1])
+
+
+def _mineMethod(miner: Any) -> Any:
+    """
+    The method mining the patterns, mine, or Mine or startMine for the algorithms without mine
+    """
+    for name in ('mine', 'Mine', 'startMine'):
+        method = getattr(miner, name, None)
+        if callable(method):
+            return method
+    raise AttributeError(type(miner).__name__ + ' has no mine method')
+
+
+def _share(database: Any) -> None:
+    global _shared
+    _shared = database
+
+
+def _run(task: Tuple[str, Dict[str, Any], str, Optional[str]]) -> Dict[str, Any]:
+    """
+    Mines the shared database with the parameters of one run
+
+    :param task: module of the algorithm, keyword arguments of its constructor, label of the run and template of the
+                 name of the patterns file
+    :return: a row of the table
+    """
+    module, parameters, label, patterns = task
+    row = {'threshold': label, 'patterns': None, 'runtime': None, 'memoryRSS': None, 'error': ''}
+    try:
+        start = _time.perf_counter()
+        miner = loadAlgorithm(module)(_shared, **parameters)
+        _mineMethod(miner)()
+        row['runtime'] = _time.perf_counter() - start
+        row['patterns'] = len(miner.getPatterns())
+        if hasattr(miner, 'getMemoryRSS'):
+            row['memoryRSS'] = miner.getMemoryRSS() / (1 << 20)
+        if patterns:
+            miner.save(patterns.format(threshold=label, **parameters))
+    except Exception as error:
+        row['error'] = type(error).__name__ + ': ' + str(error)
+    return row
+
+
+class BatchJob:
+    """
+    :Description:  Runs one algorithm over one database for every threshold of a list, the database being read once
+
+    :Attributes:
+
+        :param algorithm: str :
+            name of the algorithm, such as FPGrowth, or of its module, such as frequentPattern.basic.FPGrowth
+        :param iFile: str or DataFrame :
+            the input of the algorithm: a file, plain or compressed, a URL or a DataFrame
+        :param thresholds: list :
+            values of the first parameter of the algorithm after iFile, such as minSup, one run per value. A value may
+            also be a dict of parameters, for sweeps over several parameters.
+        :param sep: str :
+            separator of the items of the input
+        :param parameters: dict :
+            keyword arguments of the algorithm shared by all the runs, such as maxPer
+        :param workers: int :
+            number of processes making runs at the same time. Every run has a process of its own, so that it starts
+            from a clean state and its memory is measured alone.
+        :param patterns: str :
+            name of the file the patterns of every run are saved to, where {threshold} is replaced by the threshold
+            of the run. The patterns are not saved when it is None.
+
+    **Importing this module into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI import jobRunner
+
+            job = jobRunner.BatchJob("FPGrowth", "transactional.txt", [100, 200, 300], workers=3)
+
+            job.run()
+
+            job.printTable()
+
+            job.save("sweep.csv")
+    """
+
+    def __init__(self, algorithm: str, iFile: Any, thresholds: Sequence[Any], sep: str = '\t',
+                 parameters: Optional[Dict[str, Any]] = None, workers: int = 1, patterns: Optional[str] = None) -> None:
+        self.module = algorithmModule(algorithm)
+        self.iFile = iFile
+        self.thresholds = list(thresholds)
+        self.sep = sep
+        self.parameters = dict(parameters or {})
+        self.workers = int(workers)
+        self.patterns = patterns
+        self._loadTime = 0
+        self._rows = []
+
+    @classmethod
+    def fromSpec(cls, spec: Dict[str, Any]) -> 'BatchJob':
+        """
+        :param spec: a job as read from JSON, with the keys algorithm, input and thresholds, and optionally sep,
+                     parameters, workers and patterns
+        :type spec: dict
+        :return: the job
+        :rtype: BatchJob
+        """
+        missing = [key for key in ('algorithm', 'input', 'thresholds') if key not in spec]
+        if missing:
+            raise ValueError('The job spec has no ' + ', '.join(missing))
+        return cls(spec['algorithm'], spec['input'], spec['thresholds'], spec.get('sep', '\t'),
+                   spec.get('parameters'), spec.get('workers', 1), spec.get('patterns'))
+
+    def _tasks(self, algorithm: type) -> List[Tuple[str, Dict[str, Any], str, Optional[str]]]:
+        """
+        Arguments of _run for every threshold, after checking them against the constructor of the algorithm
+        """
+        signature = _inspect.signature(algorithm.__init__)
+        names = [name for name, parameter in list(signature.parameters.items())[2:]
+                 if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)]
+        required = [name for name in names if signature.parameters[name].default is _inspect.Parameter.empty]
+        if not names:
+            raise ValueError(algorithm.__name__ + ' takes no threshold')
+        tasks = []
+        for threshold in self.thresholds:
+            parameters = dict(self.parameters)
+            if isinstance(threshold, dict):
+                parameters.update(threshold)
+                label = ' '.join(str(key) + '=' + str(value) for key, value in threshold.items())
+            else:
+                parameters[names[0]] = threshold
+                label = str(threshold)
+            if 'sep' in names:
+                parameters.setdefault('sep', self.sep)
+            unknown = [name for name in parameters if name not in names]
+            if unknown and not any(p.kind == p.VAR_KEYWORD for p in signature.parameters.values()):
+                raise ValueError(algorithm.__name__ + ' has no parameter ' + ', '.join(unknown))
+            absent = [name for name in required if name not in parameters]
+            if absent:
+                raise ValueError(algorithm.__name__ + ' needs ' + ', '.join(absent))
+            tasks.append((self.module, parameters, label, self.patterns))
+        return tasks
+
+    def _load(self, algorithm: type) -> Tuple[Any, Optional[str]]:
+        """
+        The input shared by the runs, and the temporary file holding it if one was made
+        """
+        if hasattr(algorithm, '_readTransactions'):
+            intern = _sys.intern
+            return [[intern(item) if type(item) is str else item for item in transaction]
+                    for transaction in _dataSources.transactions(self.iFile, self.sep)], None
+        if isinstance(self.iFile, str) and (_parse.urlsplit(self.iFile).scheme in ('http', 'https')
+                                            or _dataSources.compression(self.iFile) is not None):
+            descriptor, path = _tempfile.mkstemp(prefix='pami', suffix='.txt')
+            with _os.fdopen(descriptor, 'w', encoding='utf-8') as writer:
+                with _dataSources.openSource(self.iFile, self.sep) as source:
+                    for block in source.lineBlocks():
+                        writer.writelines(block)
+            return path, path
+        return self.iFile, None
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        Reads the input once and makes a run per threshold
+
+        :return: one row per run, with the keys threshold, patterns, runtime in seconds, memoryRSS in MB and error
+        :rtype: list
+        """
+        algorithm = loadAlgorithm(self.module)
+        tasks = self._tasks(algorithm)
+        start = _time.perf_counter()
+        database, temporary = self._load(algorithm)
+        self._loadTime = _time.perf_counter() - start
+        try:
+            with _multiprocessing.Pool(max(1, self.workers), _share, (database,), maxtasksperchild=1) as pool:
+                self._rows = pool.map(_run, tasks, chunksize=1)
+        finally:
+            if temporary is not None:
+                _os.remove(temporary)
+        return self._rows
+
+    def getLoadTime(self) -> float:
+        """
+        :return: time taken to read the input, in seconds
+        :rtype: float
+        """
+        return self._loadTime
+
+    def getRows(self) -> List[Dict[str, Any]]:
+        """
+        :return: the rows of the last run, see run
+        :rtype: list
+        """
+        return self._rows
+
+    def getTable(self) -> str:
+        """
+        :return: the rows as an aligned text table
+        :rtype: str
+        """
+        header = [title for key, title in _columns]
+        cells = [header]
+        for row in self._rows:
+            cells.append([_cell(row[key]) for key, title in _columns])
+        widths = [max(len(line[i]) for line in cells) for i in range(len(header))]
+        return '\n'.join('  '.join(cell.rjust(width) if 0 < i < len(header) - 1 else cell.ljust(width)
+                                   for i, (cell, width) in enumerate(zip(line, widths))).rstrip() for line in cells)
+
+    def printTable(self) -> None:
+        """
+        Prints the algorithm, the input, the time taken to read it and the table of the runs
+        """
+        print(self.module + ' on ' + str(self.iFile) + ', input read once in %.3f s' % self._loadTime)
+        print(self.getTable())
+
+    def save(self, oFile: str) -> None:
+        """
+        Stores the rows as CSV
+
+        :param oFile: name of the CSV file
+        :type oFile: str
+        :return: None
+        """
+        with open(oFile, 'w', newline='') as f:
+            writer = _csv.writer(f)
+            writer.writerow(['algorithm', 'input'] + [key for key, title in _columns])
+            for row in self._rows:
+                writer.writerow([self.module, self.iFile] + [row[key] for key, title in _columns])
+
+    def failed(self) -> bool:
+        """
+        :return: True when a run raised an error
+        :rtype: bool
+        """
+        return any(row['error'] for row in self._rows)
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return '-'
+    if isinstance(value, float):
+        return '%.3f' % value
+    return str(value)
+
+
+def _assignment(text: str) -> Tuple[str, str]:
+    name, separator, value = text.partition('=')
+    if not separator or not name:
+        raise _argparse.ArgumentTypeError('expected NAME=VALUE, got ' + text)
+    return name, value
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line of python -m PAMI
+
+    :return: the exit status, 1 when a job or a run failed
+    :rtype: int
+    """
+    parser = _argparse.ArgumentParser(prog='python -m PAMI',
+                                      description='Runs an algorithm over a database for a list of thresholds, the '
+                                                  'database being read once')
+    parser.add_argument('algorithm', nargs='?', help='name of the algorithm, such as FPGrowth')
+    parser.add_argument('input', nargs='?', help='input file or URL')
+    parser.add_argument('thresholds', nargs='*', help='values of the first threshold of the algorithm, such as minSup')
+    parser.add_argument('--job', help='JSON file holding a job spec or a list of them')
+    parser.add_argument('--sep', default=None, help='separator of the items of the input, \\t by default')
+    parser.add_argument('--set', dest='parameters', action='append', type=_assignment, default=[],
+                        metavar='NAME=VALUE', help='parameter of the algorithm shared by all the runs')
+    parser.add_argument('--workers', type=int, default=None, help='number of processes making the runs')
+    parser.add_argument('--patterns', help='file the patterns of every run are saved to, with {threshold}')
+    parser.add_argument('--table', help='CSV file the table is saved to')
+    args = parser.parse_args(argv)
+    if args.job:
+        if args.algorithm:
+            parser.error('give either --job or an algorithm, an input and thresholds')
+        with open(args.job) as f:
+            specs = _json.load(f)
+        specs = specs if isinstance(specs, list) else [specs]
+    else:
+        if not args.thresholds:
+            parser.error('give an algorithm, an input and at least one threshold, or --job')
+        specs = [{'algorithm': args.algorithm, 'input': args.input, 'thresholds': args.thresholds,
+                  'parameters': dict(args.parameters), 'patterns': args.patterns, 'table': args.table}]
+    status = 0
+    for spec in specs:
+        if args.sep is not None:
+            spec['sep'] = _codecs.decode(args.sep, 'unicode_escape')
+        if args.workers is not None:
+            spec['workers'] = args.workers
+        try:
+            job = BatchJob.fromSpec(spec)
+            job.run()
+        except (ValueError, ImportError, OSError) as error:
+            print('Error: ' + str(error), file=_sys.stderr)
+            status = 1
+            continue
+        job.printTable()
+        if spec.get('table'):
+            job.save(spec['table'])
+        if job.failed():
+            status = 1
+    return status
@@ -0,0 +1,174 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Deferred imports of the heavy and optional dependencies of PAMI.
+
+pandas, psutil, validators, urllib.request, plotting libraries, pyspark and cupy are only needed by some methods of a
+miner, such as getPatternsAsDataFrame or getMemoryUSS, yet importing them at module load dominates the start-up time of
+short mining jobs. A module binds such a dependency to a proxy instead, and the dependency is imported the first time
+an attribute of the proxy is used. A dependency that is already imported is bound directly.
+
+.. code-block:: python
+
+        from PAMI import lazyImport as _lazyImport
+
+        _pd = _lazyImport.lazyModule('pandas')
+
+        _urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
+
+        frame = _pd.DataFrame(patterns)   # pandas is imported here
+
+The deprecated decorator of the deprecated package pulls in wrapt and asyncio when a class is defined, so deprecated
+below applies it when the decorated method is first used instead.
+"""
+
+import functools as _functools
+import importlib as _importlib
+import sys as _sys
+import types as _types
+from typing import Any, Callable
+
+
+class LazyModule(_types.ModuleType):
+    """
+    :Description:  Stands for a module until one of its attributes is used, then imports the module and forwards the
+                   attribute accesses to it
+
+    :Attributes:
+
+        :param name: str :
+            full name of the module
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__['_lazyModule'] = None
+
+    def _load(self) -> _types.ModuleType:
+        module = self.__dict__['_lazyModule']
+        if module is None:
+            module = _importlib.import_module(self.__name__)
+            self.__dict__['_lazyModule'] = module
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazyModule'] is not None else 'not loaded'
+        return "<lazy module '" + self.__name__ + "' (" + state + ")>"
+
+
+class LazyAttribute:
+    """
+    :Description:  Stands for an attribute of a module, such as a function or a class, until it is called or one of
+                   its own attributes is used
+
+    :Attributes:
+
+        :param module: str :
+            full name of the module
+        :param name: str :
+            name of the attribute
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+
+    def _load(self) -> Any:
+        return getattr(_importlib.import_module(self._module), self._name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        return "<lazy attribute '" + self._module + "." + self._name + "'>"
+
+
+def lazyModule(name: str) -> _types.ModuleType:
+    """
+    :param name: full name of a module, such as 'pandas' or 'matplotlib.pyplot'
+    :type name: str
+    :return: the module when it is already imported, a LazyModule otherwise
+    :rtype: module
+    """
+    module = _sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def lazyAttribute(module: str, name: str) -> Any:
+    """
+    :param module: full name of a module
+    :type module: str
+    :param name: name of one of its attributes
+    :type name: str
+    :return: the attribute when the module is already imported, a LazyAttribute otherwise
+    :rtype: Any
+    """
+    loaded = _sys.modules.get(module)
+    return getattr(loaded, name) if loaded is not None else LazyAttribute(module, name)
+
+
+class _DeferredDeprecation:
+    """
+    A function whose deprecated.deprecated decorator is applied the first time the function is called or bound
+    """
+
+    def __init__(self, function: Callable, args: tuple, kwargs: dict) -> None:
+        _functools.update_wrapper(self, function)
+        self._function = function
+        self._args = args
+        self._kwargs = kwargs
+        self._decorated = None
+
+    def _load(self) -> Callable:
+        if self._decorated is None:
+            from deprecated import deprecated as _deprecated
+            self._decorated = _deprecated(*self._args, **self._kwargs)(self._function)
+        return self._decorated
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        return self._load().__get__(instance, owner)
+
+
+def deprecated(*args, **kwargs) -> Any:
+    """
+    Drop-in replacement of deprecated.deprecated that imports the deprecated package the first time a decorated
+    function is used, used as @deprecated or as @deprecated(reason, ...)
+
+    :return: the decorator, or the decorated function when used without arguments
+    :rtype: Callable
+    """
+    if len(args) == 1 and not kwargs and callable(args[0]) and not isinstance(args[0], str):
+        return _DeferredDeprecation(args[0], (), {})
+
+    def decorate(function: Callable) -> _DeferredDeprecation:
+        return _DeferredDeprecation(function, args, kwargs)
+    return decorate
@@ -61,8 +61,11 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.localPeriodicPattern.basic import abstract as _ab
+from PAMI.localPeriodicPattern.basic import ptlEngine as _engine
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.lazyImport import deprecated
+from itertools import chain as _chain
+import numpy as _np
 
 class Node:
     """
@@ -284,7 +287,7 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             finalPatterns : dict
                 To store local periodic patterns and its PTL.
             tsList : dict
-                To store items and its time stamp as bit vector.
+                To store items and its transaction positions as run-length compressed bitmaps.
             root : Tree
                 It is root node of transaction tree of whole input data.
             PTL : dict
@@ -301,7 +304,7 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             creteLPPlist()
                 Create the local periodic patterns list from input data.
             createTSList()
-                Create the tsList as bit vector from input data.
+                Create the tsList as compressed bitmaps from input data.
             generateLPP()
                 Generate 1 length local periodic pattens by tsList and execute depth first search.
             createLPPTree()
@@ -311,7 +314,7 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             calculatePTL(tsList)
                 Calculate PTL from input tsList as integer list.
             calculatePTLbit(tsList)
-                Calculate PTL from input tsList as bit vector.
+                Calculate PTL from input tsList as compressed bitmap.
             mine()
                 Mining process will start from here.
             getMemoryUSS()
@@ -482,101 +485,24 @@ class LPPGrowth(_ab._localPeriodicPatterns):
 
     def __createTSList(self) -> None:
         """
-        Create tsList as bit vector from temporal data.
-        """
-        # for line in self.__Database:
-        #     count = 1
-        #     bitVector = 0b1 << count
-        #     bitVector = bitVector | 0b1
-        #     self.__tsMin = int(line.pop(0))
-        #     self.__tsList = {item: bitVector for item in line}
-        #     count += 1
-        #     ts = ' '
-        count = 1
-        for line in self.__Database:
-            bitVector = 0b1 << count
-            bitVector = bitVector | 0b1
-            # print(line)
-            ts = line[0]
+        Create tsList as run-length compressed bitmaps of the transaction positions from temporal data.
+        """
+        positions = {}
+        for count, line in enumerate(self.__Database, start=1):
             for item in line[1:]:
-                if self.__tsList.get(item):
-                    different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-                    self.__tsList[item] = self.__tsList[item] << different
-                    self.__tsList[item] = self.__tsList[item] | 0b1
-                else:
-                    self.__tsList[item] = bitVector
-            count += 1
-            self.__tsMax = int(ts)
-
-        for item in self.__tsList:
-            different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-            self.__tsList[item] = self.__tsList[item] << different
-        self._localPeriodicPatterns__maxPer = self.__convert(self._localPeriodicPatterns__maxPer)
-        self._localPeriodicPatterns__maxSoPer = self.__convert(self._localPeriodicPatterns__maxSoPer)
-        self._localPeriodicPatterns__minDur = self.__convert(self._localPeriodicPatterns__minDur)
+                positions.setdefault(item, []).append(count)
+            self.__tsMax = int(line[0])
+        self.__tsList = {item: _engine.fromPositions(ts) for item, ts in positions.items()}
 
     def __generateLPP(self) -> None:
         """
-        Generate local periodic items from bit vector tsList.
+        Generate local periodic items from the compressed tsList.
         """
         PTL = {}
         for item in self.__tsList:
-            PTL[item] = set()
-            ts = list(bin(self.__tsList[item]))
-            ts = ts[2:]
-            start = -1
-            currentTs = 1
-            soPer = ' '
-            tsPre = ' '
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    tsPre = currentTs
-                    currentTs += 1
-                    break
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    per = currentTs - tsPre
-                    if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                        start = tsPre
-                        soPer = self._localPeriodicPatterns__maxSoPer
-                    if start != -1:
-                        soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                        if soPer > self._localPeriodicPatterns__maxSoPer:
-                            if tsPre - start >= self._localPeriodicPatterns__minDur:
-                                PTL[item].add((start, tsPre))
-                            """else:
-                                bitVector = 0b1 << currentTs
-                                different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                                bitVector = bitVector | 0b1
-                                bitVector = bitVector << different
-                                self.tsList[item] = self.tsList[item] | bitVector"""
-                            start = -1
-                    tsPre = currentTs
-                    currentTs += 1
-            if start != -1:
-                soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, tsPre))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
-                if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, self.__tsMax))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
+            PTL[item] = _engine.periodicTimeIntervals(self.__tsList[item], self._localPeriodicPatterns__maxPer,
+                                                      self._localPeriodicPatterns__maxSoPer,
+                                                      self._localPeriodicPatterns__minDur, self.__tsMax)
         self.__PTL = {k: v for k, v in PTL.items() if len(v) > 0}
         self.__items = list(self.__PTL.keys())
 
@@ -622,10 +548,7 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             while currentNode.item != -1:
                 path.insert(0, currentNode.item)
                 currentNodeItem = currentNode.item
-                if currentNodeItem in PFList:
-                    PFList[currentNodeItem] |= tidList
-                else:
-                    PFList[currentNodeItem] = tidList
+                PFList.setdefault(currentNodeItem, []).append(tidList)
                 currentNode = currentNode.parent
             prefixTree.createPrefixTree(path, tidList)
             while prefixNode.nodeLink:
@@ -636,12 +559,11 @@ class LPPGrowth(_ab._localPeriodicPatterns):
                 while currentNode.item != -1:
                     path.insert(0, currentNode.item)
                     currentNodeItem = currentNode.item
-                    if currentNodeItem in PFList:
-                        PFList[currentNodeItem] = PFList[currentNodeItem] | tidList
-                    else:
-                        PFList[currentNodeItem] = tidList
+                    PFList.setdefault(currentNodeItem, []).append(tidList)
                     currentNode = currentNode.parent
                 prefixTree.createPrefixTree(path, tidList)
+            PFList = {i: _engine.fromPositions(_np.fromiter(_chain.from_iterable(tidLists), dtype=_np.int64))
+                      for i, tidLists in PFList.items()}
             if len(prefixCopy) == 1:
                 self._localPeriodicPatterns__finalPatterns[prefixCopy[0]] = self.__calculatePTLbit(self.__tsList[item])
             else:
@@ -655,88 +577,31 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             if PFList:
                 self.__patternGrowth(prefixTree, prefixCopy, PFList)
 
-    def __calculatePTL(self, tsList: List[int]) -> set:
+    def __calculatePTL(self, tsList: _engine.Runs) -> set:
         """
-        Calculate PTL from input tsList as integer list
+        Calculate PTL from input tsList as compressed time stamps
 
-        :param tsList: It is tsList which store time stamp as integer.
-        :type tsList: list
+        :param tsList: It is tsList which store time stamps as runs.
+        :type tsList: tuple
         :return: PTL
         :rtype: set
         """
-        start = -1
-        PTL = set()
-        tsList = sorted(tsList)
-        tsPre = tsList[0]
-        soPer = ' '
-        for ts in tsList[1:]:
-            per = ts - tsPre
-            if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                start = tsPre
-                soPer = self._localPeriodicPatterns__maxSoPer
-            if start != -1:
-                soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer:
-                    if tsPre - start >= self._localPeriodicPatterns__minDur:
-                        PTL.add((start, tsPre))
-                    start = -1
-            tsPre = ts
-        if start != -1:
-            soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, self.__tsMax))
-        return PTL
-
-    def __calculatePTLbit(self, tsList: List[int]) -> set:
-        """
-        Calculate PTL from input tsList as bit vector.
-
-        :param tsList: It is tsList which store time stamp as bit vector.
-        :type tsList: list
+        return _engine.periodicTimeIntervals(tsList, self._localPeriodicPatterns__maxPer,
+                                             self._localPeriodicPatterns__maxSoPer,
+                                             self._localPeriodicPatterns__minDur, self.__tsMax)
+
+    def __calculatePTLbit(self, tsList: _engine.Runs) -> set:
+        """
+        Calculate PTL from input tsList as compressed bitmap.
+
+        :param tsList: It is tsList which store transaction positions as runs.
+        :type tsList: tuple
         :return: PTL
         :rtype: set
         """
-        tsList = list(bin(tsList))
-        tsList = tsList[2:]
-        start = -1
-        currentTs = 1
-        PTL = set()
-        tsPre = ' '
-        soPer = ' '
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                tsPre = currentTs
-                currentTs += 1
-                break
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                per = currentTs - tsPre
-                if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                    start = tsPre
-                    soPer = self._localPeriodicPatterns__maxSoPer
-                if start != -1:
-                    soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                    if soPer > self._localPeriodicPatterns__maxSoPer:
-                        if tsPre - start >= self._localPeriodicPatterns__minDur:
-                            PTL.add((start, tsPre))
-                        start = -1
-                tsPre = currentTs
-                currentTs += 1
-        if start != -1:
-            soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-        return PTL
+        return _engine.periodicTimeIntervals(tsList, self._localPeriodicPatterns__maxPer,
+                                             self._localPeriodicPatterns__maxSoPer,
+                                             self._localPeriodicPatterns__minDur, self.__tsMax, closeAtLast=False)
 
     def __convert(self, value: Any) -> float:
         """
@@ -778,6 +643,7 @@ class LPPGrowth(_ab._localPeriodicPatterns):
         self._localPeriodicPatterns__minDur = self.__convert(self._localPeriodicPatterns__minDur)
         self.__createTSList()
         self.__generateLPP()
+        self.__root = Tree()
         self.__createLPPTree()
         self.__patternGrowth(self.__root, [], self.__items)
         self._localPeriodicPatterns__endTime = _ab._time.time()
@@ -881,7 +747,6 @@ if __name__ == '__main__':
             _ap = LPPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]), _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = LPPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of Local Periodic Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -59,9 +59,11 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.localPeriodicPattern.basic import abstract as _ab
+from PAMI.localPeriodicPattern.basic import ptlEngine as _engine
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 
 class LPPMBreadth(_ab._localPeriodicPatterns):
@@ -118,18 +120,18 @@ class LPPMBreadth(_ab._localPeriodicPatterns):
         finalPatterns : dict
             To store local periodic patterns and its PTL.
         tsList : dict
-            To store items and its time stamp as bit vector.
+            To store items and its transaction positions as run-length compressed bitmaps.
         sep: str
             separator used to distinguish items from each other. The default separator is tab space.
 
     :Methods:
 
         createTSList()
-            Create the tsList as bit vector from input data.
+            Create the tsList as compressed bitmaps from input data.
         generateLPP()
             Generate 1 length local periodic pattens by tsList and execute depth first search.
         calculatePTL(tsList)
-            Calculate PTL from input tsList as bit vector
+            Calculate PTL from input tsList as compressed bitmap
         LPPMBreathSearch(extensionOfP)
             Mining local periodic patterns using breadth first search.
         mine()
@@ -250,159 +252,45 @@ class LPPMBreadth(_ab._localPeriodicPatterns):
 
     def __createTSList(self) -> None:
         """
-        Create tsList as bit vector from temporal data.
+        Create tsList as run-length compressed bitmaps of the transaction positions from temporal data.
         """
-        # for line in self.Database:
-        #     count = 1
-        #     bitVector = 0b1 << count
-        #     bitVector = bitVector | 0b1
-        #     self.tsMin = int(line.pop(0))
-        #     self.tsList = {item: bitVector for item in line}
-        #     count += 1
-        #     ts = ' '
-        count = 1
-        for line in self.__Database:
-            bitVector = 0b1 << count
-            bitVector = bitVector | 0b1
-            ts = line[0]
+        positions = {}
+        for count, line in enumerate(self.__Database, start=1):
             for item in line[1:]:
-                if self.__tsList.get(item):
-                    different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-                    self.__tsList[item] = self.__tsList[item] << different
-                    self.__tsList[item] = self.__tsList[item] | 0b1
-                else:
-                    self.__tsList[item] = bitVector
-            count += 1
-            self.__tsMax = int(ts)
-
-        for item in self.__tsList:
-            different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-            self.__tsList[item] = self.__tsList[item] << different
-        self._localPeriodicPatterns__maxPer = self.__convert(self._localPeriodicPatterns__maxPer)
-        self._localPeriodicPatterns__maxSoPer = self.__convert(self._localPeriodicPatterns__maxSoPer)
-        self._localPeriodicPatterns__minDur = self.__convert(self._localPeriodicPatterns__minDur)
+                positions.setdefault(item, []).append(count)
+            self.__tsMax = int(line[0])
+        self.__tsList = {item: _engine.fromPositions(ts) for item, ts in positions.items()}
 
     def __generateLPP(self) -> None:
         """
-        Generate local periodic items from bit vector tsList.
+        Generate local periodic items from the compressed tsList.
         When finish generating local periodic items, execute mining depth first search.
         """
         I = set()
-        PTL = {}
         for item in self.__tsList:
-            PTL[item] = set()
-            ts = list(bin(self.__tsList[item]))
-            ts = ts[2:]
-            start = -1
-            currentTs = 1
-            tsPre = ' '
-            soPer = ' '
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    tsPre = currentTs
-                    currentTs += 1
-                    break
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    per = currentTs - tsPre
-                    if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                        start = tsPre
-                        soPer = self._localPeriodicPatterns__maxSoPer
-                    if start != -1:
-                        soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                        if soPer > self._localPeriodicPatterns__maxSoPer:
-                            if tsPre - start >= self._localPeriodicPatterns__minDur:
-                                PTL[item].add((start, tsPre))
-                            """else:
-                                bitVector = 0b1 << currentTs
-                                different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                                bitVector = bitVector | 0b1
-                                bitVector = bitVector << different
-                                self.tsList[item] = self.tsList[item] | bitVector"""
-                            start = -1
-                    tsPre = currentTs
-                    currentTs += 1
-            if start != -1:
-                soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, tsPre))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
-                if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, self.__tsMax))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
-            if len(PTL[item]) > 0:
+            PTL = _engine.periodicTimeIntervals(self.__tsList[item], self._localPeriodicPatterns__maxPer,
+                                                self._localPeriodicPatterns__maxSoPer,
+                                                self._localPeriodicPatterns__minDur, self.__tsMax)
+            if len(PTL) > 0:
                 I |= {item}
-                self._localPeriodicPatterns__finalPatterns[item] = PTL[item]
+                self._localPeriodicPatterns__finalPatterns[item] = PTL
         I = sorted(list(I))
         map = {-1 : I}
-        I = set(I)
         while len(map) > 0:
             map = self.__LPPMBreadthSearch(map)
 
-    def __calculatePTL(self, tsList: int) -> Set[Tuple[int, int]]:
+    def __calculatePTL(self, tsList: _engine.Runs) -> Set[Tuple[int, int]]:
         """
-        calculate PTL from tsList as bit vector.
+        calculate PTL from tsList as compressed bitmap.
 
-        :param tsList: it is one item's tsList which is used bit vector.
-        :type tsList: int
-        :return: it is PTL of input item.
+        :param tsList: it is one pattern's tsList given as runs of transaction positions.
+        :type tsList: tuple
+        :return: it is PTL of input pattern.
         :rtype: set
         """
-        tsList = list(bin(tsList))
-        tsList = tsList[2:]
-        start = -1
-        currentTs = 1
-        PTL = set()
-        tsPre = ' '
-        soPer = ' '
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                tsPre = currentTs
-                currentTs += 1
-                break
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                per = currentTs - tsPre
-                if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                    start = tsPre
-                    soPer = self._localPeriodicPatterns__maxSoPer
-                if start != -1:
-                    soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                    if soPer > self._localPeriodicPatterns__maxSoPer:
-                        if tsPre - start >= self._localPeriodicPatterns__minDur:
-                            PTL.add((start, tsPre))
-                        start = -1
-                tsPre = currentTs
-                currentTs += 1
-        if start != -1:
-            soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-        return PTL
+        return _engine.periodicTimeIntervals(tsList, self._localPeriodicPatterns__maxPer,
+                                             self._localPeriodicPatterns__maxSoPer,
+                                             self._localPeriodicPatterns__minDur, self.__tsMax, closeAtLast=False)
 
     def __LPPMBreadthSearch(self, wMap: Dict[Union[int, str], List[Union[int, str]]]) -> Dict[Union[int, str], List[Union[int, str]]]:
         """
@@ -424,13 +312,14 @@ class LPPMBreadth(_ab._localPeriodicPatterns):
                     listP = [p]
                 tsp = self.__tsList[listP[0]]
                 for item in listP[1:]:
-                    tsp = tsp & self.__tsList[item]
+                    tsp = _engine.intersect(tsp, self.__tsList[item])
             for x in range(len(wMap[p])-1):
                 for y in range(x+1, len(wMap[p])):
                     if p == -1:
-                        tspxy = self.__tsList[wMap[p][x]] & self.__tsList[wMap[p][y]]
+                        tspxy = _engine.intersect(self.__tsList[wMap[p][x]], self.__tsList[wMap[p][y]])
                     else:
-                        tspxy = tsp & self.__tsList[wMap[p][x]] & self.__tsList[wMap[p][y]]
+                        tspxy = _engine.intersect(_engine.intersect(tsp, self.__tsList[wMap[p][x]]),
+                                                  self.__tsList[wMap[p][y]])
                     PTL = self.__calculatePTL(tspxy)
                     if len(PTL) > 0:
                         if p == -1:
@@ -527,7 +416,7 @@ class LPPMBreadth(_ab._localPeriodicPatterns):
 
         return self._localPeriodicPatterns__endTime - self._localPeriodicPatterns__startTime
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """
         Storing final local periodic patterns in a dataframe
 
@@ -591,7 +480,6 @@ if __name__ == '__main__':
             _ap = LPPMBreadth(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]), _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = LPPMBreadth(_ab._sys.argv[1], _ab._sys.argv[3], float(_ab._sys.argv[4]))
-        _ap.startMine()
         _ap.mine()
         print("Total number of Local Periodic Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
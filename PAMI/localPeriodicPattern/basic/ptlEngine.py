@@ -0,0 +1,197 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Occurrence lists and periodic time-intervals (PTL) shared by the local periodic miners.
+
+The occurrences of a pattern are kept as a run-length compressed bitmap: two sorted int64 arrays holding the first and
+the last position of every maximal run of consecutive positions. Dense patterns collapse to a handful of runs, and the
+occurrences of a pattern extension are obtained with a linear merge of the runs of its parents.
+
+The PTL of a pattern is derived from the gaps between its occurrences. An interval opens at the first gap not larger
+than maxPer, the spillover soPer = max(0, soPer + gap - maxPer) starts at maxSoPer and the interval closes when soPer
+exceeds maxSoPer. The gaps inside a run are all 1 and only lower soPer, so every run is folded into a single step and
+the spillover is evaluated block by block from the running minimum of its cumulative excess.
+
+.. code-block:: python
+
+        from PAMI.localPeriodicPattern.basic import ptlEngine as engine
+
+        runs = engine.fromPositions([1, 2, 3, 7, 8])
+
+        common = engine.intersect(runs, engine.fromPositions([2, 3, 4, 8]))
+
+        PTL = engine.periodicTimeIntervals(common, maxPer, maxSoPer, minDur, last)
+"""
+
+import numpy as _np
+from typing import Iterable, Set, Tuple
+
+Runs = Tuple[_np.ndarray, _np.ndarray]
+
+blockSize = 64
+
+
+def emptyRuns() -> Runs:
+    """
+    :return: the runs of a pattern without occurrences
+    :rtype: tuple
+    """
+    return _np.zeros(0, dtype=_np.int64), _np.zeros(0, dtype=_np.int64)
+
+
+def fromPositions(positions: Iterable) -> Runs:
+    """
+    Compresses positions into maximal runs of consecutive positions
+
+    :param positions: positions given as a list, set or array
+    :type positions: iterable
+    :return: the first and the last position of every run
+    :rtype: tuple
+    """
+    if not isinstance(positions, _np.ndarray):
+        positions = _np.fromiter(positions, dtype=_np.int64)
+    positions = _np.unique(positions.astype(_np.int64, copy=False))
+    if len(positions) == 0:
+        return emptyRuns()
+    breaks = _np.flatnonzero(_np.diff(positions) != 1)
+    starts = positions[_np.concatenate(([0], breaks + 1))]
+    ends = positions[_np.concatenate((breaks, [len(positions) - 1]))]
+    return starts, ends
+
+
+def toPositions(runs: Runs) -> _np.ndarray:
+    """
+    :param runs: runs of a pattern
+    :type runs: tuple
+    :return: the sorted positions covered by the runs
+    :rtype: numpy.ndarray
+    """
+    starts, ends = runs
+    lengths = ends - starts + 1
+    offsets = _np.arange(lengths.sum()) - _np.repeat(_np.cumsum(lengths) - lengths, lengths)
+    return _np.repeat(starts, lengths) + offsets
+
+
+def support(runs: Runs) -> int:
+    """
+    :param runs: runs of a pattern
+    :type runs: tuple
+    :return: the number of positions covered by the runs
+    :rtype: int
+    """
+    return int((runs[1] - runs[0] + 1).sum())
+
+
+def intersect(first: Runs, second: Runs) -> Runs:
+    """
+    Positions common to two run lists, computed with a linear merge of the runs
+
+    :param first: runs of the first pattern
+    :type first: tuple
+    :param second: runs of the second pattern
+    :type second: tuple
+    :return: the runs of the common positions
+    :rtype: tuple
+    """
+    if len(first[0]) > len(second[0]):
+        first, second = second, first
+    firstStarts, firstEnds = first
+    secondStarts, secondEnds = second
+    low = _np.searchsorted(secondEnds, firstStarts, 'left')
+    high = _np.searchsorted(secondStarts, firstEnds, 'right')
+    counts = _np.maximum(high - low, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return emptyRuns()
+    owner = _np.repeat(_np.arange(len(firstStarts)), counts)
+    partner = _np.repeat(low, counts) + _np.arange(total) - _np.repeat(_np.cumsum(counts) - counts, counts)
+    return (_np.maximum(firstStarts[owner], secondStarts[partner]),
+            _np.minimum(firstEnds[owner], secondEnds[partner]))
+
+
+def _steps(runs: Runs, maxPer: float) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    Folds every run into one step
+
+    :return: the positions visited in order and the excess over maxPer of the step leaving every position but the last.
+             The step through a run of length L lowers the spillover by (L - 1) * (maxPer - 1).
+    """
+    starts, ends = runs
+    inner = ends > starts
+    points = _np.empty(len(starts) + int(inner.sum()), dtype=_np.int64)
+    startSlots = _np.arange(len(starts)) + _np.cumsum(inner) - inner
+    points[startSlots] = starts
+    points[startSlots[inner] + 1] = ends[inner]
+    excess = _np.diff(points) - maxPer
+    innerSteps = startSlots[inner]
+    excess[innerSteps] = -(points[innerSteps + 1] - points[innerSteps]) * (maxPer - 1)
+    return points, excess
+
+
+def periodicTimeIntervals(runs: Runs, maxPer: float, maxSoPer: float, minDur: float, last: int,
+                          closeAtLast: bool = True) -> Set[Tuple[int, int]]:
+    """
+    Periodic time-intervals of a pattern
+
+    :param runs: runs of the pattern
+    :type runs: tuple
+    :param maxPer: maximum period
+    :type maxPer: int or float
+    :param maxSoPer: maximum spillover period
+    :type maxSoPer: int or float
+    :param minDur: minimum duration of an interval
+    :type minDur: int or float
+    :param last: last timestamp of the database
+    :type last: int
+    :param closeAtLast: an interval still open at the end of the database ends at last when True and at the last
+                        occurrence of the pattern otherwise
+    :type closeAtLast: bool
+    :return: the (start, end) of every periodic time-interval
+    :rtype: set
+    """
+    PTL = set()
+    if len(runs[0]) == 0 or maxPer < 1:
+        return PTL
+    points, excess = _steps(runs, maxPer)
+    openings = _np.flatnonzero(excess <= 0)
+    step, soPer, start = 0, 0, -1
+    while True:
+        if start == -1:
+            index = _np.searchsorted(openings, step)
+            if index == len(openings):
+                return PTL
+            step = int(openings[index])
+            start, soPer, size = int(points[step]), maxSoPer, blockSize
+        block = excess[step:step + size]
+        if len(block) == 0:
+            break
+        cumulative = _np.cumsum(block)
+        spill = cumulative - _np.minimum(_np.minimum.accumulate(cumulative), -soPer)
+        closed = _np.flatnonzero(spill > maxSoPer)
+        if len(closed):
+            step += int(closed[0])
+            if points[step] - start >= minDur:
+                PTL.add((start, int(points[step])))
+            step, start = step + 1, -1
+        else:
+            step, soPer, size = step + len(block), max(0, spill[-1].item()), size * 2
+    tsPre = int(points[-1])
+    soPer = max(0, soPer + last - tsPre - maxPer)
+    if soPer > maxSoPer and tsPre - start >= minDur:
+        PTL.add((start, tsPre))
+    if soPer <= maxSoPer and last - start >= minDur:
+        PTL.add((start, last if closeAtLast else tsPre))
+    return PTL
@@ -55,8 +55,9 @@ __copyright__ = """
 
 from PAMI.multipleMinimumSupportBasedFrequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Generator
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 _fp._sys.setrecursionlimit(20000)
 _MIS = {}
@@ -614,7 +615,7 @@ class CFPGrowth(_fp._frequentPatterns):
 
         return self.__endTime - self.__startTime
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """Storing final frequent patterns in a dataframe
 
         :return: returning frequent patterns in a dataframe
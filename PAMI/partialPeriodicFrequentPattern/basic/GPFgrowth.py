@@ -50,8 +50,9 @@ __copyright__ = """
 
 """
 
-import deprecated
+from PAMI.lazyImport import deprecated
 from PAMI.partialPeriodicFrequentPattern.basic.abstract import *
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
 
 orderOfItem = {}
 
@@ -264,18 +265,8 @@ class calculateIP:
         calculate ip from timeStamp list
         :return: it represents ip value
         """
-        ip = 0
-        self.timeStamp = sorted(list(self.timeStamp))
-        if len(self.timeStamp) <= 0:
-            return ip
-        if self.timeStamp[0] - 0 <= self.maxPer:
-            ip += 1
-        for i in range(len(self.timeStamp)-1):
-            if (self.timeStamp[i+1] - self.timeStamp[i]) <= self.maxPer:
-                ip += 1
-        if abs(self.timeStamp[(len(self.timeStamp)-1)] - self.timeStampFinal) <= self.maxPer:
-            ip += 1
-        return ip
+        self.timeStamp = _pm.asTimestamps(self.timeStamp, unique=False)
+        return _pm.periodicSupport(self.timeStamp, self.maxPer, self.timeStampFinal)
 
 
 class generatePFListver2:
@@ -53,7 +53,9 @@ __copyright__ = """
 
 
 from PAMI.partialPeriodicFrequentPattern.basic.abstract import *
-import deprecated
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+import numpy as _np
+from PAMI.lazyImport import deprecated
 
 class PPF_DFS(partialPeriodicPatterns):
     """
@@ -245,24 +247,8 @@ class PPF_DFS(partialPeriodicPatterns):
         :type tids: list
         :return: ip / (sup+1)
         """
-        # print(lno)
-        tids = list(set(tids))
-        tids.sort()
-        per = 0
-        sup = 0
-        cur = 0
-        if len(tids) == 0:
-            return 0
-        if abs(0 - tids[0]) <= self._partialPeriodicPatterns__maxPer:
-            sup += 1
-        for j in range(len(tids) - 1):
-            i = j + 1
-            per = abs(tids[i] - tids[j])
-            if (per <= self._partialPeriodicPatterns__maxPer):
-                sup += 1
-            cur = tids[j]
-        if abs(self.__last - tids[len(tids) - 1]) <= self._partialPeriodicPatterns__maxPer:
-            sup += 1
+        tids = _pm.asTimestamps(tids)
+        sup = _pm.periodicSupport(tids, self._partialPeriodicPatterns__maxPer, self.__last)
         if sup == 0:
             return 0
         return sup / (len(tids) + 1)
@@ -275,26 +261,7 @@ class PPF_DFS(partialPeriodicPatterns):
         :type tids: list
         :return: ip
         """
-        # print(lno)
-        tids = list(set(tids))
-        tids.sort()
-        per = 0
-        sup = 0
-        cur = 0
-        if len(tids) == 0:
-            return 0
-        if abs(0 - tids[0]) <= self._partialPeriodicPatterns__maxPer:
-            sup += 1
-        for j in range(len(tids) - 1):
-            i = j + 1
-            per = abs(tids[i] - tids[j])
-            if (per <= self._partialPeriodicPatterns__maxPer):
-                sup += 1
-        if abs(tids[len(tids) - 1] - self.__last) <= self._partialPeriodicPatterns__maxPer:
-            sup += 1
-        if sup == 0:
-            return 0
-        return sup
+        return _pm.periodicSupport(_pm.asTimestamps(tids), self._partialPeriodicPatterns__maxPer, self.__last)
 
     def __convert(self, value):
         """
@@ -361,6 +328,7 @@ class PPF_DFS(partialPeriodicPatterns):
                 self.__mapSupport[x][0] += 1
         self.__mapSupport = {k: [v[1], v[0]] for k, v in self.__mapSupport.items() if
                              v[1] >= self._partialPeriodicPatterns__minSup and v[0] / (self._partialPeriodicPatterns__minSup + 1) >= self._partialPeriodicPatterns__minPR}
+        self.__tidlist = {k: _pm.asTimestamps(self.__tidlist[k]) for k in self.__mapSupport}
         plist = [key for key, value in sorted(self.__mapSupport.items(), key=lambda x: (x[1][0], x[0]), reverse=True)]
         return plist
 
@@ -374,7 +342,7 @@ class PPF_DFS(partialPeriodicPatterns):
         :param tidsetx: it represents prefix tids
         :type tidsetx: list
         """
-        tidsetx = list(set(tidsetx))
+        tidsetx = _pm.asTimestamps(tidsetx)
         if (prefix == None):
             prefix = suffix
         else:
@@ -408,11 +376,9 @@ class PPF_DFS(partialPeriodicPatterns):
             classItemsets = []
             classtidsets = []
             itemsetx = [itemx]
-            for j in range(i + 1, len(itemsets)):
-                itemj = itemsets[j]
-                tidsetj = tidsets[j]
-                y = list(set(tidsetx) & set(tidsetj))
-                val = self._partialPeriodicPatterns__getPerSup(y)
+            candidates = [_np.intersect1d(tidsetx, tidsets[j], assume_unique=True) for j in range(i + 1, len(itemsets))]
+            values = _pm.batchPeriodicSupport(candidates, self._partialPeriodicPatterns__maxPer, self.__last)
+            for itemj, y, val in zip(itemsets[i + 1:], candidates, values):
                 if len(y) >= self._partialPeriodicPatterns__minSup and val / (self._partialPeriodicPatterns__minSup + 1) >= self._partialPeriodicPatterns__minPR:
                     classItemsets.append(itemj)
                     classtidsets.append(y)
@@ -445,11 +411,9 @@ class PPF_DFS(partialPeriodicPatterns):
             itemsetx = [itemx]
             itemsets = []
             tidsets = []
-            for j in range(i + 1, len(plist)):
-                itemj = plist[j]
-                tidsetj = self.__tidlist[itemj]
-                y1 = list(set(tidsetx) & set(tidsetj))
-                val = self._partialPeriodicPatterns__getPerSup(y1)
+            candidates = [_np.intersect1d(tidsetx, self.__tidlist[itemj], assume_unique=True) for itemj in plist[i + 1:]]
+            values = _pm.batchPeriodicSupport(candidates, self._partialPeriodicPatterns__maxPer, self.__last)
+            for itemj, y1, val in zip(plist[i + 1:], candidates, values):
                 if len(y1) >= self._partialPeriodicPatterns__minSup and val / (self._partialPeriodicPatterns__minSup + 1) >= self._partialPeriodicPatterns__minPR:
                     itemsets.append(itemj)
                     tidsets.append(y1)
@@ -2,15 +2,16 @@ from abc import ABC, abstractmethod
 import time
 import math
 import csv
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 from collections import defaultdict
 from itertools import combinations as c
 import os
 import os.path
-import psutil
+psutil = _lazyImport.lazyModule('psutil')
 import sys
-import validators
-from urllib.request import urlopen
+validators = _lazyImport.lazyModule('validators')
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 
 
 class partialPeriodicPatterns(ABC):
@@ -20,10 +20,11 @@ __copyright__ = """
 # import abstract as _ab
 
 from PAMI.partialPeriodicFrequentPattern.basic.abstract import *
-import cupy as cp
+from PAMI import lazyImport as _lazyImport
+cp = _lazyImport.lazyModule('cupy')
 import numpy as np
-import pandas as pd
-from deprecated import deprecated
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 class cuGPPMiner(partialPeriodicPatterns):
   __path = ' '
@@ -49,11 +49,13 @@ __copyright__ = """
 """
 
 from pandas.core.arrays import period
-import deprecated
+from PAMI.lazyImport import deprecated
 from PAMI.partialPeriodicPattern.basic import Gabstract as _abstract
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+from PAMI import lazyImport as _lazyImport
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import sys as _sys
 
 _minPS = float()
@@ -210,14 +212,7 @@ class _Tree(object):
         :type timeStamps : list
         """
         global _frequentList, _lno
-        timeStamps.sort()
-        per = 0
-        sup = 0
-        for i in range(len(timeStamps) - 1):
-            j = i + 1
-            if abs(timeStamps[j] - timeStamps[i]) <= _period:
-                per += 1
-            sup += 1
+        per = _pm.periodicSupport(_pm.asTimestamps(timeStamps, unique=False), _period)
         l = []
         for i in pattern:
             l.append(_frequentList[i])
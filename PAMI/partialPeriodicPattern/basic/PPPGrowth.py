@@ -54,12 +54,14 @@ __copyright__ = """
 
 
 from PAMI.partialPeriodicPattern.basic import abstract as _abstract
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
 from typing import List, Dict, Tuple, Set, Union, Any, Iterable, Generator
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+from PAMI import lazyImport as _lazyImport
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import sys as _sys
-import pandas as pd
-from deprecated import deprecated
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 _minPS = float()
 _period = float()
@@ -221,15 +223,7 @@ class _Tree(object):
         :type timeStamps : lis
         :return: int
         """
-        timeStamps.sort()
-        per = 0
-        sup = 0
-        for i in range(len(timeStamps) - 1):
-            j = i + 1
-            if abs(timeStamps[j] - timeStamps[i]) <= _period:
-                per += 1
-            sup += 1
-        return per
+        return _pm.periodicSupport(_pm.asTimestamps(timeStamps, unique=False), _period)
 
     def _conditionalTransactions(self, conditionalPatterns: List, conditionalTimeStamps: List) -> Tuple[List, List, Dict]:
         """
@@ -648,7 +642,7 @@ class PPPGrowth(_abstract._partialPeriodicPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _abstract._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_abstract._pd.DataFrame':
         """Storing final frequent patterns in a dataframe
 
         :return: returning frequent patterns in a dataframe
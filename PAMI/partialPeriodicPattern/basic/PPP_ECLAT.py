@@ -54,11 +54,12 @@ __copyright__ = """
 
 from PAMI.partialPeriodicPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 
-from PAMI.partialPeriodicPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+import numpy as _np
+from PAMI.lazyImport import deprecated
 
 class PPP_ECLAT(_ab._partialPeriodicPatterns):
     """
@@ -236,13 +237,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         :type timeStamps : list
         :return: list
         """
-        timeStamps.sort()
-        per = 0
-        for i in range(len(timeStamps) - 1):
-            j = i + 1
-            if abs(timeStamps[j] - timeStamps[i]) <= self._period:
-                per += 1
-        return per
+        return _pm.periodicSupport(_pm.asTimestamps(timeStamps, unique=False), self._period)
 
     def _creatingItemSets(self) -> None:
         """
@@ -313,6 +308,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
                     self._tidList[si].append(n)
         self._minPS = self._convert(self._minPS)
         self._mapSupport = {k: v[0] for k, v in self._mapSupport.items() if v[0] >= self._minPS}
+        self._tidList = {k: _pm.asTimestamps(self._tidList[k]) for k in self._mapSupport}
         plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x: x[1], reverse=True)]
         return plist
 
@@ -366,11 +362,9 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
-            for j in range(i + 1, len(itemSets)):
-                itemJ = itemSets[j]
-                tidSetJ = tidSets[j]
-                y = list(set(tidSetX).intersection(tidSetJ))
-                val = self._getPeriodicSupport(y)
+            candidates = [_np.intersect1d(tidSetX, tidSets[j], assume_unique=True) for j in range(i + 1, len(itemSets))]
+            values = _pm.batchPeriodicSupport(candidates, self._period)
+            for itemJ, y, val in zip(itemSets[i + 1:], candidates, values):
                 if val >= self._minPS:
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
@@ -395,6 +389,15 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         performs prefix equivalence to form the combinations and generates partial-periodic patterns.
         :return: None
 
+        """
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Main program start with extracting the periodic frequent items from the database and
+        performs prefix equivalence to form the combinations and generates partial-periodic patterns.
+        :return: None
+
         """
         self._startTime = _ab._time.time()
         self._creatingItemSets()
@@ -406,11 +409,9 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
             itemSetX = [itemI]
             itemSets = []
             tidSets = []
-            for j in range(i + 1, len(plist)):
-                itemJ = plist[j]
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetX).intersection(tidSetJ))
-                val = self._getPeriodicSupport(y1)
+            candidates = [_np.intersect1d(tidSetX, self._tidList[itemJ], assume_unique=True) for itemJ in plist[i + 1:]]
+            values = _pm.batchPeriodicSupport(candidates, self._period)
+            for itemJ, y1, val in zip(plist[i + 1:], candidates, values):
                 if val >= self._minPS:
                     itemSets.append(itemJ)
                     tidSets.append(y1)
@@ -453,7 +454,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """Storing final frequent patterns in a dataframe
 
         :return: returning frequent patterns in a dataframe
@@ -54,11 +54,13 @@ __copyright__ = """
 
 
 import sys as _sys
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+from PAMI import lazyImport as _lazyImport
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 from PAMI.partialPeriodicPattern.closed import abstract as _abstract
-import pandas as pd
-from deprecated import deprecated
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 class PPPClose(_abstract._partialPeriodicPatterns):
     """
@@ -344,13 +346,7 @@ class PPPClose(_abstract._partialPeriodicPatterns):
         :param: timeStamps: timeStamps of itemSet
         :return: period and support
         """
-        timeStamps.sort()
-        sup = 0
-        for j in range(len(timeStamps) - 1):
-            per = abs(timeStamps[j + 1] - timeStamps[j])
-            if per <= self._period:
-                sup += 1
-        return sup
+        return _pm.periodicSupport(_pm.asTimestamps(timeStamps, unique=False), self._period)
 
     def _save(self, prefix, suffix, tidSetX):
         """
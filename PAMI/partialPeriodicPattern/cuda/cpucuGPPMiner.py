@@ -19,14 +19,15 @@ __copyright__ = """
 """
 
 import abstract as _ab
-import cupy as cp
+from PAMI import lazyImport as _lazyImport
+cp = _lazyImport.lazyModule('cupy')
 import cudf
-import pandas as pd
+pd = _lazyImport.lazyModule('pandas')
 import numpy as np
 
 from PAMI.partialPeriodicPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 class cpucuGPPMiner(_ab._partialPeriodicPatterns):
     """
@@ -1,9 +1,10 @@
 import os
 import csv
 import time
-import psutil
+from PAMI import lazyImport as _lazyImport
+psutil = _lazyImport.lazyModule('psutil')
 import numpy as np
-import deprecated
+from PAMI.lazyImport import deprecated
 import pycuda.driver as cuda
 from pycuda.compiler import SourceModule
 
@@ -19,9 +19,10 @@ __copyright__ = """
 """
 
 import abstract as _ab
-import cupy as cp
+from PAMI import lazyImport as _lazyImport
+cp = _lazyImport.lazyModule('cupy')
 import cudf
-import deprecated
+from PAMI.lazyImport import deprecated
 
 class gdscuGPPMiner(_ab._partialPeriodicPatterns):
     """
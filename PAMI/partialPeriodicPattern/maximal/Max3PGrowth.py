@@ -53,10 +53,11 @@ __copyright__ = """
 """
 
 import sys as _sys
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+from PAMI import lazyImport as _lazyImport
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 from PAMI.partialPeriodicPattern.maximal import abstract as _abstract
-import deprecated
+from PAMI.lazyImport import deprecated
 
 global maximalTree
 _periodicSupport = float()
@@ -51,12 +51,14 @@ __copyright__ = """
 """
 
 from PAMI.partialPeriodicPattern.pyspark import abstract as _ab
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+from PAMI import lazyImport as _lazyImport
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import sys as _sys
-from pyspark import SparkContext, SparkConf
-import pandas as pd
-from deprecated import deprecated
+SparkContext = _lazyImport.lazyAttribute('pyspark', 'SparkContext')
+SparkConf = _lazyImport.lazyAttribute('pyspark', 'SparkConf')
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 _periodicSupport = float()
 _period = float()
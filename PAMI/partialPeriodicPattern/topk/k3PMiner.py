@@ -53,11 +53,12 @@ __copyright__ = """
 """
 
 from PAMI.partialPeriodicPattern.topk import abstract as _abstract
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+from PAMI import lazyImport as _lazyImport
+_validators = _lazyImport.lazyModule('validators')
+_urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
 import sys as _sys
-import pandas as pd
-from deprecated import deprecated
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 class k3PMiner(_abstract.partialPeriodicPatterns):
     """
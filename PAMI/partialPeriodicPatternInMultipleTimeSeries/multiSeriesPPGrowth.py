@@ -0,0 +1,654 @@
+# multiSeriesPPGrowth discovers the partial periodic patterns of many time series in one run. All series share one item
+# dictionary and are stored as the columns (series, timestamp, item) of one table.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#
+#             from PAMI.partialPeriodicPatternInMultipleTimeSeries import multiSeriesPPGrowth as alg
+#
+#             obj = alg.multiSeriesPPGrowth(iFile, periodicSupport, period, minSeries)
+#
+#             obj.mine()
+#
+#             partialPeriodicPatterns = obj.getPatterns()
+#
+#             print("Total number of Partial Periodic Patterns:", len(partialPeriodicPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.lazyImport import deprecated
+from PAMI.partialPeriodicPatternInMultipleTimeSeries import abstract as _ab
+
+
+def _merge(keys):
+    """
+    k-way merge of sorted key arrays
+
+    :param keys: sorted int64 arrays
+    :type keys: list
+    :return: the merged sorted array
+    :rtype: numpy.ndarray
+    """
+    if len(keys) == 1:
+        return keys[0]
+    return _ab._np.sort(_ab._np.concatenate(keys), kind='stable')
+
+
+def _seriesSupports(owners, keys, numOwners, stride, periods):
+    """
+    Periodic-support of many patterns in every series, computed in one pass. A key encodes an occurrence as
+    series * stride + timestamp, so that sorting the keys of a pattern groups its occurrences by series in time order.
+
+    :param owners: index of the pattern of every occurrence
+    :type owners: numpy.ndarray
+    :param keys: key of every occurrence
+    :type keys: numpy.ndarray
+    :param numOwners: number of patterns
+    :type numOwners: int
+    :param stride: key distance between two consecutive series
+    :type stride: int
+    :param periods: period of every series
+    :type periods: numpy.ndarray
+    :return: a numOwners x numSeries matrix counting the gaps of every pattern in every series that do not exceed the
+             period of the series
+    :rtype: numpy.ndarray
+    """
+    numSeries = len(periods)
+    order = _ab._np.lexsort((keys, owners))
+    owners, keys = owners[order], keys[order]
+    series = keys // stride
+    gaps = _ab._np.diff(keys)
+    periodic = (owners[1:] == owners[:-1]) & (series[1:] == series[:-1]) & (gaps > 0) & (gaps <= periods[series[1:]])
+    cells = owners[1:][periodic] * numSeries + series[1:][periodic]
+    return _ab._np.bincount(cells, minlength=numOwners * numSeries).reshape(numOwners, numSeries)
+
+
+class _Node(object):
+    """
+    A node of the multi-series tree
+
+    :Attributes:
+
+        item : int
+            Rank of the item stored in the node
+        parent : _Node
+            Parent of the node
+        children : dict
+            Children of the node keyed by item
+        keys : list
+            Sorted arrays of the (series, timestamp) keys of the transactions ending at the node
+    """
+    __slots__ = ('item', 'parent', 'children', 'keys')
+
+    def __init__(self, item, parent):
+        self.item = item
+        self.parent = parent
+        self.children = {}
+        self.keys = []
+
+
+class _Tree(object):
+    """
+    Tree over the transactions of all the series of a shard. Only the last node of a transaction keeps its keys; they
+    are handed to the parent once the item of the node has been mined.
+
+    :Attributes:
+
+        root : _Node
+            Root of the tree
+        nodes : dict
+            Node links of every item
+        info : dict
+            Periodic-support of every item in every series, zero in the series where it is not periodic
+    """
+
+    def __init__(self):
+        self.root = _Node(None, None)
+        self.nodes = {}
+        self.info = {}
+
+    def add(self, transaction, keys):
+        """
+        Inserts a transaction whose items are sorted by rank
+
+        :param transaction: ranks of the items
+        :type transaction: list
+        :param keys: sorted keys of the transaction
+        :type keys: numpy.ndarray
+        """
+        node = self.root
+        for item in transaction:
+            child = node.children.get(item)
+            if child is None:
+                child = _Node(item, node)
+                node.children[item] = child
+                self.nodes.setdefault(item, []).append(child)
+            node = child
+        node.keys.append(keys)
+
+    def conditionalTree(self, item, periodicSupport, periods, stride, minSeries):
+        """
+        Builds the tree of the conditional pattern base of an item. Only the keys of the series where the item is
+        periodic are kept, and the per-series supports of all the candidate items are counted in one pass.
+
+        :param item: rank of the item
+        :type item: int
+        :param periodicSupport: minimum periodic-support of every series
+        :type periodicSupport: numpy.ndarray
+        :param periods: period of every series
+        :type periods: numpy.ndarray
+        :param stride: key distance between two consecutive series
+        :type stride: int
+        :param minSeries: minimum number of series in which a pattern has to be periodic
+        :type minSeries: int
+        :return: the conditional tree
+        :rtype: _Tree
+        """
+        interesting = self.info[item] >= periodicSupport
+        paths, owners, keys = [], [], []
+        for node in self.nodes[item]:
+            nodeKeys = _merge(node.keys)
+            node.keys = [nodeKeys]
+            nodeKeys = nodeKeys[interesting[nodeKeys // stride]]
+            path = []
+            parent = node.parent
+            while parent.item is not None:
+                path.append(parent.item)
+                parent = parent.parent
+            if path and len(nodeKeys):
+                path.reverse()
+                paths.append((path, nodeKeys))
+                owners.append(_ab._np.repeat(path, len(nodeKeys)))
+                keys.append(_ab._np.tile(nodeKeys, len(path)))
+        tree = _Tree()
+        if not paths:
+            return tree
+        candidates, owners = _ab._np.unique(_ab._np.concatenate(owners), return_inverse=True)
+        supports = _seriesSupports(owners.ravel(), _ab._np.concatenate(keys), len(candidates), stride, periods)
+        periodic = supports >= periodicSupport
+        for index in _ab._np.flatnonzero(periodic.sum(axis=1) >= minSeries).tolist():
+            tree.info[int(candidates[index])] = _ab._np.where(periodic[index], supports[index], 0)
+        for path, nodeKeys in paths:
+            path = [x for x in path if x in tree.info]
+            if path:
+                tree.add(path, nodeKeys)
+        return tree
+
+    def mine(self, suffix, patterns, periodicSupport, periods, stride, minSeries):
+        """
+        Pattern growth over the tree. Items are visited from the deepest rank upwards so that the keys of a node
+        already include those of its descendants.
+
+        :param suffix: ranks of the pattern the tree is conditioned on
+        :type suffix: tuple
+        :param patterns: receives the series in which every pattern is periodic with its periodic-support
+        :type patterns: dict
+        :param periodicSupport: minimum periodic-support of every series
+        :type periodicSupport: numpy.ndarray
+        :param periods: period of every series
+        :type periods: numpy.ndarray
+        :param stride: key distance between two consecutive series
+        :type stride: int
+        :param minSeries: minimum number of series in which a pattern has to be periodic
+        :type minSeries: int
+        """
+        for item in sorted(self.nodes, reverse=True):
+            pattern = (item,) + suffix
+            series = _ab._np.flatnonzero(self.info[item] >= periodicSupport)
+            patterns[pattern] = list(zip(series.tolist(), self.info[item][series].tolist()))
+            conditional = self.conditionalTree(item, periodicSupport, periods, stride, minSeries)
+            if conditional.nodes:
+                conditional.mine(pattern, patterns, periodicSupport, periods, stride, minSeries)
+            for node in self.nodes[item]:
+                node.parent.keys.extend(node.keys)
+
+
+def _mineShard(arrays, task):
+    """
+    Mines the series first, ..., last - 1 of the columnar store
+
+    :param arrays: the columns ``series``, ``timestamps`` and ``items`` sorted by series and timestamp, and the
+                   ``periodicSupport`` and ``period`` of every series
+    :type arrays: dict
+    :param task: (first, last, minSeries, numItems, tsMin, stride)
+    :type task: tuple
+    :return: patterns given as item codes with the series in which they are periodic and their periodic-support
+    :rtype: list
+    """
+    first, last, minSeries, numItems, tsMin, stride = task
+    start, stop = _ab._np.searchsorted(arrays['series'], [first, last])
+    series = arrays['series'][start:stop].astype(_ab._np.int64) - first
+    keys = series * stride + (arrays['timestamps'][start:stop] - tsMin)
+    items = arrays['items'][start:stop].astype(_ab._np.int64)
+    periodicSupport, periods = arrays['periodicSupport'][first:last], arrays['period'][first:last]
+    if len(items) == 0:
+        return []
+    supports = _seriesSupports(items, keys, numItems, stride, periods)
+    periodic = supports >= periodicSupport
+    kept = _ab._np.flatnonzero(periodic.sum(axis=1) >= minSeries)
+    if len(kept) == 0:
+        return []
+    kept = kept[_ab._np.argsort(-_ab._np.bincount(items, minlength=numItems)[kept], kind='stable')]
+    rank = _ab._np.full(numItems, -1, dtype=_ab._np.int64)
+    rank[kept] = _ab._np.arange(len(kept))
+    tree = _Tree()
+    for index, item in enumerate(kept.tolist()):
+        tree.info[index] = _ab._np.where(periodic[item], supports[item], 0)
+    ranks = rank[items]
+    keys, ranks = keys[ranks >= 0], ranks[ranks >= 0]
+    order = _ab._np.lexsort((ranks, keys))
+    keys, ranks = keys[order], ranks[order]
+    bounds = _ab._np.concatenate(([0], _ab._np.flatnonzero(_ab._np.diff(keys)) + 1, [len(keys)])).tolist()
+    paths = {}
+    keyList, rankList = keys.tolist(), ranks.tolist()
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        paths.setdefault(tuple(rankList[a:b]), []).append(keyList[a])
+    for path, pathKeys in paths.items():
+        tree.add(list(path), _ab._np.asarray(pathKeys, dtype=_ab._np.int64))
+    patterns = {}
+    tree.mine((), patterns, periodicSupport, periods, stride, minSeries)
+    return [(sorted(kept[list(pattern)].tolist()), [(first + s, count) for s, count in value])
+            for pattern, value in patterns.items()]
+
+
+class multiSeriesPPGrowth(_ab._partialPeriodicPatterns):
+    """
+    About this algorithm
+    ====================
+
+    :Description:   multiSeriesPPGrowth discovers the partial periodic patterns of many time series in one run. The series
+                    are encoded into one columnar store (series, timestamp, item) that shares a single item dictionary.
+                    The tree holds the transactions of all the series, and every occurrence is a (series, timestamp)
+                    key. The periodic-support of a pattern in every series is counted in one vectorized pass over its
+                    keys. A pattern is reported when it is periodic in at least minSeries series. Its conditional
+                    pattern base keeps only the series where it is periodic, since the periodic-support of a pattern
+                    never increases when items are added. With numWorkers > 1 the series are split into shards that
+                    are mined in parallel from the store published in shared memory.
+
+    :Reference:   C. Saideep, R. Uday Kiran, K. Zettsu, P. Fournier-Viger, M. Kitsuregawa and P. Krishna Reddy,
+                 "Discovering Periodic Patterns in Irregular Time Series," 2019 International Conference on Data Mining Workshops (ICDMW), 2019,
+                  pp. 1020-1028, doi: 10.1109/ICDMW.2019.00147.
+
+    :param  iFile: str or DataFrame or dict :
+                   The series to mine. A file (or URL) whose lines are 'series timestamp item item ...', a DataFrame with
+                   the columns 'Series', 'TS' and 'Transactions', or a dictionary mapping every series name to a file
+                   whose lines are 'timestamp item item ...' or to a DataFrame with the columns 'TS' and 'Transactions'.
+    :param  oFile: str :
+                   Name of the output file to store complete set of partial periodic patterns
+    :param  periodicSupport: int or float or str :
+                   Minimum periodic-support of a pattern in a series. A float is taken as a proportion of the number of
+                   transactions of every series.
+    :param  period: int or float or str :
+                   Maximum gap between two consecutive occurrences of a periodic pattern. A float is taken as a
+                   proportion of the number of transactions of every series.
+    :param  minSeries: int :
+                   Minimum number of series in which a pattern has to be periodic. The default is 1.
+    :param  numWorkers: int :
+                   The number of worker processes and of series shards
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   Execution backend of the shards: 'process' (default), 'spark' or 'inline'
+
+    :Attributes:
+
+        startTime : float
+            To record the start time of the mining process
+        endTime : float
+            To record the completion time of the mining process
+        finalPatterns : dict
+            Maps every pattern to the series where it is periodic and its periodic-support in each of them
+        memoryUSS : float
+            To store the total amount of USS memory consumed by the program
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+        seriesNames : list
+            Name of every series, in series id order
+        itemNames : list
+            Name of every item, in item id order
+
+    Execution methods
+    =================
+
+
+    **Terminal command**
+
+
+    .. code-block:: console
+
+       Format:
+
+       (.venv) $ python3 multiSeriesPPGrowth.py <inputFile> <outputFile> <periodicSupport> <period> <minSeries>
+
+       Examples:
+
+       (.venv) $  python3 multiSeriesPPGrowth.py fleet.txt patterns.txt 20 5 10
+
+    **Sample run of importing the code:**
+    ----------------------------------------
+
+        from PAMI.partialPeriodicPatternInMultipleTimeSeries import multiSeriesPPGrowth as alg
+
+        obj = alg.multiSeriesPPGrowth(iFile, periodicSupport, period, minSeries, numWorkers=4)
+
+        obj.mine()
+
+        partialPeriodicPatterns = obj.getPatterns()
+
+        print("Total number of Partial Periodic Patterns:", len(partialPeriodicPatterns))
+
+        obj.save(oFile)
+
+        Df = obj.getPatternsAsDataFrame()
+
+        memUSS = obj.getMemoryUSS()
+
+        print("Total Memory in USS:", memUSS)
+
+        memRSS = obj.getMemoryRSS()
+
+        print("Total Memory in RSS", memRSS)
+
+        run = obj.getRuntime()
+
+        print("Total ExecutionTime in seconds:", run)
+
+    **Credits:**
+    --------------
+
+            The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+    _startTime = float()
+    _endTime = float()
+    _periodicSupport = str()
+    _period = float()
+    _minSeries = 1
+    _numWorkers = 1
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _seriesNames = []
+    _itemNames = []
+    _seriesLengths = []
+    _columns = {}
+
+    def __init__(self, iFile, periodicSupport, period, minSeries=1, sep='\t', numWorkers=1, backend='process'):
+        super().__init__(iFile, periodicSupport, period, sep)
+        self._minSeries = minSeries
+        self._numWorkers = numWorkers
+        self._backend = backend
+
+    def _readLines(self, source):
+        """
+        Yields the split lines of a file or URL
+
+        :param source: file name or URL
+        :type source: str
+        """
+        if _ab._validators.url(source):
+            for line in _ab._urlopen(source):
+                temp = [i.rstrip() for i in line.decode("utf-8").split(self._sep)]
+                temp = [x for x in temp if x]
+                if temp:
+                    yield temp
+        else:
+            try:
+                with open(source, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        temp = [i.rstrip() for i in line.split(self._sep)]
+                        temp = [x for x in temp if x]
+                        if temp:
+                            yield temp
+            except IOError:
+                print("File Not Found")
+                quit()
+
+    def _records(self):
+        """
+        Yields every transaction of the input as (series name, timestamp, items)
+        """
+        if isinstance(self._iFile, _ab._pd.DataFrame):
+            yield from zip(self._iFile['Series'], self._iFile['TS'], self._iFile['Transactions'])
+        elif isinstance(self._iFile, dict):
+            for name, source in self._iFile.items():
+                if isinstance(source, _ab._pd.DataFrame):
+                    for ts, items in zip(source['TS'], source['Transactions']):
+                        yield name, ts, items
+                else:
+                    for line in self._readLines(source):
+                        yield name, line[0], line[1:]
+        elif isinstance(self._iFile, str):
+            for line in self._readLines(self._iFile):
+                yield line[0], line[1], line[2:]
+
+    def _creatingItemSets(self):
+        """
+        Encodes all the series into one columnar store of (series, timestamp, item) rows sorted by series, timestamp
+        and item, with one item dictionary shared by all the series
+        """
+        seriesIndex, itemIndex = {}, {}
+        seriesColumn, timestampColumn, itemColumn, lengths = [], [], [], []
+        for name, ts, items in self._records():
+            if name not in seriesIndex:
+                seriesIndex[name] = len(seriesIndex)
+                lengths.append(0)
+            series = seriesIndex[name]
+            lengths[series] += 1
+            ts = int(ts)
+            for item in items:
+                seriesColumn.append(series)
+                timestampColumn.append(ts)
+                itemColumn.append(itemIndex.setdefault(item, len(itemIndex)))
+        self._seriesNames = list(seriesIndex)
+        self._itemNames = list(itemIndex)
+        self._seriesLengths = _ab._np.asarray(lengths, dtype=_ab._np.int64)
+        series = _ab._np.asarray(seriesColumn, dtype=_ab._np.int32)
+        timestamps = _ab._np.asarray(timestampColumn, dtype=_ab._np.int64)
+        items = _ab._np.asarray(itemColumn, dtype=_ab._np.int32)
+        order = _ab._np.lexsort((items, timestamps, series))
+        series, timestamps, items = series[order], timestamps[order], items[order]
+        distinct = _ab._np.ones(len(order), dtype=bool)
+        distinct[1:] = (series[1:] != series[:-1]) | (timestamps[1:] != timestamps[:-1]) | (items[1:] != items[:-1])
+        self._columns = {'series': series[distinct], 'timestamps': timestamps[distinct], 'items': items[distinct]}
+
+    def _convert(self, value):
+        """
+        To convert the given user specified value for every series
+
+        :param value: user specified value
+        :return: converted value of every series
+        :rtype: numpy.ndarray
+        """
+        if type(value) is str:
+            value = float(value) if '.' in value else int(value)
+        if type(value) is float:
+            return self._seriesLengths * value
+        return _ab._np.full(len(self._seriesLengths), value, dtype=_ab._np.float64)
+
+    def _shards(self):
+        """
+        Splits the series into numWorkers contiguous shards holding about the same number of rows
+
+        :return: the first and the last + 1 series of every shard
+        :rtype: list
+        """
+        numSeries = len(self._seriesNames)
+        numShards = max(1, min(self._numWorkers, numSeries))
+        rows = _ab._np.cumsum(_ab._np.bincount(self._columns['series'], minlength=numSeries))
+        targets = rows[-1] * _ab._np.arange(1, numShards) / numShards if numSeries else []
+        bounds = sorted(set([0] + (_ab._np.searchsorted(rows, targets) + 1).tolist() + [numSeries]))
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self):
+        """
+        Mining process will start from this function
+        """
+        self.mine()
+
+    def Mine(self):
+        """
+        Mining process will start from this function
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Mining process will start from this function
+        """
+        self._startTime = _ab._time.time()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        if self._periodicSupport is None:
+            raise Exception("Please enter the Periodic Support")
+        self._creatingItemSets()
+        self._finalPatterns = {}
+        arrays = dict(self._columns)
+        arrays['periodicSupport'] = self._convert(self._periodicSupport)
+        arrays['period'] = self._convert(self._period)
+        numSeries, timestamps = len(self._seriesNames), arrays['timestamps']
+        tsMin = int(timestamps.min()) if len(timestamps) else 0
+        stride = int(timestamps.max()) - tsMin + 1 if len(timestamps) else 1
+        tasks = [(first, last, max(1, self._minSeries - (numSeries - (last - first))), len(self._itemNames), tsMin,
+                  stride) for first, last in self._shards()]
+        with _ab._backends.openSession(self._backend, arrays, self._numWorkers) as session:
+            results = session.map(_mineShard, tasks)
+        merged = {}
+        for patterns in results:
+            for pattern, value in patterns:
+                merged.setdefault(tuple(pattern), []).extend(value)
+        for pattern, value in merged.items():
+            if len(value) >= self._minSeries:
+                self._finalPatterns["\t".join(self._itemNames[i] for i in pattern)] = \
+                    {self._seriesNames[s]: count for s, count in value}
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Partial Periodic patterns were generated successfully using multiSeriesPPGrowth algorithm ")
+
+    def getMemoryUSS(self):
+        """Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self):
+        """Storing final partial periodic patterns in a dataframe
+
+        :return: returning partial periodic patterns in a dataframe with the number of series in which every pattern
+                 is periodic and its periodic-support in each of them
+        :rtype: pd.DataFrame
+        """
+
+        data = [[a.replace('\t', ' '), len(b), b] for a, b in self._finalPatterns.items()]
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Series', 'PeriodicSupport'])
+
+    def save(self, outFile):
+        """
+        Complete set of partial periodic patterns will be loaded in to a output file
+
+        :param outFile: name of the output file
+        :type outFile: file
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                series = " ".join(str(s) + "=" + str(count) for s, count in y.items())
+                writer.write("%s:%s:%s\n" % (x, len(y), series))
+
+    def getPatterns(self):
+        """ Function to send the set of partial periodic patterns after completion of the mining process
+
+        :return: returning partial periodic patterns with their periodic-support in every series
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self):
+        """
+        This function is used to print the results
+        """
+        print("Total number of Partial Periodic Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:",  self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 6 or len(_ab._sys.argv) == 7:
+        if len(_ab._sys.argv) == 7:
+            _ap = multiSeriesPPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], int(_ab._sys.argv[5]),
+                                      _ab._sys.argv[6])
+        if len(_ab._sys.argv) == 6:
+            _ap = multiSeriesPPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], int(_ab._sys.argv[5]))
+        _ap.mine()
+        print("Total number of Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
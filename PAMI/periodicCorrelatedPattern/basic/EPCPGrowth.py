@@ -56,7 +56,8 @@ import sys
 
 from PAMI.periodicCorrelatedPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 
 _maxPer = float()
 _minAllConf = float()
@@ -676,7 +677,7 @@ class EPCPGrowth(_ab._periodicCorrelatedPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """
         Storing final periodic-frequent patterns in a dataframe
 
@@ -55,11 +55,11 @@ __copyright__ = """
 """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 import numpy as np
-
-from PAMI.periodicFrequentPattern.basic import abstract as _ab
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
 
 
 class PFECLAT(_ab._periodicFrequentPatterns):
@@ -282,7 +282,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         Mining process will start from this function
         :return: None
         """
-        self.Mine()
+        self.mine()
         # self._startTime = _ab._time.time()
         # self._finalPatterns = {}
         # frequentSets = self._creatingOneItemSets()
@@ -302,14 +302,44 @@ class PFECLAT(_ab._periodicFrequentPatterns):
 
         return np.max(arr)
 
+    def _search(self, prefix, members):
+        """
+        Depth-first search of the equivalence class of a prefix
+
+        :param prefix: items of the prefix
+        :type prefix: tuple
+        :param members: (item, timestamps) of the periodic-frequent extensions of the prefix, in support order
+        :type members: list
+        :return: None
+        """
+        for i in range(len(members)):
+            item, timestamps = members[i]
+            pattern = prefix + (item,)
+            extensions = []
+            for other, otherTimestamps in members[i + 1:]:
+                result = _pm.intersect(timestamps, otherTimestamps, self._minSup, self._maxPer, self._dbSize)
+                if result is not None:
+                    self._finalPatterns[pattern + (other,)] = [len(result[0]), result[1]]
+                    extensions.append((other, result[0]))
+            if extensions:
+                self._search(pattern, extensions)
+
     def Mine(self) -> None:
         """
         Mining process will start from this function
         :return: None
         """
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Mining process will start from this function. The periodic-frequent items are extended depth first, so only the
+        timestamp arrays of the current path are kept alive.
+        :return: None
+        """
         self._startTime = _ab._time.time()
         self._finalPatterns = {}
-        frequentSets = self._creatingItemSets()
+        self._creatingItemSets()
 
         items = {}
         maxTS = 0
@@ -317,45 +347,26 @@ class PFECLAT(_ab._periodicFrequentPatterns):
             index = int(line[0])
             maxTS = max(maxTS, index)
             for item in line[1:]:
-                if tuple([item]) not in items:
-                    items[tuple([item])] = set()
-                items[tuple([item])].add(index)
+                if item not in items:
+                    items[item] = []
+                items[item].append(index)
 
         self._dbSize = maxTS
 
         self._minSup = self._convert(self._minSup)
         self._maxPer = self._convert(self._maxPer)
-        minSup = self._minSup
-        maxPer = self._maxPer
-
-
-        items = {k: v for k, v in items.items() if len(v) >= minSup}
-        items = {k: v for k, v in sorted(items.items(), key = lambda x: len(x[1]), reverse = True)}
-
-        keys = []
-        for item in list(items.keys()):
-            per = self._getMaxPer(items[item], maxTS)
-            if per <= maxPer:
-                keys.append(item)
-                self._finalPatterns[item] = [len(items[item]), per, set(items[item])]
-
-        while keys:
-            newKeys = []
-            for i in range(len(keys)):
-                for j in range(i + 1, len(keys)):
-                    if keys[i][:-1] == keys[j][:-1] and keys[i][-1] != keys[j][-1]:
-                        # print(keys[i], keys[j])
-                        newKey = tuple(keys[i] + (keys[j][-1],))
-                        intersect = items[keys[i]].intersection(items[keys[j]])
-                        per = self._getMaxPer(intersect, maxTS)
-                        sup = len(intersect)
-                        if sup >= minSup and per <= maxPer:
-                            items[newKey] = intersect
-                            newKeys.append(newKey)
-                            self._finalPatterns[newKey] = [sup, per, set(intersect)]
-                    else:
-                        break
-            keys = newKeys
+
+        members = []
+        for item, timestamps in items.items():
+            timestamps = np.unique(np.asarray(timestamps, dtype=np.int64))
+            if len(timestamps) < self._minSup:
+                continue
+            per = int(self._getMaxPer(timestamps, maxTS))
+            if per <= self._maxPer:
+                members.append((item, timestamps))
+                self._finalPatterns[(item,)] = [len(timestamps), per]
+        members.sort(key=lambda x: len(x[1]), reverse=True)
+        self._search((), members)
 
         newPattern = {}
         for k, v in self._finalPatterns.items():
@@ -363,7 +374,6 @@ class PFECLAT(_ab._periodicFrequentPatterns):
 
         self._finalPatterns = newPattern
 
-        # self._generateEclat(frequentSets)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryRSS = float()
@@ -400,7 +410,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final periodic-frequent patterns in a dataframe
 
@@ -0,0 +1,611 @@
+# PFPIncremental keeps the periodic-frequent patterns of a temporal database up to date while new transactions are
+# appended to it.
+#
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#
+#             from PAMI.periodicFrequentPattern.basic import PFPIncremental as alg
+#
+#             obj = alg.PFPIncremental("history.txt", "2", "5")
+#
+#             obj.mine()
+#
+#             obj.saveState("state.npz")
+#
+#             obj = alg.PFPIncremental("day.txt", "2", "5", state="state.npz")
+#
+#             obj.mine()
+#
+#             obj.saveState("state.npz")
+#
+#             periodicFrequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Periodic Frequent Patterns:", len(periodicFrequentPatterns))
+#
+#             obj.save("patterns")
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+from PAMI.periodicFrequentPattern.basic import abstract as _ab
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+from PAMI.lazyImport import deprecated
+import numpy as _np
+
+
+def _common(first, second):
+    """
+    :return: the timestamps common to two sorted timestamp arrays
+    """
+    if len(first) > len(second):
+        first, second = second, first
+    if len(first) == 0:
+        return first
+    positions = _np.searchsorted(second, first)
+    positions[positions == len(second)] = 0
+    return first[second[positions] == first]
+
+
+class PFPIncremental(_ab._periodicFrequentPatterns):
+    """
+    :Description:   PFPIncremental mines the periodic-frequent patterns of a temporal database and keeps them up to date
+                    when new transactions are appended, without reading the earlier transactions again.
+
+                    The state of the miner holds the timestamps of every item and the periodic patterns of the database
+                    regardless of their support. For every periodic pattern only its support, its last timestamp and
+                    the largest gap before its last timestamp are kept. Appending transactions only adds gaps, so a
+                    pattern is periodic after an update only if it was periodic before, and a pattern whose last
+                    timestamp lies more than maxPer before the end of the database can never become periodic again.
+                    An update therefore intersects the new timestamps along the stored patterns only, and drops a
+                    pattern together with all its supersets as soon as it is no longer periodic. The periodic-frequent
+                    patterns are the stored patterns that reach minSup.
+
+                    The patterns are mined again from the stored item timestamps when maxPer resolves to another value
+                    or when the database is still shorter than maxPer, since a pattern first seen in the appended
+                    transactions may then be periodic. maxPer is best given in count.
+
+    :param  iFile: str :
+                   Name of the Input file holding the database, or the transactions to append when a state is given
+    :param  minSup: str:
+                   Controls the minimum number of transactions in which every item must appear in a database.
+    :param  maxPer: str:
+                   Controls the maximum number of transactions in which any two items within a pattern can reappear.
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  state: str :
+                   Name of a state file written by saveState(). The transactions of iFile are then appended to it and
+                   their timestamps must follow the last timestamp of the state.
+
+    :Attributes:
+
+        iFile : file
+            Name of the Input file or path of the input file
+        oFile : file
+            Name of the output file or path of the output file
+        minSup : int or float or str
+            The user can specify minSup either in count or proportion of database size.
+            If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
+            Otherwise, it will be treated as float.
+            Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
+        maxPer : int or float or str
+            The user can specify maxPer either in count or proportion of database size.
+            If the program detects the data type of maxPer is integer, then it treats maxPer is expressed in count.
+            Otherwise, it will be treated as float.
+            Example: maxPer=10 will be treated as integer, while maxPer=10.0 will be treated as float
+        sep : str
+            This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
+            However, the users can override their default separator.
+        memoryUSS : float
+            To store the total amount of USS memory consumed by the program
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+        startTime : float
+            To record the start time of the mining process
+        endTime : float
+            To record the completion time of the mining process
+        Database : list
+            To store the transactions of a database in list
+        items : list
+            The items of the database; patterns refer to items by their index in this list
+        timestamps : list
+            The sorted timestamps of every item
+        last : int
+            The last timestamp of the database
+        lattice : dict
+            Maps every periodic pattern to its support, last timestamp and largest gap before its last timestamp
+        finalPatterns : dict
+            it represents to store the patterns
+
+    :Methods:
+
+        mine()
+            Mining process will start from here
+        update(iFile)
+            Appends the transactions of iFile to the database and updates the patterns
+        saveState(outFile)
+            Stores the state of the miner in a NumPy .npz file
+        getPatterns()
+            Complete set of patterns will be retrieved with this function
+        save(oFile)
+            Complete set of periodic-frequent patterns will be loaded in to a output file
+        getPatternsAsDataFrame()
+            Complete set of periodic-frequent patterns will be loaded in to a dataframe
+        getMemoryUSS()
+            Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+            Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+            Total amount of runtime taken by the mining process will be retrieved from this function
+
+    **Methods to execute code on terminal**
+    ------------------------------------------
+    .. code-block:: console
+
+
+       Format:
+
+       (.venv) $ python3 PFPIncremental.py <inputFile> <outputFile> <minSup> <maxPer> [<stateFile>]
+
+       Example usage:
+
+       (.venv) $ python3 PFPIncremental.py day.txt patterns.txt 10 20 state.npz
+
+
+
+               .. note:: the state is read from stateFile when it exists, and the updated state is written back to it
+
+
+    **Importing this algorithm into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+                from PAMI.periodicFrequentPattern.basic import PFPIncremental as alg
+
+                obj = alg.PFPIncremental("history.txt", "2", "5")
+
+                obj.mine()
+
+                obj.saveState("state.npz")
+
+                obj = alg.PFPIncremental("day.txt", "2", "5", state="state.npz")
+
+                obj.mine()
+
+                obj.saveState("state.npz")
+
+                periodicFrequentPatterns = obj.getPatterns()
+
+                print("Total number of Periodic Frequent Patterns:", len(periodicFrequentPatterns))
+
+                obj.save("patterns")
+
+                Df = obj.getPatternsAsDataFrame()
+
+                memUSS = obj.getMemoryUSS()
+
+                print("Total Memory in USS:", memUSS)
+
+                memRSS = obj.getMemoryRSS()
+
+                print("Total Memory in RSS", memRSS)
+
+                run = obj.getRuntime()
+
+                print("Total ExecutionTime in seconds:", run)
+
+    **Credits:**
+    --------------
+             The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _dbSize = None
+    _Database = None
+    _minSup = str()
+    _maxPer = str()
+    _finalPatterns = {}
+    _startTime = None
+    _endTime = None
+    _memoryUSS = float()
+    _memoryRSS = float()
+
+    def __init__(self, iFile, minSup, maxPer, sep='\t', state=None) -> None:
+        super().__init__(iFile, minSup, maxPer, sep)
+        self._items = []
+        self._timestamps = []
+        self._last = 0
+        self._period = None
+        self._lattice = None
+        if state is not None:
+            self._loadState(state)
+
+    def _convert(self, value) -> float:
+        """
+        To convert the given user specified value
+
+        :param value: user specified value
+        :return: converted value
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._dbSize * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._dbSize * value)
+            else:
+                value = int(value)
+        return value
+
+    def _creatingItemSets(self) -> None:
+        """
+            Storing the complete transactions of the database/input file in a database variable
+        :return: None
+        """
+        self._Database = []
+        if isinstance(self._iFile, _ab._pd.DataFrame):
+            data, ts = [], []
+            if self._iFile.empty:
+                print("its empty..")
+            i = self._iFile.columns.values.tolist()
+            if 'TS' in i:
+                ts = self._iFile['TS'].tolist()
+            if 'Transactions' in i:
+                data = self._iFile['Transactions'].tolist()
+            for i in range(len(data)):
+                tr = [ts[i]]
+                tr = tr + data[i]
+                self._Database.append(tr)
+
+        if isinstance(self._iFile, str):
+            if _ab._validators.url(self._iFile):
+                data = _ab._urlopen(self._iFile)
+                for line in data:
+                    line.strip()
+                    line = line.decode("utf-8")
+                    temp = [i.rstrip() for i in line.split(self._sep)]
+                    temp = [x for x in temp if x]
+                    self._Database.append(temp)
+            else:
+                try:
+                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            line.strip()
+                            temp = [i.rstrip() for i in line.split(self._sep)]
+                            temp = [x for x in temp if x]
+                            self._Database.append(temp)
+                except IOError:
+                    print("File Not Found")
+                    quit()
+
+    def _loadState(self, inFile: str) -> None:
+        """
+        Restores the state written by saveState()
+
+        :param inFile: name of the state file
+        :type inFile: str
+        :return: None
+        """
+        with _np.load(inFile, allow_pickle=False) as state:
+            self._items = state['items'].tolist()
+            stamps, bounds = state['stamps'], state['bounds']
+            self._timestamps = [stamps[bounds[i]:bounds[i + 1]] for i in range(len(self._items))]
+            self._last = int(state['last'])
+            self._period = state['period'].item()
+            patternItems, patternBounds = state['patternItems'].tolist(), state['patternBounds'].tolist()
+            summaries = state['summaries'].tolist()
+        self._lattice = {tuple(patternItems[patternBounds[i]:patternBounds[i + 1]]): summaries[i]
+                         for i in range(len(summaries))}
+
+    def saveState(self, outFile: str) -> None:
+        """
+        Stores the item timestamps, the last timestamp, the resolved maxPer and the periodic patterns of the database,
+        so that a later run can append transactions to them
+
+        :param outFile: name of the state file. NumPy appends .npz when the name has another extension.
+        :type outFile: str
+        :return: None
+        """
+        if self._lattice is None:
+            raise Exception("Please mine the database before saving its state")
+        lengths = [len(x) for x in self._timestamps]
+        bounds = _np.zeros(len(lengths) + 1, dtype=_np.int64)
+        _np.cumsum(lengths, out=bounds[1:])
+        patterns = list(self._lattice)
+        patternBounds = _np.zeros(len(patterns) + 1, dtype=_np.int64)
+        _np.cumsum([len(x) for x in patterns], out=patternBounds[1:])
+        _np.savez(outFile, items=_np.asarray(self._items, dtype=str),
+                  stamps=_np.concatenate(self._timestamps) if lengths else _np.zeros(0, dtype=_np.int64),
+                  bounds=bounds, last=_np.int64(self._last), period=_np.asarray(self._period),
+                  patternItems=_np.fromiter((item for pattern in patterns for item in pattern), dtype=_np.int64,
+                                            count=int(patternBounds[-1])),
+                  patternBounds=patternBounds,
+                  summaries=_np.asarray([self._lattice[x] for x in patterns], dtype=_np.int64).reshape(-1, 3))
+
+    def _summary(self, timestamps):
+        """
+        :param timestamps: sorted timestamps of a pattern
+        :return: [support, last timestamp, largest gap before the last timestamp] of a periodic pattern, or None
+        """
+        if len(timestamps) == 0 or self._last - int(timestamps[-1]) > self._period:
+            return None
+        periodicity = int(max(timestamps[0], _np.diff(timestamps).max() if len(timestamps) > 1 else 0))
+        if periodicity > self._period:
+            return None
+        return [len(timestamps), int(timestamps[-1]), periodicity]
+
+    def _advance(self, summary, timestamps):
+        """
+        :param summary: summary of a periodic pattern before the update
+        :param timestamps: sorted timestamps of the pattern in the appended transactions
+        :return: the summary of the pattern after the update, or None if it is no longer periodic
+        """
+        support, seen, periodicity = summary
+        if len(timestamps):
+            periodicity = max(periodicity, int(_np.diff(timestamps, prepend=seen).max()))
+            support, seen = support + len(timestamps), int(timestamps[-1])
+        if periodicity > self._period or self._last - seen > self._period:
+            return None
+        return [support, seen, periodicity]
+
+    def _grow(self, prefix, members) -> None:
+        """
+        Depth-first search of the periodic extensions of a prefix
+
+        :param prefix: items of the prefix
+        :type prefix: tuple
+        :param members: (item, timestamps) of the periodic extensions of the prefix
+        :type members: list
+        :return: None
+        """
+        for i in range(len(members)):
+            item, timestamps = members[i]
+            pattern = prefix + (item,)
+            extensions = []
+            for other, otherTimestamps in members[i + 1:]:
+                common = _common(timestamps, otherTimestamps)
+                summary = self._summary(common)
+                if summary is not None:
+                    self._lattice[pattern + (other,)] = summary
+                    extensions.append((other, common))
+            if extensions:
+                self._grow(pattern, extensions)
+
+    def _build(self) -> None:
+        """
+        Mines the periodic patterns of the database from the item timestamps
+        :return: None
+        """
+        self._lattice = {}
+        members = []
+        for item, timestamps in enumerate(self._timestamps):
+            summary = self._summary(timestamps)
+            if summary is not None:
+                self._lattice[(item,)] = summary
+                members.append((item, timestamps))
+        self._grow((), members)
+
+    def _refresh(self, prefix, common, children, delta, lattice) -> None:
+        """
+        Carries the stored extensions of a prefix over the appended transactions
+
+        :param prefix: items of the prefix
+        :type prefix: tuple
+        :param common: timestamps of the prefix in the appended transactions, None for the empty prefix
+        :type common: numpy.ndarray
+        :param children: the stored extensions of every stored pattern
+        :type children: dict
+        :param delta: timestamps of every item in the appended transactions
+        :type delta: list
+        :param lattice: receives the patterns that remain periodic
+        :type lattice: dict
+        :return: None
+        """
+        for item in children.get(prefix, ()):
+            pattern = prefix + (item,)
+            timestamps = delta[item] if common is None else _common(common, delta[item])
+            summary = self._advance(self._lattice[pattern], timestamps)
+            if summary is not None:
+                lattice[pattern] = summary
+                self._refresh(pattern, timestamps, children, delta, lattice)
+
+    def update(self, iFile) -> None:
+        """
+        Appends the transactions of iFile to the database and updates the patterns
+
+        :param iFile: name of the input file or a dataframe holding the transactions to append
+        :type iFile: str or pandas.DataFrame
+        :return: None
+        """
+        self._iFile = iFile
+        self.mine()
+
+    def Mine(self) -> None:
+        """
+        Mining process will start from this function
+        :return: None
+        """
+        self.mine()
+
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self) -> None:
+        """
+        Mining process will start from this function
+        :return: None
+        """
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Mining process will start from this function. Without a state the database of iFile is mined; otherwise the
+        transactions of iFile are appended to the state and only the stored periodic patterns are updated.
+        :return: None
+        """
+        self._startTime = _ab._time.time()
+        self._creatingItemSets()
+        if self._lattice is not None and len(self._Database) and min(int(x[0]) for x in self._Database) <= self._last:
+            raise ValueError("the timestamps of the appended transactions must follow the last timestamp " +
+                             str(self._last) + " of the state")
+        previous = len(self._items)
+        self._items, delta, last = _pm.itemTimestamps(self._Database, self._items)
+        self._timestamps = [_np.concatenate((self._timestamps[i], delta[i])) if len(delta[i]) else
+                            self._timestamps[i] for i in range(previous)] + delta[previous:]
+        incremental = self._lattice is not None and self._last >= self._period
+        self._last = max(self._last, last)
+        self._dbSize = self._last
+        maxPer = self._convert(self._maxPer)
+        if incremental and maxPer == self._period:
+            children = {}
+            for pattern in self._lattice:
+                children.setdefault(pattern[:-1], []).append(pattern[-1])
+            lattice = {}
+            self._refresh((), None, children, delta, lattice)
+            self._lattice = lattice
+        else:
+            self._period = maxPer
+            self._build()
+        minSup = self._convert(self._minSup)
+        self._finalPatterns = {}
+        for pattern, (support, seen, periodicity) in self._lattice.items():
+            if support >= minSup:
+                self._finalPatterns["\t".join(self._items[item] for item in pattern)] = \
+                    [support, max(periodicity, self._last - seen)]
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryRSS = float()
+        self._memoryUSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Periodic-Frequent patterns were generated successfully using PFPIncremental algorithm ")
+
+    def getMemoryUSS(self) -> float:
+        """Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """Calculating the total amount of runtime taken by the mining process
+
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
+        """
+        Storing final periodic-frequent patterns in a dataframe
+
+        :return: returning periodic-frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+
+        data = []
+        for a, b in self._finalPatterns.items():
+            data.append([a, b[0], b[1]])
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support', 'Periodicity'])
+
+    def save(self, outFile: str) -> None:
+        """
+        Complete set of periodic-frequent patterns will be loaded in to a output file
+
+        :param outFile: name of the output file
+        :type outFile: csv file
+        :return: None
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                writer.write("%s \n" % (x + ":" + str(y[0]) + ":" + str(y[1])))
+
+    def getPatterns(self) -> dict:
+        """
+        Function to send the set of periodic-frequent patterns after completion of the mining process
+
+        :return: returning periodic-frequent patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self) -> None:
+        """
+        This function is used to print the results
+        :return: None
+        """
+        print("Total number of Periodic Frequent Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:",  self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 5 or len(_ab._sys.argv) == 6:
+        if len(_ab._sys.argv) == 6 and _ab._os.path.exists(_ab._sys.argv[5]):
+            _ap = PFPIncremental(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], state=_ab._sys.argv[5])
+        else:
+            _ap = PFPIncremental(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        _ap.mine()
+        if len(_ab._sys.argv) == 6:
+            _ap.saveState(_ab._sys.argv[5])
+        print("Total number of Periodic-Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
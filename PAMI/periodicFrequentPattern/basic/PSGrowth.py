@@ -53,202 +53,78 @@ __copyright__ = """
 """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+import numpy as _np
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 from itertools import combinations as _combinations
-from PAMI.periodicFrequentPattern.basic import abstract as _ab
-from typing import List, Dict, Tuple, Set, Union, Any, Generator  
-
-_pfList = []
-_minSup = int()
-_maxPer = int()
-_lno = int()
+from typing import List, Dict, Tuple, Set, Union, Any, Generator
 
 
-class _Interval(object):
+def _emptySummaries() -> _np.ndarray:
     """
-    To represent the timestamp interval of a node in summaries
+    :return: an empty summary array
     """
-
-    def __init__(self, start, end, per, sup) -> None:
-        self.start = start
-        self.end = end
-        self.per = per
-        self.sup = sup
+    return _np.zeros(0, dtype=_pm.summaryType)
 
 
-class _NodeSummaries(object):
+def _concatenate(summariesList) -> _np.ndarray:
     """
-    To define the summaries of timeStamps of a node
-
-    :Attributes:
-
-        totalSummaries : list
-            stores the summaries of timestamps
+    Concatenates summary arrays without going through NumPy's structured dtype promotion
 
-    :Methods:
-
-        insert(timeStamps)
-            inserting and merging the timestamps into the summaries of a node
+    :param summariesList: summary arrays
+    :return: the intervals of all arrays in one array
     """
+    result = _np.empty(sum(len(summaries) for summaries in summariesList), dtype=_pm.summaryType)
+    position = 0
+    for summaries in summariesList:
+        result[position:position + len(summaries)] = summaries
+        position += len(summaries)
+    return result
 
-    def __init__(self) -> None:
-        self.totalSummaries = []
-
-    def insert(self, tid) -> List[_Interval]:
-        """ To insert and merge the timeStamps into summaries of a node
-            :param tid: timeStamps of a node
-            :return: summaries of a node
-        """
-        k = self.totalSummaries[-1]
-        diff = tid - k.end
-        if diff <= _maxPer:
-            k.end = tid
-            k.per = max(diff, k.per)
-            #             print(k.per)
-            k.sup += 1
-        else:
-            self.totalSummaries.append(_Interval(tid, tid, 0, 1))
-        return self.totalSummaries
 
+def _coalesce(summaries, maxPer) -> _np.ndarray:
+    """
+    Sorts the intervals by their start and joins every run of intervals that overlap or lie within maxPer of each other.
+    The period of an interval lying inside another one is bounded by the period of the outer interval and is skipped.
 
-def _merge(summariesX, summariesY) -> List[_Interval]:
+    :param summaries: intervals given as a structured array of (start, end, per, sup)
+    :param maxPer: maximum periodicity
+    :return: the coalesced summaries
+    """
+    if len(summaries) <= 1:
+        return summaries
+    summaries = summaries[_np.lexsort((-summaries['end'], summaries['start']))]
+    reach = _np.maximum.accumulate(summaries['end'])
+    gaps = summaries['start'][1:] - reach[:-1]
+    breaks = gaps > maxPer
+    starts = _np.concatenate(([0], _np.flatnonzero(breaks) + 1))
+    merged = _np.zeros(len(starts), dtype=_pm.summaryType)
+    merged['start'] = summaries['start'][starts]
+    merged['end'] = _np.maximum.reduceat(summaries['end'], starts)
+    merged['sup'] = _np.add.reduceat(summaries['sup'], starts)
+    inner = _np.concatenate(([0], _np.where(breaks, 0, gaps)))
+    contained = _np.concatenate(([False], summaries['end'][1:] <= reach[:-1]))
+    per = _np.where(contained, 0, _np.maximum(summaries['per'], inner))
+    merged['per'] = _np.maximum.reduceat(per, starts)
+    return merged
+
+
+def _merge(summariesX, summariesY, maxPer) -> _np.ndarray:
     """
     To Merge the timeStamps
 
     :param summariesX:  TimeStamps of a one itemSet
     :param summariesY:  TimeStamps of a one itemSet
+    :param maxPer: maximum periodicity
     :return:  Merged timestamp of both itemSets
     """
-    iter1 = 0
-    iter2 = 0
-    updatedSummaries = []
-    l1 = len(summariesX)
-    l2 = len(summariesY)
-    while 1:
-        if summariesX[iter1].start < summariesY[iter2].start:
-            if summariesX[iter1].end < summariesY[iter2].start:
-                diff = summariesY[iter2].start - summariesX[iter1].end
-                if diff > _maxPer:
-                    updatedSummaries.append(_Interval(summariesX[iter1].start,
-                                                     summariesX[iter1].end, summariesX[iter1].per,
-                                                     summariesX[iter1].sup))
-                    iter1 += 1
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-                else:
-                    per1 = max(diff, summariesX[iter1].per)
-                    per1 = max(per1, summariesY[iter2].per)
-                    updatedSummaries.append(
-                        _Interval(summariesX[iter1].start, summariesY[iter2].end, per1,
-                                 summariesX[iter1].sup + summariesY[iter2].sup))
-                    iter1 += 1
-                    iter2 += 1
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-
-            else:
-                if summariesX[iter1].end > summariesY[iter2].end:
-                    updatedSummaries.append(_Interval(summariesX[iter1].start, summariesX[iter1].end,
-                                                     summariesX[iter1].per,
-                                                     summariesX[iter1].sup + summariesY[iter2].sup))
-                else:
-                    per1 = max(summariesX[iter1].per, summariesY[iter2].per)
-                    updatedSummaries.append(
-                        _Interval(summariesX[iter1].start, summariesY[iter2].end, per1,
-                                 summariesX[iter1].sup + summariesY[iter2].sup))
-                iter1 += 1
-                iter2 += 1
-                if iter1 >= l1:
-                    ck = 1
-                    break
-
-                if iter2 >= l2:
-                    ck = 2
-                    break
-        else:
-            if summariesY[iter2].end < summariesX[iter1].start:
-                diff = summariesX[iter1].start - summariesY[iter2].end
-                if diff > _maxPer:
-                    updatedSummaries.append(_Interval(summariesY[iter2].start, summariesY[iter2].end,
-                                                     summariesY[iter2].per, summariesY[iter2].sup))
-                    iter2 += 1
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-                else:
-                    per1 = max(diff, summariesY[iter2].per)
-                    per1 = max(per1, summariesX[iter1].per)
-                    updatedSummaries.append(
-                        _Interval(summariesY[iter2].start, summariesX[iter1].end, per1,
-                                 summariesY[iter2].sup + summariesX[iter1].sup))
-                    iter2 += 1
-                    iter1 += 1
-                    if iter2 >= l2:
-                        ck = 2
-                        break
-
-                    if iter1 >= l1:
-                        ck = 1
-                        break
-
-            else:
-                if summariesY[iter2].end > summariesX[iter1].end:
-                    updatedSummaries.append(_Interval(summariesY[iter2].start, summariesY[iter2].end,
-                                                     summariesY[iter2].per,
-                                                     summariesY[iter2].sup + summariesX[iter1].sup))
-                else:
-                    per1 = max(summariesY[iter2].per, summariesX[iter1].per)
-                    updatedSummaries.append(
-                        _Interval(summariesY[iter2].start, summariesX[iter1].end, per1,
-                                 summariesY[iter2].sup + summariesX[iter1].sup))
-                iter2 += 1
-                iter1 += 1
-                if iter2 >= l2:
-                    ck = 2
-                    break
-
-                if iter1 >= l1:
-                    ck = 1
-                    break
-    if ck == 1:
-        while iter2 < l2:
-            updatedSummaries.append(summariesY[iter2])
-            iter2 += 1
-    else:
-        while iter1 < l1:
-            updatedSummaries.append(summariesX[iter1])
-            iter1 += 1
-    updatedSummaries = _update(updatedSummaries)
-
-    return updatedSummaries
-
-
-def _update(updatedSummaries) -> List[_Interval]:
-    """ After updating the summaries with first, last, and period elements in summaries
-
-    :param updatedSummaries: summaries that have been merged
-    :return: updated summaries of a node
-    """
-    summaries = [updatedSummaries[0]]
-    cur = updatedSummaries[0]
-    for i in range(1, len(updatedSummaries)):
-        v = (updatedSummaries[i].start - cur.end)
-        if cur.end > updatedSummaries[i].start or v <= _maxPer:
-            cur.end = max(updatedSummaries[i].end, cur.end)
-            cur.sup += updatedSummaries[i].sup
-            cur.per = max(cur.per, updatedSummaries[i].per)
-            cur.per = max(cur.per, v)
-        else:
-            summaries.append(updatedSummaries[i])
-        cur = summaries[-1]
-    return summaries
+    if len(summariesX) == 0:
+        return summariesY
+    if len(summariesY) == 0:
+        return summariesX
+    return _coalesce(_concatenate((summariesX, summariesY)), maxPer)
 
 
 class Node(object):
@@ -259,8 +135,8 @@ class Node(object):
 
         item : int
             storing item of a node
-        timeStamps : list
-            To maintain the timeStamps of Database at the end of the branch
+        timeStamps : numpy.ndarray
+            To maintain the summaries of the timeStamps of Database at the end of the branch
         parent : node
             To maintain the parent of every node
         children : list
@@ -285,7 +161,7 @@ class Node(object):
         self.item = item
         self.children = children
         self.parent = None
-        self.timeStamps = _NodeSummaries()
+        self.timeStamps = _emptySummaries()
 
     def addChild(self, node) -> None:
         """
@@ -311,11 +187,21 @@ class _Tree(object):
             storing the nodes with same item name
         info : dictionary
             stores the support of items
+        minSup : int or float
+            minimum support expressed in count
+        maxPer : int or float
+            maximum periodicity expressed in count
+        lno : int
+            total number of transactions
+        pfList : list
+            the periodic-frequent items in rank order
 
     :Methods:
 
             addTransaction(Database)
                 creating Database as a branch in frequentPatternTree
+            summarize()
+                replaces the timestamps collected by addTransaction with their summaries
             addConditionalTransactions(prefixPaths, supportOfItems)
                 construct the conditional tree for prefix paths
             getConditionalPatterns(Node)
@@ -330,20 +216,29 @@ class _Tree(object):
 
     """
 
-    def __init__(self) -> None:
+    def __init__(self, minSup, maxPer, lno, pfList) -> None:
         self.root = Node(None, {})
         self.summaries = {}
         self.info = {}
+        self.minSup = minSup
+        self.maxPer = maxPer
+        self.lno = lno
+        self.pfList = pfList
+        self._tids = {}
+        self._parts = {}
 
-    def addTransaction(self, transaction, tid) -> None:
+    def _newTree(self) -> '_Tree':
         """
-        Adding transaction into the tree
+        :return: an empty tree sharing the thresholds of this tree
+        """
+        return _Tree(self.minSup, self.maxPer, self.lno, self.pfList)
 
-        :param transaction: it represents the one transaction in a database
-        :type transaction: list
-        :param tid: represents the timestamp of a transaction
-        :type tid: list
-        :return: None
+    def _addPath(self, transaction) -> Node:
+        """
+        Adds the items of a transaction as a branch of the tree
+
+        :param transaction: items of the transaction
+        :return: the last node of the branch
         """
         currentNode = self.root
         for i in range(len(transaction)):
@@ -357,37 +252,51 @@ class _Tree(object):
                 currentNode = newNode
             else:
                 currentNode = currentNode.children[transaction[i]]
-        if len(currentNode.timeStamps.totalSummaries) != 0:
-            currentNode.timeStamps.insert(tid)
+        return currentNode
+
+    def addTransaction(self, transaction, tid) -> None:
+        """
+        Adding transaction into the tree. The timestamps are summarized by summarize() once all transactions are added.
+
+        :param transaction: it represents the one transaction in a database
+        :type transaction: list
+        :param tid: represents the timestamp of a transaction
+        :type tid: int
+        :return: None
+        """
+        currentNode = self._addPath(transaction)
+        if currentNode in self._tids:
+            self._tids[currentNode].append(tid)
         else:
-            currentNode.timeStamps.totalSummaries.append(_Interval(tid, tid, 0, 1))
+            self._tids[currentNode] = [tid]
+
+    def summarize(self) -> None:
+        """
+        Replaces the timestamps and summaries collected at every node with their merged period summaries
+        """
+        for node, tids in self._tids.items():
+            node.timeStamps = _pm.periodSummaries(_pm.asTimestamps(tids, unique=False), self.maxPer)
+        for node, parts in self._parts.items():
+            node.timeStamps = parts[0] if len(parts) == 1 else _coalesce(_concatenate(parts), self.maxPer)
+        self._tids = {}
+        self._parts = {}
 
     def addConditionalPatterns(self, transaction, tid) -> None:
         """
-        To add the conditional transactions in to conditional tree
+        To add the conditional transactions in to conditional tree. The summaries are merged by summarize() once all
+        conditional transactions are added.
 
         :param transaction: conditional transaction list of a node
-        :param tid: timestamp of a conditional transaction
+        :param tid: summaries of the timestamps of a conditional transaction
         :return: the conditional tree of a node
         """
-        currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = Node(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
-        if len(currentNode.timeStamps.totalSummaries) != 0:
-            currentNode.timeStamps.totalSummaries = _merge(currentNode.timeStamps.totalSummaries, tid)
+        currentNode = self._addPath(transaction)
+        if currentNode in self._parts:
+            self._parts[currentNode].append(tid)
         else:
-            currentNode.timeStamps.totalSummaries = tid
+            self._parts[currentNode] = [tid]
 
-    def getConditionalPatterns(self, alpha) -> Tuple[List[List[int]], List[List[_Interval]], Dict[int, Tuple[int, int]]]:
+    def getConditionalPatterns(self, alpha) -> Tuple[List[List[int]], List[_np.ndarray], Dict[int, List[int]]]:
         """
         To mine the conditional patterns of a node
 
@@ -397,7 +306,7 @@ class _Tree(object):
         finalPatterns = []
         finalSets = []
         for i in self.summaries[alpha]:
-            set1 = i.timeStamps.totalSummaries
+            set1 = i.timeStamps
             set2 = []
             while i.parent.item is not None:
                 set2.append(i.parent.item)
@@ -406,7 +315,8 @@ class _Tree(object):
                 set2.reverse()
                 finalPatterns.append(set2)
                 finalSets.append(set1)
-        finalPatterns, finalSets, info = conditionalTransactions(finalPatterns, finalSets)
+        finalPatterns, finalSets, info = conditionalTransactions(finalPatterns, finalSets, self.minSup, self.maxPer,
+                                                                 self.lno)
         return finalPatterns, finalSets, info
 
     def removeNode(self, nodeValue) -> None:
@@ -417,26 +327,19 @@ class _Tree(object):
         :return: removes the node from the tree
         """
         for i in self.summaries[nodeValue]:
-            if len(i.parent.timeStamps.totalSummaries) != 0:
-                i.parent.timeStamps.totalSummaries = _merge(i.parent.timeStamps.totalSummaries,
-                                                           i.timeStamps.totalSummaries)
-            else:
-                i.parent.timeStamps.totalSummaries = i.timeStamps.totalSummaries
+            i.parent.timeStamps = _merge(i.parent.timeStamps, i.timeStamps, self.maxPer)
             del i.parent.children[nodeValue]
             del i
         del self.summaries[nodeValue]
 
-    def getTimeStamps(self, alpha) -> List[_Interval]:
+    def getTimeStamps(self, alpha) -> _np.ndarray:
         """
         To get the timeStamps of a respective node
 
         :param alpha: name of node for the timeStamp
         :return: timeStamps of a node
         """
-        temp = []
-        for i in self.summaries[alpha]:
-            temp += i.timeStamps
-        return temp
+        return _coalesce(_concatenate([i.timeStamps for i in self.summaries[alpha]]), self.maxPer)
 
     def check(self) -> int:
         """
@@ -447,30 +350,30 @@ class _Tree(object):
         while len(k.children) != 0:
             if len(k.children) > 1:
                 return 1
-            if len(k.children) != 0 and len(k.timeStamps.totalSummaries) > 0:
+            if len(k.children) != 0 and len(k.timeStamps) > 0:
                 return 1
             for j in k.children:
                 v = k.children[j]
                 k = v
         return -1
 
-    def generatePatterns(self, prefix) -> None:
+    def generatePatterns(self, prefix) -> Generator:
         """
         Generating the patterns from the tree
 
         :param prefix: empty list to form the combinations
         :return: returning the periodic-frequent patterns from the tree
         """
-        global _pfList
         for i in sorted(self.summaries, key=lambda x: (self.info.get(x)[0], -x)):
             pattern = prefix[:]
-            pattern.append(_pfList[i])
+            pattern.append(self.pfList[i])
             yield pattern, self.info[i]
             patterns, timeStamps, info = self.getConditionalPatterns(i)
-            conditionalTree = _Tree()
+            conditionalTree = self._newTree()
             conditionalTree.info = info.copy()
             for pat in range(len(patterns)):
                 conditionalTree.addConditionalPatterns(patterns[pat], timeStamps[pat])
+            conditionalTree.summarize()
             find = conditionalTree.check()
             if find == 1:
                 del patterns, timeStamps, info
@@ -478,16 +381,13 @@ class _Tree(object):
                     yield cp
             else:
                 if len(conditionalTree.info) != 0:
-                    j = []
-                    for r in timeStamps:
-                        j += r
-                    inf = getPeriodAndSupport(j)
+                    j = _coalesce(_concatenate(timeStamps), self.maxPer)
+                    inf = getPeriodAndSupport(j, self.maxPer, self.lno)
                     patterns[0].reverse()
                     upp = []
                     for jm in patterns[0]:
-                        upp.append(_pfList[jm])
+                        upp.append(self.pfList[jm])
                     allSubsets = _subLists(upp)
-                    # print(upp,inf)
                     for pa in allSubsets:
                         yield pattern + pa, inf
                 del patterns, timeStamps, info
@@ -511,51 +411,51 @@ def _subLists(itemSet) -> List[List[int]]:
     return subs
 
 
-def getPeriodAndSupport(timeStamps) -> List[int]:
+def getPeriodAndSupport(timeStamps, maxPer, lno) -> List[int]:
     """
-    Calculates the period and support of list of timeStamps
+    Calculates the period and support of the summaries of a pattern
 
-    :param timeStamps: timeStamps of a  pattern or item
+    :param timeStamps: summaries of the timeStamps of a pattern or item, sorted by their start
+    :param maxPer: maximum periodicity
+    :param lno: total number of transactions
     :return: support and periodicity
     """
-    cur = 0
-    per = 0
-    sup = 0
-    for j in range(len(timeStamps)):
-        per = max(per, timeStamps[j].start - cur)
-        per = max(per, timeStamps[j].per)
-        if per > _maxPer:
-            return [0, 0]
-        cur = timeStamps[j].end
-        sup += timeStamps[j].sup
-    per = max(per, _lno - cur)
-    return [sup, per]
-
-
-def conditionalTransactions(patterns, timestamp) -> Tuple[List[List[int]], List[List[_Interval]], Dict[int, Tuple[int, int]]]:
+    if len(timeStamps) == 0:
+        return [0, 0]
+    gaps = timeStamps['start'] - _np.concatenate(([0], timeStamps['end'][:-1]))
+    per = max(int(gaps.max()), int(timeStamps['per'].max()))
+    if per > maxPer:
+        return [0, 0]
+    per = max(per, lno - int(timeStamps['end'][-1]))
+    return [int(timeStamps['sup'].sum()), per]
+
+
+def conditionalTransactions(patterns, timestamp, minSup, maxPer, lno) -> Tuple[List[List[int]], List[_np.ndarray], Dict[int, List[int]]]:
     """
     To sort and update the conditional transactions by removing the items which fails frequency
     and periodicity conditions
 
     :param patterns: conditional patterns of a node
     :param timestamp: timeStamps of a conditional pattern
+    :param minSup: minimum support
+    :param maxPer: maximum periodicity
+    :param lno: total number of transactions
     :return: conditional transactions with their respective timeStamps
     """
-    global _minSup, _maxPer
     pat = []
     timeStamps = []
     data1 = {}
     for i in range(len(patterns)):
         for j in patterns[i]:
             if j in data1:
-                data1[j] = _merge(data1[j], timestamp[i])
+                data1[j].append(timestamp[i])
             else:
-                data1[j] = timestamp[i]
+                data1[j] = [timestamp[i]]
 
     updatedDict = {}
     for m in data1:
-        updatedDict[m] = getPeriodAndSupport(data1[m])
-    updatedDict = {k: v for k, v in updatedDict.items() if v[0] >= _minSup and v[1] <= _maxPer}
+        updatedDict[m] = getPeriodAndSupport(_coalesce(_concatenate(data1[m]), maxPer), maxPer, lno)
+    updatedDict = {k: v for k, v in updatedDict.items() if v[0] >= minSup and v[1] <= maxPer}
     count = 0
     for p in patterns:
         p1 = [v for v in p if v in updatedDict]
@@ -781,7 +681,7 @@ class PSGrowth(_ab._periodicFrequentPatterns):
         Storing the complete values of a database/input file into a database variable
         """
         data = {}
-        global _minSup, _maxPer, _lno
+        self._lno = 0
         for tr in self._Database:
             self._lno += 1
             for i in range(1, len(tr)):
@@ -795,13 +695,12 @@ class PSGrowth(_ab._periodicFrequentPatterns):
             data[key][0] = max(data[key][0], self._lno - data[key][1])
         self._minSup = self._convert(self._minSup)
         self._maxPer = self._convert(self._maxPer)
-        _minSup, _maxPer, _lno = self._minSup, self._maxPer, self._lno
         data = {k: [v[2], v[0]] for k, v in data.items() if v[0] <= self._maxPer and v[2] >= self._minSup}
         genList = [k for k, v in sorted(data.items(), key=lambda x: (x[1][0], x[0]), reverse=True)]
         self._rank = dict([(index, item) for (item, index) in enumerate(genList)])
         return data, genList
 
-    def _buildTree(self, info, sampleDict) -> _Tree:
+    def _buildTree(self, info, sampleDict, pfList) -> _Tree:
         """
         it takes the Databases and support of each item and construct the main tree with setting root node as null
 
@@ -809,9 +708,11 @@ class PSGrowth(_ab._periodicFrequentPatterns):
         :type info: dictionary
         :param sampleDict: One length periodic-frequent patterns in a dictionary
         :type sampleDict: dict
+        :param pfList: periodic-frequent items in rank order
+        :type pfList: list
         :return: Returns the root node of the tree
         """
-        rootNode = _Tree()
+        rootNode = _Tree(self._minSup, self._maxPer, self._lno, pfList)
         rootNode.info = info.copy()
         k = 0
         for line in self._Database:
@@ -826,6 +727,7 @@ class PSGrowth(_ab._periodicFrequentPatterns):
                 basket.sort()
                 list2[1:] = basket[0:]
                 rootNode.addTransaction(list2[1:], list2[0])
+        rootNode.summarize()
         return rootNode
 
     @deprecated("It is recommended to use mine() instead of startMine() for mining process")
@@ -834,46 +736,29 @@ class PSGrowth(_ab._periodicFrequentPatterns):
         Mining process will start from this function
         :return: None
         """
-        global _minSup, _maxPer, _lno, _pfList
-        self._startTime = _ab._time.time()
-        if self._iFile is None:
-            raise Exception("Please enter the file path or file name:")
-        if self._minSup is None:
-            raise Exception("Please enter the Minimum Support")
-        self._creatingItemSets()
-        OneLengthPeriodicItems, _pfList = self._OneLengthItems()
-        info = {self._rank[k]: v for k, v in OneLengthPeriodicItems.items()}
-        Tree = self._buildTree(info, OneLengthPeriodicItems)
-        patterns = Tree.generatePatterns([])
-        self._finalPatterns = {}
-        for i in patterns:
-            sample = str()
-            for k in i[0]:
-                sample = sample + k + "\t"
-            self._finalPatterns[sample] = i[1]
-        self._endTime = _ab._time.time()
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Periodic-Frequent patterns were generated successfully using PS-Growth algorithm ")
+        self.mine()
 
     def Mine(self) -> None:
         """
         Mining process will start from this function
         :return: None
         """
-        global _minSup, _maxPer, _lno, _pfList
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Mining process will start from this function
+        :return: None
+        """
         self._startTime = _ab._time.time()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
         self._creatingItemSets()
-        OneLengthPeriodicItems, _pfList = self._OneLengthItems()
+        OneLengthPeriodicItems, pfList = self._OneLengthItems()
         info = {self._rank[k]: v for k, v in OneLengthPeriodicItems.items()}
-        Tree = self._buildTree(info, OneLengthPeriodicItems)
+        Tree = self._buildTree(info, OneLengthPeriodicItems, pfList)
         patterns = Tree.generatePatterns([])
         self._finalPatterns = {}
         for i in patterns:
@@ -917,7 +802,7 @@ class PSGrowth(_ab._periodicFrequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final periodic-frequent patterns in a dataframe
 
@@ -0,0 +1,158 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Closed and maximal periodic-frequent patterns shared by the condensed periodic-frequent miners.
+
+A periodic-frequent pattern is closed when no superset has the same timestamps, and maximal when no superset is
+periodic-frequent. Patterns with the same timestamps have the same support and periodicity, so the closed patterns are
+found with a CHARM-like depth-first search over sorted timestamp arrays: an extension whose timestamps contain those of
+the current pattern is merged into it instead of being explored, and an extension contained in the current pattern
+leaves its equivalence class. Every closed candidate is looked up in an index keyed by (support, periodicity, sum of
+the timestamps) and is dropped when an already found closed pattern with the same key contains it.
+
+Every maximal pattern is closed, and a closed pattern is maximal when no other closed pattern contains it, so the
+maximal patterns are taken from the closed ones in a single pass, longest first, with an item index over the maximal
+patterns found so far. The full set of periodic-frequent patterns is never built.
+
+.. code-block:: python
+
+        from PAMI.periodicFrequentPattern.basic import periodicityMeasures as pm
+        from PAMI.periodicFrequentPattern.basic import condensedEngine as engine
+
+        items, timestamps, last = pm.itemTimestamps(database)
+
+        closed = engine.closedPatterns(timestamps, minSup, maxPer, last)
+
+        for pattern, support, periodicity in engine.maximalPatterns(closed):
+            print([items[item] for item in pattern], support, periodicity)
+"""
+
+import numpy as _np
+from typing import List, Tuple
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+
+Pattern = Tuple[tuple, int, int]
+
+
+class _ClosedIndex:
+    """
+    Closed patterns found so far, grouped by (support, periodicity, sum of the timestamps)
+    """
+
+    def __init__(self) -> None:
+        self.patterns = []
+        self._buckets = {}
+
+    def add(self, items: frozenset, timestamps: _np.ndarray, periodicity: int) -> None:
+        """
+        Stores a pattern unless a stored pattern with the same timestamps contains it
+        """
+        key = (len(timestamps), periodicity, int(timestamps.sum()))
+        bucket = self._buckets.setdefault(key, [])
+        for other in bucket:
+            if items <= other:
+                return
+        bucket.append(items)
+        self.patterns.append((tuple(sorted(items)), len(timestamps), periodicity))
+
+
+def _extend(prefix: frozenset, members: list, minSup: float, maxPer: float, last: int, index: _ClosedIndex) -> None:
+    """
+    Depth-first search of the equivalence class of a prefix
+
+    :param prefix: items of the prefix
+    :param members: [items, timestamps, periodicity] of the periodic-frequent extensions of the prefix, in increasing
+                    support. Merged and removed members are changed in place.
+    """
+    for i in range(len(members)):
+        if members[i] is None:
+            continue
+        items, timestamps, periodicity = members[i]
+        children = []
+        for j in range(i + 1, len(members)):
+            if members[j] is None:
+                continue
+            otherItems, otherTimestamps, otherPeriodicity = members[j]
+            result = _pm.intersect(timestamps, otherTimestamps, minSup, maxPer, last)
+            if result is None:
+                continue
+            common, commonPeriodicity = result
+            if len(common) == len(timestamps):
+                items = items | otherItems
+                if len(common) == len(otherTimestamps):
+                    members[j] = None
+            elif len(common) == len(otherTimestamps):
+                members[j] = None
+                children.append([otherItems, common, commonPeriodicity])
+            else:
+                children.append([otherItems, common, commonPeriodicity])
+        pattern = prefix | items
+        if children:
+            _extend(pattern, children, minSup, maxPer, last, index)
+        index.add(pattern, timestamps, periodicity)
+
+
+def closedPatterns(timestamps: List[_np.ndarray], minSup: float, maxPer: float, last: int) -> List[Pattern]:
+    """
+    Closed periodic-frequent patterns
+
+    :param timestamps: sorted timestamps of every item
+    :type timestamps: list
+    :param minSup: minimum support
+    :type minSup: int or float
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param last: end of the database
+    :type last: int
+    :return: (item indexes, support, periodicity) of every closed periodic-frequent pattern
+    :rtype: list
+    """
+    members = []
+    for item, itemTimestamps in enumerate(timestamps):
+        if len(itemTimestamps) >= max(minSup, 1):
+            periodicity = _pm.maxPeriod(itemTimestamps, last)
+            if periodicity <= maxPer:
+                members.append([frozenset((item,)), itemTimestamps, periodicity])
+    members.sort(key=lambda x: len(x[1]))
+    index = _ClosedIndex()
+    _extend(frozenset(), members, minSup, maxPer, last, index)
+    return index.patterns
+
+
+def maximalPatterns(closed: List[Pattern]) -> List[Pattern]:
+    """
+    Maximal periodic-frequent patterns
+
+    :param closed: the closed periodic-frequent patterns, as returned by closedPatterns
+    :type closed: list
+    :return: the closed patterns not contained in another closed pattern
+    :rtype: list
+    """
+    maximal = []
+    owners = {}
+    for pattern in sorted(closed, key=lambda x: len(x[0]), reverse=True):
+        items = sorted(pattern[0], key=lambda x: len(owners.get(x, ())))
+        candidates = set(owners.get(items[0], ()))
+        for item in items[1:]:
+            if not candidates:
+                break
+            candidates &= owners.get(item, set())
+        if candidates:
+            continue
+        for item in items:
+            owners.setdefault(item, set()).add(len(maximal))
+        maximal.append(pattern)
+    return maximal
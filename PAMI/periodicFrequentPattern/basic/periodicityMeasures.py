@@ -0,0 +1,303 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Periodicity measures shared by the periodic, partial periodic and stable periodic miners.
+
+Every measure takes the timestamps of a pattern as a sorted int64 NumPy array and is computed from the gaps between
+consecutive timestamps. When the end of the database (last) is given, the gap from 0 to the first timestamp and the
+gap from the last timestamp to the end of the database are counted too. The batch variants evaluate many candidates in
+one call.
+
+.. code-block:: python
+
+        from PAMI.periodicFrequentPattern.basic import periodicityMeasures as pm
+
+        timestamps = pm.asTimestamps({3, 1, 7})
+
+        pm.periodicSupport(timestamps, period=2)
+
+        pm.maxPeriod(timestamps, last=10)
+
+        pm.batchPeriodicSupport([timestamps, pm.asTimestamps([2, 4])], period=2)
+
+        items, itemTimestamps, last = pm.itemTimestamps([['1', 'a', 'b'], ['3', 'a']])
+"""
+
+import numpy as _np
+from typing import Iterable, List, Optional, Tuple
+
+blockSize = 1024
+
+summaryType = _np.dtype([('start', _np.int64), ('end', _np.int64), ('per', _np.int64), ('sup', _np.int64)])
+
+
+def asTimestamps(timestamps: Iterable, unique: bool = True) -> _np.ndarray:
+    """
+    :param timestamps: timestamps given as a list, set or array
+    :type timestamps: iterable
+    :param unique: drop repeated timestamps
+    :type unique: bool
+    :return: the timestamps as a sorted int64 array
+    :rtype: numpy.ndarray
+    """
+    if not isinstance(timestamps, _np.ndarray):
+        timestamps = _np.fromiter(timestamps, dtype=_np.int64)
+    timestamps = timestamps.astype(_np.int64, copy=False)
+    return _np.unique(timestamps) if unique else _np.sort(timestamps)
+
+
+def itemTimestamps(database: List[List[str]], items: Optional[List[str]] = None) -> Tuple[List[str], List[_np.ndarray], int]:
+    """
+    Collects the timestamps of every item of a temporal database
+
+    :param database: transactions given as lists whose first element is the timestamp
+    :type database: list
+    :param items: items whose indexes must be kept, e.g. the items of an earlier part of the database. Items not seen in
+                  the database get an empty array.
+    :type items: list
+    :return: the items, the sorted timestamps of every item as views into one flat array and the last timestamp
+    :rtype: tuple
+    """
+    names = {item: index for index, item in enumerate(items or [])}
+    codes, stamps = [], []
+    for line in database:
+        if len(line) < 2:
+            continue
+        timestamp = int(line[0])
+        for item in line[1:]:
+            codes.append(names.setdefault(item, len(names)))
+            stamps.append(timestamp)
+    codes = _np.asarray(codes, dtype=_np.int64)
+    stamps = _np.asarray(stamps, dtype=_np.int64)
+    if len(stamps) == 0:
+        return list(names), [stamps[:0]] * len(names), 0
+    order = _np.lexsort((stamps, codes))
+    codes, stamps = codes[order], stamps[order]
+    keep = _np.ones(len(codes), dtype=bool)
+    keep[1:] = (codes[1:] != codes[:-1]) | (stamps[1:] != stamps[:-1])
+    codes, stamps = codes[keep], stamps[keep]
+    bounds = _np.searchsorted(codes, _np.arange(len(names) + 1))
+    timestamps = [stamps[bounds[i]:bounds[i + 1]] for i in range(len(names))]
+    return list(names), timestamps, int(stamps.max())
+
+
+def _gaps(timestamps: _np.ndarray, last: Optional[int] = None) -> _np.ndarray:
+    """
+    :return: the gaps between consecutive timestamps, including the boundary gaps when last is given
+    :rtype: numpy.ndarray
+    """
+    if last is None:
+        return _np.diff(timestamps)
+    return _np.diff(_np.concatenate(([0], timestamps, [last])))
+
+
+def periodicSupport(timestamps: _np.ndarray, period: float, last: Optional[int] = None) -> int:
+    """
+    Number of gaps between consecutive timestamps that do not exceed period
+
+    :param timestamps: sorted timestamps of a pattern
+    :type timestamps: numpy.ndarray
+    :param period: maximum length of a periodic gap
+    :type period: int or float
+    :param last: end of the database. When given, the gaps from 0 and to the end of the database are counted too.
+    :type last: int
+    :return: the periodic-support of the pattern
+    :rtype: int
+    """
+    if len(timestamps) == 0:
+        return 0
+    return int(_np.count_nonzero(_gaps(timestamps, last) <= period))
+
+
+def maxPeriod(timestamps: _np.ndarray, last: int) -> int:
+    """
+    :param timestamps: sorted timestamps of a pattern
+    :type timestamps: numpy.ndarray
+    :param last: end of the database
+    :type last: int
+    :return: the largest gap of the pattern, including the gaps from 0 and to the end of the database
+    :rtype: int
+    """
+    return int(_gaps(timestamps, last).max())
+
+
+def liability(timestamps: _np.ndarray, maxPer: float, last: int) -> float:
+    """
+    Maximum liability of a pattern. The liability grows by the excess of every gap over maxPer and never drops below
+    zero, i.e. la = max(0, la + gap - maxPer); it is evaluated for all gaps at once from the running minimum of the
+    cumulative excess.
+
+    :param timestamps: sorted timestamps of a pattern
+    :type timestamps: numpy.ndarray
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param last: end of the database
+    :type last: int
+    :return: the largest liability reached by the pattern
+    :rtype: int or float
+    """
+    excess = _np.cumsum(_gaps(timestamps, last) - maxPer)
+    la = excess - _np.minimum(_np.minimum.accumulate(excess), 0)
+    return max(0, la.max().item())
+
+
+def periodSummaries(timestamps: _np.ndarray, maxPer: float) -> _np.ndarray:
+    """
+    Splits the timestamps into maximal runs whose consecutive gaps do not exceed maxPer
+
+    :param timestamps: sorted timestamps of a pattern
+    :type timestamps: numpy.ndarray
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :return: one (start, end, per, sup) record per run, where per is the largest gap inside the run and sup the number
+             of timestamps of the run
+    :rtype: numpy.ndarray
+    """
+    summaries = _np.zeros(0, dtype=summaryType)
+    if len(timestamps) == 0:
+        return summaries
+    gaps = _np.diff(timestamps)
+    breaks = _np.flatnonzero(gaps > maxPer) + 1
+    starts = _np.concatenate(([0], breaks))
+    ends = _np.concatenate((breaks, [len(timestamps)])) - 1
+    summaries = _np.zeros(len(starts), dtype=summaryType)
+    summaries['start'] = timestamps[starts]
+    summaries['end'] = timestamps[ends]
+    summaries['sup'] = ends - starts + 1
+    inner = _np.concatenate((_np.where(gaps > maxPer, 0, gaps), [0]))
+    summaries['per'] = _np.maximum.reduceat(inner, starts)
+    return summaries
+
+
+def intersect(first: _np.ndarray, second: _np.ndarray, minSup: float, maxPer: float,
+              last: int) -> Optional[Tuple[_np.ndarray, int]]:
+    """
+    Intersects two sorted timestamp arrays block by block
+
+    :param first: sorted timestamps of the first pattern
+    :type first: numpy.ndarray
+    :param second: sorted timestamps of the second pattern
+    :type second: numpy.ndarray
+    :param minSup: minimum support
+    :type minSup: int or float
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param last: end of the database
+    :type last: int
+    :return: the common timestamps and their periodicity, or None once the result is certain to have a gap larger than
+             maxPer or fewer than minSup timestamps. The shorter array itself is returned when it is fully contained in
+             the other one.
+    :rtype: tuple
+    """
+    if len(first) > len(second):
+        first, second = second, first
+    if len(first) < minSup:
+        return None
+    blocks = []
+    found, previous, periodicity = 0, 0, 0
+    for start in range(0, len(first), blockSize):
+        block = first[start:start + blockSize]
+        positions = _np.searchsorted(second, block)
+        positions[positions == len(second)] = 0
+        common = block[second[positions] == block]
+        if len(common):
+            gap = max(int(common[0]) - previous, int(_np.diff(common).max()) if len(common) > 1 else 0)
+            if gap > maxPer:
+                return None
+            periodicity = max(periodicity, gap)
+            previous = int(common[-1])
+            found += len(common)
+            blocks.append(common)
+        if int(block[-1]) - previous > maxPer or found + len(first) - start - len(block) < minSup:
+            return None
+    periodicity = max(periodicity, last - previous)
+    if periodicity > maxPer:
+        return None
+    if found == len(first):
+        return first, periodicity
+    return _np.concatenate(blocks), periodicity
+
+
+def _flatten(timestampLists: List[_np.ndarray]):
+    """
+    :return: the concatenated timestamps, the length of every list and the list index of every timestamp
+    """
+    lengths = _np.fromiter((len(x) for x in timestampLists), dtype=_np.int64, count=len(timestampLists))
+    flat = _np.concatenate(timestampLists).astype(_np.int64, copy=False) if len(timestampLists) else \
+        _np.zeros(0, dtype=_np.int64)
+    owner = _np.repeat(_np.arange(len(timestampLists)), lengths)
+    return flat, lengths, owner
+
+
+def batchPeriodicSupport(timestampLists: List[_np.ndarray], period: float, last: Optional[int] = None) -> _np.ndarray:
+    """
+    Periodic-support of many patterns in one call
+
+    :param timestampLists: sorted timestamps of every pattern
+    :type timestampLists: list
+    :param period: maximum length of a periodic gap
+    :type period: int or float
+    :param last: end of the database. When given, the gaps from 0 and to the end of the database are counted too.
+    :type last: int
+    :return: the periodic-support of every pattern
+    :rtype: numpy.ndarray
+    """
+    flat, lengths, owner = _flatten(timestampLists)
+    inner = (_np.diff(flat) <= period) & (owner[1:] == owner[:-1])
+    result = _np.bincount(owner[1:][inner], minlength=len(timestampLists)).astype(_np.int64)
+    if last is not None:
+        nonEmpty = lengths > 0
+        firsts = _np.cumsum(lengths) - lengths
+        result[nonEmpty] += flat[firsts[nonEmpty]] <= period
+        result[nonEmpty] += (last - flat[firsts[nonEmpty] + lengths[nonEmpty] - 1]) <= period
+    return result
+
+
+def batchMaxPeriod(timestampLists: List[_np.ndarray], last: int) -> _np.ndarray:
+    """
+    Largest gap of many patterns in one call
+
+    :param timestampLists: sorted timestamps of every pattern
+    :type timestampLists: list
+    :param last: end of the database
+    :type last: int
+    :return: the periodicity of every pattern
+    :rtype: numpy.ndarray
+    """
+    flat, lengths, owner = _flatten(timestampLists)
+    result = _np.full(len(timestampLists), last, dtype=_np.int64)
+    nonEmpty = lengths > 0
+    firsts = _np.cumsum(lengths) - lengths
+    result[nonEmpty] = _np.maximum(flat[firsts[nonEmpty]], last - flat[firsts[nonEmpty] + lengths[nonEmpty] - 1])
+    inner = owner[1:] == owner[:-1]
+    _np.maximum.at(result, owner[1:][inner], _np.diff(flat)[inner])
+    return result
+
+
+def batchLiability(timestampLists: List[_np.ndarray], maxPer: float, last: int) -> List[float]:
+    """
+    Maximum liability of many patterns
+
+    :param timestampLists: sorted timestamps of every pattern
+    :type timestampLists: list
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param last: end of the database
+    :type last: int
+    :return: the liability of every pattern
+    :rtype: list
+    """
+    return [liability(timestamps, maxPer, last) for timestamps in timestampLists]
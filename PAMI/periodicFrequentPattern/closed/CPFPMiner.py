@@ -9,7 +9,7 @@
 #
 #             obj = alg.CPFPMiner("../basic/sampleTDB.txt", "2", "6")
 #
-#             obj.startMine()
+#             obj.mine()
 #
 #             periodicFrequentPatterns = obj.getPatterns()
 #
@@ -53,11 +53,13 @@ __copyright__ = """
 
 """
 
-from PAMI.periodicFrequentPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 from PAMI.periodicFrequentPattern.closed import abstract as _ab
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+from PAMI.periodicFrequentPattern.basic import condensedEngine as _engine
 
 class CPFPMiner(_ab._periodicFrequentPatterns):
     """
@@ -65,7 +67,8 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
     ====================
 
     :Description:   CPFPMiner algorithm is used to discover the closed periodic frequent patterns in temporal databases.
-                    It uses depth-first search.
+                    It uses depth-first search over the sorted timestamps of the items and checks the closure of a
+                    pattern against the closed patterns with the same support, periodicity and timestamp sum.
 
     :Reference:   P. Likhitha et al., "Discovering Closed Periodic-Frequent Patterns in Very Large Temporal Databases"
                   2020 IEEE International Conference on Big Data (Big Data), 2020, https://ieeexplore.ieee.org/document/9378215
@@ -114,7 +117,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
 
     :Methods:
 
-        startMine()
+        mine()
             Mining process will start from here
         getPatterns()
             Complete set of patterns will be retrieved with this function
@@ -158,7 +161,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         
                     obj = alg.CPFPMiner("../basic/sampleTDB.txt", "2", "6")
         
-                    obj.startMine()
+                    obj.mine()
         
                     periodicFrequentPatterns = obj.getPatterns()
         
@@ -195,13 +198,6 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
     _sep = " "
     _memoryUSS = float()
     _memoryRSS = float()
-    _transaction = []
-    _hashing = {}
-    _mapSupport = {}
-    _itemSetCount = 0
-    _maxItemId = 0
-    _tableSize = 10000
-    _tidList = {}
     _lno = 0
 
     def __init__(self, iFile, minSup, maxPer, sep='\t'):
@@ -229,9 +225,9 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
 
     def _scanDatabase(self):
         """
-        To scan the database and extracts the 1-length periodic-frequent items
+        To scan the database and collect the timestamps of every item
 
-        :return:   Returns the 1-length periodic-frequent items
+        :return:   Returns the items, their sorted timestamps and the last timestamp of the database
         """
         Database = []
         if isinstance(self._iFile, _ab._pd.DataFrame):
@@ -268,229 +264,20 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
                 except IOError:
                     print("File Not Found")
                     quit()
-        self._tidList = {}
-        self._mapSupport = {}
-        for line in Database:
-            self._lno += 1
-            s = line
-            n = int(s[0])
-            for i in range(1, len(s)):
-                si = s[i]
-                if self._mapSupport.get(si) is None:
-                    self._mapSupport[si] = [1, abs(0 - n), n]
-                    self._tidList[si] = [n]
-                else:
-                    self._mapSupport[si][0] += 1
-                    self._mapSupport[si][1] = max(self._mapSupport[si][1], abs(n - self._mapSupport[si][2]))
-                    self._mapSupport[si][2] = n
-                    self._tidList[si].append(n)
-        for x, y in self._mapSupport.items():
-            self._mapSupport[x][1] = max(self._mapSupport[x][1], abs(self._lno - self._mapSupport[x][2]))
-        self._minSup = self._convert(self._minSup)
-        self._maxPer = self._convert(self._maxPer)
-        self._mapSupport = {k: [v[0], v[1]] for k, v in self._mapSupport.items() if
-                           v[0] >= self._minSup and v[1] <= self._maxPer}
-        periodicFrequentItems = {}
-        self._tidList = {k: v for k, v in self._tidList.items() if k in self._mapSupport}
-        for x, y in self._tidList.items():
-            t1 = 0
-            for i in y:
-                t1 += i
-            periodicFrequentItems[x] = t1
-        periodicFrequentItems = [key for key, value in sorted(periodicFrequentItems.items(), key=lambda x: x[1])]
-        return periodicFrequentItems
-
-    def _calculate(self, tidSet):
-        """
-        To calculate the weight if pattern based on the respective timeStamps
-
-        :param tidSet: timeStamps of the pattern
-        :return: the calculated weight of the timeStamps
-        """
-        hashcode = 0
-        for i in tidSet:
-            hashcode += i
-        if hashcode < 0:
-            hashcode = abs(0 - hashcode)
-        return hashcode % self._tableSize
-
-    def _contains(self, itemSet, val, hashcode):
-        """
-        To check if the key(hashcode) is in dictionary(hashing) variable
-
-        :param itemSet: generated periodic-frequent itemSet
-        :param val: support and periodicity of itemSet
-        :param hashcode: the key generated in calculate() method for every itemSet
-
-        :return: true if itemSet with same support present in dictionary(hashing) or else returns false
-        """
-        if self._hashing.get(hashcode) is None:
-            return False
-        for i in self._hashing[hashcode]:
-            itemSetX = i
-            if val[0] == self._hashing[hashcode][itemSetX][0] and set(itemSetX).issuperset(itemSet):
-                return True
-        return False
-
-    def _getPeriodAndSupport(self, timeStamps):
-        """
-        Calculates the periodicity and support of timeStamps
+        self._lno = len(Database)
+        return _pm.itemTimestamps(Database)
 
-        :param timeStamps: timeStamps of itemSet
-        :return: periodicity and support
-        """
-        timeStamps.sort()
-        cur = 0
-        per = 0
-        sup = 0
-        for j in range(len(timeStamps)):
-            per = max(per, timeStamps[j] - cur)
-            if per > self._maxPer:
-                return [0, 0]
-            cur = timeStamps[j]
-            sup += 1
-        per = max(per, self._lno - cur)
-        return [sup, per]
-
-    def _save(self, prefix, suffix, tidSetX):
-        """
-        Saves the generated pattern which satisfies the closed property
-        Parameters:
-        -----------
-            prefix: the prefix part of itemSet
-            suffix: the suffix part of itemSet
-            tidSetX: the timeStamps of the generated itemSet
-
-        Returns:
-        --------
-            saves the closed periodic-frequent pattern
-
-        """
-        if prefix is None:
-            prefix = suffix
-        else:
-            prefix = prefix + suffix
-        prefix = list(set(prefix))
-        prefix.sort()
-        val = self._getPeriodAndSupport(tidSetX)
-        if val[0] >= self._minSup and val[1] <= self._maxPer:
-            hashcode = self._calculate(tidSetX)
-            if self._contains(prefix, val, hashcode) is False:
-                self._itemSetCount += 1
-                sample = str()
-                for i in prefix:
-                    sample = sample + i + " "
-                self._finalPatterns[sample] = val
-            if hashcode not in self._hashing:
-                self._hashing[hashcode] = {tuple(prefix): val}
-            else:
-                self._hashing[hashcode][tuple(prefix)] = val
-
-    def _processEquivalenceClass(self, prefix, itemSets, tidSets):
-        """
-        identifies and saves closed periodic patterns of length more than 2 in a dataset, by processing equivalence classes of item sets that satisfy a minimum support condition.
-        :param prefix: Prefix class of an itemSet
-        :param itemSets: suffix items in periodicFrequentItems that satisfies the minSup condition
-        :param tidSets: timeStamps of items in itemSets respectively
-        :return:  closed periodic patterns with length more than 2
-        """
-        if len(itemSets) == 1:
-            i = itemSets[0]
-            tidList = tidSets[0]
-            self._save(prefix, [i], tidList)
-            return
-        if len(itemSets) == 2:
-            itemI = itemSets[0]
-            tidSetI = tidSets[0]
-            itemJ = itemSets[1]
-            tidSetJ = tidSets[1]
-            y1 = list(set(tidSetI).intersection(tidSetJ))
-            if len(y1) >= self._minSup:
-                suffix = []
-                suffix += [itemI, itemJ]
-                suffix = list(set(suffix))
-                self._save(prefix, suffix, y1)
-            if len(y1) != len(tidSetI):
-                self._save(prefix, [itemI], tidSetI)
-            if len(y1) != len(tidSetJ):
-                self._save(prefix, [itemJ], tidSetJ)
-            return
-        for i in range(len(itemSets)):
-            itemX = itemSets[i]
-            if itemX is None:
-                continue
-            tidSetX = tidSets[i]
-            classItemSets = []
-            classTidSets = []
-            itemSetX = [itemX]
-            for j in range(i + 1, len(itemSets)):
-                itemJ = itemSets[j]
-                if itemJ is None:
-                    continue
-                tidSetJ = tidSets[j]
-                y = list(set(tidSetX).intersection(tidSetJ))
-                if len(y) < self._minSup:
-                    continue
-                if len(tidSetX) == len(tidSetJ) and len(y) == len(tidSetX):
-                    itemSets.insert(j, None)
-                    tidSets.insert(j, None)
-                    itemSetX.append(itemJ)
-                elif len(tidSetX) < len(tidSetJ) and len(y) == len(tidSetX):
-                    itemSetX.append(itemJ)
-                elif len(tidSetX) > len(tidSetJ) and len(y) == len(tidSetJ):
-                    itemSets.insert(j, None)
-                    tidSets.insert(j, None)
-                    classItemSets.append(itemJ)
-                    classTidSets.append(y)
-                else:
-                    classItemSets.append(itemJ)
-                    classTidSets.append(y)
-            if len(classItemSets) > 0:
-                newPrefix = list(set(itemSetX)) + prefix
-                self._processEquivalenceClass(newPrefix, classItemSets, classTidSets)
-            self._save(prefix, list(set(itemSetX)), tidSetX)
-
-    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
-    def startMine(self):
+    def mine(self):
         """
         Mining process will start from here
         """
         self._startTime = _ab._time.time()
         self._finalPatterns = {}
-        self._hashing = {}
-        periodicFrequentItems = self._scanDatabase()
-        for i in range(len(periodicFrequentItems)):
-            itemX = periodicFrequentItems[i]
-            if itemX is None:
-                continue
-            tidSetX = self._tidList[itemX]
-            itemSetX = [itemX]
-            itemSets = []
-            tidSets = []
-            for j in range(i + 1, len(periodicFrequentItems)):
-                itemJ = periodicFrequentItems[j]
-                if itemJ is None:
-                    continue
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetX).intersection(tidSetJ))
-                if len(y1) < self._minSup:
-                    continue
-                if len(tidSetX) == len(tidSetJ) and len(y1) is len(tidSetX):
-                    periodicFrequentItems.insert(j, None)
-                    itemSetX.append(itemJ)
-                elif len(tidSetX) < len(tidSetJ) and len(y1) is len(tidSetX):
-                    itemSetX.append(itemJ)
-                elif len(tidSetX) > len(tidSetJ) and len(y1) is len(tidSetJ):
-                    periodicFrequentItems.insert(j, None)
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-                else:
-
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-            if len(itemSets) > 0:
-                self._processEquivalenceClass(itemSetX, itemSets, tidSets)
-            self._save([], itemSetX, tidSetX)
+        items, timestamps, last = self._scanDatabase()
+        self._minSup = self._convert(self._minSup)
+        self._maxPer = self._convert(self._maxPer)
+        for pattern, support, periodicity in _engine.closedPatterns(timestamps, self._minSup, self._maxPer, last):
+            self._finalPatterns["\t".join(items[item] for item in pattern)] = [support, periodicity]
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -499,53 +286,18 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         self._memoryRSS = process.memory_info().rss
         print("Closed periodic frequent patterns were generated successfully using CPFPMiner algorithm ")
 
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self):
+        """
+        Mining process will start from here
+        """
+        self.mine()
+
     def Mine(self):
         """
         Mining process will start from here
         """
-        self._startTime = _ab._time.time()
-        self._finalPatterns = {}
-        self._hashing = {}
-        periodicFrequentItems = self._scanDatabase()
-        for i in range(len(periodicFrequentItems)):
-            itemX = periodicFrequentItems[i]
-            if itemX is None:
-                continue
-            tidSetX = self._tidList[itemX]
-            itemSetX = [itemX]
-            itemSets = []
-            tidSets = []
-            for j in range(i + 1, len(periodicFrequentItems)):
-                itemJ = periodicFrequentItems[j]
-                if itemJ is None:
-                    continue
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetX).intersection(tidSetJ))
-                if len(y1) < self._minSup:
-                    continue
-                if len(tidSetX) == len(tidSetJ) and len(y1) is len(tidSetX):
-                    periodicFrequentItems.insert(j, None)
-                    itemSetX.append(itemJ)
-                elif len(tidSetX) < len(tidSetJ) and len(y1) is len(tidSetX):
-                    itemSetX.append(itemJ)
-                elif len(tidSetX) > len(tidSetJ) and len(y1) is len(tidSetJ):
-                    periodicFrequentItems.insert(j, None)
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-                else:
-
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-            if len(itemSets) > 0:
-                self._processEquivalenceClass(itemSetX, itemSets, tidSets)
-            self._save([], itemSetX, tidSetX)
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Closed periodic frequent patterns were generated successfully using CPFPMiner algorithm ")
+        self.mine()
 
     def getMemoryUSS(self):
         """
@@ -599,7 +351,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         self._oFile = outFile
         writer = open(self._oFile, 'w+')
         for x, y in self._finalPatterns.items():
-            s1 = x.replace(' ', '\t').strip() + ":" + str(y[0]) + ":" + str(y[1])
+            s1 = x + ":" + str(y[0]) + ":" + str(y[1])
             writer.write("%s \n" % s1)
 
     def getPatterns(self):
@@ -627,7 +379,7 @@ if __name__ == "__main__":
             _ap = CPFPMiner(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = CPFPMiner(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
-        _ap.startMine()
+        _ap.mine()
         print("Total number of Closed Periodic-Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
         print("Total Memory in USS:", _ap.getMemoryUSS())
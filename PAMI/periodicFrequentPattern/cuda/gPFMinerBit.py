@@ -45,15 +45,16 @@ import os
 import sys
 import csv
 import time
-import psutil
+from PAMI import lazyImport as _lazyImport
+psutil = _lazyImport.lazyModule('psutil')
 import numpy as np
 import pycuda.autoinit
 import pycuda.driver as cuda
 from pycuda.compiler import SourceModule
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 
 supportAndPeriod = SourceModule(r"""
@@ -0,0 +1,525 @@
+# Parallel PFPGrowth discovers periodic-frequent patterns in a temporal database with the partition → conditional-transaction → local-tree plan of parallel FP-growth. The mining tasks run on a local process pool over a shared-memory copy of the database, or on Spark when requested.
+#
+# **Importing this algorithm into a python program**
+# ----------------------------------------------------
+#
+#             from PAMI.periodicFrequentPattern.parallel import parallelPFPGrowth as alg
+#
+#             obj = alg.parallelPFPGrowth(iFile, minSup, maxPer, numWorkers)
+#
+#             obj.mine()
+#
+#             periodicFrequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Periodic Frequent Patterns:", len(periodicFrequentPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.periodicFrequentPattern.parallel import abstract as _ab
+from PAMI.lazyImport import deprecated
+
+_ab._sys.setrecursionlimit(20000)
+
+
+def _periodicity(tids, lastTimestamp):
+    """
+    Maximum period of a pattern: the largest gap between consecutive timestamps, counting the gaps from 0 to the first
+    timestamp and from the last timestamp to the end of the database
+
+    :param tids: timestamps of the pattern
+    :type tids: list
+    :param lastTimestamp: end of the database
+    :type lastTimestamp: int
+    :return: the periodicity of the pattern
+    :rtype: int
+    """
+    return int(_ab._np.diff(_ab._np.sort(_ab._np.append(_ab._np.asarray(tids, dtype=_ab._np.int64), [0, lastTimestamp]))).max())
+
+
+class _Node:
+    """
+    A node of the local periodic-frequent tree
+
+    :Attributes:
+
+        item : int
+            Rank of the item stored in the node
+        parent : _Node
+            Parent of the node
+        children : dict
+            Children of the node keyed by item
+        tids : list
+            Timestamps of the transactions ending at the node
+    """
+    __slots__ = ('item', 'parent', 'children', 'tids')
+
+    def __init__(self, item, parent):
+        self.item = item
+        self.parent = parent
+        self.children = {}
+        self.tids = []
+
+
+class _Tree:
+    """
+    Local periodic-frequent tree built from the conditional transactions of one partition. Only the last node of a
+    transaction keeps its timestamps; they are pushed to the parent once the item of the node has been mined.
+
+    :Attributes:
+
+        root : _Node
+            Root of the tree
+        nodes : dict
+            Node links of every item
+    """
+
+    def __init__(self):
+        self.root = _Node(None, None)
+        self.nodes = {}
+
+    def add(self, transaction, tids):
+        """
+        Inserts a transaction whose items are sorted by rank
+
+        :param transaction: ranks of the items
+        :type transaction: list
+        :param tids: timestamps of the transaction
+        :type tids: list
+        """
+        node = self.root
+        for item in transaction:
+            child = node.children.get(item)
+            if child is None:
+                child = _Node(item, node)
+                node.children[item] = child
+                self.nodes.setdefault(item, []).append(child)
+            node = child
+        node.tids.extend(tids)
+
+    def conditionalTree(self, item, minSup, maxPer, lastTimestamp):
+        """
+        Builds the tree of the conditional pattern base of an item, keeping only the items that are periodic-frequent
+        in it
+
+        :param item: rank of the item
+        :type item: int
+        :param minSup: minimum support in count
+        :type minSup: int or float
+        :param maxPer: maximum periodicity
+        :type maxPer: int or float
+        :param lastTimestamp: end of the database
+        :type lastTimestamp: int
+        :return: the conditional tree
+        :rtype: _Tree
+        """
+        paths = []
+        itemTids = {}
+        for node in self.nodes[item]:
+            path = []
+            parent = node.parent
+            while parent.item is not None:
+                path.append(parent.item)
+                itemTids.setdefault(parent.item, []).extend(node.tids)
+                parent = parent.parent
+            if path:
+                path.reverse()
+                paths.append((path, node.tids))
+        keep = {x for x, tids in itemTids.items() if len(tids) >= minSup and _periodicity(tids, lastTimestamp) <= maxPer}
+        tree = _Tree()
+        for path, tids in paths:
+            path = [x for x in path if x in keep]
+            if path:
+                tree.add(path, tids)
+        return tree
+
+    def mine(self, minSup, maxPer, lastTimestamp, suffix, patterns, isResponsible=None):
+        """
+        Periodic-frequent pattern growth over the tree. Items are visited from the deepest rank upwards so that the
+        timestamps of a node already include those of its descendants.
+
+        :param minSup: minimum support in count
+        :type minSup: int or float
+        :param maxPer: maximum periodicity
+        :type maxPer: int or float
+        :param lastTimestamp: end of the database
+        :type lastTimestamp: int
+        :param suffix: ranks of the pattern the tree is conditioned on
+        :type suffix: tuple
+        :param patterns: receives every periodic-frequent pattern with its support and periodicity
+        :type patterns: dict
+        :param isResponsible: restricts the items of the first level, None for all items
+        :type isResponsible: callable
+        """
+        for item in sorted(self.nodes, reverse=True):
+            nodes = self.nodes[item]
+            if isResponsible is None or isResponsible(item):
+                tids = [tid for node in nodes for tid in node.tids]
+                if len(tids) >= minSup:
+                    periodicity = _periodicity(tids, lastTimestamp)
+                    if periodicity <= maxPer:
+                        pattern = (item,) + suffix
+                        patterns[pattern] = [len(tids), periodicity]
+                        conditional = self.conditionalTree(item, minSup, maxPer, lastTimestamp)
+                        if conditional.nodes:
+                            conditional.mine(minSup, maxPer, lastTimestamp, pattern, patterns)
+            for node in nodes:
+                node.parent.tids.extend(node.tids)
+
+
+def _minePartition(arrays, task):
+    """
+    Builds the local tree of a partition from the prefix of every transaction ending at its last item of the partition
+    and mines the patterns whose last item belongs to it
+
+    :param arrays: CSR encoding of the database and the timestamp of every transaction
+    :type arrays: dict
+    :param task: (partition, numPartitions, minSup, maxPer, lastTimestamp)
+    :type task: tuple
+    :return: patterns given as rank tuples with their support and periodicity
+    :rtype: dict
+    """
+    partition, numPartitions, minSup, maxPer, lastTimestamp = task
+    items, indptr, timestamps = arrays['items'], arrays['indptr'], arrays['timestamps']
+    patterns = {}
+    if len(indptr) < 2:
+        return patterns
+    positions = _ab._np.where(items % numPartitions == partition, _ab._np.arange(len(items)), -1)
+    last = _ab._np.maximum.reduceat(positions, indptr[:-1])
+    items = items.tolist()
+    tree = _Tree()
+    for row in _ab._np.flatnonzero(last >= 0).tolist():
+        tree.add(items[indptr[row]:last[row] + 1], [int(timestamps[row])])
+    tree.mine(minSup, maxPer, lastTimestamp, (), patterns, lambda item: item % numPartitions == partition)
+    return patterns
+
+
+class parallelPFPGrowth(_ab._periodicFrequentPatterns):
+    """
+    :Description: ParallelPFPGrowth is one of the fundamental distributed algorithm to discover periodic-frequent patterns in a transactional database.
+                  The frequent items are ranked by support and split into numWorkers groups. Every group becomes a task that
+                  scans the shared database, keeps the prefix of each transaction ending at its last item of the group, builds a
+                  local tree whose tail nodes keep the timestamps of these conditional transactions and mines the patterns whose
+                  least frequent item is in the group. The tasks run on a process pool that maps the database from shared memory,
+                  or on Spark with backend='spark'.
+
+    :Reference: C. Saideep, R. Uday Kiran, Koji Zettsu, Cheng-Wei Wu, P. Krishna Reddy, Masashi Toyoda, Masaru Kitsuregawa: Parallel Mining of Partial Periodic Itemsets in Big Data. IEA/AIE 2020: 807-819
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of periodic frequent pattern's
+    :param  oFile: str :
+                   Name of the output file to store complete set of periodic frequent pattern's
+    :param  minSup: int :
+                   The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
+    :param  maxPer: int :
+                   Controls the maximum number of transactions in which any two items within a pattern can reappear.
+    :param  numWorkers: int :
+                   The number of worker processes and of item partitions
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   Execution backend of the partition tasks: 'process' (default), 'spark' or 'inline'
+
+
+    :Attributes:
+
+        startTime : float
+          To record the start time of the mining process
+
+        endTime : float
+          To record the completion time of the mining process
+
+        finalPatterns : dict
+          Storing the complete set of patterns in a dictionary variable
+
+        memoryUSS : float
+          To store the total amount of USS memory consumed by the program
+
+        memoryRSS : float
+          To store the total amount of RSS memory consumed by the program
+
+        lno : int
+                the number of transactions
+
+    **Methods to execute code on terminal**
+    ----------------------------------------------------
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 parallelPFPGrowth.py <inputFile> <outputFile> <minSup> <maxPer> <numWorkers>
+
+      Example Usage:
+
+      (.venv) $ python3 parallelPFPGrowth.py sampleTDB.txt patterns.txt 0.3 0.4 3
+
+    .. note:: minSup will be considered in percentage of database transactions
+
+
+    **Importing this algorithm into a python program**
+    ----------------------------------------------------
+    .. code-block:: python
+
+                    from PAMI.periodicFrequentPattern.parallel import parallelPFPGrowth as alg
+
+                    obj = alg.parallelPFPGrowth(iFile, minSup, maxPer, numWorkers)
+
+                    obj.mine()
+
+                    periodicFrequentPatterns = obj.getPatterns()
+
+                    print("Total number of Periodic Frequent Patterns:", len(periodicFrequentPatterns))
+
+                    obj.save(oFile)
+
+                    Df = obj.getPatternsAsDataFrame()
+
+                    memUSS = obj.getMemoryUSS()
+
+                    print("Total Memory in USS:", memUSS)
+
+                    memRSS = obj.getMemoryRSS()
+
+                    print("Total Memory in RSS", memRSS)
+
+                    run = obj.getRuntime()
+
+                    print("Total ExecutionTime in seconds:", run)
+
+
+    **Credits:**
+    ----------------------------------------------------
+
+             The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    _minSup = float()
+    _maxPer = float()
+    _numWorkers = int()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _lno = int()
+    _maxTS = int()
+    _Database = []
+
+    def __init__(self, iFile, minSup, maxPer, numWorkers=1, sep='\t', backend='process'):
+        super().__init__(iFile, minSup, maxPer, numWorkers, sep, backend)
+
+    def _creatingItemSets(self):
+        """
+        Storing the complete transactions of the database/input file in a database variable. The first entry of every
+        transaction is its timestamp. The last timestamp of the database is kept in _maxTS.
+        """
+        self._Database = []
+        if isinstance(self._iFile, _ab._pd.DataFrame):
+            data, ts = [], []
+            if self._iFile.empty:
+                print("its empty..")
+            i = self._iFile.columns.values.tolist()
+            if 'TS' in i:
+                ts = self._iFile['TS'].tolist()
+            if 'Transactions' in i:
+                data = self._iFile['Transactions'].tolist()
+            for i in range(len(data)):
+                self._Database.append([ts[i]] + data[i])
+        if isinstance(self._iFile, str):
+            if _ab._validators.url(self._iFile):
+                data = _ab._urlopen(self._iFile)
+                for line in data:
+                    line = line.decode("utf-8")
+                    temp = [i.rstrip() for i in line.split(self._sep)]
+                    temp = [x for x in temp if x]
+                    self._Database.append(temp)
+            else:
+                try:
+                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            temp = [i.rstrip() for i in line.split(self._sep)]
+                            temp = [x for x in temp if x]
+                            self._Database.append(temp)
+                except IOError:
+                    print("File Not Found")
+                    quit()
+        self._Database = [line for line in self._Database if line]
+        self._lno = len(self._Database)
+        self._maxTS = max((int(line[0]) for line in self._Database), default=0)
+
+    def _convert(self, value):
+        """
+        To convert the given user specified value
+
+        :param value: user specified value
+        :return: converted value
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._lno * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._lno * value)
+            else:
+                value = int(value)
+        return value
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self):
+        """
+        Periodic-frequent pattern mining process will start from here
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Periodic-frequent pattern mining process will start from here
+        """
+        self._startTime = _ab._time.time()
+        self._finalPatterns = {}
+        self._creatingItemSets()
+        self._minSup = self._convert(self._minSup)
+        self._maxPer = self._convert(self._maxPer)
+        items, supports, arrays = _ab._backends.encodeTransactions([line[1:] for line in self._Database], self._minSup)
+        arrays['timestamps'] = _ab._np.asarray([int(self._Database[row][0]) for row in arrays['rows'].tolist()],
+                                               dtype=_ab._np.int64)
+        numPartitions = max(1, min(self._numWorkers, len(items)))
+        tasks = [(partition, numPartitions, self._minSup, self._maxPer, self._maxTS) for partition in range(numPartitions)]
+        with _ab._backends.openSession(self._backend, arrays, self._numWorkers) as session:
+            results = session.map(_minePartition, tasks)
+        for patterns in results:
+            for pattern, value in patterns.items():
+                self._finalPatterns["\t".join(items[i] for i in sorted(pattern))] = value
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Periodic Frequent patterns were generated successfully using Parallel PFPGrowth algorithm")
+
+    def getMemoryUSS(self):
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryUSS
+
+    def getMemoryRSS(self):
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryRSS
+
+    def getRuntime(self):
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self):
+        """
+        Storing final periodic-frequent patterns in a dataframe
+
+        :return: returning periodic-frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+        data = [[a.replace('\t', ' '), b[0], b[1]] for a, b in self._finalPatterns.items()]
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Support', 'Periodicity'])
+
+    def save(self, outFile):
+        """
+        Complete set of periodic-frequent patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csv file
+        """
+        self._oFile = outFile
+        with open(self._oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                writer.write("%s:%s:%s\n" % (x, y[0], y[1]))
+
+    def getPatterns(self):
+        """
+        Function to send the set of periodic-frequent patterns after completion of the mining process
+
+        :return: returning periodic-frequent patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def printResults(self):
+        """
+        This function is used to print the results
+        """
+        print("Total number of Periodic Frequent Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 6 or len(_ab._sys.argv) == 7:
+        if len(_ab._sys.argv) == 7:
+            _ap = parallelPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5],
+                                    _ab._sys.argv[6])
+        if len(_ab._sys.argv) == 6:
+            _ap = parallelPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
+        _ap.mine()
+        print("Total number of Periodic Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
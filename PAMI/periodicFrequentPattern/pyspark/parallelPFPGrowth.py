@@ -51,11 +51,13 @@ __copyright__ = """
 """
 
 from PAMI.periodicFrequentPattern.pyspark import abstract as _ab
-from pyspark import SparkContext, SparkConf
+from PAMI import lazyImport as _lazyImport
+SparkContext = _lazyImport.lazyAttribute('pyspark', 'SparkContext')
+SparkConf = _lazyImport.lazyAttribute('pyspark', 'SparkConf')
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 _maxPer = float()
 _minSup = float()
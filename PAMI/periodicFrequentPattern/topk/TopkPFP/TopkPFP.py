@@ -2,11 +2,11 @@
 # --------------------------------------------------------
 #
 #
-#             import PAMI.periodicFrequentPattern.topk.TopkPFPGrowth as alg
+#             import PAMI.periodicFrequentPattern.topk.TopkPFP.TopkPFP as alg
 #
 #             obj = alg.TopkPFPGrowth(iFile, k, maxPer,oFile)
 #
-#             obj.startMine()
+#             obj.mine()
 #
 #             periodicFrequentPatterns = obj.getPatterns()
 #
@@ -50,9 +50,12 @@ __copyright__ = """
 
 """
 
-from PAMI.periodicFrequentPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+from PAMI.periodicFrequentPattern.topk.TopkPFP import abstract as _ab
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+from PAMI.periodicFrequentPattern.topk import topkEngine as _engine
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 
 class TopkPFPGrowth(_ab._periodicFrequentPatterns):
@@ -96,7 +99,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
 
     :Methods:
 
-        startMine()
+        mine()
             Mining process will start from here
         getPatterns()
             Complete set of patterns will be retrieved with this function
@@ -112,12 +115,8 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
             Total amount of runtime taken by the mining process will be retrieved from this function
         creatingItemSets()
             Scans the dataset or dataframes and stores in list format
-        frequentOneItem()
-            Generates one frequent patterns
-        eclatGeneration(candidateList)
-            It will generate the combinations of frequent items
-        generateFrequentPatterns(tidList)
-            It will generate the combinations of frequent items from a list of items
+        convert(value)
+            Converts a user specified value into a count
 
     **Executing the code on terminal:**
     -------------------------------------
@@ -137,11 +136,11 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
     ---------------------------------------
     .. code-block:: python
 
-            import PAMI.periodicFrequentPattern.topk.TopkPFPGrowth as alg
+            import PAMI.periodicFrequentPattern.topk.TopkPFP.TopkPFP as alg
 
             obj = alg.TopkPFPGrowth(iFile, k, maxPer)
 
-            obj.startMine()
+            obj.mine()
 
             periodicFrequentPatterns = obj.getPatterns()
 
@@ -180,10 +179,6 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _Database = []
-    _tidList = {}
-    _lno = int()
-    _minimum = int()
-    _mapSupport = {}
 
     def _creatingItemSets(self):
         """
@@ -246,141 +241,10 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
                 value = int(value)
         return value
 
-    def _frequentOneItem(self):
+    def mine(self):
         """
-        Generating one frequent patterns
-        """
-
-        self._mapSupport = {}
-        self._tidList = {}
-        n = 0
-        for line in self._Database:
-            self._lno += 1
-            n = int(line[0])
-            for i in range(1, len(line)):
-                si = line[i]
-                if self._mapSupport.get(si) is None:
-                    self._mapSupport[si] = [1, abs(0 - n), n]
-                    self._tidList[si] = [n]
-                else:
-                    self._mapSupport[si][0] += 1
-                    self._mapSupport[si][1] = max(self._mapSupport[si][1], abs(n - self._mapSupport[si][2]))
-                    self._mapSupport[si][2] = n
-                    self._tidList[si].append(n)
-        for x, y in self._mapSupport.items():
-            self._mapSupport[x][1] = max(self._mapSupport[x][1], abs(n - self._mapSupport[x][2]))
-        self._maxPer = self._convert(self._maxPer)
-        self._k = self._convert(self._k)
-        self._mapSupport = {k: [v[0], v[1]] for k, v in self._mapSupport.items() if v[1] <= self._maxPer}
-        plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x: (x[1][0], x[0]), reverse=True)]
-        self._finalPatterns = {}
-        #print(len(plist))
-        for i in plist:
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = [self._mapSupport[i][0], self._mapSupport[i][1]]
-        self._minimum = min([self._finalPatterns[i][0] for i in self._finalPatterns.keys()])
-        plist = list(self._finalPatterns.keys())
-        return plist
-
-    def _getSupportAndPeriod(self, timeStamps):
-        """To calculate the periodicity and support
-
-        :param timeStamps: Timestamps of an item set
-        :return: support, periodicity
-        """
-
-        global lno
-        timeStamps.sort()
-        cur = 0
-        per = list()
-        sup = 0
-        for j in range(len(timeStamps)):
-            per.append(timeStamps[j] - cur)
-            cur = timeStamps[j]
-            sup += 1
-        per.append(self._lno - cur)
-        if len(per) == 0:
-            return [0, 0]
-        return [sup, max(per)]
-
-    def _save(self, prefix, suffix, tidSetI):
-        """Saves the patterns that satisfy the periodic frequent property.
-
-        :param prefix: the prefix of a pattern
-        :type prefix: list
-        :param suffix: the suffix of a patterns
-        :type suffix: list
-        :param tidSetI: the timestamp of a patterns
-        :type tidSetI: list
-        """
-
-        if prefix is None:
-            prefix = suffix
-        else:
-            prefix = prefix + suffix
-        val = self._getSupportAndPeriod(tidSetI)
-        sample = str()
-        for i in prefix:
-            sample = sample + i + " "
-        if len(self._finalPatterns) < self._k:
-            if val[0] >= self._minimum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in
-                                  sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._minimum = min([self._finalPatterns[i][0] for i in self._finalPatterns.keys()])
-        else:
-            for x, y in sorted(self._finalPatterns.items(), key=lambda x: x[1][0]):
-                if val[0] > y[0]:
-                    del self._finalPatterns[x]
-                    self._finalPatterns[x] = y
-                    self._finalPatterns = {k: v for k, v in
-                                          sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                    self._minimum = min([self._finalPatterns[i][0] for i in self._finalPatterns.keys()])
-                    return
-
-    def _Generation(self, prefix, itemSets, tidSets):
-        """
-        Equivalence class is followed  and checks for the patterns generated for periodic-frequent patterns.
-
-        :param prefix:  main equivalence prefix
-        :type prefix: periodic-frequent item or pattern
-        :param itemSets: patterns which are items combined with prefix and satisfying the periodicity
-                            and frequent with their timestamps
-        :type itemSets: list
-        :param tidSets: timestamps of the items in the argument itemSets
-        :type tidSets: list
-        """
-        if len(itemSets) == 1:
-            i = itemSets[0]
-            tidI = tidSets[0]
-            self._save(prefix, [i], tidI)
-            return
-        for i in range(len(itemSets)):
-            itemI = itemSets[i]
-            if itemI is None:
-                continue
-            tidSetI = tidSets[i]
-            classItemSets = []
-            classTidSets = []
-            itemSetX = [itemI]
-            for j in range(i + 1, len(itemSets)):
-                itemJ = itemSets[j]
-                tidSetJ = tidSets[j]
-                y = list(set(tidSetI).intersection(tidSetJ))
-                val = self._getSupportAndPeriod(y)
-                if val[0] >= self._minimum and val[1] <= self._maxPer:
-                    classItemSets.append(itemJ)
-                    classTidSets.append(y)
-            newPrefix = list(set(itemSetX)) + prefix
-            self._Generation(newPrefix, classItemSets, classTidSets)
-            self._save(prefix, list(set(itemSetX)), tidSetI)
-
-    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
-    def startMine(self):
-        """
-        Main function of the program
+        Main function of the program. The patterns are searched depth first with a bounded heap of the k most frequent
+        patterns found so far; once it is full the support of its worst pattern becomes the effective minimum support.
         """
         self._startTime = _ab._time.time()
         if self._iFile is None:
@@ -388,22 +252,12 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
         if self._k is None:
             raise Exception("Please enter the Minimum Support")
         self._creatingItemSets()
-        _plist = self._frequentOneItem()
-        for i in range(len(_plist)):
-            itemI = _plist[i]
-            tidSetI = self._tidList[itemI]
-            itemSetX = [itemI]
-            itemSets = []
-            tidSets = []
-            for j in range(i + 1, len(_plist)):
-                itemJ = _plist[j]
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetI).intersection(tidSetJ))
-                val = self._getSupportAndPeriod(y1)
-                if val[0] >= self._minimum and val[1] <= self._maxPer:
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-            self._Generation(itemSetX, itemSets, tidSets)
+        self._maxPer = self._convert(self._maxPer)
+        self._k = self._convert(self._k)
+        items, timestamps, last = _pm.itemTimestamps(self._Database)
+        self._finalPatterns = {}
+        for pattern, support, periodicity in _engine.mine(timestamps, self._k, last, self._maxPer):
+            self._finalPatterns["\t".join(items[item] for item in pattern)] = [support, periodicity]
         print("TopK Periodic Frequent patterns were generated successfully")
         self._endTime = _ab._time.time()
         _process = _ab._psutil.Process(_ab._os.getpid())
@@ -412,39 +266,18 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
         self._memoryUSS = _process.memory_full_info().uss
         self._memoryRSS = _process.memory_info().rss
 
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
+    def startMine(self):
+        """
+        Main function of the program
+        """
+        self.mine()
+
     def Mine(self):
         """
         Main function of the program
         """
-        self._startTime = _ab._time.time()
-        if self._iFile is None:
-            raise Exception("Please enter the file path or file name:")
-        if self._k is None:
-            raise Exception("Please enter the Minimum Support")
-        self._creatingItemSets()
-        _plist = self._frequentOneItem()
-        for i in range(len(_plist)):
-            itemI = _plist[i]
-            tidSetI = self._tidList[itemI]
-            itemSetX = [itemI]
-            itemSets = []
-            tidSets = []
-            for j in range(i + 1, len(_plist)):
-                itemJ = _plist[j]
-                tidSetJ = self._tidList[itemJ]
-                y1 = list(set(tidSetI).intersection(tidSetJ))
-                val = self._getSupportAndPeriod(y1)
-                if val[0] >= self._minimum and val[1] <= self._maxPer:
-                    itemSets.append(itemJ)
-                    tidSets.append(y1)
-            self._Generation(itemSetX, itemSets, tidSets)
-        print("TopK Periodic Frequent patterns were generated successfully")
-        self._endTime = _ab._time.time()
-        _process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryRSS = float()
-        self._memoryUSS = float()
-        self._memoryUSS = _process.memory_full_info().uss
-        self._memoryRSS = _process.memory_info().rss
+        self.mine()
 
     def getMemoryUSS(self):
         """Total amount of USS memory consumed by the mining process will be retrieved from this function
@@ -497,7 +330,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
         self._oFile = outFile
         writer = open(self._oFile, 'w+')
         for x, y in self._finalPatterns.items():
-            patternsAndSupport = x.replace(' ', '\t') + ":" + f'{y[0]}:{y[1]}'
+            patternsAndSupport = x + ":" + f'{y[0]}:{y[1]}'
             writer.write("%s \n" % patternsAndSupport)
 
     def getPatterns(self):
@@ -522,7 +355,7 @@ if __name__ == "__main__":
             _ap = TopkPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
         if len(_ab._sys.argv) == 5:
             _ap = TopkPFPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
-        _ap.startMine()
+        _ap.mine()
         print("Top K Periodic-Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
         print("Total Memory in USS:",  _ap.getMemoryUSS())
@@ -0,0 +1,154 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Top-k search shared by the top-k periodic-frequent miners.
+
+The k best patterns found so far are kept in a bounded min-heap whose root is the worst of them. Patterns are ranked
+either by support (the larger the better) or by periodicity (the smaller the better). As soon as the heap holds k
+patterns the root becomes a threshold: a pattern enters the heap only if it is strictly better than the root, and
+both support and periodicity are anti-monotone, so an extension that cannot beat the root is dropped together with all
+its supersets.
+
+The items are visited best first, so the threshold rises early. The search is depth first over sorted timestamp
+arrays: the timestamps of every item are views into one flat array, the timestamps of an extension are intersected
+from the arrays of its parents, and an extension that keeps all the timestamps of its parent shares the parent array.
+The intersection gives up as soon as a gap exceeds the periodicity limit or the timestamps left cannot reach the
+support limit.
+
+.. code-block:: python
+
+        from PAMI.periodicFrequentPattern.basic import periodicityMeasures as pm
+        from PAMI.periodicFrequentPattern.topk import topkEngine as engine
+
+        items, timestamps, last = pm.itemTimestamps(database)
+
+        for pattern, support, periodicity in engine.mine(timestamps, k, last, maxPer=maxPer):
+            print([items[item] for item in pattern], support, periodicity)
+"""
+
+import heapq as _heapq
+import numpy as _np
+from typing import List, Tuple
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+
+rankings = ('support', 'periodicity')
+
+
+class _TopK:
+    """
+    Bounded min-heap of the k best patterns. Among patterns of equal rank the one found first is kept.
+    """
+
+    def __init__(self, k: int, rankBy: str, maxPer: float) -> None:
+        self._k = k
+        self._bySupport = rankBy == 'support'
+        self._maxPer = maxPer
+        self._entries = []
+        self._count = 0
+
+    def _rank(self, support: int, periodicity: int) -> int:
+        return support if self._bySupport else -periodicity
+
+    def limits(self) -> Tuple[float, float]:
+        """
+        :return: the smallest support and the largest periodicity a new pattern needs to enter the heap
+        """
+        if len(self._entries) < self._k:
+            return 1, self._maxPer
+        worst = self._entries[0][0]
+        if self._bySupport:
+            return worst + 1, self._maxPer
+        return 1, min(self._maxPer, -worst - 1)
+
+    def admits(self, support: int, periodicity: int) -> bool:
+        minSup, maxPer = self.limits()
+        return support >= minSup and periodicity <= maxPer
+
+    def push(self, pattern: tuple, support: int, periodicity: int) -> None:
+        if not self.admits(support, periodicity):
+            return
+        self._count += 1
+        entry = (self._rank(support, periodicity), -self._count, pattern, support, periodicity)
+        if len(self._entries) < self._k:
+            _heapq.heappush(self._entries, entry)
+        else:
+            _heapq.heapreplace(self._entries, entry)
+
+    def patterns(self) -> List[Tuple[tuple, int, int]]:
+        return [entry[2:] for entry in sorted(self._entries, reverse=True)]
+
+
+def _search(prefix: tuple, members: list, heap: _TopK, last: int) -> None:
+    """
+    Depth-first search of the equivalence class of a prefix
+
+    :param members: (item, timestamps, periodicity) of the extensions of the prefix, best first
+    """
+    for i in range(len(members)):
+        item, timestamps, periodicity = members[i]
+        if not heap.admits(len(timestamps), periodicity):
+            continue
+        pattern = prefix + (item,)
+        extensions = []
+        for other, otherTimestamps, otherPeriodicity in members[i + 1:]:
+            minSup, maxPer = heap.limits()
+            if min(len(timestamps), len(otherTimestamps)) < minSup or max(periodicity, otherPeriodicity) > maxPer:
+                continue
+            result = _pm.intersect(timestamps, otherTimestamps, minSup, maxPer, last)
+            if result is None:
+                continue
+            heap.push(pattern + (other,), len(result[0]), result[1])
+            extensions.append((other, result[0], result[1]))
+        if extensions:
+            _search(pattern, extensions, heap, last)
+
+
+def mine(timestamps: List[_np.ndarray], k: int, last: int, maxPer: float = float('inf'),
+         rankBy: str = 'support') -> List[Tuple[tuple, int, int]]:
+    """
+    Top-k periodic-frequent patterns
+
+    :param timestamps: sorted timestamps of every item
+    :type timestamps: list
+    :param k: number of patterns to find
+    :type k: int
+    :param last: last timestamp of the database
+    :type last: int
+    :param maxPer: maximum periodicity of a pattern
+    :type maxPer: int or float
+    :param rankBy: 'support' to find the most frequent patterns or 'periodicity' to find the most periodic ones
+    :type rankBy: str
+    :return: (item indexes, support, periodicity) of the patterns, best first
+    :rtype: list
+    """
+    if rankBy not in rankings:
+        raise ValueError("rankBy must be one of " + ", ".join(rankings))
+    if int(k) < 1 or len(timestamps) == 0:
+        return []
+    heap = _TopK(int(k), rankBy, maxPer)
+    periods = _pm.batchMaxPeriod(timestamps, last)
+    supports = _np.fromiter((len(x) for x in timestamps), dtype=_np.int64, count=len(timestamps))
+    if rankBy == 'support':
+        order = _np.lexsort((_np.arange(len(timestamps)), -supports))
+    else:
+        order = _np.lexsort((_np.arange(len(timestamps)), periods))
+    members = []
+    for item in order.tolist():
+        if periods[item] <= maxPer:
+            heap.push((item,), int(supports[item]), int(periods[item]))
+            members.append((item, timestamps[item], int(periods[item])))
+    _search((), members, heap, last)
+    return heap.patterns()
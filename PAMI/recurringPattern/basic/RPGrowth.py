@@ -3,11 +3,11 @@
 # --------------------------------------------------------
 #
 #
-#             from PAMI.periodicFrequentPattern.recurring import RPGrowth as alg
+#             from PAMI.recurringPattern.basic import RPGrowth as alg
 #
 #             obj = alg.RPGrowth(iFile, maxPer, minPS, minRec)
 #
-#             obj.startMine()
+#             obj.mine()
 #
 #             periodicFrequentPatterns = obj.getPatterns()
 #
@@ -51,14 +51,43 @@ __copyright__ = """
 """
 
 from PAMI.recurringPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
-from PAMI.recurringPattern.basic import abstract as _ab
+from PAMI.lazyImport import deprecated
+
+
+def _merge(timeStamps):
+    """
+    k-way merge of sorted timestamp arrays
+
+    :param timeStamps: sorted int64 arrays
+    :type timeStamps: list
+    :return: the merged sorted array
+    :rtype: numpy.ndarray
+    """
+    if len(timeStamps) == 1:
+        return timeStamps[0]
+    if len(timeStamps) == 0:
+        return _ab._np.zeros(0, dtype=_ab._np.int64)
+    return _ab._np.sort(_ab._np.concatenate(timeStamps), kind='stable')
 
-_maxPer = float()
-_minPS = float()
-_minRec = float()
-_lno = int()
+
+def _recurrences(timeStamps, maxPer, minPS):
+    """
+    Splits the sorted timestamps of a pattern into periodic intervals in one pass and keeps those with at least minPS
+    timestamps
+
+    :param timeStamps: sorted timestamps of a pattern
+    :type timeStamps: numpy.ndarray
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param minPS: minimum periodic support
+    :type minPS: int or float
+    :return: recurring intervals with corresponding periodic support, summation of support of periodic intervals, support
+    :rtype: list
+    """
+    summaries = _ab._pm.periodSummaries(timeStamps, maxPer)
+    summaries = summaries[summaries['sup'] >= minPS]
+    recli = _ab._np.column_stack((summaries['start'], summaries['end'], summaries['sup'])).tolist()
+    return [recli, int(summaries['sup'].sum()), len(timeStamps)]
 
 
 class _Node(object):
@@ -70,7 +99,7 @@ class _Node(object):
             item : int or None
                 Storing item of a node
             timeStamps : list
-                To maintain the timestamps of a database at the end of the branch
+                Sorted timestamp arrays of the transactions ending at the node, merged when they are read
             parent : node
                 To maintain the parent of every node
             children : list
@@ -119,6 +148,12 @@ class _Tree(object):
                 Storing the nodes with same item name
             info : dictionary
                 Stores the support of the items
+            maxPer : int or float
+                maximum periodicity
+            minPS : int or float
+                minimum periodic support
+            minRec : int
+                minimum recurrence
 
         :Methods:
 
@@ -136,10 +171,13 @@ class _Tree(object):
 
         """
 
-    def __init__(self):
+    def __init__(self, maxPer, minPS, minRec):
         self.root = _Node(None, {})
         self.summaries = {}
         self.info = {}
+        self.maxPer = maxPer
+        self.minPS = minPS
+        self.minRec = minRec
 
     def addTransaction(self, transaction, tid):
         """
@@ -147,8 +185,8 @@ class _Tree(object):
 
         :param transaction: To represent the complete database
         :type transaction: list
-        :param tid: To represent the timestamp of a database
-        :type tid: list
+        :param tid: To represent the sorted timestamps of the transaction
+        :type tid: numpy.ndarray
         :return: rp-tree
         """
 
@@ -164,7 +202,7 @@ class _Tree(object):
                 currentNode = newNode
             else:
                 currentNode = currentNode.children[transaction[i]]
-        currentNode.timeStamps = currentNode.timeStamps + tid
+        currentNode.timeStamps.append(tid)
 
     def getConditionalPatterns(self, alpha):
         """
@@ -177,7 +215,7 @@ class _Tree(object):
         finalPatterns = []
         finalSets = []
         for i in self.summaries[alpha]:
-            set1 = i.timeStamps
+            set1 = self.generateTimeStamps(i)
             set2 = []
             while i.parent.item is not None:
                 set2.append(i.parent.item)
@@ -198,7 +236,8 @@ class _Tree(object):
         :return: Timestamps of a node
         """
 
-        finalTimeStamps = node.timeStamps
+        finalTimeStamps = _merge(node.timeStamps)
+        node.timeStamps = [finalTimeStamps]
         return finalTimeStamps
 
     def removeNode(self, nodeValue):
@@ -211,7 +250,7 @@ class _Tree(object):
         """
 
         for i in self.summaries[nodeValue]:
-            i.parent.timeStamps = i.parent.timeStamps + i.timeStamps
+            i.parent.timeStamps.extend(i.timeStamps)
             del i.parent.children[nodeValue]
 
     def getTimeStamps(self, alpha):
@@ -221,48 +260,16 @@ class _Tree(object):
         :param alpha: Node in a tree
         :return: Timestamps of a  node
         """
-        temporary = []
-        for i in self.summaries[alpha]:
-            temporary += i.timeStamps
-        return temporary
+        return _merge([ts for i in self.summaries[alpha] for ts in i.timeStamps])
 
-    @staticmethod
-    def getSupportAndPeriod(timeStamps):
+    def getSupportAndPeriod(self, timeStamps):
         """
         To calculate the recurrence and support
 
-        :param timeStamps: Timestamps of an item set
+        :param timeStamps: sorted timestamps of an item set
         :return: recurring intervals with corresponding periodic support, summation of support of periodic intervals, support
         """
-
-        global _maxPer,_minPS
-        timeStamps.sort()
-        cur = ' '
-        st = ' '
-        end = ' '
-        if len(timeStamps) > 0:
-            cur = timeStamps[0]
-            st = timeStamps[0]
-            end = timeStamps[0]
-        ps = 0
-        lps = 1
-        recli = []
-        for i in range(1, len(timeStamps)):
-            if abs(timeStamps[i] - cur) <= _maxPer:
-                lps += 1
-            else:
-                if lps >= _minPS:
-                    recli.append([st, end, lps])
-                    ps += lps
-                lps = 1
-                st = timeStamps[i]
-            cur = timeStamps[i]
-            end = cur
-        if lps >= _minPS:
-            recli.append([st, end, lps])
-            ps+=lps
-        # print(recli)
-        return [recli, ps, len(timeStamps)]
+        return _recurrences(timeStamps, self.maxPer, self.minPS)
 
     def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps):
         """
@@ -274,22 +281,16 @@ class _Tree(object):
         :type conditionalTimeStamps: list
         :returns: Returns conditional transactions by removing non recurring items
         """
-
-        global _maxPer, _minPS, _minRec
         pat = []
         timeStamps = []
         data1 = {}
         for i in range(len(conditionalPatterns)):
             for j in conditionalPatterns[i]:
-                if j in data1:
-                    data1[j] = data1[j] + conditionalTimeStamps[i]
-                else:
-                    data1[j] = conditionalTimeStamps[i]
+                data1.setdefault(j, []).append(conditionalTimeStamps[i])
         updatedDictionary = {}
         for m in data1:
-            updatedDictionary[m] = self.getSupportAndPeriod(data1[m])
-        # print(updatedDictionary)
-        updatedDictionary = {k: [v[0],v[2]] for k, v in updatedDictionary.items() if v[1] >= (_minPS*_minRec)}
+            updatedDictionary[m] = self.getSupportAndPeriod(_merge(data1[m]))
+        updatedDictionary = {k: [v[0], v[2]] for k, v in updatedDictionary.items() if v[1] >= (self.minPS * self.minRec)}
         count = 0
         for p in conditionalPatterns:
             p1 = [v for v in p if v in updatedDictionary]
@@ -300,31 +301,64 @@ class _Tree(object):
             count += 1
         return pat, timeStamps, updatedDictionary
 
-    def generatePatterns(self, prefix):
+    def generatePatterns(self, prefix, isResponsible=None):
         """
         Generates the patterns
 
         :param prefix: Forms the combination of items
         :type prefix: list
+        :param isResponsible: restricts the items mined at this level, None for all items. The other items are still
+                              removed so that their timestamps reach their parents.
+        :type isResponsible: callable
         :returns: yields patterns with their recurrence and support
         """
-        global _minRec
         for i in sorted(self.summaries, key=lambda x: (self.info.get(x)[1], -x)):
-            pattern = prefix[:]
-            pattern.append(i)
-            if len(self.info.get(i)[0]) >= _minRec:
-                yield pattern, self.info[i]
-            patterns, timeStamps, info = self.getConditionalPatterns(i)
-            conditionalTree = _Tree()
-            conditionalTree.info = info.copy()
-            for pat in range(len(patterns)):
-                conditionalTree.addTransaction(patterns[pat], timeStamps[pat])
-            if len(patterns) > 0:
-                for q in conditionalTree.generatePatterns(pattern):
-                    yield q
+            if isResponsible is None or isResponsible(i):
+                pattern = prefix[:]
+                pattern.append(i)
+                if len(self.info.get(i)[0]) >= self.minRec:
+                    yield pattern, self.info[i]
+                patterns, timeStamps, info = self.getConditionalPatterns(i)
+                conditionalTree = _Tree(self.maxPer, self.minPS, self.minRec)
+                conditionalTree.info = info.copy()
+                for pat in range(len(patterns)):
+                    conditionalTree.addTransaction(patterns[pat], timeStamps[pat])
+                if len(patterns) > 0:
+                    for q in conditionalTree.generatePatterns(pattern):
+                        yield q
             self.removeNode(i)
 
 
+def _mineSuffixes(arrays, task):
+    """
+    Builds the tree of a group of suffix items from the prefix of every transaction ending at its last item of the
+    group and mines the patterns whose first item belongs to the group
+
+    :param arrays: CSR encoding of the ranked database and the timestamp of every transaction
+    :type arrays: dict
+    :param task: (partition, numPartitions, maxPer, minPS, minRec, info)
+    :type task: tuple
+    :return: patterns given as rank lists with their recurring intervals and support
+    :rtype: list
+    """
+    partition, numPartitions, maxPer, minPS, minRec, info = task
+    items, indptr, timestamps = arrays['items'], arrays['indptr'], arrays['timestamps']
+    if len(indptr) < 2:
+        return []
+    positions = _ab._np.where(items % numPartitions == partition, _ab._np.arange(len(items)), -1)
+    last = _ab._np.maximum.reduceat(positions, indptr[:-1]).tolist()
+    items, indptr, timestamps = items.tolist(), indptr.tolist(), timestamps.tolist()
+    paths = {}
+    for row in range(len(last)):
+        if last[row] >= 0:
+            paths.setdefault(tuple(items[indptr[row]:last[row] + 1]), []).append(timestamps[row])
+    tree = _Tree(maxPer, minPS, minRec)
+    tree.info = info
+    for path, ts in paths.items():
+        tree.addTransaction(list(path), _ab._pm.asTimestamps(ts, unique=False))
+    return list(tree.generatePatterns([], lambda item: item % numPartitions == partition))
+
+
 class RPGrowth(_ab._recurringPatterns):
     """
     :Description:   RPGrowth is one of the fundamental algorithm to discover recurring patterns in a transactional database.
@@ -344,6 +378,10 @@ class RPGrowth(_ab._recurringPatterns):
                    It represent a maximum percentage or some other numeric value.
     :param  minRec: str :
                    It could represent a minimum recommended value or some other string-based setting.
+    :param  numWorkers: int :
+                   The number of worker processes. The suffix items are split into this many groups, each mined on its own tree.
+    :param  backend: str :
+                   Execution backend of the groups: 'process' (default), 'spark' or 'inline'
 
     :Attributes:
 
@@ -389,7 +427,7 @@ class RPGrowth(_ab._recurringPatterns):
 
     :Methods:
 
-        startMine()
+        mine()
             Mining process will start from here
         getPatterns()
             Complete set of patterns will be retrieved with this function
@@ -409,8 +447,8 @@ class RPGrowth(_ab._recurringPatterns):
             Extracts the possible recurring items of size one from database
         updateDatabases()
             Update the database by removing non recurring items and sort the Database by item decreased support
-        buildTree()
-            After updating the Database, remaining items will be added into the tree by setting root node as null
+        encodeDatabase()
+            After updating the Database, the transactions are encoded as arrays shared with the mining tasks
         convert()
             to convert the user specified value
 
@@ -434,11 +472,11 @@ class RPGrowth(_ab._recurringPatterns):
     --------------------------------------------------------
     .. code-block:: python
 
-                from PAMI.periodicFrequentPattern.recurring import RPGrowth as alg
+                from PAMI.recurringPattern.basic import RPGrowth as alg
 
                 obj = alg.RPGrowth(iFile, maxPer, minPS, minRec)
 
-                obj.startMine()
+                obj.mine()
 
                 periodicFrequentPatterns = obj.getPatterns()
 
@@ -521,32 +559,15 @@ class RPGrowth(_ab._recurringPatterns):
 
         :return: return the RP-list
         """
-        #global rank
-        data = {}
+        timeStamps = {}
         for tr in self._Database:
             for i in range(1, len(tr)):
-                if tr[i] not in data:
-                    data[tr[i]] = [[], int(tr[0]), int(tr[0]), 1, 0, 1]
-                else:
-                    lp = int(tr[0]) - data[tr[i]][2]
-                    if lp <= self._maxPer:
-                        data[tr[i]][3] += 1
-
-                    else:
-                        if data[tr[i]][3] >= self._minPS:
-                            data[tr[i]][0].append([data[tr[i]][1], data[tr[i]][2], data[tr[i]][3]])
-                            data[tr[i]][4] += data[tr[i]][3]
-                        data[tr[i]][3] = 1
-                        data[tr[i]][1] = int(tr[0])
-                    data[tr[i]][2] = int(tr[0])
-                    data[tr[i]][5] += 1
-            # print(data)
-           
-        for ri in data:
-            if data[ri][3] >= self._minPS:
-                data[ri][0].append([data[ri][1], data[ri][2], data[ri][3]])
-                data[ri][4] += data[ri][3]
-        data = {k: [v[0], v[5]] for k, v in data.items() if v[4] >= (self._minPS*self._minRec)}
+                timeStamps.setdefault(tr[i], []).append(int(tr[0]))
+        data = {}
+        for item, ts in timeStamps.items():
+            recli, ps, support = _recurrences(_ab._pm.asTimestamps(ts, unique=False), self._maxPer, self._minPS)
+            if ps >= (self._minPS * self._minRec):
+                data[item] = [recli, support]
         genList = [k for k, v in sorted(data.items(), key=lambda x: (x[1][1], x[0]), reverse=True)]
         self._rank = dict([(index, item) for (item, index) in enumerate(genList)])
         return data, genList
@@ -574,23 +595,20 @@ class RPGrowth(_ab._recurringPatterns):
         return list1
 
     @staticmethod
-    def _buildTree(data, info):
+    def _encodeDatabase(data):
         """
-        It takes the database and construct the main tree by setting root node as a null
+        Encodes the updated transactions as one array of item ranks with the offsets of every transaction
 
-        :param data: it represents the one items in database
+        :param data: updated transactions whose first entry is the timestamp
         :type data: list
-        :param info: it represents the support and recurrence of each item
-        :type info: dictionary
-        :return: returns root node of tree
+        :return: the arrays ``items``, ``indptr`` and ``timestamps`` shared with the mining tasks
+        :rtype: dict
         """
-
-        rootNode = _Tree()
-        rootNode.info = info.copy()
-        for i in range(len(data)):
-            set1 = [data[i][0]]
-            rootNode.addTransaction(data[i][1:], set1)
-        return rootNode
+        indptr = _ab._np.zeros(len(data) + 1, dtype=_ab._np.int64)
+        _ab._np.cumsum([len(tr) - 1 for tr in data], out=indptr[1:])
+        items = _ab._np.fromiter((i for tr in data for i in tr[1:]), dtype=_ab._np.int32, count=int(indptr[-1]))
+        timestamps = _ab._np.fromiter((tr[0] for tr in data), dtype=_ab._np.int64, count=len(data))
+        return {'items': items, 'indptr': indptr, 'timestamps': timestamps}
 
     def _savePeriodic(self, itemSet):
         """
@@ -623,44 +641,29 @@ class RPGrowth(_ab._recurringPatterns):
                 value = int(value)
         return value
 
+    def __init__(self, iFile, maxPer, minPS, minRec, sep='\t', numWorkers=1, backend='process'):
+        super().__init__(iFile, maxPer, minPS, minRec, sep)
+        self._numWorkers = numWorkers
+        self._backend = backend
+
     @deprecated("It is recommended to use mine() instead of startMine() for mining process")
     def startMine(self):
         """
         Mining process will start from this function
         """
-        global _minPS, _minRec, _maxPer, _lno
-        self._startTime = _ab._time.time()
-        if self._iFile is None:
-            raise Exception("Please enter the file path or file name:")
-        self._creatingItemSets()
-        self._minPS = self._convert(self._minPS)
-        self._maxPer = self._convert(self._maxPer)
-        self._minRec = int(self._minRec)
-        self._finalPatterns = {}
-        _maxPer, _minPS, _minRec, _lno = self._maxPer, self._minPS, self._minRec, len(self._Database)
-        generatedItems, pfList = self._OneItems()
-        updatedDatabases = self._updateDatabases(generatedItems)
-        for x, y in self._rank.items():
-            self._rankedUp[y] = x
-        info = {self._rank[k]: v for k, v in generatedItems.items()}
-        Tree = self._buildTree(updatedDatabases, info)
-        patterns = Tree.generatePatterns([])
-        for i in patterns:
-            sample = self._savePeriodic(i[0])
-            self._finalPatterns[sample] = i[1]
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Recurring patterns were generated successfully using RPGrowth algorithm ")
+        self.mine()
 
     def Mine(self):
         """
         Mining process will start from this function
         """
-        global _minPS, _minRec, _maxPer, _lno
+        self.mine()
+
+    def mine(self):
+        """
+        Mining process will start from this function. The recurring items are split into numWorkers groups of suffix
+        items, and every group is mined on its own tree by the selected backend.
+        """
         self._startTime = _ab._time.time()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
@@ -669,17 +672,19 @@ class RPGrowth(_ab._recurringPatterns):
         self._maxPer = self._convert(self._maxPer)
         self._minRec = int(self._minRec)
         self._finalPatterns = {}
-        _maxPer, _minPS, _minRec, _lno = self._maxPer, self._minPS, self._minRec, len(self._Database)
         generatedItems, pfList = self._OneItems()
         updatedDatabases = self._updateDatabases(generatedItems)
-        for x, y in self._rank.items():
-            self._rankedUp[y] = x
+        self._rankedUp = {y: x for x, y in self._rank.items()}
         info = {self._rank[k]: v for k, v in generatedItems.items()}
-        Tree = self._buildTree(updatedDatabases, info)
-        patterns = Tree.generatePatterns([])
-        for i in patterns:
-            sample = self._savePeriodic(i[0])
-            self._finalPatterns[sample] = i[1]
+        arrays = self._encodeDatabase(updatedDatabases)
+        numPartitions = max(1, min(self._numWorkers, len(info)))
+        tasks = [(partition, numPartitions, self._maxPer, self._minPS, self._minRec, info)
+                 for partition in range(numPartitions)]
+        with _ab._backends.openSession(self._backend, arrays, self._numWorkers) as session:
+            results = session.map(_mineSuffixes, tasks)
+        for patterns in results:
+            for pattern, value in patterns:
+                self._finalPatterns[self._savePeriodic(pattern)] = value
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -54,11 +54,12 @@ __copyright__ = """
 
 from PAMI.relativeFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-import pandas as pd
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
 
 from PAMI.relativeFrequentPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 
 class _Node:
@@ -409,7 +410,7 @@ class RSFPGrowth(_ab._frequentPatterns):
     __itemSetCount = 0
     __maxPatternLength = 1000
 
-    def __init__(self, iFile: Union[str, pd.DataFrame], minSup: Union[int, float, str], minRS: float, sep: str='\t') -> None:
+    def __init__(self, iFile: 'Union[str, pd.DataFrame]', minSup: Union[int, float, str], minRS: float, sep: str='\t') -> None:
         super().__init__(iFile, minSup, minRS, sep)
         self.__finalPatterns = {}
 
@@ -718,7 +719,7 @@ class RSFPGrowth(_ab._frequentPatterns):
 
         return self.__endTime - self.__startTime
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
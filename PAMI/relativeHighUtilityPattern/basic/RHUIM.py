@@ -53,8 +53,9 @@ __copyright__ = """
 
 """
 
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 from PAMI.relativeHighUtilityPattern.basic import abstract as _ab
 
 
@@ -780,7 +781,7 @@ class RHUIM(_ab._utilityPatterns):
                 else:
                     self._utilityBinArrayLU[item] = transaction.transactionUtility
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """Storing final patterns in a dataframe
 
         :return: returning patterns in a dataframe
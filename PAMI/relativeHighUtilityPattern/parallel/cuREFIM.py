@@ -57,13 +57,14 @@ __copyright__ = """
 import os
 import time
 import mmap
-import psutil
-import cupy as cp
+from PAMI import lazyImport as _lazyImport
+psutil = _lazyImport.lazyModule('psutil')
+cp = _lazyImport.lazyModule('cupy')
 import numpy as np
 
 from PAMI.relativeHighUtilitytPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 searchGPU = cp.RawKernel(r'''
 
@@ -55,14 +55,15 @@ __copyright__ = """
 import os
 import mmap
 import time
-import psutil
+from PAMI import lazyImport as _lazyImport
+psutil = _lazyImport.lazyModule('psutil')
 from joblib import Parallel, delayed
 
 from PAMI.relativeHighUtilityPattern.basic import abstract as _ab
 
 from PAMI.relativeHighUtilitytPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 class efimParallel(_ab._utilityPatterns):
     """
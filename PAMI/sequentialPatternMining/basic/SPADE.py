@@ -55,8 +55,9 @@ __copyright__ = """
 """
 
 
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 from PAMI.sequentialPatternMining.basic import abstract as _ab
 
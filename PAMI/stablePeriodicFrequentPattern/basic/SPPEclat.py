@@ -53,10 +53,13 @@ __copyright__ = """
      Copyright (C)  2021 Rage Uday Kiran
 
 """
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 from PAMI.stablePeriodicFrequentPattern.basic import abstract as _ab
+from PAMI.stablePeriodicFrequentPattern.basic import liabilityEngine as _engine
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
 
 class SPPEclat(_ab._stablePeriodicFrequentPatterns):
     """
@@ -311,42 +314,37 @@ class SPPEclat(_ab._stablePeriodicFrequentPatterns):
             self._SPPList[item][1] = max(la[item], self._SPPList[item][1])
         self._SPPList = {k: v for k, v in self._SPPList.items() if v[0] >= self._minSup and v[1] <= self._maxLa}
         self._SPPList = {k: v for k, v in sorted(self._SPPList.items(), key=lambda x: x[1][0], reverse=True)}
-        self._Generation(list(self._SPPList), set())
+        self._tsList = {k: _pm.asTimestamps(self._tsList[k]) for k in self._SPPList}
+        self._Generation([(k, self._tsList[k], v[1]) for k, v in self._SPPList.items()], ())
 
-    def _Generation(self, GPPFList, CP):
+    def _Generation(self, members, prefix):
         """
-        To generate the patterns using depth-first search
+        To generate the patterns using depth-first search. Every member of the equivalence class of prefix is joined with
+        the members that follow it, and the liability of each join is computed while the timestamps are intersected.
+
+        :param members: (item, timestamps, liability) of the stable periodic-frequent extensions of prefix
+        :type members: list
+        :param prefix: items of the prefix
+        :type prefix: tuple
         """
-        for i in range(len(GPPFList)):
-            item = GPPFList[i]
-            CP1 = CP | {item}
-            if CP != set():
-                self._tsList['\t'.join(CP1)] = list(set(self._tsList['\t'.join(CP)]) & set(self._tsList[item]))
-            la = self._calculateLa(self._tsList['\t'.join(CP1)])
-            support = len(self._tsList['\t'.join(CP1)])
-            if la <= self._maxLa and len(self._tsList['\t'.join(CP1)]) >= self._minSup:
-                #CP = CP1
-                self._finalPatterns['\t'.join(CP1)] = [support, la]
-                if i+1 < len(GPPFList):
-                    self._Generation(GPPFList[i+1:], CP1)
+        for i in range(len(members)):
+            item, timestamps, la = members[i]
+            pattern = prefix + (item,)
+            self._finalPatterns['\t'.join(pattern)] = [len(timestamps), la]
+            extensions = []
+            for other, otherTimestamps, otherLa in members[i + 1:]:
+                result = _engine.intersect(timestamps, otherTimestamps, self._minSup, self._maxPer, self._maxLa,
+                                           self._last, bound=max(la, otherLa))
+                if result is not None:
+                    extensions.append((other, result[0], result[1]))
+            if extensions:
+                self._Generation(extensions, pattern)
 
     def _calculateLa(self, tsList):
         """
         To calculate the liability of a patterns based on its timestamps
         """
-        previous = 0
-        la = 0
-        tsList = sorted(tsList)
-        laList = []
-        for ts in tsList:
-            la = max(0, la + ts - previous - self._maxPer)
-            laList.append(la)
-            previous = ts
-            
-        la = max(0, la + self._last - previous - self._maxPer)
-        laList.append(la)
-        maxla = max(laList)
-        return maxla
+        return _engine.liability(_pm.asTimestamps(tsList, unique=False), self._maxPer, self._last)
 
     @deprecated("It is recommended to use mine() instead of startMine() for mining process")
     def startMine(self):
@@ -456,7 +454,6 @@ if __name__ == '__main__':
             _ap = SPPEclat(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5], _ab._sys.argv[6])
         if len(_ab._sys.argv) == 6:
             _ap = SPPEclat(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -57,12 +57,9 @@ __copyright__ = """
 
 
 from PAMI.stablePeriodicFrequentPattern.basic import abstract as _ab
-import deprecated
-
-_minSup = int()
-_maxPer = int()
-_maxLa = int()
-_last = int()
+from PAMI.stablePeriodicFrequentPattern.basic import liabilityEngine as _engine
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
+from PAMI.lazyImport import deprecated
 
 
 class _Node:
@@ -93,10 +90,14 @@ class _Node:
         node.parent = self
 
 class _Tree:
-    def __init__(self):
+    def __init__(self, minSup, maxPer, maxLa, last):
         self.root = _Node(None, {})
         self.summaries = {}
         self.info = {}
+        self.minSup = minSup
+        self.maxPer = maxPer
+        self.maxLa = maxLa
+        self.last = last
 
     def addTransaction(self, transaction, tid):
         """
@@ -183,28 +184,18 @@ class _Tree:
             temporary += i.timeStamps
         return temporary
 
-    @staticmethod
-    def getSupportAndPeriod(timeStamps):
+    def getSupportAndPeriod(self, timeStamps):
         """
-        To calculate the periodicity and support
+        To calculate the support and liability. The liability is not computed for infrequent item sets and its
+        computation stops as soon as maxLa is certain to be exceeded.
 
         :param timeStamps: Timestamps of an item set
-        :return: support, periodicity
-        """
-        global _maxPer, _last
-        previous = 0
-        la = 0
-        tsList = sorted(timeStamps)
-        laList = []
-        for ts in tsList:
-            la = max(0, la + ts - previous - _maxPer)
-            laList.append(la)
-            previous = ts
-        la = max(0, la + _last - previous - _maxPer)
-        laList.append(la)
-
-        maxla = max(laList)
-        return len(timeStamps), maxla
+        :return: support, liability or None if the item set is not stable periodic-frequent
+        """
+        if len(timeStamps) < self.minSup:
+            return len(timeStamps), None
+        la = _engine.liability(_pm.asTimestamps(timeStamps, unique=False), self.maxPer, self.last, self.maxLa)
+        return len(timeStamps), la
 
     def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps):
         """
@@ -217,20 +208,19 @@ class _Tree:
         :returns: Returns conditional transactions by removing non-periodic and non-frequent items
         """
 
-        global _maxPer, _minSup, _maxLa
         pat = []
         timeStamps = []
         data1 = {}
         for i in range(len(conditionalPatterns)):
             for j in conditionalPatterns[i]:
                 if j in data1:
-                    data1[j] = data1[j] + conditionalTimeStamps[i]
+                    data1[j].extend(conditionalTimeStamps[i])
                 else:
-                    data1[j] = conditionalTimeStamps[i]
+                    data1[j] = list(conditionalTimeStamps[i])
         updatedDictionary = {}
         for m in data1:
             updatedDictionary[m] = self.getSupportAndPeriod(data1[m])
-        updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[0] >= _minSup and v[1] <= _maxLa}
+        updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[1] is not None}
         count = 0
         for p in conditionalPatterns:
             p1 = [v for v in p if v in updatedDictionary]
@@ -255,7 +245,7 @@ class _Tree:
             pattern.append(i)
             yield pattern, self.info[i]
             patterns, timeStamps, info = self.getConditionalPatterns(i)
-            conditionalTree = _Tree()
+            conditionalTree = _Tree(self.minSup, self.maxPer, self.maxLa, self.last)
             conditionalTree.info = info.copy()
             for pat in range(len(patterns)):
                 conditionalTree.addTransaction(patterns[pat], timeStamps[pat])
@@ -429,6 +419,7 @@ class SPPGrowth():
     _rank = {}
     _rankedUp = {}
     _lno = 0
+    _last = 0
     SPPList = {}
 
     def __init__(self, inputFile, minSup, maxPer, maxLa, sep='\t'):
@@ -484,7 +475,6 @@ class SPPGrowth():
 
         :returns: return the one-length periodic frequent patterns
         """
-        global _last
         tidLast = {}
         la = {}
         self.SPPList = {}
@@ -499,9 +489,9 @@ class SPPGrowth():
                     la[item] = max(0, la[item] + ts - tidLast.get(item) - self._maxPer)
                     self.SPPList[item] = [s, max(la[item], self.SPPList[item][1])]
                 tidLast[item] = ts
-            _last = ts
+            self._last = ts
         for item in self.SPPList:
-            la[item] = max(0, la[item] + _last - tidLast[item] - self._maxPer)
+            la[item] = max(0, la[item] + self._last - tidLast[item] - self._maxPer)
             self.SPPList[item][1] = max(la[item], self.SPPList[item][1])
         self.SPPList = {k: v for k, v in self.SPPList.items() if v[0] >= self._minSup and v[1] <= self._maxLa}
         self.SPPList = {k: v for k, v in sorted(self.SPPList.items(), key=lambda x: x[1][0], reverse=True)}
@@ -532,8 +522,7 @@ class SPPGrowth():
                 list1.append(list2)
         return list1
 
-    @staticmethod
-    def _buildTree(data, info):
+    def _buildTree(self, data, info):
         """
         It takes the database and support of each item and construct the main tree by setting root node as a null
 
@@ -544,7 +533,7 @@ class SPPGrowth():
         :return: returns root node of tree
         """
 
-        rootNode = _Tree()
+        rootNode = _Tree(self._minSup, self._maxPer, self._maxLa, self._last)
         rootNode.info = info.copy()
         for i in range(len(data)):
             set1 = [data[i][0]]
@@ -595,7 +584,6 @@ class SPPGrowth():
         Mining process will start from this function
         """
 
-        global _minSup, _maxPer, _lno, _maxLa
         self._startTime = _ab._time.time()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
@@ -605,8 +593,6 @@ class SPPGrowth():
         self._minSup = self._convert(self._minSup)
         self._maxPer = self._convert(self._maxPer)
         self._maxLa = self._convert(self._maxLa)
-        _minSup, _maxPer, _maxLa, _lno = self._minSup, self._maxPer, self._maxLa, len(self._Database)
-        #print(_minSup, _maxPer, _maxLa)
         if self._minSup > len(self._Database):
             raise Exception("Please enter the minSup in range between 0 to 1")
         generatedItems, pfList = self._periodicFrequentOneItem()
@@ -712,7 +698,6 @@ if __name__ == "__main__":
             _ap = SPPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5], _ab._sys.argv[6])
         if len(_ab._sys.argv) == 6:
             _ap = SPPGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -51,17 +51,18 @@ __copyright__ = """
 """
 
 from PAMI.stableperiodicFrequentPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
-from urllib.request import urlopen
-import validators
-import pandas as pd
+urlopen = _lazyImport.lazyAttribute('urllib.request', 'urlopen')
+validators = _lazyImport.lazyModule('validators')
+pd = _lazyImport.lazyModule('pandas')
 import resource
 import time
 import sys
 import os
-import psutil
+psutil = _lazyImport.lazyModule('psutil')
 
 _minSup = int()
 _maxPer = int()
@@ -548,7 +549,6 @@ if __name__ == "__main__":
             _ap = SPPGrowth(sys.argv[1], sys.argv[3], sys.argv[4], sys.argv[5])
         if len(sys.argv) == 5:
             _ap = SPPGrowth(sys.argv[1], sys.argv[3], sys.argv[4])
-        _ap.startMine()
         _ap.mine()
         _Patterns = _ap.getPatterns()
         print("Total number of Patterns:", len(_Patterns))
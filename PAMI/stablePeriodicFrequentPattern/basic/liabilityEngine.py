@@ -0,0 +1,161 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Liability computations shared by the stable periodic-frequent miners.
+
+The liability of a pattern follows the recursion la = max(0, la + gap - maxPer) over the gaps between its consecutive
+timestamps, starting from 0 and ending at the last timestamp of the database, and a pattern is stable when the largest
+liability reached does not exceed maxLa. The functions of this module evaluate the recursion block by block while the
+timestamps are produced and give up as soon as the pattern can no longer be stable or frequent:
+
+    - the liability reached so far already exceeds maxLa,
+    - the timestamps left cannot bring the final liability back under maxLa, since every remaining gap lowers the
+      liability by at most maxPer,
+    - the timestamps left cannot reach minSup.
+
+Removing timestamps from a pattern merges gaps and never lowers its liability, so the liability of a pattern is a lower
+bound of the liability of all its supersets. Together with lowerBound this lets a miner discard an extension before
+intersecting its timestamps.
+
+.. code-block:: python
+
+        from PAMI.stablePeriodicFrequentPattern.basic import liabilityEngine as engine
+
+        la = engine.liability(timestamps, maxPer, last, maxLa)
+
+        result = engine.intersect(first, second, minSup, maxPer, maxLa, last, bound=max(laFirst, laSecond))
+
+        if result is not None:
+            timestamps, la = result
+"""
+
+import numpy as _np
+from typing import Optional, Tuple
+
+blockSize = 1024
+
+
+def lowerBound(support: int, maxPer: float, last: int) -> float:
+    """
+    Smallest liability a pattern with the given support can have: the total excess of its support + 1 gaps, which
+    always add up to last
+
+    :param support: number of timestamps of the pattern
+    :type support: int
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param last: last timestamp of the database
+    :type last: int
+    :return: a lower bound of the liability
+    :rtype: int or float
+    """
+    return max(0, last - (support + 1) * maxPer)
+
+
+def _advance(state: float, previous: int, timestamps: _np.ndarray, maxPer: float) -> Tuple[float, float]:
+    """
+    Runs the liability recursion over a block of timestamps
+
+    :param state: liability before the block
+    :param previous: timestamp preceding the block
+    :param timestamps: sorted timestamps of the block
+    :param maxPer: maximum periodicity
+    :return: the liability after the block and the largest liability reached inside it
+    """
+    excess = _np.cumsum(_np.diff(timestamps, prepend=previous) - maxPer)
+    la = excess - _np.minimum(_np.minimum.accumulate(excess), -state)
+    return la[-1].item(), la.max().item()
+
+
+def liability(timestamps: _np.ndarray, maxPer: float, last: int, maxLa: float = float('inf')) -> Optional[float]:
+    """
+    Maximum liability of a pattern
+
+    :param timestamps: sorted timestamps of the pattern
+    :type timestamps: numpy.ndarray
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param last: last timestamp of the database
+    :type last: int
+    :param maxLa: maximum liability. The computation stops once it is certain to be exceeded.
+    :type maxLa: int or float
+    :return: the liability of the pattern, or None if it exceeds maxLa
+    :rtype: int or float
+    """
+    if lowerBound(len(timestamps), maxPer, last) > maxLa:
+        return None
+    state, peak, previous = 0, 0, 0
+    for start in range(0, len(timestamps), blockSize):
+        block = timestamps[start:start + blockSize]
+        state, blockPeak = _advance(state, previous, block, maxPer)
+        peak = max(peak, blockPeak)
+        previous = int(block[-1])
+        remaining = len(timestamps) - start - len(block)
+        if peak > maxLa or state + last - previous - (remaining + 1) * maxPer > maxLa:
+            return None
+    peak = max(peak, state + last - previous - maxPer)
+    return None if peak > maxLa else peak
+
+
+def intersect(first: _np.ndarray, second: _np.ndarray, minSup: float, maxPer: float, maxLa: float, last: int,
+              bound: float = 0) -> Optional[Tuple[_np.ndarray, float]]:
+    """
+    Intersects the timestamps of two patterns and computes the liability of their union while the common timestamps are
+    found
+
+    :param first: sorted timestamps of the first pattern
+    :type first: numpy.ndarray
+    :param second: sorted timestamps of the second pattern
+    :type second: numpy.ndarray
+    :param minSup: minimum support
+    :type minSup: int or float
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param maxLa: maximum liability
+    :type maxLa: int or float
+    :param last: last timestamp of the database
+    :type last: int
+    :param bound: a known lower bound of the liability of the union, usually the larger liability of the two patterns
+    :type bound: int or float
+    :return: the common timestamps and their liability, or None if the union is not a stable periodic-frequent pattern
+    :rtype: tuple
+    """
+    if len(first) > len(second):
+        first, second = second, first
+    if len(first) < minSup or max(bound, lowerBound(len(first), maxPer, last)) > maxLa:
+        return None
+    blocks = []
+    found, state, peak, previous = 0, 0, 0, 0
+    for start in range(0, len(first), blockSize):
+        block = first[start:start + blockSize]
+        positions = _np.searchsorted(second, block)
+        positions[positions == len(second)] = 0
+        common = block[second[positions] == block]
+        if len(common):
+            state, blockPeak = _advance(state, previous, common, maxPer)
+            peak = max(peak, blockPeak)
+            previous = int(common[-1])
+            found += len(common)
+            blocks.append(common)
+        remaining = len(first) - start - len(block)
+        if found + remaining < minSup:
+            return None
+        if peak > maxLa or state + last - previous - (remaining + 1) * maxPer > maxLa:
+            return None
+    peak = max(peak, state + last - previous - maxPer)
+    if peak > maxLa:
+        return None
+    return (_np.concatenate(blocks) if blocks else first[:0]), peak
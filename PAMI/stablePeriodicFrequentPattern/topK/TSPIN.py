@@ -52,16 +52,11 @@ __copyright__ = """
 """
 
 from PAMI.stablePeriodicFrequentPattern.topK import abstract as _ab
+from PAMI.stablePeriodicFrequentPattern.basic import liabilityEngine as _engine
+from PAMI.periodicFrequentPattern.basic import periodicityMeasures as _pm
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 
 
-_maxPer = float()
-_maxLa = float()
-_k = float()
-_lno = int()
-_last = int()
-
-
 class _Node(object):
     """
         A class used to represent the node of stablePeriodicFrequentPatternTree
@@ -121,6 +116,14 @@ class _Tree(object):
             Storing the nodes with same item name
         info : dictionary
             Stores the support of the items
+        maxPer : int or float
+            maximum periodicity expressed in count
+        maxLa : int or float
+            maximum liability expressed in count
+        k : int
+            number of patterns to be found
+        last : int
+            last timestamp of the database
 
 
     :Methods:
@@ -138,10 +141,14 @@ class _Tree(object):
             Starts from the root node of the tree and mines the periodic-frequent patterns
         """
 
-    def __init__(self) -> None:
+    def __init__(self, maxPer, maxLa, k, last) -> None:
         self.root = _Node(None, {})
         self.summaries = {}
         self.info = {}
+        self.maxPer = maxPer
+        self.maxLa = maxLa
+        self.k = k
+        self.last = last
 
     def addTransaction(self, transaction, tid) -> None:
         """
@@ -168,12 +175,14 @@ class _Tree(object):
                 currentNode = currentNode.children[transaction[i]]
         currentNode.timeStamps = currentNode.timeStamps + tid
 
-    def getConditionalPatterns(self, alpha) -> None:
+    def getConditionalPatterns(self, alpha, minSup) -> tuple:
         """
         Generates all the conditional patterns of a respective node
 
         :param alpha: To represent a Node in the tree
         :type alpha: Node
+        :param minSup: support of the k-th best pattern found so far
+        :type minSup: int
         :return: A tuple consisting of finalPatterns, conditional pattern base and information
         """
         finalPatterns = []
@@ -188,7 +197,7 @@ class _Tree(object):
                 set2.reverse()
                 finalPatterns.append(set2)
                 finalSets.append(set1)
-        finalPatterns, finalSets, info = self.conditionalDatabases(finalPatterns, finalSets)
+        finalPatterns, finalSets, info = self.conditionalDatabases(finalPatterns, finalSets, minSup)
         return finalPatterns, finalSets, info
 
     @staticmethod
@@ -227,26 +236,21 @@ class _Tree(object):
             temporary += i.timeStamps
         return temporary
 
-    @staticmethod
-    def getSupportAndPeriod(timeStamps) -> tuple:
+    def getSupportAndPeriod(self, timeStamps, minSup) -> tuple:
         """
-        To calculate the periodicity and support
+        To calculate the support and liability. The liability is not computed for item sets whose support is below
+        minSup and its computation stops as soon as maxLa is certain to be exceeded.
 
         :param timeStamps: Timestamps of an item set
-        :return: support, periodicity
+        :param minSup: support of the k-th best pattern found so far
+        :return: support, liability or None if the item set cannot be a top-k stable periodic pattern
         """
-
-        global _maxPer, _last
-        previous = 0
-        la = 0
-        tsList = sorted(timeStamps)
-        for ts in tsList:
-            la = max(0, la + ts - previous - _maxPer)
-            previous = ts
-        la = max(0, la + _last - previous - _maxPer)
+        if len(timeStamps) < minSup:
+            return len(timeStamps), None
+        la = _engine.liability(_pm.asTimestamps(timeStamps, unique=False), self.maxPer, self.last, self.maxLa)
         return len(timeStamps), la
 
-    def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps) -> tuple:
+    def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps, minSup) -> tuple:
         """
         It generates the conditional patterns with periodic-frequent items
 
@@ -254,23 +258,23 @@ class _Tree(object):
         :type conditionalPatterns: list
         :param conditionalTimeStamps: Represents the timestamps of a conditional patterns of a node
         :type conditionalTimeStamps: list
+        :param minSup: support of the k-th best pattern found so far
+        :type minSup: int
         :returns: Returns conditional transactions by removing non-periodic and non-frequent items
         """
-
-        global _maxPer, _minSup
         pat = []
         timeStamps = []
         data1 = {}
         for i in range(len(conditionalPatterns)):
             for j in conditionalPatterns[i]:
                 if j in data1:
-                    data1[j] = data1[j] + conditionalTimeStamps[i]
+                    data1[j].extend(conditionalTimeStamps[i])
                 else:
-                    data1[j] = conditionalTimeStamps[i]
+                    data1[j] = list(conditionalTimeStamps[i])
         updatedDictionary = {}
         for m in data1:
-            updatedDictionary[m] = self.getSupportAndPeriod(data1[m])
-        updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[1] <= _maxLa}
+            updatedDictionary[m] = self.getSupportAndPeriod(data1[m], minSup)
+        updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[1] is not None}
         count = 0
         for p in conditionalPatterns:
             p1 = [v for v in p if v in updatedDictionary]
@@ -281,35 +285,60 @@ class _Tree(object):
             count += 1
         return pat, timeStamps, updatedDictionary
 
-    def generatePatterns(self, minSup, prefix, Qk) -> None:
+    def _insert(self, Qk, pattern, value, minSup) -> int:
+        """
+        Adds a pattern to the top-k patterns. When more than k patterns are kept, the patterns with the lowest support
+        are dropped as long as k patterns remain.
+
+        :param Qk: the top-k patterns found so far
+        :type Qk: dict
+        :param pattern: the pattern to be added
+        :type pattern: tuple
+        :param value: support and liability of the pattern
+        :param minSup: support of the k-th best pattern found so far
+        :type minSup: int
+        :return: the updated support of the k-th best pattern
+        :rtype: int
+        """
+        if value[0] < minSup:
+            return minSup
+        Qk[pattern] = value
+        if len(Qk) > self.k:
+            lowest = min(v[0] for v in Qk.values())
+            res = [key for key in Qk if Qk[key][0] == lowest]
+            if len(Qk) - len(res) >= self.k:
+                for j in res:
+                    del Qk[j]
+        if len(Qk) >= self.k:
+            minSup = min(v[0] for v in Qk.values())
+        return minSup
+
+    def generatePatterns(self, minSup, prefix, Qk) -> int:
         """
         Generates the patterns
 
+        :param minSup: support of the k-th best pattern found so far
+        :type minSup: int
         :param prefix: Forms the combination of items
         :type prefix: list
-        :returns: yields patterns with their support and periodicity
+        :param Qk: the top-k patterns found so far
+        :type Qk: dict
+        :returns: the updated support of the k-th best pattern
         """
-
-        global _k
         for i in sorted(self.summaries, key=lambda x: (self.info.get(x)[0], -x)):
             pattern = prefix[:]
             pattern.append(i)
-            Qk[tuple(pattern)] = self.info[i]
-            if len(Qk) >= _k:
-                minSup = min([v[0] for v in Qk.values()])
-            if len(Qk) > _k:
-                temp = min([v[0] for v in Qk.values()])
-                res = [key for key in Qk if Qk[key] == temp]
-                for j in res:
-                    Qk[j] = None
-            patterns, timeStamps, info = self.getConditionalPatterns(i)
-            conditionalTree = _Tree()
-            conditionalTree.info = info.copy()
-            for pat in range(len(patterns)):
-                conditionalTree.addTransaction(patterns[pat], timeStamps[pat])
-            if len(patterns) > 0:
-                conditionalTree.generatePatterns(minSup, pattern, Qk)
+            minSup = self._insert(Qk, tuple(pattern), self.info[i], minSup)
+            if self.info[i][0] >= minSup:
+                patterns, timeStamps, info = self.getConditionalPatterns(i, minSup)
+                conditionalTree = _Tree(self.maxPer, self.maxLa, self.k, self.last)
+                conditionalTree.info = info.copy()
+                for pat in range(len(patterns)):
+                    conditionalTree.addTransaction(patterns[pat], timeStamps[pat])
+                if len(patterns) > 0:
+                    minSup = conditionalTree.generatePatterns(minSup, pattern, Qk)
             self.removeNode(i)
+        return minSup
 
 
 class TSPIN(_ab._stablePeriodicFrequentPatterns):
@@ -460,6 +489,7 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
     _rank = {}
     _rankedUp = {}
     _lno = 0
+    _last = 0
 
     def _creatingItemSets(self) -> None:
         """
@@ -510,9 +540,9 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
 
         :returns: return the one-length periodic frequent patterns
         """
-        global _last
         tidLast = {}
         la = {}
+        self._SPPList = {}
         for transaction in self._Database:
             ts = int(transaction[0])
             for item in transaction[1:]:
@@ -524,9 +554,9 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
                     la[item] = max(0, la[item] + ts - tidLast.get(item) - self._maxPer)
                     self._SPPList[item] = [s, max(la[item], self._SPPList[item][1])]
                 tidLast[item] = ts
-            _last = ts
+            self._last = ts
         for item in self._SPPList:
-            la[item] = max(0, la[item] + _last - tidLast[item] - self._maxPer)
+            la[item] = max(0, la[item] + self._last - tidLast[item] - self._maxPer)
             self._SPPList[item][1] = max(la[item], self._SPPList[item][1])
         self._SPPList = {k: v for k, v in self._SPPList.items() if v[1] <= self._maxLa}
         self._SPPList = {k: v for k, v in sorted(self._SPPList.items(), key=lambda x: (x[1][0]), reverse=True)}
@@ -556,8 +586,7 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
                 list1.append(list2)
         return list1
 
-    @staticmethod
-    def _buildTree(data: List[List[int]], info: Dict[int, List[int]]) -> _Tree:
+    def _buildTree(self, data: List[List[int]], info: Dict[int, List[int]]) -> _Tree:
         """
         It takes the database and support of each item and construct the main tree by setting root node as a null
 
@@ -568,7 +597,7 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
         :return: returns root node of tree
         """
 
-        rootNode = _Tree()
+        rootNode = _Tree(self._maxPer, self._maxLa, self._k, self._last)
         rootNode.info = info.copy()
         for i in range(len(data)):
             set1 = [data[i][0]]
@@ -611,7 +640,6 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
         Mining process will start from this function
         """
 
-        global _maxLa, _maxPer, _k, _lno
         self._startTime = _ab._time.time()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
@@ -621,7 +649,6 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
         self._maxLa = self._convert(self._maxLa)
         self._maxPer = self._convert(self._maxPer)
         self._k = self._convert(self._k)
-        _maxLa, _maxPer, _k, _lno = self._maxLa, self._maxPer, self._k, len(self._Database)
         if self._maxLa > len(self._Database):
             raise Exception("Please enter the minSup in range between 0 to 1")
         generatedItems, pfList = self._periodicFrequentOneItem()
@@ -671,7 +698,7 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final periodic-frequent patterns in a dataframe
 
@@ -8,8 +8,9 @@ from .extendedEdge import ExtendedEdge
 from .sparseTriangularMatrix import SparseTriangularMatrix
 import time
 import math
-import matplotlib.pyplot as plt
-import psutil as _psutil
+from PAMI import lazyImport as _lazyImport
+plt = _lazyImport.lazyModule('matplotlib.pyplot')
+_psutil = _lazyImport.lazyModule('psutil')
 import os as _os
 
 
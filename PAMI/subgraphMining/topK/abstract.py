@@ -10,8 +10,9 @@ from .sparseTriangularMatrix import SparseTriangularMatrix
 from queue import PriorityQueue
 import time
 import math
-import matplotlib.pyplot as plt
-import psutil as _psutil
+from PAMI import lazyImport as _lazyImport
+plt = _lazyImport.lazyModule('matplotlib.pyplot')
+_psutil = _lazyImport.lazyModule('psutil')
 import os as _os
 import time
 
@@ -48,8 +48,9 @@ __copyright__ = """
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 import numpy as _np
 from PAMI.faultTolerantFrequentPattern.basic import abstract as _ab
@@ -427,7 +428,6 @@ if __name__ == "__main__":
                             _ab._sys.argv[5], _ab._sys.argv[6], _ab._sys.argv[7],)
         if len(_ab._sys.argv) == 7:
             _ap = VBFTMine(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4], _ab._sys.argv[5], _ab._sys.argv[6])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
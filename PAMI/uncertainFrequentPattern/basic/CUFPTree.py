@@ -52,10 +52,12 @@ __copyright__ = """
 
 """
 
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
+from PAMI.uncertainFrequentPattern.basic.probabilisticTidLists import ProbabilisticTidLists as _ProbabilisticTidLists
 from typing import List, Tuple
 
 
@@ -622,27 +624,18 @@ class CUFPTree(_ab._frequentPatterns):
     def _removeFalsePositives(self) -> None:
         """
 
-        To remove the false positive patterns generated in frequent patterns.
+        To remove the false positive patterns generated in frequent patterns. The exact expected supports of the
+        candidates are computed from the vertical tid lists of the database instead of rescanning it per candidate.
 
         :return: patterns with accurate probability
         """
         global _finalPatterns
-        periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
+        periods = {x: y for x, y in _finalPatterns.items() if len(x) == 1}
+        candidates = [x for x in _finalPatterns if len(x) > 1]
+        vertical = _ProbabilisticTidLists(self._Database)
+        for x, y in zip(candidates, vertical.expectedSupports(candidates)):
+            if y > 0:
+                periods[x] = y
         for x, y in periods.items():
             if y >= self._minSup:
                 sample = str()
@@ -714,7 +707,7 @@ class CUFPTree(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -770,7 +763,6 @@ if __name__ == "__main__":
             _ap = CUFPTree(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = CUFPTree(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Uncertain Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
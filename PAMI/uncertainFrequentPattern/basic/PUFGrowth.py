@@ -48,7 +48,8 @@ __copyright__ = """
 
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
 from typing import List, Tuple
-import deprecated
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from PAMI.lazyImport import deprecated
 
 _minSup = str()
 _ab._sys.setrecursionlimit(20000)
@@ -283,6 +284,96 @@ class _Tree(object):
             self.removeNode(i)
 
 
+class _CandidateTrie(object):
+    """
+    A prefix trie over candidate patterns used to compute their exact expected supports.
+    Every candidate is inserted with its items ordered by rank, so one depth-first sweep over a rank-ordered
+    transaction visits exactly the candidates contained in it.
+
+    :Attributes:
+    root : dict
+        children of the root node, mapping an item to a [children, candidate index] pair
+    candidates : list
+        the candidate patterns in insertion order
+    items : set
+        the items that occur in at least one candidate
+    :Methods:
+        countTransaction(transaction, supports)
+            adds the expected support contributed by one transaction to every candidate it contains
+    """
+
+    def __init__(self, candidates, rank) -> None:
+        self.root = {}
+        self.candidates = list(candidates)
+        self.items = set()
+        self._rank = rank
+        for index, pattern in enumerate(self.candidates):
+            children = self.root
+            node = None
+            for item in sorted(pattern, key=lambda x: rank[x]):
+                node = children.get(item)
+                if node is None:
+                    node = [{}, -1]
+                    children[item] = node
+                children = node[0]
+                self.items.add(item)
+            node[1] = index
+
+    def countTransaction(self, transaction, supports) -> None:
+        """
+        Accumulates the expected supports of the candidates contained in a transaction
+        :param transaction: (item, probability) pairs of one transaction, ordered by rank
+        :type transaction: list
+        :param supports: the expected support of each candidate, updated in place
+        :type supports: list
+        """
+        stack = [(self.root, 0, 1.0)]
+        length = len(transaction)
+        while stack:
+            children, start, probability = stack.pop()
+            for position in range(start, length):
+                item, itemProbability = transaction[position]
+                node = children.get(item)
+                if node is None:
+                    continue
+                product = probability * itemProbability
+                if node[1] >= 0:
+                    supports[node[1]] += product
+                if node[0]:
+                    stack.append((node[0], position + 1, product))
+
+    def prepare(self, transaction) -> List[Tuple]:
+        """
+        Restricts a transaction to the items of the trie and orders it by rank
+        :param transaction: (item, probability) pairs of one transaction
+        :type transaction: list
+        :return: the rank ordered pairs
+        :rtype: list
+        """
+        pairs = [x for x in transaction if x[0] in self.items]
+        pairs.sort(key=lambda x: self._rank[x[0]])
+        return pairs
+
+
+def _verifyChunk(candidates, rank, transactions) -> List[float]:
+    """
+    Computes the expected supports of the candidates over one chunk of the database
+    :param candidates: the candidate patterns
+    :type candidates: list
+    :param rank: rank of every frequent item
+    :type rank: dict
+    :param transactions: (item, probability) pairs of every transaction in the chunk
+    :type transactions: list
+    :return: the expected support of every candidate within the chunk
+    :rtype: list
+    """
+    trie = _CandidateTrie(candidates, rank)
+    supports = [0.0] * len(trie.candidates)
+    for transaction in transactions:
+        trie.countTransaction(trie.prepare(transaction), supports)
+    return supports
+
+
 class PUFGrowth(_ab._frequentPatterns):
     """
     :Description: It is one of the fundamental algorithm to discover frequent patterns in a uncertain transactional database using PUF-Tree.
@@ -324,6 +415,8 @@ class PUFGrowth(_ab._frequentPatterns):
             To represents the total no of patterns
         finalPatterns : dict
             To store the complete patterns
+        numWorkers : int
+            Number of processes used to verify the expected supports of the candidate patterns. The default is 1.
 
     :Methods:
         startMine()
@@ -407,8 +500,9 @@ class PUFGrowth(_ab._frequentPatterns):
     _Database = []
     _rank = {}
 
-    def __init__(self, iFile, minSup, sep='\t') -> None:
+    def __init__(self, iFile, minSup, sep='\t', numWorkers=1) -> None:
         super().__init__(iFile, minSup, sep)
+        self._numWorkers = numWorkers
 
     def _creatingItemSets(self) -> None:
         """
@@ -562,26 +656,29 @@ class PUFGrowth(_ab._frequentPatterns):
 
     def _removeFalsePositives(self) -> None:
         """
-        To remove the false positive patterns generated in frequent patterns
+        To remove the false positive patterns generated in frequent patterns. The candidates are indexed in a prefix
+        trie and their exact expected supports are accumulated in one sweep per transaction, optionally over
+        chunks of the database processed in parallel.
         :return: patterns with accurate probability
         """
         global _finalPatterns
-        periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
+        periods = {x: y for x, y in _finalPatterns.items() if len(x) == 1}
+        candidates = [x for x in _finalPatterns if len(x) > 1]
+        if candidates:
+            transactions = [[(j.item, j.probability) for j in i] for i in self._Database]
+            if self._numWorkers > 1 and len(transactions) > 1:
+                size = -(-len(transactions) // (self._numWorkers * 4))
+                chunks = [transactions[k:k + size] for k in range(0, len(transactions), size)]
+                supports = [0.0] * len(candidates)
+                with _ProcessPoolExecutor(max_workers=self._numWorkers) as executor:
+                    for partial in executor.map(_verifyChunk, [candidates] * len(chunks),
+                                                [self.rank] * len(chunks), chunks):
+                        supports = [a + b for a, b in zip(supports, partial)]
+            else:
+                supports = _verifyChunk(candidates, self.rank, transactions)
+            for x, y in zip(candidates, supports):
+                if y > 0:
                     periods[x] = y
-                else:
-                    s = 1
-                    check = self._check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
         for x, y in periods.items():
             if y >= self._minSup:
                 sample = str()
@@ -600,8 +697,9 @@ class PUFGrowth(_ab._frequentPatterns):
         """
         Main method where the patterns are mined by constructing tree and remove the false patterns by counting the original support of a patterns
         """
-        global minSup
+        global minSup, _finalPatterns
         self._startTime = _ab._time.time()
+        _finalPatterns = {}
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
         minSup = self._minSup
@@ -647,7 +745,7 @@ class PUFGrowth(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
         :return: returning frequent patterns in a dataframe
@@ -698,7 +796,6 @@ if __name__ == "__main__":
             _ap = PUFGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = PUFGrowth(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Uncertain Frequent Patterns:", _ap.getPatterns())
         _ap.save(_ab._sys.argv[2])
@@ -47,8 +47,9 @@ __copyright__ = """
 
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Union
-import pandas as pd
-import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 _minSup = float()
 _finalPatterns = {}
@@ -438,7 +439,7 @@ class TUFP(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
         :return: returning frequent patterns in a dataframe
@@ -488,7 +489,6 @@ class TUFP(_ab._frequentPatterns):
                 _ap = TUFP(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
             if len(_ab._sys.argv) == 4:
                 _ap = TUFP(_ab._sys.argv[1], _ab._sys.argv[3])
-            _ap.startMine()
             _ap.mine()
             _Patterns = _ap.getPatterns()
             print("Total number of Patterns:", len(_Patterns))
@@ -47,7 +47,8 @@ __copyright__ = """
 """
 
 from PAMI.uncertainFrequentPattern.basic import abstract as _fp
-import deprecated
+from PAMI.uncertainFrequentPattern.basic.probabilisticTidLists import ProbabilisticTidLists as _ProbabilisticTidLists
+from PAMI.lazyImport import deprecated
 
 _minSup = float()
 _fp._sys.setrecursionlimit(20000)
@@ -602,26 +603,17 @@ class TubeS(_fp._frequentPatterns):
 
     def _removeFalsePositives(self):
         """
-        To remove the false positive patterns generated in frequent patterns.
+        To remove the false positive patterns generated in frequent patterns. The exact expected supports of the
+        candidates are computed from the vertical tid lists of the database instead of rescanning it per candidate.
         :return: Patterns with accurate probability
         """
         global _finalPatterns
-        periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._Check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
+        periods = {x: y for x, y in _finalPatterns.items() if len(x) == 1}
+        candidates = [x for x in _finalPatterns if len(x) > 1]
+        vertical = _ProbabilisticTidLists(self._Database)
+        for x, y in zip(candidates, vertical.expectedSupports(candidates)):
+            if y > 0:
+                periods[x] = y
         for x, y in periods.items():
             if y >= self._minSup:
                 sample = str()
@@ -738,7 +730,6 @@ if __name__ == "__main__":
             _ap = TubeS(_fp._sys.argv[1], _fp._sys.argv[3], _fp._sys.argv[4])
         if len(_fp._sys.argv) == 4:
             _ap = TubeS(_fp._sys.argv[1], _fp._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Uncertain Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_fp._sys.argv[2])
@@ -46,7 +46,7 @@ __copyright__ = """
 """
 
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
-import deprecated
+from PAMI.lazyImport import deprecated
 
 _minSup = str()
 _ab._sys.setrecursionlimit(20000)
@@ -666,7 +666,6 @@ if __name__ == "__main__":
             _ap = UFGrowth(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = UFGrowth(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Uncertain Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
@@ -48,7 +48,8 @@ __copyright__ = """
 
 import operator as _operator
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
-import deprecated
+from PAMI.uncertainFrequentPattern.basic.probabilisticTidLists import ProbabilisticTidLists as _ProbabilisticTidLists
+from PAMI.lazyImport import deprecated
 
 _minSup = float()
 _finalPatterns = {}
@@ -250,17 +251,9 @@ class UVEclat(_ab._frequentPatterns):
         takes the self.Database and calculates the support of each item in the dataset and assign the ranks to the items by decreasing support and returns the frequent items list
         """
 
-        mapSupport = {}
-        k = 0
-        for i in self._Database:
-            k += 1
-            for j in i:
-                if j.item not in mapSupport:
-                    mapSupport[str(j.item)] = j.probability
-                    self._tidList[str(j.item)] = {k: j.probability}
-                else:
-                    mapSupport[str(j.item)] += j.probability
-                    self._tidList[str(j.item)].update({k: j.probability})
+        vertical = _ProbabilisticTidLists([[(str(j.item), j.probability) for j in i] for i in self._Database])
+        self._tidList = vertical.tidLists
+        mapSupport = vertical.itemSupports()
         mapSupport = {k: v for k, v in mapSupport.items() if v >= self._minSup}
         plist = dict( sorted(mapSupport.items(), key=_operator.itemgetter(1),reverse=True))
         return list(plist.keys())
@@ -305,27 +298,13 @@ class UVEclat(_ab._frequentPatterns):
 
     def _removeFalsePositives(self):
         """
-        To remove the false positive patterns generated in frequent patterns
+        To remove the false positive patterns generated in frequent patterns. Every pattern's tid list is its prefix's
+        tid list intersected with the tid list of its last item, so its expected support is exact and only the minimum
+        support has to be checked.
         :return: patterns with accurate probability
         """
         global _finalPatterns
-        periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
-        for x, y in periods.items():
+        for x, y in _finalPatterns.items():
             if y >= self._minSup:
                 sample = str()
                 for i in x:
@@ -336,29 +315,20 @@ class UVEclat(_ab._frequentPatterns):
     def _Intersection(tidSetx, tidSetY):
         """
         This function is used to find the intersection
-        :param tidSetx: the timestamp of a patterns
-        :type tidSetx: dict
-        :param tidSetY: the timestamp of a patterns
-        :type tidSetY: dict
+        :param tidSetx: the tids and probabilities of a pattern
+        :type tidSetx: tuple
+        :param tidSetY: the tids and probabilities of a pattern
+        :type tidSetY: tuple
         """
-        tids = []
-        support = []
-        tidDict = {}
-        for x, y in tidSetx.items():
-            for x1, y1 in tidSetY.items():
-                if x == x1:
-                    tids.append(x)
-                    support.append(y * y1)
-                    tidDict.update({x: y * y1})
-        return tidDict
+        return _ProbabilisticTidLists.intersect(tidSetx, tidSetY)
 
     def _calculateExpSup(self, tidList):
         """
         This function is used to calculate support of tidList
-        :param tidList: timestamp of a list.
-        :type tidList: List
+        :param tidList: the tids and probabilities of a pattern
+        :type tidList: tuple
         """
-        return sum(tidList.values())
+        return _ProbabilisticTidLists.expectedSupport(tidList)
 
     def _save(self, prefix, suffix, tidSetI):
         """
@@ -367,8 +337,8 @@ class UVEclat(_ab._frequentPatterns):
         :type prefix: list
         :param suffix: the suffix of a patterns
         :type suffix: list
-        :param tidSetI: the timestamp of a patterns
-        :type tidSetI: dict
+        :param tidSetI: the tids and probabilities of a pattern
+        :type tidSetI: tuple
         """
 
         global _finalPatterns
@@ -404,8 +374,9 @@ class UVEclat(_ab._frequentPatterns):
             itemSetX = [itemI]
             for j in range(i + 1, len(itemSets)):
                 itemJ = itemSets[j]
-                tidSetJ = tidSets[j]
-                y = self._Intersection(tidSetI, tidSetJ)
+                # tidSetI already holds the prefix, so it is extended with the tid list of itemJ alone: intersecting
+                # it with the sibling tidSets[j] would multiply the probabilities of the prefix twice
+                y = self._Intersection(tidSetI, self._tidList[itemJ])
                 if self._calculateExpSup(y) >= self._minSup:
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
@@ -424,8 +395,9 @@ class UVEclat(_ab._frequentPatterns):
         """
         Main method where the patterns are mined by constructing tree and remove the false patterns by counting the original support of a patterns
         """
-        global _minSup
+        global _minSup, _finalPatterns
         self._startTime = _ab._time.time()
+        _finalPatterns = {}
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
         _minSup = self._minSup
@@ -526,7 +498,6 @@ if __name__ == "__main__":
             _ap = UVEclat(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
         if len(_ab._sys.argv) == 4:
             _ap = UVEclat(_ab._sys.argv[1], _ab._sys.argv[3])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
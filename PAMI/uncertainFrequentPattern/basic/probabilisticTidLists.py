@@ -0,0 +1,180 @@
+#  Copyright (C)  2021 Rage Uday Kiran
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as _np
+from typing import Dict, Iterable, List, Tuple
+
+TidList = Tuple[_np.ndarray, _np.ndarray]
+
+
+class ProbabilisticTidLists:
+    """
+    :Description: Vertical (U-Eclat style) representation of an uncertain transactional database shared by the uncertain
+                  frequent pattern miners. Every item keeps a sorted int32 array of the transactions containing it and a
+                  float64 array of its existential probabilities, i.e. 12 bytes per item occurrence. The expected support
+                  of an itemset is the sum over its common transactions of the product of the item probabilities, which
+                  is computed by intersecting tid arrays and multiplying the aligned probability arrays.
+
+    :Attributes:
+
+        tidLists : dict
+            Maps every item to its (tids, probabilities) pair
+        size : int
+            Number of transactions in the database
+
+    :Methods:
+
+        tidList(item)
+            Returns the (tids, probabilities) pair of an item
+        intersect(x, y)
+            Intersects two tid lists and multiplies their probabilities
+        expectedSupport(tidList)
+            Returns the expected support stored in a tid list
+        patternTidList(pattern)
+            Returns the tid list of an itemset
+        expectedSupports(patterns)
+            Returns the exact expected support of every pattern, sharing prefix intersections between them
+
+    **Importing this module into a python program**
+    -------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.uncertainFrequentPattern.basic.probabilisticTidLists import ProbabilisticTidLists
+
+            vertical = ProbabilisticTidLists(database)
+
+            support = vertical.expectedSupports([('a', 'b'), ('a', 'c')])
+
+    """
+
+    def __init__(self, database: Iterable) -> None:
+        """
+        :param database: transactions given as lists of objects with item and probability attributes, or as lists of
+                         (item, probability) pairs
+        :type database: list
+        """
+        tids: Dict[object, List[int]] = {}
+        probabilities: Dict[object, List[float]] = {}
+        size = 0
+        for tid, transaction in enumerate(database):
+            size += 1
+            for entry in transaction:
+                if isinstance(entry, tuple):
+                    item, probability = entry
+                else:
+                    item, probability = entry.item, entry.probability
+                itemTids = tids.get(item)
+                if itemTids is None:
+                    tids[item] = [tid]
+                    probabilities[item] = [probability]
+                elif itemTids[-1] != tid:
+                    itemTids.append(tid)
+                    probabilities[item].append(probability)
+        self.size = size
+        self.tidLists = {item: (_np.array(tids[item], dtype=_np.int32),
+                                _np.array(probabilities[item], dtype=_np.float64)) for item in tids}
+        self._empty = (_np.zeros(0, dtype=_np.int32), _np.zeros(0, dtype=_np.float64))
+
+    def items(self) -> List:
+        """
+        :return: the items of the database
+        :rtype: list
+        """
+        return list(self.tidLists)
+
+    def tidList(self, item) -> TidList:
+        """
+        :param item: an item of the database
+        :return: the (tids, probabilities) pair of the item, empty if the item does not occur
+        :rtype: tuple
+        """
+        return self.tidLists.get(item, self._empty)
+
+    def itemSupports(self) -> Dict[object, float]:
+        """
+        :return: the expected support of every single item
+        :rtype: dict
+        """
+        return {item: float(probabilities.sum()) for item, (tids, probabilities) in self.tidLists.items()}
+
+    @staticmethod
+    def intersect(x: TidList, y: TidList) -> TidList:
+        """
+        Intersects two tid lists and multiplies the probabilities of the common transactions
+
+        :param x: the first (tids, probabilities) pair
+        :type x: tuple
+        :param y: the second (tids, probabilities) pair
+        :type y: tuple
+        :return: the (tids, probabilities) pair of the union of both itemsets
+        :rtype: tuple
+        """
+        tids, indexX, indexY = _np.intersect1d(x[0], y[0], assume_unique=True, return_indices=True)
+        return tids, x[1][indexX] * y[1][indexY]
+
+    @staticmethod
+    def expectedSupport(tidList: TidList) -> float:
+        """
+        :param tidList: a (tids, probabilities) pair
+        :type tidList: tuple
+        :return: the expected support of the itemset represented by the tid list
+        :rtype: float
+        """
+        return float(tidList[1].sum())
+
+    def patternTidList(self, pattern: Iterable) -> TidList:
+        """
+        :param pattern: the items of an itemset
+        :type pattern: list
+        :return: the (tids, probabilities) pair of the itemset
+        :rtype: tuple
+        """
+        items = sorted(pattern, key=lambda x: len(self.tidList(x)[0]))
+        if not items:
+            return self._empty
+        result = self.tidList(items[0])
+        for item in items[1:]:
+            if len(result[0]) == 0:
+                break
+            result = self.intersect(result, self.tidList(item))
+        return result
+
+    def expectedSupports(self, patterns: Iterable) -> List[float]:
+        """
+        Computes the exact expected support of every pattern. Patterns are visited in a canonical order so that
+        consecutive patterns reuse the tid lists of their common prefix.
+
+        :param patterns: itemsets given as sequences of items
+        :type patterns: list
+        :return: the expected support of every pattern, in the given order
+        :rtype: list
+        """
+        patterns = list(patterns)
+        order = {item: (len(tidList[0]), index) for index, (item, tidList) in enumerate(self.tidLists.items())}
+        unknown = (0, -1)
+        keys = [tuple(sorted(set(pattern), key=lambda x: order.get(x, unknown))) for pattern in patterns]
+        supports = [0.0] * len(patterns)
+        stack: List[Tuple[object, TidList]] = []
+        for position in sorted(range(len(keys)), key=lambda k: [order.get(x, unknown) for x in keys[k]]):
+            key = keys[position]
+            common = 0
+            while common < len(stack) and common < len(key) and stack[common][0] == key[common]:
+                common += 1
+            del stack[common:]
+            for item in key[common:]:
+                tidList = self.tidList(item) if not stack else self.intersect(stack[-1][1], self.tidList(item))
+                stack.append((item, tidList))
+            supports[position] = self.expectedSupport(stack[-1][1]) if stack else 0.0
+        return supports
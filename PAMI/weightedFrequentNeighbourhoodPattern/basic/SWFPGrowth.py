@@ -53,8 +53,9 @@ __copyright__ = """
 """
 
 from PAMI.weightedFrequentNeighbourhoodPattern.basic import abstract as _fp
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 from typing import List, Dict, Tuple, Union, Iterable
 
 _minWS = str()
@@ -469,7 +470,7 @@ class SWFPGrowth(_fp._weightedFrequentSpatialPatterns):
     __rank = {}
     __rankDup = {}
 
-    def __init__(self, iFile: Union[str, _fp._pd.DataFrame], nFile: Union[str, _fp._pd.DataFrame], minWS: Union[int, float, str], sep='\t') -> None:
+    def __init__(self, iFile: 'Union[str, _fp._pd.DataFrame]', nFile: 'Union[str, _fp._pd.DataFrame]', minWS: Union[int, float, str], sep='\t') -> None:
         super().__init__(iFile, nFile, minWS, sep)
 
     def __creatingItemSets(self) -> None:
@@ -716,7 +717,7 @@ class SWFPGrowth(_fp._weightedFrequentSpatialPatterns):
 
         return self.__endTime - self.__startTime
 
-    def getPatternsAsDataFrame(self) -> _fp._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_fp._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -773,7 +774,6 @@ if __name__ == "__main__":
                              _fp._sys.argv[7])
         if len(_fp._sys.argv) == 7:
             _ap = SWFPGrowth(_fp._sys.argv[1], _fp._sys.argv[3], _fp._sys.argv[4], _fp._sys.argv[5], _fp._sys.argv[6])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Weighted Spatial Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_fp._sys.argv[2])
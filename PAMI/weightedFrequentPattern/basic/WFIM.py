@@ -54,8 +54,9 @@ __copyright__ = """
 
 from PAMI.weightedFrequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Union, Generator
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 
 
 _minSup = str()
@@ -625,7 +626,7 @@ class WFIM(_fp._weightedFrequentPatterns):
 
         return self.__endTime - self.__startTime
 
-    def getPatternsAsDataFrame(self) -> pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> 'pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe.
 
@@ -683,7 +684,6 @@ if __name__ == "__main__":
             _ap = WFIM(_fp._sys.argv[1], _fp._sys.argv[3], _fp._sys.argv[4], _fp._sys.argv[5], _fp._sys.argv[6])
         if len(_fp._sys.argv) == 6:
             _ap = WFIM(_fp._sys.argv[1], _fp._sys.argv[3], _fp._sys.argv[4], _fp._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Weighted Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_fp._sys.argv[2])
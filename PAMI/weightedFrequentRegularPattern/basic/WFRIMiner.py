@@ -53,8 +53,9 @@ __copyright__ = """
 """
 
 from PAMI.weightedFrequentRegularPattern.basic import abstract as _fp
-import pandas as pd
-from deprecated import deprecated
+from PAMI import lazyImport as _lazyImport
+pd = _lazyImport.lazyModule('pandas')
+from PAMI.lazyImport import deprecated
 from typing import List, Dict
 
 
@@ -724,7 +725,7 @@ class WFRIMiner(_fp._weightedFrequentRegularPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _fp._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_fp._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -780,7 +781,6 @@ if __name__ == "__main__":
             _ap = WFRIMiner(_fp._sys.argv[1], _fp._sys.argv[3], _fp._sys.argv[4], _fp._sys.argv[5], _fp._sys.argv[6])
         if len(_fp._sys.argv) == 5:
             _ap = WFRIMiner(_fp._sys.argv[1], _fp._sys.argv[3], _fp._sys.argv[4], _fp._sys.argv[5])
-        _ap.startMine()
         _ap.mine()
         print("Total number of Weighted Frequent Regular Patterns:", len(_ap.getPatterns()))
         _ap.save(_fp._sys.argv[2])